@@ -0,0 +1,25 @@
+"""add notifications (user_id, status, created_at) index"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "2024070408"
+down_revision = "2024070407"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_notifications_user_status_created",
+        "notifications",
+        ["user_id", "status", "created_at"],
+    )
+    # Bileşik indeksin ilk sütunu user_id olduğu için tekil indeks gereksiz.
+    op.drop_index("ix_notifications_user", table_name="notifications")
+
+
+def downgrade() -> None:
+    op.create_index("ix_notifications_user", "notifications", ["user_id"])
+    op.drop_index("ix_notifications_user_status_created", table_name="notifications")
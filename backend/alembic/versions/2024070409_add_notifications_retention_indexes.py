@@ -0,0 +1,20 @@
+"""add notifications created_at indexes for listing and retention"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "2024070409"
+down_revision = "2024070408"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_notifications_user_created", "notifications", ["user_id", "created_at"])
+    op.create_index("ix_notifications_created", "notifications", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notifications_created", table_name="notifications")
+    op.drop_index("ix_notifications_user_created", table_name="notifications")
@@ -0,0 +1,102 @@
+"""partition notifications by month on PostgreSQL (optional)
+
+`NOTIFICATION_PARTITIONING_ENABLED=true` ile ve yalnızca PostgreSQL üzerinde çalışır;
+diğer durumlarda no-op'tur. Sonraki ayların açılması ve süresi dolanların kaldırılması
+`notifications.maintain_partitions` görevi ile yapılır.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+from sytefy_backend.config import get_settings
+from sytefy_backend.modules.notifications.infrastructure.partitions import (
+    COLUMNS,
+    DEFAULT_PARTITION,
+    IS_PARTITIONED_SQL,
+    create_partition_sql,
+    months_to_create,
+)
+
+revision = "2024070410"
+down_revision = "2024070409"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_notifications_user_status_created", "user_id, status, created_at"),
+    ("ix_notifications_user_created", "user_id, created_at"),
+    ("ix_notifications_created", "created_at"),
+)
+
+
+def _is_partitioned(bind) -> bool:
+    return bool(bind.execute(sa.text(IS_PARTITIONED_SQL)).scalar())
+
+
+def _rename_legacy() -> None:
+    op.execute("ALTER TABLE notifications RENAME TO notifications_legacy")
+    op.execute("ALTER TABLE notifications_legacy RENAME CONSTRAINT notifications_pkey TO notifications_legacy_pkey")
+    for name, _ in INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {name} RENAME TO {name}_legacy")
+    # Sıra eski tabloyla birlikte silinmesin.
+    op.execute("ALTER SEQUENCE notifications_id_seq OWNED BY NONE")
+
+
+def _create_table(partitioned: bool) -> None:
+    primary_key = "PRIMARY KEY (id, created_at)" if partitioned else "PRIMARY KEY (id)"
+    suffix = " PARTITION BY RANGE (created_at)" if partitioned else ""
+    op.execute(
+        f"""
+        CREATE TABLE notifications (
+            id INTEGER NOT NULL DEFAULT nextval('notifications_id_seq'),
+            user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            title VARCHAR(255) NOT NULL,
+            body TEXT NOT NULL,
+            channel VARCHAR(20) NOT NULL DEFAULT 'log',
+            status VARCHAR(20) NOT NULL DEFAULT 'pending',
+            read_at TIMESTAMP WITH TIME ZONE NULL,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT notifications_pkey {primary_key}
+        ){suffix}
+        """
+    )
+    op.execute("ALTER SEQUENCE notifications_id_seq OWNED BY notifications.id")
+
+
+def _copy_and_drop_legacy() -> None:
+    op.execute(f"INSERT INTO notifications ({COLUMNS}) SELECT {COLUMNS} FROM notifications_legacy")
+    op.execute("DROP TABLE notifications_legacy")
+    for name, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON notifications ({columns})")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    settings = get_settings()
+    if bind.dialect.name != "postgresql" or not settings.notification_partitioning_enabled:
+        return
+    if _is_partitioned(bind):
+        return
+    oldest = bind.execute(sa.text("SELECT min(created_at) FROM notifications")).scalar()
+    now = datetime.now(timezone.utc)
+
+    _rename_legacy()
+    _create_table(partitioned=True)
+    for month in months_to_create(now, settings.notification_partition_months_ahead, start=oldest):
+        op.execute(create_partition_sql(month))
+    # Bakım görevi gecikirse eklemeler başarısız olmasın.
+    op.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF notifications DEFAULT")
+    _copy_and_drop_legacy()
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql" or not _is_partitioned(bind):
+        return
+    _rename_legacy()
+    _create_table(partitioned=False)
+    _copy_and_drop_legacy()
@@ -0,0 +1,55 @@
+"""add invoice daily rollups table"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "2024070411"
+down_revision = "2024070410"
+branch_labels = None
+depends_on = None
+
+BACKFILL_SQL = """
+INSERT INTO invoice_daily_rollups
+    (user_id, bucket, day, month, status, currency, customer_id, invoice_count, amount_total)
+SELECT user_id, bucket, day, date_trunc('month', day)::date, status, currency, customer_id, COUNT(*), SUM(amount)
+FROM (
+    SELECT user_id, 'issued' AS bucket, (issued_at AT TIME ZONE 'UTC')::date AS day,
+           status, currency, COALESCE(customer_id, 0) AS customer_id, amount
+    FROM invoices
+    UNION ALL
+    SELECT user_id, 'due', (due_date AT TIME ZONE 'UTC')::date,
+           status, currency, COALESCE(customer_id, 0), amount
+    FROM invoices
+) AS source
+GROUP BY user_id, bucket, day, status, currency, customer_id
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "invoice_daily_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("bucket", sa.String(length=8), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("currency", sa.String(length=8), nullable=False),
+        sa.Column("customer_id", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("invoice_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("amount_total", sa.Numeric(14, 2), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "uq_invoice_rollups_key",
+        "invoice_daily_rollups",
+        ["user_id", "bucket", "day", "status", "currency", "customer_id"],
+        unique=True,
+    )
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    op.drop_index("uq_invoice_rollups_key", table_name="invoice_daily_rollups")
+    op.drop_table("invoice_daily_rollups")
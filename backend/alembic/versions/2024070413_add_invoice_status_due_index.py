@@ -0,0 +1,18 @@
+"""add (status, due_date) index for the overdue invoice scan"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "2024070413"
+down_revision = "2024070412"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_invoices_status_due", "invoices", ["status", "due_date", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_invoices_status_due", table_name="invoices")
@@ -0,0 +1,26 @@
+"""add versioned fx rate table"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "2024070414"
+down_revision = "2024070413"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fx_rates",
+        sa.Column("version", sa.Integer(), primary_key=True),
+        sa.Column("currency", sa.String(length=8), primary_key=True),
+        sa.Column("base_currency", sa.String(length=8), nullable=False),
+        sa.Column("rate", sa.Numeric(20, 10), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("fx_rates")
@@ -0,0 +1,37 @@
+"""add normalized customer search text with trigram index"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "2024070415"
+down_revision = "2024070414"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column("customers", sa.Column("search_text", sa.String(length=600), nullable=False, server_default=""))
+    # `customer_search_text` ile aynı kurallar: Türkçe karakter katlama, küçük harf, telefonda yalnızca rakam.
+    op.execute(
+        r"""
+        UPDATE customers SET search_text = btrim(btrim(regexp_replace(
+            lower(translate(
+                name || ' ' || coalesce(email, ''),
+                'ıİşŞğĞüÜöÖçÇâÂîÎûÛ',
+                'iissgguuoocciiaauu'
+            )),
+            '[^a-z0-9@._+-]+', ' ', 'g'
+        )) || ' ' || regexp_replace(coalesce(phone, ''), '\D', '', 'g'))
+        """
+    )
+    op.execute("CREATE INDEX ix_customers_search_trgm ON customers USING gin (search_text gin_trgm_ops)")
+    op.execute("CREATE INDEX ix_customers_user_search_prefix ON customers (user_id, search_text text_pattern_ops)")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_customers_user_search_prefix", table_name="customers")
+    op.drop_index("ix_customers_search_trgm", table_name="customers")
+    op.drop_column("customers", "search_text")
@@ -0,0 +1,36 @@
+"""add hashed customer email/phone keys for import deduplication"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "2024070416"
+down_revision = "2024070415"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("customers", sa.Column("email_key", sa.String(length=255), nullable=True))
+    op.add_column("customers", sa.Column("phone_key", sa.String(length=16), nullable=True))
+    # `email_key` / `phone_key` ile aynı kurallar: küçük harf e-posta, telefonun son 10 hanesi (en az 7 hane).
+    op.execute(
+        r"""
+        UPDATE customers SET
+            email_key = nullif(lower(btrim(email)), ''),
+            phone_key = CASE
+                WHEN length(regexp_replace(coalesce(phone, ''), '\D', '', 'g')) >= 7
+                THEN right(regexp_replace(phone, '\D', '', 'g'), 10)
+            END
+        """
+    )
+    op.create_index("ix_customers_email_key", "customers", ["email_key"], postgresql_using="hash")
+    op.create_index("ix_customers_phone_key", "customers", ["phone_key"], postgresql_using="hash")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_customers_phone_key", table_name="customers")
+    op.drop_index("ix_customers_email_key", table_name="customers")
+    op.drop_column("customers", "phone_key")
+    op.drop_column("customers", "email_key")
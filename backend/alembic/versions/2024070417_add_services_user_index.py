@@ -0,0 +1,18 @@
+"""add services (user_id, name) index"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "2024070417"
+down_revision = "2024070416"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_services_user_name", "services", ["user_id", "name"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_services_user_name", table_name="services")
@@ -0,0 +1,71 @@
+"""add appointments per-user overlap exclusion constraint
+
+Kısıt eklenmeden önce iptal edilmemiş çakışan randevular aranır: her kullanıcı için başlangıç
+sırasıyla taranır ve daha önce gelen bir randevuyla çakışan kayıtlar toplanır. Çakışma varsa
+migration veriye dokunmadan durur ve kimlikleri listeler; operatör bunları (ve kuyruktaki
+hatırlatıcılarını) çözdükten sonra migration yeniden çalıştırılır.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "2024070418"
+down_revision = "2024070417"
+branch_labels = None
+depends_on = None
+
+
+def _overlapping_pairs(bind) -> list[tuple[int, int]]:
+    """`(çakışan, önceki)` kimlik çiftleri; önceki, o ana kadar en geç biten randevudur."""
+    rows = bind.execute(
+        sa.text(
+            """
+            SELECT id, user_id, start_at, end_at
+            FROM appointments
+            WHERE status <> 'cancelled'
+            ORDER BY user_id, start_at, id
+            """
+        )
+    )
+    pairs: list[tuple[int, int]] = []
+    current_user = None
+    kept_id, kept_end = None, None
+    for row in rows:
+        if row.user_id != current_user:
+            current_user, kept_id, kept_end = row.user_id, None, None
+        if kept_end is not None and row.start_at < kept_end:
+            pairs.append((row.id, kept_id))
+        if kept_end is None or row.end_at > kept_end:
+            kept_id, kept_end = row.id, row.end_at
+    return pairs
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    pairs = _overlapping_pairs(bind)
+    if pairs:
+        listed = ", ".join(f"#{later}↔#{earlier}" for later, earlier in pairs)
+        raise RuntimeError(
+            f"{len(pairs)} randevu çakışması dışlama kısıtını engelliyor: {listed}. "
+            "Bu randevuları iptal edin ya da taşıyın, hatırlatıcılarını geri çekin ve migration'ı yeniden çalıştırın."
+        )
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute(
+        """
+        ALTER TABLE appointments
+        ADD CONSTRAINT ex_appointments_user_overlap
+        EXCLUDE USING gist (user_id WITH =, tstzrange(start_at, end_at, '[)') WITH &&)
+        WHERE (status <> 'cancelled')
+        """
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    op.execute("ALTER TABLE appointments DROP CONSTRAINT IF EXISTS ex_appointments_user_overlap")
@@ -0,0 +1,39 @@
+"""add appointment recurrence columns and series indexes"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "2024070419"
+down_revision = "2024070418"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("appointments", sa.Column("recurrence_rule", sa.String(length=255), nullable=True))
+    op.add_column("appointments", sa.Column("recurrence_exceptions", sa.JSON(), nullable=True))
+    op.add_column("appointments", sa.Column("recurrence_until", sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        "ix_appointments_series_user_start",
+        "appointments",
+        ["user_id", "start_at"],
+        postgresql_where=sa.text("recurrence_rule IS NOT NULL"),
+        sqlite_where=sa.text("recurrence_rule IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_appointments_series_remind",
+        "appointments",
+        ["remind_at"],
+        postgresql_where=sa.text("recurrence_rule IS NOT NULL"),
+        sqlite_where=sa.text("recurrence_rule IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_appointments_series_remind", table_name="appointments")
+    op.drop_index("ix_appointments_series_user_start", table_name="appointments")
+    op.drop_column("appointments", "recurrence_until")
+    op.drop_column("appointments", "recurrence_exceptions")
+    op.drop_column("appointments", "recurrence_rule")
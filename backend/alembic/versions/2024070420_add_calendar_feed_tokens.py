@@ -0,0 +1,27 @@
+"""add calendar feed tokens and appointments (user_id, updated_at) index"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "2024070420"
+down_revision = "2024070419"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "calendar_feed_tokens",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True),
+        sa.Column("token_hash", sa.String(length=64), nullable=False, unique=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_appointments_user_updated", "appointments", ["user_id", "updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_appointments_user_updated", table_name="appointments")
+    op.drop_table("calendar_feed_tokens")
@@ -0,0 +1,39 @@
+"""exclude recurring series rows from the appointment overlap constraint
+
+Seri satırının `[start_at, end_at)` aralığı her zaman gerçek bir tekrar değildir (ilk tekrar
+atlanmış olabilir ya da DTSTART kurala uymayabilir); seriler kısıt yerine kullanıcı başına
+danışma kilidi altındaki uygulama denetimiyle korunur.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "2024070421"
+down_revision = "2024070420"
+branch_labels = None
+depends_on = None
+
+
+def _replace_constraint(predicate: str) -> None:
+    op.execute("ALTER TABLE appointments DROP CONSTRAINT IF EXISTS ex_appointments_user_overlap")
+    op.execute(
+        f"""
+        ALTER TABLE appointments
+        ADD CONSTRAINT ex_appointments_user_overlap
+        EXCLUDE USING gist (user_id WITH =, tstzrange(start_at, end_at, '[)') WITH &&)
+        WHERE ({predicate})
+        """
+    )
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    _replace_constraint("status <> 'cancelled' AND recurrence_rule IS NULL")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    _replace_constraint("status <> 'cancelled'")
@@ -6,10 +6,17 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from redis import Redis
 
 from sytefy_backend.config import get_settings
 from sytefy_backend.core.logging import configure_logging
 from sytefy_backend.core.observability import MetricsRecorder, ObservabilityMiddleware, metrics_endpoint
+from sytefy_backend.core.observability.queue_metrics import (
+    PendingReminderCollector,
+    QueueDepthCollector,
+    register_collector,
+)
+from sytefy_backend.core.redis import close_async_redis
 from sytefy_backend.core.security import (
     InMemoryRateLimiter,
     RateLimitConfig,
@@ -18,7 +25,10 @@ from sytefy_backend.core.security import (
     SecurityHeadersConfig,
     SecurityHeadersMiddleware,
 )
+from sytefy_backend.core.tasks.routing import PRIORITY_STEPS, build_task_queues
 from sytefy_backend.modules import api_router
+from sytefy_backend.modules.appointments.infrastructure.pending_reminders import get_pending_reminder_tracker
+from sytefy_backend.modules.finances.infrastructure.pdf_renderer import shutdown_invoice_pdf_renderer
 
 settings = get_settings()
 configure_logging()
@@ -27,6 +37,21 @@ configure_logging()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     yield
+    shutdown_invoice_pdf_renderer()
+    await close_async_redis()
+
+
+def _register_queue_collectors() -> None:
+    tracker = get_pending_reminder_tracker(settings)
+    if tracker is not None:
+        register_collector("pending_reminders", PendingReminderCollector(tracker.snapshot))
+    if settings.metrics_queue_depth_enabled:
+        broker = Redis.from_url(settings.celery_broker_url or settings.redis_url, socket_timeout=2)
+        queues = [queue.name for queue in build_task_queues(settings)]
+        register_collector(
+            "celery_queue_depth",
+            QueueDepthCollector(broker, queues, priority_steps=PRIORITY_STEPS),
+        )
 
 
 def create_app() -> FastAPI:
@@ -60,6 +85,7 @@ def create_app() -> FastAPI:
     @app.get("/api/health")
     async def health_check():
         return {"status": "ok"}
+    _register_queue_collectors()
     app.add_api_route("/metrics", metrics_endpoint, methods=["GET"], include_in_schema=False)
     return app
 
@@ -20,6 +20,7 @@ class Settings(BaseSettings):
     access_token_ttl_minutes: int = Field(default=15)
     refresh_token_ttl_days: int = Field(default=7)
     password_min_length: int = Field(default=12)
+    platform_admin_emails_raw: str = Field(default="", alias="PLATFORM_ADMIN_EMAILS")
 
     # Database
     database_url: str = Field(
@@ -31,6 +32,12 @@ class Settings(BaseSettings):
     redis_url: str = Field(default="redis://localhost:6379/0")
     celery_broker_url: str | None = Field(default=None)
     celery_result_backend: str | None = Field(default=None)
+    celery_task_ignore_result: bool = Field(default=True)
+    celery_result_expires_seconds: int = Field(default=3600)
+    celery_visibility_timeout_seconds: int = Field(default=3600)
+    celery_reminders_prefetch_multiplier: int = Field(default=1)
+    celery_notifications_prefetch_multiplier: int = Field(default=4)
+    celery_bulk_prefetch_multiplier: int = Field(default=1)
 
     # CORS / Security headers
     cors_allowed_origins_raw: str = Field(
@@ -63,6 +70,9 @@ class Settings(BaseSettings):
     celery_task_always_eager: bool = Field(default=True)
     reminder_offset_minutes: int = Field(default=30)
     reminder_max_retries: int = Field(default=3)
+    reminder_pending_backend: Literal["memory", "redis"] = Field(default="memory")
+    reminder_pending_key: str = Field(default="reminders:pending")
+    metrics_queue_depth_enabled: bool = Field(default=False)
     notification_email_from: str = Field(default="no-reply@sytefy.local")
     notification_email_enabled: bool = Field(default=True)
     notification_email_host: str | None = Field(default=None)
@@ -78,6 +88,89 @@ class Settings(BaseSettings):
     notification_sms_auth_token: str | None = Field(default=None)
     notification_sms_base_url: str = Field(default="https://api.twilio.com")
     notification_sms_timeout: float = Field(default=10.0)
+    notification_sms_http2: bool = Field(default=True)
+    notification_sms_max_connections: int = Field(default=20)
+    notification_sms_max_keepalive_connections: int = Field(default=10)
+    notification_sms_keepalive_expiry: float = Field(default=30.0)
+    notification_sms_batch_concurrency: int = Field(default=8)
+    notification_batch_enabled: bool = Field(default=False)
+    notification_batch_size: int = Field(default=50)
+    notification_batch_flush_seconds: float = Field(default=5.0)
+    notification_batch_backend: Literal["memory", "redis"] = Field(default="memory")
+    notification_batch_prefix: str = Field(default="notifications:batch")
+    notification_circuit_failure_threshold: int = Field(default=5)
+    notification_circuit_recovery_seconds: float = Field(default=30.0)
+    notification_circuit_half_open_max_calls: int = Field(default=1)
+    notification_circuit_backend: Literal["memory", "redis"] = Field(default="memory")
+    notification_circuit_prefix: str = Field(default="notifications:circuit")
+    notification_stream_backend: Literal["memory", "redis"] = Field(default="memory")
+    notification_stream_prefix: str = Field(default="notifications:user")
+    notification_stream_heartbeat_seconds: float = Field(default=15.0)
+    notification_stream_buffer_size: int = Field(default=100)
+    notification_stream_backlog_limit: int = Field(default=200)
+    notification_unread_backend: Literal["memory", "redis"] = Field(default="memory")
+    notification_unread_prefix: str = Field(default="notifications:unread")
+    notification_unread_ttl_seconds: int = Field(default=86400)
+    notification_retention_days: int = Field(default=180)
+    notification_purge_batch_size: int = Field(default=1000)
+    notification_purge_max_batches: int = Field(default=200)
+    notification_purge_interval_seconds: float = Field(default=3600.0)
+    notification_partitioning_enabled: bool = Field(default=False)
+    notification_partition_months_ahead: int = Field(default=3)
+    notification_broadcast_backend: Literal["memory", "redis"] = Field(default="memory")
+    notification_broadcast_prefix: str = Field(default="notifications:broadcast")
+    notification_broadcast_ttl_seconds: int = Field(default=86400)
+    notification_broadcast_chunk_size: int = Field(default=500)
+    export_batch_size: int = Field(default=1000)
+    export_storage_dir: str = Field(default="var/exports")
+    customer_import_storage_dir: str = Field(default="var/imports")
+    customer_import_batch_size: int = Field(default=500)
+    customer_import_inline_max_bytes: int = Field(default=262144)
+    customer_import_max_bytes: int = Field(default=52428800)
+    customer_import_default_country_code: str = Field(default="90")
+    service_catalog_backend: Literal["memory", "redis"] = Field(default="memory")
+    service_catalog_prefix: str = Field(default="services:catalog")
+    service_catalog_ttl_seconds: int = Field(default=3600)
+    service_catalog_max_users: int = Field(default=1024)
+    service_catalog_memory_ttl_seconds: float = Field(default=5.0)
+    availability_timezone: str = Field(default="Europe/Istanbul")
+    availability_work_start: str = Field(default="09:00")
+    availability_work_end: str = Field(default="18:00")
+    availability_work_days: str = Field(default="1,2,3,4,5")
+    availability_buffer_minutes: int = Field(default=0)
+    availability_step_minutes: int = Field(default=15)
+    recurrence_expansion_days: int = Field(default=90)
+    recurring_reminder_scan_seconds: int = Field(default=300)
+    recurring_reminder_batch_size: int = Field(default=500)
+    calendar_feed_past_days: int = Field(default=30)
+    calendar_feed_future_days: int = Field(default=365)
+    calendar_feed_refresh_minutes: int = Field(default=15)
+    calendar_feed_batch_size: int = Field(default=500)
+    appointment_import_storage_dir: str = Field(default="var/imports/appointments")
+    appointment_import_batch_size: int = Field(default=500)
+    appointment_import_inline_max_bytes: int = Field(default=262144)
+    appointment_import_max_bytes: int = Field(default=52428800)
+    invoice_number_backend: Literal["database", "redis"] = Field(default="database")
+    invoice_number_prefix: str = Field(default="invoices:sequence")
+    invoice_number_block_size: int = Field(default=20)
+    invoice_number_format: str = Field(default="INV-{user_id}-{year}-{seq:06d}")
+    invoice_pdf_renderer: Literal["process", "celery"] = Field(default="process")
+    invoice_pdf_process_workers: int = Field(default=2)
+    invoice_pdf_cache_dir: str = Field(default="var/invoice-pdfs")
+    invoice_overdue_scan_interval_seconds: float = Field(default=900.0)
+    invoice_overdue_batch_size: int = Field(default=500)
+    invoice_overdue_max_batches: int = Field(default=100)
+    invoice_overdue_notification_channel: str = Field(default="log")
+    fx_base_currency: str = Field(default="TRY")
+    fx_rates_file: str | None = Field(default=None)
+    fx_rate_cache_ttl_seconds: float = Field(default=60.0)
+    notification_throttle_backend: Literal["memory", "redis"] = Field(default="memory")
+    notification_throttle_prefix: str = Field(default="notifications:throttle")
+    notification_throttle_max_wait_seconds: float = Field(default=30.0)
+    notification_email_rate_per_second: float = Field(default=5.0)
+    notification_email_burst: int = Field(default=10)
+    notification_sms_rate_per_second: float = Field(default=10.0)
+    notification_sms_burst: int = Field(default=10)
 
     @property
     def cors_allowed_origins(self) -> List[str]:
@@ -93,6 +186,10 @@ class Settings(BaseSettings):
                 pass
         return [origin.strip() for origin in raw.split(",") if origin.strip()]
 
+    @property
+    def platform_admin_emails(self) -> set[str]:
+        return {email.strip().lower() for email in self.platform_admin_emails_raw.split(",") if email.strip()}
+
     @field_validator("database_url", mode="before")
     @classmethod
     def ensure_async_driver(cls, value: str) -> str:
@@ -23,6 +23,11 @@ class AuthorizationError(ApplicationError):
     detail = "Bu işlem için yetkiniz bulunmuyor."
 
 
+class ConflictError(ApplicationError):
+    status_code = 409
+    detail = "Kayıt zaten mevcut."
+
+
 class ValidationError(ApplicationError):
     status_code = 422
     detail = "Gönderilen veriler doğrulama kurallarına uymuyor."
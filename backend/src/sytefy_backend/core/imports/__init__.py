@@ -0,0 +1,30 @@
+from .reader import (
+    MAX_REPORTED_ERRORS,
+    CsvColumns,
+    ImportRowError,
+    chunked,
+    clean_text,
+    iter_text_lines,
+    report_errors,
+    sample_starts_with,
+    unfold_lines,
+)
+from .runner import BatchCallback, ImportJobRunner
+from .storage import IImportStorage, ImportJob, LocalImportStorage
+
+__all__ = [
+    "BatchCallback",
+    "CsvColumns",
+    "IImportStorage",
+    "ImportJob",
+    "ImportJobRunner",
+    "ImportRowError",
+    "LocalImportStorage",
+    "MAX_REPORTED_ERRORS",
+    "chunked",
+    "clean_text",
+    "iter_text_lines",
+    "report_errors",
+    "sample_starts_with",
+    "unfold_lines",
+]
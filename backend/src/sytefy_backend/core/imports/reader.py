@@ -0,0 +1,134 @@
+"""İçe aktarma dosyaları için ortak akış yardımcıları.
+
+Dosyalar bellekte tutulmadan satır satır okunur; kayıtlar `chunked` ile sabit boyutlu
+parçalar halinde işlenir. Satır hataları yanıtta `MAX_REPORTED_ERRORS` ile sınırlanır.
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import itertools
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Collection, Iterable, Iterator, Mapping, TypeVar
+
+from sytefy_backend.core.exceptions import ApplicationError
+
+MAX_REPORTED_ERRORS = 100
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class ImportRowError:
+    line: int
+    reason: str
+
+
+def sample_starts_with(sample: bytes, marker: bytes) -> bool:
+    """Biçim sezimi: BOM ve baştaki boşluklar atlanarak büyük/küçük harf duyarsız karşılaştırılır."""
+    return sample.removeprefix(codecs.BOM_UTF8).lstrip().upper().startswith(marker)
+
+
+def clean_text(value: str | None) -> str | None:
+    text = (value or "").strip()
+    return text or None
+
+
+def report_errors(reported: list[ImportRowError], errors: list[ImportRowError]) -> None:
+    """Parçanın hatalarını satır sırasına dizer; yanıtta yalnızca ilk `MAX_REPORTED_ERRORS` satır tutulur.
+
+    Tam rapor arka plan işinde `on_batch` ile dosyaya yazılır.
+    """
+    errors.sort(key=lambda error: error.line)
+    reported.extend(errors[: max(0, MAX_REPORTED_ERRORS - len(reported))])
+
+
+def iter_text_lines(handle: BinaryIO) -> Iterator[str]:
+    """UTF-8 (BOM'lu ya da BOM'suz) satırlar; çözülemeyen satırlar Windows-1254 (Türkçe Excel) sayılır."""
+    for index, raw in enumerate(handle):
+        if index == 0:
+            raw = raw.removeprefix(codecs.BOM_UTF8)
+        try:
+            yield raw.decode("utf-8")
+        except UnicodeDecodeError:
+            yield raw.decode("cp1254", errors="replace")
+
+
+def unfold_lines(lines: Iterable[str]) -> Iterator[tuple[int, str]]:
+    """Katlanmış satırları birleştirir; mantıksal satır ilk fiziksel satır numarasıyla döner.
+
+    RFC 6350/5545: boşluk ya da sekmeyle başlayan satır bir önceki satırın devamıdır.
+    """
+    current: str | None = None
+    start = 0
+    for number, line in enumerate(lines, start=1):
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield start, current
+        current, start = line, number
+    if current is not None:
+        yield start, current
+
+
+class CsvColumns:
+    """CSV başlığını eş anlamlı sütun adlarıyla eşler; satırlar `(satır no, sütun -> değer)` olarak okunur.
+
+    Başlık `normalize` ile katlanıp `aliases` kümelerinde aranır; aynı sütun birden çok kez
+    eşleşirse ilki kullanılır. Eşlenmeyen sütunların değeri `None` döner.
+    """
+
+    def __init__(
+        self,
+        lines: Iterable[str],
+        aliases: Mapping[str, Collection[str]],
+        *,
+        normalize: Callable[[str], str],
+    ):
+        lines = iter(lines)
+        header_line = next(lines, None)
+        if header_line is None:
+            raise ApplicationError("İçe aktarma dosyası boş.")
+        # Türkçe yerel ayarlı Excel `;` ayırıcıyla kaydeder.
+        delimiter = ";" if header_line.count(";") > header_line.count(",") else ","
+        self._reader = csv.reader(itertools.chain([header_line], lines), delimiter=delimiter)
+        self._positions: dict[str, int] = {}
+        for index, title in enumerate(next(self._reader)):
+            key = normalize(title)
+            for column, names in aliases.items():
+                if key in names:
+                    self._positions.setdefault(column, index)
+
+    def __contains__(self, column: str) -> bool:
+        return column in self._positions
+
+    def __iter__(self) -> Iterator[tuple[int, dict[str, str | None]]]:
+        for row in self._reader:
+            if not any(cell.strip() for cell in row):
+                continue
+            yield self._reader.line_num, {
+                column: clean_text(row[index]) if index < len(row) else None
+                for column, index in self._positions.items()
+            }
+
+
+def chunked(records: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(records)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+__all__ = [
+    "CsvColumns",
+    "ImportRowError",
+    "MAX_REPORTED_ERRORS",
+    "chunked",
+    "clean_text",
+    "iter_text_lines",
+    "report_errors",
+    "sample_starts_with",
+    "unfold_lines",
+]
@@ -0,0 +1,69 @@
+"""Kuyruğa alınmış içe aktarma işlerinin worker tarafında çalıştırılması.
+
+Durum geçişleri (`running` → `completed`/`failed`), dosya konumu, satır hata raporu ve yüklenen
+dosyanın silinmesi modüllerden bağımsızdır; modüller yalnızca ayrıştırma ve içe aktarıcıyı verir.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, ClassVar, Generic, Iterator, TypeVar
+
+from sytefy_backend.core.exceptions import ApplicationError
+from sytefy_backend.core.imports.reader import ImportRowError, iter_text_lines
+from sytefy_backend.core.imports.storage import IImportStorage, ImportJob
+
+J = TypeVar("J", bound=ImportJob)
+R = TypeVar("R")
+
+BatchCallback = Callable[[R, list[ImportRowError]], None]
+
+
+class ImportJobRunner(Generic[J, R]):
+    """Yüklenen dosyayı işler; ilerleme ve satır hataları her parçada yazılır.
+
+    `progress_fields` sonuç nesnesinden işe her parçada kopyalanan sayaçlardır.
+    """
+
+    progress_fields: ClassVar[tuple[str, ...]] = ()
+
+    def __init__(self, storage: IImportStorage[J]):
+        self._storage = storage
+
+    async def run(
+        self,
+        *,
+        user_id: int,
+        job_id: str,
+        process: Callable[[J, Iterator[str], BatchCallback[R]], Awaitable[Any]],
+    ) -> J:
+        job = self._storage.get(user_id=user_id, job_id=job_id)
+        if job is None:
+            raise ApplicationError("İçe aktarma işi bulunamadı.")
+        job.status = "running"
+        self._storage.save(job)
+        source = self._storage.source_path(job)
+        try:
+            with source.open("rb") as handle:
+
+                def progress(result: R, errors: list[ImportRowError]) -> None:
+                    job.position = handle.tell()
+                    for name in self.progress_fields:
+                        setattr(job, name, getattr(result, name))
+                    self._storage.append_errors(job, errors)
+                    self._storage.save(job)
+
+                await process(job, iter_text_lines(handle), progress)
+        except Exception as exc:
+            job.status = "failed"
+            job.error = str(exc)
+            self._storage.save(job)
+            raise
+        finally:
+            source.unlink(missing_ok=True)
+        job.status = "completed"
+        job.position = job.size
+        self._storage.save(job)
+        return job
+
+
+__all__ = ["BatchCallback", "ImportJobRunner"]
@@ -0,0 +1,94 @@
+"""İçe aktarma işlerinin yerel diskte saklanması.
+
+Yüklenen dosya `<kök>/<user_id>/<job_id>.upload`, durum `<job_id>.json`, satır hata raporu
+`<job_id>.errors.csv` olarak tutulur. Kök dizin web ve worker süreçleri arasında paylaşılan
+bir birim olmalıdır; yüklenen dosya iş bitince silinir.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import re
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Generic, Protocol, Sequence, TypeVar
+
+from sytefy_backend.core.imports.reader import ImportRowError
+
+_JOB_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+class ImportJob(Protocol):
+    job_id: str
+    user_id: int
+    format: str
+    status: str
+    size: int
+    position: int
+    error: str | None
+
+
+J = TypeVar("J", bound=ImportJob)
+
+
+class IImportStorage(Protocol[J]):
+    def save(self, job: J) -> None: ...
+
+    def get(self, *, user_id: int, job_id: str) -> J | None: ...
+
+    def source_path(self, job: J) -> Path: ...
+
+    def errors_path(self, job: J) -> Path: ...
+
+    def append_errors(self, job: J, errors: Sequence[ImportRowError]) -> None: ...
+
+
+class LocalImportStorage(Generic[J]):
+    """İş durumunu JSON olarak saklar; `job_type` okunan kaydın dataclass'ıdır."""
+
+    def __init__(self, root: str | Path, *, job_type: type[J]):
+        self._root = Path(root)
+        self._job_type = job_type
+
+    def _dir(self, user_id: int) -> Path:
+        return self._root / str(user_id)
+
+    def _meta(self, user_id: int, job_id: str) -> Path:
+        return self._dir(user_id) / f"{job_id}.json"
+
+    def source_path(self, job: J) -> Path:
+        return self._dir(job.user_id) / f"{job.job_id}.upload"
+
+    def errors_path(self, job: J) -> Path:
+        return self._dir(job.user_id) / f"{job.job_id}.errors.csv"
+
+    def save(self, job: J) -> None:
+        target = self._meta(job.user_id, job.job_id)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(asdict(job)), encoding="utf-8")  # type: ignore[call-overload]
+        os.replace(tmp, target)
+
+    def get(self, *, user_id: int, job_id: str) -> J | None:
+        if not _JOB_ID.match(job_id):
+            return None
+        try:
+            data: dict[str, Any] = json.loads(self._meta(user_id, job_id).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        return self._job_type(**data)
+
+    def append_errors(self, job: J, errors: Sequence[ImportRowError]) -> None:
+        target = self.errors_path(job)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not target.exists()
+        with target.open("a", encoding="utf-8", newline="") as handle:
+            writer = csv.writer(handle)
+            if is_new:
+                writer.writerow(["line", "reason"])
+            writer.writerows((error.line, error.reason) for error in errors)
+
+
+__all__ = ["IImportStorage", "ImportJob", "LocalImportStorage"]
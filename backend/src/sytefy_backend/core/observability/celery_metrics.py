@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from prometheus_client import Counter
+from datetime import datetime, timezone
+
+from prometheus_client import Counter, Gauge, Histogram
 
 ReminderTaskCounter = Counter(
     "sytefy_reminder_tasks_total",
@@ -14,6 +16,66 @@ ReminderChannelCounter = Counter(
     "Kanal bazlı reminder teslimat sonuçları.",
     labelnames=("channel", "status"),
 )
+ProviderLatencyHistogram = Histogram(
+    "sytefy_notification_provider_duration_seconds",
+    "E-posta/SMS sağlayıcı çağrılarının süresi.",
+    labelnames=("provider", "outcome"),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+ProviderCircuitStateGauge = Gauge(
+    "sytefy_notification_provider_circuit_state",
+    "Sağlayıcı devre kesici durumu (0=closed, 1=half_open, 2=open).",
+    labelnames=("provider",),
+)
+CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+ThrottleWaitHistogram = Histogram(
+    "sytefy_notification_throttle_wait_seconds",
+    "Sağlayıcı gönderim izni için beklenen süre.",
+    labelnames=("provider",),
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+ReminderDispatchLagHistogram = Histogram(
+    "sytefy_reminder_dispatch_lag_seconds",
+    "Hatırlatıcı görevinin başlama anı ile remind_at arasındaki gecikme.",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0),
+)
+ChannelSendDurationHistogram = Histogram(
+    "sytefy_reminder_channel_send_duration_seconds",
+    "Kanal bazlı gönderim süresi.",
+    labelnames=("channel",),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+ReminderDeliveryHistogram = Histogram(
+    "sytefy_reminder_delivery_seconds",
+    "remind_at ile başarılı teslimat arasındaki uçtan uca süre.",
+    labelnames=("channel",),
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0),
+)
+InvoiceOverdueRowsHistogram = Histogram(
+    "sytefy_invoice_overdue_rows_per_run",
+    "Vade taramasının tek çalışmada overdue yaptığı fatura sayısı.",
+    buckets=(0, 1, 10, 50, 100, 500, 1000, 5000, 10000, 50000),
+)
+InvoiceOverdueRunDurationHistogram = Histogram(
+    "sytefy_invoice_overdue_run_duration_seconds",
+    "Vade taraması çalışmasının toplam süresi.",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+
+
+def _seconds_since(remind_at: str | datetime | None, now: datetime | None = None) -> float | None:
+    if remind_at is None:
+        return None
+    if isinstance(remind_at, str):
+        try:
+            remind_at = datetime.fromisoformat(remind_at)
+        except ValueError:
+            return None
+    if remind_at.tzinfo is None:
+        remind_at = remind_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    # Eager/erken çalıştırmalarda negatif gecikme anlamsız; sıfıra sabitlenir.
+    return max(0.0, (now - remind_at).total_seconds())
 
 
 def record_reminder_task_outcome(status: str) -> None:
@@ -24,9 +86,57 @@ def record_reminder_channel_event(channel: str, status: str) -> None:
     ReminderChannelCounter.labels(channel=channel, status=status).inc()
 
 
+def record_provider_latency(provider: str, outcome: str, duration_seconds: float) -> None:
+    ProviderLatencyHistogram.labels(provider=provider, outcome=outcome).observe(duration_seconds)
+
+
+def record_provider_circuit_state(provider: str, state: str) -> None:
+    ProviderCircuitStateGauge.labels(provider=provider).set(CIRCUIT_STATE_VALUES.get(state, 0))
+
+
+def record_throttle_wait(provider: str, wait_seconds: float) -> None:
+    ThrottleWaitHistogram.labels(provider=provider).observe(wait_seconds)
+
+
+def record_reminder_dispatch_lag(remind_at: str | datetime | None, now: datetime | None = None) -> None:
+    lag = _seconds_since(remind_at, now)
+    if lag is not None:
+        ReminderDispatchLagHistogram.observe(lag)
+
+
+def record_channel_send_duration(channel: str, duration_seconds: float) -> None:
+    ChannelSendDurationHistogram.labels(channel=channel).observe(duration_seconds)
+
+
+def record_reminder_delivery(channel: str, remind_at: str | datetime | None, now: datetime | None = None) -> None:
+    elapsed = _seconds_since(remind_at, now)
+    if elapsed is not None:
+        ReminderDeliveryHistogram.labels(channel=channel).observe(elapsed)
+
+
+def record_invoice_overdue_run(rows: int, duration_seconds: float) -> None:
+    InvoiceOverdueRowsHistogram.observe(rows)
+    InvoiceOverdueRunDurationHistogram.observe(duration_seconds)
+
+
 __all__ = [
     "ReminderTaskCounter",
     "ReminderChannelCounter",
+    "ProviderLatencyHistogram",
+    "ProviderCircuitStateGauge",
+    "ThrottleWaitHistogram",
+    "ReminderDispatchLagHistogram",
+    "ChannelSendDurationHistogram",
+    "ReminderDeliveryHistogram",
+    "InvoiceOverdueRowsHistogram",
+    "InvoiceOverdueRunDurationHistogram",
     "record_reminder_task_outcome",
     "record_reminder_channel_event",
+    "record_provider_latency",
+    "record_provider_circuit_state",
+    "record_throttle_wait",
+    "record_reminder_dispatch_lag",
+    "record_channel_send_duration",
+    "record_reminder_delivery",
+    "record_invoice_overdue_run",
 ]
@@ -0,0 +1,98 @@
+"""Scrape anında hesaplanan kuyruk derinliği ve bekleyen hatırlatıcı metrikleri."""
+
+from __future__ import annotations
+
+from typing import Callable, Iterable, Sequence
+
+import structlog
+from prometheus_client import REGISTRY
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector, CollectorRegistry
+from redis import Redis
+from redis.exceptions import RedisError
+
+logger = structlog.get_logger("sytefy.observability.queues")
+
+# (bekleyen toplam, vadesi geçmiş sayısı, en eski vadesi geçmiş kaydın yaşı sn)
+PendingSnapshot = tuple[int, int, float | None]
+
+
+class QueueDepthCollector(Collector):
+    """Redis broker kuyruklarının uzunluğunu öncelik alt listeleriyle birlikte raporlar."""
+
+    def __init__(self, redis: Redis, queues: Sequence[str], *, priority_steps: Iterable[int] = (0,), sep: str = ":"):
+        self._redis = redis
+        self._queues = tuple(queues)
+        self._steps = tuple(priority_steps)
+        self._sep = sep
+
+    def _keys(self, queue: str) -> list[str]:
+        # kombu Redis transport'u 0 dışındaki öncelikleri `kuyruk{sep}{öncelik}` listelerinde tutar.
+        return [queue if step == 0 else f"{queue}{self._sep}{step}" for step in self._steps]
+
+    def collect(self):
+        family = GaugeMetricFamily(
+            "sytefy_celery_queue_depth",
+            "Broker kuyruğunda bekleyen Celery mesajı sayısı.",
+            labels=("queue",),
+        )
+        try:
+            with self._redis.pipeline(transaction=False) as pipe:
+                for queue in self._queues:
+                    for key in self._keys(queue):
+                        pipe.llen(key)
+                lengths = pipe.execute()
+        except RedisError as exc:
+            logger.warning("observability.queue_depth.failed", error=str(exc))
+            return
+        per_queue = len(self._steps)
+        for index, queue in enumerate(self._queues):
+            family.add_metric([queue], sum(lengths[index * per_queue : (index + 1) * per_queue]))
+        yield family
+
+
+class PendingReminderCollector(Collector):
+    """Zamanı gelmiş ama henüz çalışmamış hatırlatıcıları raporlar."""
+
+    def __init__(self, snapshot: Callable[[], PendingSnapshot]):
+        self._snapshot = snapshot
+
+    def collect(self):
+        try:
+            pending, overdue, oldest_age = self._snapshot()
+        except RedisError as exc:
+            logger.warning("observability.pending_reminders.failed", error=str(exc))
+            return
+        counts = GaugeMetricFamily(
+            "sytefy_reminders_pending",
+            "Kuyruğa alınmış ve henüz başlamamış hatırlatıcılar.",
+            labels=("state",),
+        )
+        counts.add_metric(["scheduled"], pending - overdue)
+        counts.add_metric(["overdue"], overdue)
+        yield counts
+        yield GaugeMetricFamily(
+            "sytefy_reminder_oldest_overdue_seconds",
+            "Zamanı geçmiş en eski bekleyen hatırlatıcının yaşı.",
+            value=oldest_age or 0.0,
+        )
+
+
+_registered: dict[str, Collector] = {}
+
+
+def register_collector(name: str, collector: Collector, registry: CollectorRegistry = REGISTRY) -> None:
+    """Aynı isimle ikinci kez kayıt yapılırsa önceki toplayıcıyı değiştirir."""
+    previous = _registered.pop(name, None)
+    if previous is not None:
+        registry.unregister(previous)
+    registry.register(collector)
+    _registered[name] = collector
+
+
+__all__ = [
+    "PendingReminderCollector",
+    "PendingSnapshot",
+    "QueueDepthCollector",
+    "register_collector",
+]
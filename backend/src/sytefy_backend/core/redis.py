@@ -0,0 +1,35 @@
+"""Event loop başına paylaşılan `redis.asyncio` istemcileri.
+
+asyncio istemcisinin bağlantıları oluşturuldukları döngüye bağlıdır. API süreci tek döngüde
+çalışır; Celery görevleri her çalıştırmada `asyncio.run` ile yeni döngü açar. Bu yüzden
+istemciler döngü başına tutulur ve döngü kapanmadan `close_async_redis` ile kapatılır.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+
+from redis.asyncio import Redis
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Redis]]" = weakref.WeakKeyDictionary()
+
+
+def get_async_redis(url: str) -> Redis:
+    loop = asyncio.get_running_loop()
+    clients = _clients.setdefault(loop, {})
+    client = clients.get(url)
+    if client is None:
+        client = Redis.from_url(url, decode_responses=True, socket_timeout=2)
+        clients[url] = client
+    return client
+
+
+async def close_async_redis() -> None:
+    """Çalışan döngüye bağlı istemcileri kapatır."""
+    clients = _clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
+
+
+__all__ = ["close_async_redis", "get_async_redis"]
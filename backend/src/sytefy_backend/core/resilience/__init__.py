@@ -0,0 +1,27 @@
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitOpenError,
+    InMemoryCircuitBreakerStore,
+    RedisCircuitBreakerStore,
+)
+from .throttle import (
+    InMemoryTokenBucketStore,
+    RedisTokenBucketStore,
+    Throttle,
+    ThrottleTimeoutError,
+    TokenBucketConfig,
+)
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitBreakerConfig",
+    "CircuitOpenError",
+    "InMemoryCircuitBreakerStore",
+    "RedisCircuitBreakerStore",
+    "InMemoryTokenBucketStore",
+    "RedisTokenBucketStore",
+    "Throttle",
+    "ThrottleTimeoutError",
+    "TokenBucketConfig",
+]
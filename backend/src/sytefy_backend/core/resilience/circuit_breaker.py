@@ -0,0 +1,229 @@
+"""Worker'lar arası paylaşılabilen devre kesici (circuit breaker)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Protocol
+
+from redis import Redis
+from redis.exceptions import WatchError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    half_open_max_calls: int = 1
+
+
+@dataclass
+class CircuitSnapshot:
+    state: str = CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    probes: int = 0
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} devresi açık; {retry_after:.1f} sn sonra tekrar denenecek.")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreakerStore(Protocol):
+    def get(self, name: str) -> CircuitSnapshot: ...
+
+    def incr_failures(self, name: str) -> int: ...
+
+    def acquire_probe(self, name: str) -> int: ...
+
+    def release_probe(self, name: str) -> None: ...
+
+    def open(self, name: str, opened_at: float) -> None: ...
+
+    def close(self, name: str) -> None: ...
+
+
+class InMemoryCircuitBreakerStore(CircuitBreakerStore):
+    def __init__(self):
+        self._circuits: dict[str, CircuitSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def _snapshot(self, name: str) -> CircuitSnapshot:
+        return self._circuits.setdefault(name, CircuitSnapshot())
+
+    def get(self, name: str) -> CircuitSnapshot:
+        with self._lock:
+            current = self._snapshot(name)
+            return CircuitSnapshot(current.state, current.failures, current.opened_at, current.probes)
+
+    def incr_failures(self, name: str) -> int:
+        with self._lock:
+            current = self._snapshot(name)
+            current.failures += 1
+            return current.failures
+
+    def acquire_probe(self, name: str) -> int:
+        with self._lock:
+            current = self._snapshot(name)
+            current.probes += 1
+            return current.probes
+
+    def release_probe(self, name: str) -> None:
+        with self._lock:
+            current = self._snapshot(name)
+            if current.state == OPEN and current.probes > 0:
+                current.probes -= 1
+
+    def open(self, name: str, opened_at: float) -> None:
+        with self._lock:
+            self._circuits[name] = CircuitSnapshot(state=OPEN, opened_at=opened_at)
+
+    def close(self, name: str) -> None:
+        with self._lock:
+            self._circuits[name] = CircuitSnapshot()
+
+
+class RedisCircuitBreakerStore(CircuitBreakerStore):
+    """Devre durumunu Redis hash'inde tutar; tüm worker'lar aynı durumu görür."""
+
+    def __init__(self, redis: Redis, prefix: str = "circuit"):
+        self._redis = redis
+        self._prefix = prefix.rstrip(":")
+
+    def _key(self, name: str) -> str:
+        return f"{self._prefix}:{name}"
+
+    def get(self, name: str) -> CircuitSnapshot:
+        raw = self._redis.hgetall(self._key(name))
+        if not raw:
+            return CircuitSnapshot()
+        data = {
+            (key.decode() if isinstance(key, bytes) else key): (value.decode() if isinstance(value, bytes) else value)
+            for key, value in raw.items()
+        }
+        return CircuitSnapshot(
+            state=data.get("state", CLOSED),
+            failures=int(data.get("failures", 0)),
+            opened_at=float(data.get("opened_at", 0.0)),
+            probes=int(data.get("probes", 0)),
+        )
+
+    def incr_failures(self, name: str) -> int:
+        return int(self._redis.hincrby(self._key(name), "failures", 1))
+
+    def acquire_probe(self, name: str) -> int:
+        return int(self._redis.hincrby(self._key(name), "probes", 1))
+
+    def release_probe(self, name: str) -> None:
+        key = self._key(name)
+        with self._redis.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(key)
+                    state, probes = pipe.hmget(key, "state", "probes")
+                    if isinstance(state, bytes):
+                        state = state.decode()
+                    if state != OPEN or int(probes or 0) <= 0:
+                        pipe.unwatch()
+                        return
+                    pipe.multi()
+                    pipe.hincrby(key, "probes", -1)
+                    pipe.execute()
+                    return
+                except WatchError:
+                    continue
+
+    def open(self, name: str, opened_at: float) -> None:
+        self._redis.hset(
+            self._key(name),
+            mapping={"state": OPEN, "failures": 0, "opened_at": opened_at, "probes": 0},
+        )
+
+    def close(self, name: str) -> None:
+        self._redis.delete(self._key(name))
+
+
+@dataclass
+class CircuitBreaker:
+    """Ardışık hatalarda devreyi açar, `recovery_timeout` sonrası yarı açık deneme yapar."""
+
+    name: str
+    store: CircuitBreakerStore
+    config: CircuitBreakerConfig = field(default_factory=CircuitBreakerConfig)
+    clock: Callable[[], float] = time.time
+    on_state_change: Callable[[str, str], None] | None = None
+
+    def _notify(self, state: str) -> None:
+        if self.on_state_change:
+            self.on_state_change(self.name, state)
+
+    def state(self) -> str:
+        snapshot = self.store.get(self.name)
+        if snapshot.state == OPEN and self.clock() - snapshot.opened_at >= self.config.recovery_timeout:
+            return HALF_OPEN
+        return snapshot.state
+
+    def before_call(self) -> None:
+        """Çağrıya izin verilmiyorsa `CircuitOpenError` fırlatır."""
+        snapshot = self.store.get(self.name)
+        if snapshot.state != OPEN:
+            self._notify(CLOSED)
+            return
+        elapsed = self.clock() - snapshot.opened_at
+        recovery = self.config.recovery_timeout
+        if elapsed < recovery:
+            self._notify(OPEN)
+            raise CircuitOpenError(self.name, recovery - elapsed)
+        if self.store.acquire_probe(self.name) <= self.config.half_open_max_calls:
+            self._notify(HALF_OPEN)
+            return
+        if elapsed >= recovery * 2:
+            # Deneme çağrısı sonuç bildirmeden kaybolduysa yeni bir deneme penceresi aç.
+            self.store.open(self.name, self.clock() - recovery)
+            self.store.acquire_probe(self.name)
+            self._notify(HALF_OPEN)
+            return
+        self._notify(HALF_OPEN)
+        raise CircuitOpenError(self.name, recovery)
+
+    def release(self) -> None:
+        """`before_call` izni sağlayıcıya ulaşmadan bırakıldığında (ör. kısıtlama zaman aşımı) yarı açık deneme hakkını iade eder."""
+        self.store.release_probe(self.name)
+
+    def record_success(self) -> None:
+        snapshot = self.store.get(self.name)
+        if snapshot.state != CLOSED or snapshot.failures:
+            self.store.close(self.name)
+            self._notify(CLOSED)
+
+    def record_failure(self) -> None:
+        snapshot = self.store.get(self.name)
+        if snapshot.state == OPEN:
+            self.store.open(self.name, self.clock())
+            self._notify(OPEN)
+            return
+        if self.store.incr_failures(self.name) >= self.config.failure_threshold:
+            self.store.open(self.name, self.clock())
+            self._notify(OPEN)
+
+
+__all__ = [
+    "CLOSED",
+    "OPEN",
+    "HALF_OPEN",
+    "CircuitBreaker",
+    "CircuitBreakerConfig",
+    "CircuitBreakerStore",
+    "CircuitOpenError",
+    "CircuitSnapshot",
+    "InMemoryCircuitBreakerStore",
+    "RedisCircuitBreakerStore",
+]
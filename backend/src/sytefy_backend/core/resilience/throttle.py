@@ -0,0 +1,135 @@
+"""Sağlayıcı hesabı başına dağıtık token-bucket hız sınırlayıcı."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Protocol
+
+from redis import Redis
+from redis.exceptions import WatchError
+
+
+@dataclass(frozen=True)
+class TokenBucketConfig:
+    rate_per_second: float
+    capacity: int
+
+
+class ThrottleTimeoutError(Exception):
+    def __init__(self, name: str, wait_seconds: float, retry_after: float | None = None):
+        super().__init__(f"{name} için gönderim izni {wait_seconds:.1f} sn içinde alınamadı.")
+        self.name = name
+        self.wait_seconds = wait_seconds
+        self.retry_after = wait_seconds if retry_after is None else retry_after
+
+
+def _refill(tokens: float | None, updated_at: float | None, now: float, config: TokenBucketConfig) -> float:
+    if tokens is None or updated_at is None:
+        return float(config.capacity)
+    elapsed = max(0.0, now - updated_at)
+    return min(float(config.capacity), tokens + elapsed * config.rate_per_second)
+
+
+class TokenBucketStore(Protocol):
+    def try_acquire(self, key: str, config: TokenBucketConfig, tokens: int = 1) -> float:
+        """İzin alınırsa 0, alınamazsa beklenmesi gereken saniyeyi döndürür."""
+        ...
+
+
+class InMemoryTokenBucketStore(TokenBucketStore):
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self._clock = clock
+
+    def try_acquire(self, key: str, config: TokenBucketConfig, tokens: int = 1) -> float:
+        with self._lock:
+            now = self._clock()
+            current, updated_at = self._buckets.get(key, (None, None))
+            available = _refill(current, updated_at, now, config)
+            if available < tokens:
+                self._buckets[key] = (available, now)
+                return (tokens - available) / config.rate_per_second
+            self._buckets[key] = (available - tokens, now)
+            return 0.0
+
+
+class RedisTokenBucketStore(TokenBucketStore):
+    """Kova durumunu Redis hash'inde tutar; WATCH/MULTI ile atomik günceller."""
+
+    def __init__(self, redis: Redis, prefix: str = "throttle", clock: Callable[[], float] = time.time):
+        self._redis = redis
+        self._prefix = prefix.rstrip(":")
+        self._clock = clock
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}:{key}"
+
+    def try_acquire(self, key: str, config: TokenBucketConfig, tokens: int = 1) -> float:
+        redis_key = self._key(key)
+        ttl = max(1, math.ceil(config.capacity / config.rate_per_second) + 1)
+        with self._redis.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(redis_key)
+                    raw_tokens, raw_updated = pipe.hmget(redis_key, "tokens", "updated_at")
+                    now = self._clock()
+                    available = _refill(
+                        float(raw_tokens) if raw_tokens is not None else None,
+                        float(raw_updated) if raw_updated is not None else None,
+                        now,
+                        config,
+                    )
+                    if available < tokens:
+                        pipe.unwatch()
+                        return (tokens - available) / config.rate_per_second
+                    pipe.multi()
+                    pipe.hset(redis_key, mapping={"tokens": available - tokens, "updated_at": now})
+                    pipe.expire(redis_key, ttl)
+                    pipe.execute()
+                    return 0.0
+                except WatchError:
+                    continue
+
+
+@dataclass
+class Throttle:
+    """Gönderim izni alınana kadar bekler; `max_wait` aşılırsa `ThrottleTimeoutError` fırlatır."""
+
+    name: str
+    key: str
+    store: TokenBucketStore
+    config: TokenBucketConfig
+    max_wait: float = 30.0
+    sleep: Callable[[float], None] = time.sleep
+    on_wait: Callable[[str, float], None] | None = field(default=None)
+
+    def acquire(self) -> float:
+        started = time.perf_counter()
+        planned = 0.0
+        while True:
+            wait = self.store.try_acquire(self.key, self.config)
+            if wait <= 0:
+                waited = time.perf_counter() - started
+                if self.on_wait:
+                    self.on_wait(self.name, waited)
+                return waited
+            if planned + wait > self.max_wait:
+                if self.on_wait:
+                    self.on_wait(self.name, time.perf_counter() - started)
+                raise ThrottleTimeoutError(self.name, planned + wait, retry_after=wait)
+            self.sleep(wait)
+            planned += wait
+
+
+__all__ = [
+    "InMemoryTokenBucketStore",
+    "RedisTokenBucketStore",
+    "Throttle",
+    "ThrottleTimeoutError",
+    "TokenBucketConfig",
+    "TokenBucketStore",
+]
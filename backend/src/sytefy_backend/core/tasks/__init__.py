@@ -1,3 +1,4 @@
 from .celery_app import celery_app, create_celery_app
+from .runner import run_async
 
-__all__ = ["celery_app", "create_celery_app"]
+__all__ = ["celery_app", "create_celery_app", "run_async"]
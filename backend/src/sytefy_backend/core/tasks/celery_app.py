@@ -5,11 +5,23 @@ from __future__ import annotations
 from functools import lru_cache
 
 from celery import Celery
+from celery.signals import worker_init
 
 from sytefy_backend.config import get_settings
+from sytefy_backend.core.tasks.routing import (
+    DEFAULT_QUEUE,
+    PRIORITY_STEPS,
+    QueueAnnotations,
+    build_task_queues,
+    build_task_routes,
+    prefetch_for_queues,
+)
 
 CELERY_IMPORTS = (
     "sytefy_backend.modules.appointments.tasks",
+    "sytefy_backend.modules.customers.tasks",
+    "sytefy_backend.modules.exports.tasks",
+    "sytefy_backend.modules.finances.tasks",
     "sytefy_backend.modules.notifications.tasks",
 )
 
@@ -31,10 +43,64 @@ def create_celery_app() -> Celery:
         enable_utc=True,
         timezone="UTC",
         task_default_retry_delay=60,
+        task_queues=build_task_queues(settings),
+        task_default_queue=DEFAULT_QUEUE,
+        task_default_routing_key=DEFAULT_QUEUE,
+        task_routes=build_task_routes(settings),
+        task_annotations=(QueueAnnotations(settings),),
+        task_default_priority=5,
+        # Hatırlatıcı sonuçları (müşteri iletişim bilgisi içerir) okunmuyor; saklanmaz.
+        task_ignore_result=settings.celery_task_ignore_result,
+        result_expires=settings.celery_result_expires_seconds,
+        broker_transport_options={
+            "priority_steps": PRIORITY_STEPS,
+            "sep": ":",
+            "queue_order_strategy": "priority",
+            "visibility_timeout": settings.celery_visibility_timeout_seconds,
+        },
+        worker_prefetch_multiplier=settings.celery_notifications_prefetch_multiplier,
     )
+    beat_schedule: dict[str, dict] = {}
+    if settings.notification_batch_enabled:
+        beat_schedule["notifications-flush-batches"] = {
+            "task": "notifications.flush_batches",
+            "schedule": settings.notification_batch_flush_seconds,
+        }
+    if settings.notification_retention_days > 0:
+        beat_schedule["notifications-purge-expired"] = {
+            "task": "notifications.purge_expired",
+            "schedule": settings.notification_purge_interval_seconds,
+        }
+    if settings.notification_partitioning_enabled:
+        beat_schedule["notifications-maintain-partitions"] = {
+            "task": "notifications.maintain_partitions",
+            "schedule": 86400.0,
+        }
+    if settings.invoice_overdue_scan_interval_seconds > 0:
+        beat_schedule["finances-mark-overdue"] = {
+            "task": "finances.mark_overdue",
+            "schedule": settings.invoice_overdue_scan_interval_seconds,
+        }
+    if settings.recurring_reminder_scan_seconds > 0:
+        beat_schedule["appointments-materialize-series-reminders"] = {
+            "task": "appointments.materialize_series_reminders",
+            "schedule": settings.recurring_reminder_scan_seconds,
+        }
+    if beat_schedule:
+        app.conf.beat_schedule = beat_schedule
     return app
 
 
+@worker_init.connect
+def _apply_queue_prefetch(sender=None, **_: object) -> None:
+    """`-Q` ile seçilen kuyrukların profiline göre worker prefetch çarpanını ayarlar."""
+    if sender is None:
+        return
+    multiplier = prefetch_for_queues(tuple(sender.app.amqp.queues.consume_from), get_settings())
+    if multiplier is not None:
+        sender.prefetch_multiplier = multiplier
+
+
 celery_app = create_celery_app()
 
 __all__ = ["celery_app", "create_celery_app"]
@@ -0,0 +1,126 @@
+"""Celery kuyruk, öncelik ve worker profili tanımları."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+
+from kombu import Queue
+
+from sytefy_backend.config.settings import Settings
+
+DEFAULT_QUEUE = "default"
+REMINDERS_QUEUE = "reminders"
+NOTIFICATIONS_QUEUE = "notifications"
+BULK_QUEUE = "bulk"
+
+# Redis broker'da 0 en yüksek önceliktir.
+PRIORITY_STEPS = list(range(10))
+
+
+@dataclass(frozen=True, slots=True)
+class QueueProfile:
+    name: str
+    priority: int
+    prefetch_multiplier: int
+    acks_late: bool
+
+
+# Görev adı → kuyruk; toplu işler `bulk.*` adını kullanır.
+TASK_QUEUES: dict[str, str] = {
+    "appointments.send_reminder": REMINDERS_QUEUE,
+    "notifications.deliver": NOTIFICATIONS_QUEUE,
+    "notifications.deliver_many": NOTIFICATIONS_QUEUE,
+    "notifications.flush_batches": NOTIFICATIONS_QUEUE,
+    "notifications.retry_delivery": NOTIFICATIONS_QUEUE,
+    "notifications.purge_expired": BULK_QUEUE,
+    "notifications.maintain_partitions": BULK_QUEUE,
+    "finances.mark_overdue": BULK_QUEUE,
+    "bulk.*": BULK_QUEUE,
+}
+
+
+def queue_profiles(settings: Settings) -> dict[str, QueueProfile]:
+    return {
+        REMINDERS_QUEUE: QueueProfile(
+            name=REMINDERS_QUEUE,
+            priority=0,
+            prefetch_multiplier=settings.celery_reminders_prefetch_multiplier,
+            acks_late=True,
+        ),
+        NOTIFICATIONS_QUEUE: QueueProfile(
+            name=NOTIFICATIONS_QUEUE,
+            priority=3,
+            prefetch_multiplier=settings.celery_notifications_prefetch_multiplier,
+            acks_late=True,
+        ),
+        DEFAULT_QUEUE: QueueProfile(
+            name=DEFAULT_QUEUE,
+            priority=5,
+            prefetch_multiplier=settings.celery_notifications_prefetch_multiplier,
+            acks_late=False,
+        ),
+        BULK_QUEUE: QueueProfile(
+            name=BULK_QUEUE,
+            priority=9,
+            prefetch_multiplier=settings.celery_bulk_prefetch_multiplier,
+            acks_late=True,
+        ),
+    }
+
+
+def build_task_queues(settings: Settings) -> tuple[Queue, ...]:
+    return tuple(Queue(name, routing_key=name) for name in queue_profiles(settings))
+
+
+def build_task_routes(settings: Settings) -> dict[str, dict]:
+    profiles = queue_profiles(settings)
+    return {
+        pattern: {"queue": queue, "routing_key": queue, "priority": profiles[queue].priority}
+        for pattern, queue in TASK_QUEUES.items()
+    }
+
+
+def queue_for_task(name: str) -> str:
+    queue = TASK_QUEUES.get(name)
+    if queue is not None:
+        return queue
+    for pattern, candidate in TASK_QUEUES.items():
+        if fnmatchcase(name, pattern):
+            return candidate
+    return DEFAULT_QUEUE
+
+
+class QueueAnnotations:
+    """`task_annotations` girdisi: acks_late ayarını görevin kuyruk profilinden uygular."""
+
+    def __init__(self, settings: Settings):
+        self._profiles = queue_profiles(settings)
+
+    def annotate(self, task) -> dict | None:
+        profile = self._profiles[queue_for_task(task.name)]
+        return {"acks_late": profile.acks_late, "reject_on_worker_lost": profile.acks_late}
+
+
+def prefetch_for_queues(queue_names: list[str] | tuple[str, ...], settings: Settings) -> int | None:
+    """Worker'ın dinlediği kuyruklar için en temkinli prefetch çarpanını döndürür."""
+    profiles = queue_profiles(settings)
+    values = [profiles[name].prefetch_multiplier for name in queue_names if name in profiles]
+    return min(values) if values else None
+
+
+__all__ = [
+    "BULK_QUEUE",
+    "DEFAULT_QUEUE",
+    "NOTIFICATIONS_QUEUE",
+    "PRIORITY_STEPS",
+    "QueueProfile",
+    "REMINDERS_QUEUE",
+    "TASK_QUEUES",
+    "QueueAnnotations",
+    "build_task_queues",
+    "build_task_routes",
+    "prefetch_for_queues",
+    "queue_for_task",
+    "queue_profiles",
+]
@@ -0,0 +1,25 @@
+"""Celery görevlerinden eşzamansız kod çalıştırma."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+from sytefy_backend.core.redis import close_async_redis
+
+T = TypeVar("T")
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """`asyncio.run` gibi çalışır; döngü kapanmadan ona bağlı Redis istemcilerini kapatır."""
+
+    async def _main() -> T:
+        try:
+            return await coro
+        finally:
+            await close_async_redis()
+
+    return asyncio.run(_main())
+
+
+__all__ = ["run_async"]
@@ -0,0 +1,4 @@
+from .conditional import etag_matches, not_modified
+from .streaming import open_streaming_session, stream_and_close
+
+__all__ = ["etag_matches", "not_modified", "open_streaming_session", "stream_and_close"]
@@ -0,0 +1,38 @@
+"""Koşullu GET yardımcıları (`If-None-Match`, `If-Modified-Since`).
+
+`If-None-Match` RFC 9110'daki zayıf karşılaştırmayla değerlendirilir: `W/` öneki iki tarafta da
+yok sayılır ve `*` mevcut her temsille eşleşir. Başlık varsa `If-Modified-Since` dikkate alınmaz.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+
+from starlette.requests import Request
+
+
+def _opaque(tag: str) -> str:
+    return tag.strip().removeprefix("W/")
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {_opaque(value) for value in if_none_match.split(",")}
+    return "*" in candidates or _opaque(etag) in candidates
+
+
+def not_modified(request: Request, etag: str, last_modified: datetime | None = None) -> bool:
+    """İstemcideki kopya güncelse `True`; çağıran 304 döndürür."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if last_modified is None or not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return since.tzinfo is not None and last_modified.replace(microsecond=0) <= since
@@ -0,0 +1,28 @@
+"""Veritabanından akan yanıt gövdeleri için oturum yardımcıları.
+
+`StreamingResponse` gövdesi istek bağımlılıkları (ve `get_db` oturumu) kapandıktan sonra akar.
+İmleç bu yüzden aynı bağlantı havuzundan açılan ayrı bir oturumda tutulur ve gövde bitince
+ya da istemci bağlantıyı kestiğinde kapatılır.
+"""
+
+from __future__ import annotations
+
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def open_streaming_session(db: AsyncSession) -> AsyncSession:
+    return AsyncSession(bind=db.bind, expire_on_commit=False)
+
+
+async def stream_and_close(stream: AsyncIterator[str] | AsyncIterator[bytes], session: AsyncSession) -> AsyncIterator[bytes]:
+    """Gövdeyi UTF-8 baytlarına çevirerek iletir; akış nasıl biterse bitsin oturumu kapatır."""
+    try:
+        async for chunk in stream:
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+    finally:
+        await session.close()
+
+
+__all__ = ["open_streaming_session", "stream_and_close"]
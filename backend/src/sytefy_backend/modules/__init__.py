@@ -6,6 +6,9 @@ from sytefy_backend.modules.users.web.router import router as users_router
 from sytefy_backend.modules.appointments.web.router import router as appointments_router
 from sytefy_backend.modules.services.web.router import router as services_router
 from sytefy_backend.modules.notifications.web.router import router as notifications_router
+from sytefy_backend.modules.exports.web.router import router as exports_router
+from sytefy_backend.modules.finances.web.router import fx_router as finance_fx_router
+from sytefy_backend.modules.finances.web.router import reports_router as finance_reports_router
 from sytefy_backend.modules.finances.web.router import router as finances_router
 
 api_router = APIRouter(prefix="/api")
@@ -16,5 +19,8 @@ api_router.include_router(appointments_router)
 api_router.include_router(services_router)
 api_router.include_router(notifications_router)
 api_router.include_router(finances_router)
+api_router.include_router(finance_reports_router)
+api_router.include_router(finance_fx_router)
+api_router.include_router(exports_router)
 
 __all__ = ["api_router"]
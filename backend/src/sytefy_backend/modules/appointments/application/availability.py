@@ -0,0 +1,186 @@
+"""Boş randevu aralıklarının hesaplanması.
+
+Dolu aralıklar tek sorguda (başlangıca göre sıralı) okunur, serilerin pencereye düşen tekrarları
+eklenir; hepsi tampon süresi kadar genişletilip tek geçişte birleştirilir. Çalışma pencereleri gün sırasıyla üretildiğinden birleştirilmiş liste
+üzerinde geriye dönmeyen tek bir işaretçi yeterlidir; toplam maliyet O(n log n + gün + slot).
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Iterator, Sequence
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sytefy_backend.core.exceptions import ApplicationError, NotFoundError
+from sytefy_backend.modules.appointments.application.interfaces import IAppointmentRepository
+from sytefy_backend.modules.appointments.application.recurrence import occurrence_intervals
+from sytefy_backend.modules.appointments.domain.entities import (
+    MAX_APPOINTMENT_DURATION,
+    AvailabilitySlot,
+    WorkingHours,
+)
+from sytefy_backend.modules.services.application.interfaces import IServiceRepository
+
+Interval = tuple[datetime, datetime]
+
+MAX_AVAILABILITY_DAYS = 62
+# Randevu süresi üst sınırla kısıtlı olduğundan daha geride başlayan randevu pencereye taşamaz.
+BUSY_LOOKBACK = MAX_APPOINTMENT_DURATION
+
+
+def parse_working_hours(start: str, end: str, weekdays: str, tz: str) -> WorkingHours:
+    """`"09:00"`, `"18:00"`, `"1,2,3,4,5"`, `"Europe/Istanbul"` biçimindeki ayarları okur."""
+    try:
+        hours = WorkingHours(
+            start=datetime.strptime(start, "%H:%M").time(),
+            end=datetime.strptime(end, "%H:%M").time(),
+            weekdays=frozenset(int(day) for day in weekdays.split(",") if day.strip()),
+            timezone=tz,
+        )
+        ZoneInfo(tz)
+    except (ValueError, ZoneInfoNotFoundError) as exc:
+        raise ApplicationError("Çalışma saatleri ayarı geçersiz.") from exc
+    if hours.end <= hours.start or not hours.weekdays <= set(range(1, 8)):
+        raise ApplicationError("Çalışma saatleri ayarı geçersiz.")
+    return hours
+
+
+def merge_intervals(intervals: Iterable[Interval], *, buffer: timedelta = timedelta(0)) -> list[Interval]:
+    """Aralıkları her iki yönde `buffer` kadar genişletip çakışan ya da bitişik olanları birleştirir."""
+    merged: list[Interval] = []
+    for start, end in sorted((start - buffer, end + buffer) for start, end in intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def working_windows(date_from: date, date_to: date, hours: WorkingHours) -> Iterator[Interval]:
+    """Her iş günü için yerel saatle tanımlı çalışma penceresini UTC olarak üretir (yaz saati dahil)."""
+    zone = ZoneInfo(hours.timezone)
+    day = date_from
+    while day <= date_to:
+        if day.isoweekday() in hours.weekdays:
+            start = datetime.combine(day, hours.start, tzinfo=zone).astimezone(timezone.utc)
+            end = datetime.combine(day, hours.end, tzinfo=zone).astimezone(timezone.utc)
+            yield start, end
+        day += timedelta(days=1)
+
+
+def free_slots(
+    busy: Sequence[Interval],
+    windows: Iterable[Interval],
+    *,
+    duration: timedelta,
+    step: timedelta,
+    not_before: datetime | None = None,
+) -> list[AvailabilitySlot]:
+    """`busy` birleştirilmiş ve sıralı olmalı; pencereler de artan sırada gelmelidir."""
+    slots: list[AvailabilitySlot] = []
+    index = 0
+    for window_start, window_end in windows:
+        # Adım ızgarası pencere başına hizalanır; geçmiş saatler atlanır.
+        cursor = window_start
+        if not_before is not None and not_before > cursor:
+            cursor = window_start + -(-(not_before - window_start) // step) * step
+        while index < len(busy) and busy[index][1] <= cursor:
+            index += 1
+        scan = index
+        while cursor + duration <= window_end:
+            while scan < len(busy) and busy[scan][1] <= cursor:
+                scan += 1
+            if scan < len(busy) and busy[scan][0] < cursor + duration:
+                # Çakışan aralığın sonrasındaki ilk ızgara noktasına atlanır.
+                cursor = window_start + -(-(busy[scan][1] - window_start) // step) * step
+                continue
+            slots.append(AvailabilitySlot(start_at=cursor, end_at=cursor + duration))
+            cursor += step
+        index = scan
+    return slots
+
+
+class GetAvailability:
+    def __init__(
+        self,
+        repo: IAppointmentRepository,
+        services: IServiceRepository,
+        hours: WorkingHours,
+        *,
+        default_buffer_minutes: int = 0,
+        default_step_minutes: int = 15,
+    ):
+        self._repo = repo
+        self._services = services
+        self._hours = hours
+        self._default_buffer = default_buffer_minutes
+        self._default_step = default_step_minutes
+
+    async def _duration(self, *, user_id: int, service_id: int | None, duration_minutes: int | None) -> int:
+        if service_id is not None:
+            service = await self._services.get_by_id(service_id)
+            if not service or service.user_id != user_id:
+                raise NotFoundError("Hizmet bulunamadı")
+            if service.status != "active":
+                raise ApplicationError("Hizmet aktif değil.")
+            return service.duration_minutes
+        if duration_minutes is None:
+            raise ApplicationError("Hizmet ya da süre belirtilmeli.")
+        return duration_minutes
+
+    async def __call__(
+        self,
+        *,
+        user_id: int,
+        date_from: date,
+        date_to: date,
+        service_id: int | None = None,
+        duration_minutes: int | None = None,
+        buffer_minutes: int | None = None,
+        step_minutes: int | None = None,
+        now: datetime | None = None,
+    ) -> tuple[int, list[AvailabilitySlot]]:
+        if date_to < date_from:
+            raise ApplicationError("Bitiş tarihi başlangıçtan önce olamaz.")
+        if (date_to - date_from).days >= MAX_AVAILABILITY_DAYS:
+            raise ApplicationError(f"En fazla {MAX_AVAILABILITY_DAYS} günlük aralık sorgulanabilir.")
+        minutes = await self._duration(user_id=user_id, service_id=service_id, duration_minutes=duration_minutes)
+        if minutes <= 0:
+            raise ApplicationError("Süre 0'dan büyük olmalı.")
+        buffer = timedelta(minutes=self._default_buffer if buffer_minutes is None else buffer_minutes)
+        step = timedelta(minutes=step_minutes or self._default_step)
+
+        windows = list(working_windows(date_from, date_to, self._hours))
+        if not windows:
+            return minutes, []
+        range_start, range_end = windows[0][0] - buffer, windows[-1][1] + buffer
+        busy = await self._repo.busy_intervals(
+            user_id=user_id,
+            start=range_start,
+            end=range_end,
+            lookback=BUSY_LOOKBACK,
+        )
+        series = await self._repo.list_series(
+            user_id=user_id, start_from=range_start, start_to=range_end, blocking_only=True
+        )
+        for item in series:
+            busy.extend(occurrence_intervals(item, tz=self._hours.timezone, start=range_start, end=range_end))
+        slots = free_slots(
+            merge_intervals(busy, buffer=buffer),
+            windows,
+            duration=timedelta(minutes=minutes),
+            step=step,
+            not_before=now or datetime.now(timezone.utc),
+        )
+        return minutes, slots
+
+
+__all__ = [
+    "GetAvailability",
+    "MAX_AVAILABILITY_DAYS",
+    "free_slots",
+    "merge_intervals",
+    "parse_working_hours",
+    "working_windows",
+]
@@ -0,0 +1,129 @@
+"""Takvim aboneliği (webcal): belirteçle erişilen, akışla üretilen ICS beslemesi.
+
+Pencere UTC gün başına hizalanır; ETag ve `Last-Modified` kullanıcının en büyük `updated_at`
+değeri ile pencere başlangıcından türetildiği için içerik değişmedikçe aynı kalır ve birkaç
+dakikada bir yoklayan istemciler tek indeks okumasıyla 304 alır.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import secrets
+from datetime import datetime, time, timedelta, timezone
+from typing import AsyncIterator
+
+from sytefy_backend.core.exceptions import NotFoundError
+from sytefy_backend.modules.appointments.application.ics import CALENDAR_FOOTER, calendar_header, render_event
+from sytefy_backend.modules.appointments.application.interfaces import (
+    IAppointmentRepository,
+    ICalendarFeedTokenRepository,
+)
+from sytefy_backend.modules.appointments.application.recurrence import iter_occurrences
+from sytefy_backend.modules.appointments.domain.entities import Appointment, CalendarFeed
+
+# Ağa yazılan parçaların hedef boyutu (karakter).
+FEED_CHUNK_SIZE = 16384
+
+
+def hash_feed_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class RotateCalendarFeedToken:
+    """Yeni belirteç üretir; eski abonelik adresi geçersiz olur. Yalnızca özeti saklanır."""
+
+    def __init__(self, tokens: ICalendarFeedTokenRepository):
+        self._tokens = tokens
+
+    async def __call__(self, *, user_id: int) -> str:
+        token = secrets.token_urlsafe(32)
+        await self._tokens.rotate(user_id=user_id, token_hash=hash_feed_token(token))
+        return token
+
+
+class RevokeCalendarFeedToken:
+    def __init__(self, tokens: ICalendarFeedTokenRepository):
+        self._tokens = tokens
+
+    async def __call__(self, *, user_id: int) -> None:
+        if not await self._tokens.revoke(user_id=user_id):
+            raise NotFoundError("Takvim aboneliği bulunamadı.")
+
+
+class GetCalendarFeed:
+    def __init__(
+        self,
+        repo: IAppointmentRepository,
+        tokens: ICalendarFeedTokenRepository,
+        *,
+        tz: str,
+        past_days: int,
+        future_days: int,
+        domain: str,
+        product_name: str,
+        refresh_minutes: int,
+        batch_size: int = 500,
+    ):
+        self._repo = repo
+        self._tokens = tokens
+        self._tz = tz
+        self._past = timedelta(days=past_days)
+        self._future = timedelta(days=future_days)
+        self._domain = domain
+        self._product_name = product_name
+        self._refresh_minutes = refresh_minutes
+        self._batch_size = batch_size
+
+    async def resolve(self, token: str, *, now: datetime | None = None) -> CalendarFeed:
+        user_id = await self._tokens.user_id_for(hash_feed_token(token))
+        if user_id is None:
+            raise NotFoundError("Takvim aboneliği bulunamadı.")
+        today = datetime.combine((now or datetime.now(timezone.utc)).date(), time(), tzinfo=timezone.utc)
+        window_start, window_end = today - self._past, today + self._future
+        updated = await self._repo.last_modified(user_id=user_id)
+        last_modified = max(updated, today) if updated else today
+        fingerprint = "|".join(
+            str(part)
+            for part in (user_id, updated and updated.isoformat(), window_start.date(), window_end.date(), self._tz, self._domain)
+        )
+        etag = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:32]
+        return CalendarFeed(
+            user_id=user_id,
+            window_start=window_start,
+            window_end=window_end,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    async def _events(self, feed: CalendarFeed) -> AsyncIterator[Appointment]:
+        async for appointment in self._repo.stream_window(
+            user_id=feed.user_id, start=feed.window_start, end=feed.window_end, batch_size=self._batch_size
+        ):
+            yield appointment
+        series = await self._repo.list_series(user_id=feed.user_id, start_from=feed.window_start, start_to=feed.window_end)
+        for item in series:
+            for occurrence in iter_occurrences(item, tz=self._tz, start_from=feed.window_start, start_to=feed.window_end):
+                if occurrence.start_at < feed.window_end:
+                    yield occurrence
+
+    async def stream(self, feed: CalendarFeed) -> AsyncIterator[str]:
+        yield calendar_header(product_name=self._product_name, name=self._product_name, refresh_minutes=self._refresh_minutes)
+        buffer: list[str] = []
+        size = 0
+        async for appointment in self._events(feed):
+            event = render_event(appointment, domain=self._domain)
+            buffer.append(event)
+            size += len(event)
+            if size >= FEED_CHUNK_SIZE:
+                yield "".join(buffer)
+                buffer, size = [], 0
+        buffer.append(CALENDAR_FOOTER)
+        yield "".join(buffer)
+
+
+__all__ = [
+    "GetCalendarFeed",
+    "RevokeCalendarFeedToken",
+    "RotateCalendarFeedToken",
+    "hash_feed_token",
+]
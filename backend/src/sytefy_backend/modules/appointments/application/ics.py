@@ -1,11 +1,19 @@
-"""ICS export helpers for appointments."""
+"""ICS export helpers for appointments.
+
+Çıktı deterministiktir: `DTSTAMP` kaydın `updated_at` değerinden gelir, satırlar RFC 5545'e göre
+75 oktette katlanır. Akış üreten uçlar başlık, olay ve kapanış parçalarını ayrı ayrı kullanır.
+"""
 
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Iterable
 
 from sytefy_backend.modules.appointments.domain.entities import Appointment
 
+MAX_LINE_OCTETS = 75
+CALENDAR_FOOTER = "END:VCALENDAR\r\n"
+
 
 def _format_dt(dt: datetime) -> str:
     if dt.tzinfo is None:
@@ -21,19 +29,56 @@ def _escape_text(value: str | None) -> str:
     return value.replace("\\", "\\\\").replace("\n", "\\n").replace(",", "\\,").replace(";", "\\;")
 
 
-def generate_ics(appointment: Appointment, *, domain: str = "sytefy.local", product_name: str = "Sytefy") -> str:
-    """Create VCALENDAR string for given appointment."""
-    now = datetime.now(timezone.utc)
-    uid = f"appointment-{appointment.id}@{domain}"
+def fold_line(line: str) -> str:
+    """Satırı 75 oktetlik parçalara böler (çok baytlı karakterler bölünmez); CRLF ile biter."""
+    if len(line.encode("utf-8")) <= MAX_LINE_OCTETS:
+        return line + "\r\n"
+    parts: list[str] = []
+    current: list[str] = []
+    size = 0
+    for char in line:
+        width = len(char.encode("utf-8"))
+        if size + width > MAX_LINE_OCTETS:
+            parts.append("".join(current))
+            # Devam satırı bir boşlukla başlar; o da sınıra dahildir.
+            current, size = [], 1
+        current.append(char)
+        size += width
+    parts.append("".join(current))
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def event_stamp(appointment: Appointment) -> datetime:
+    return appointment.updated_at or appointment.created_at or appointment.start_at
+
+
+def event_uid(appointment: Appointment, *, domain: str) -> str:
+    if appointment.recurrence_id is not None:
+        return f"appointment-{appointment.id}-{_format_dt(appointment.recurrence_id)}@{domain}"
+    return f"appointment-{appointment.id}@{domain}"
+
+
+def calendar_header(*, product_name: str, name: str | None = None, refresh_minutes: int | None = None) -> str:
     lines = [
         "BEGIN:VCALENDAR",
         "VERSION:2.0",
         f"PRODID:-//{product_name}//Appointments//TR",
         "CALSCALE:GREGORIAN",
         "METHOD:PUBLISH",
+    ]
+    if name:
+        lines.append(f"X-WR-CALNAME:{_escape_text(name)}")
+    if refresh_minutes:
+        lines.append(f"REFRESH-INTERVAL;VALUE=DURATION:PT{refresh_minutes}M")
+        lines.append(f"X-PUBLISHED-TTL:PT{refresh_minutes}M")
+    return "".join(fold_line(line) for line in lines)
+
+
+def render_event(appointment: Appointment, *, domain: str) -> str:
+    lines = [
         "BEGIN:VEVENT",
-        f"UID:{uid}",
-        f"DTSTAMP:{_format_dt(now)}",
+        f"UID:{event_uid(appointment, domain=domain)}",
+        f"DTSTAMP:{_format_dt(event_stamp(appointment))}",
         f"DTSTART:{_format_dt(appointment.start_at)}",
         f"DTEND:{_format_dt(appointment.end_at)}",
         f"SUMMARY:{_escape_text(appointment.title)}",
@@ -42,13 +87,34 @@ def generate_ics(appointment: Appointment, *, domain: str = "sytefy.local", prod
         lines.append(f"DESCRIPTION:{_escape_text(appointment.description)}")
     if appointment.location:
         lines.append(f"LOCATION:{_escape_text(appointment.location)}")
-    lines.extend(
-        [
-            "END:VEVENT",
-            "END:VCALENDAR",
-        ]
-    )
-    return "\r\n".join(lines) + "\r\n"
+    if appointment.status == "cancelled":
+        lines.append("STATUS:CANCELLED")
+    lines.append("END:VEVENT")
+    return "".join(fold_line(line) for line in lines)
+
+
+def generate_ics(
+    appointment: Appointment,
+    *,
+    domain: str = "sytefy.local",
+    product_name: str = "Sytefy",
+    occurrences: Iterable[Appointment] | None = None,
+) -> str:
+    """Create VCALENDAR string for given appointment.
+
+    Seriler için `occurrences` (pencereyle sınırlı üreteç) verilir; her tekrar ayrı VEVENT olur.
+    """
+    events = [appointment] if occurrences is None else occurrences
+    body = "".join(render_event(event, domain=domain) for event in events)
+    return calendar_header(product_name=product_name) + body + CALENDAR_FOOTER
 
 
-__all__ = ["generate_ics"]
+__all__ = [
+    "CALENDAR_FOOTER",
+    "calendar_header",
+    "event_stamp",
+    "event_uid",
+    "fold_line",
+    "generate_ics",
+    "render_event",
+]
@@ -0,0 +1,582 @@
+"""Randevu içe aktarma: ICS/CSV akış ayrıştırma, parça parça doğrulama, çakışma denetimi ve toplu ekleme.
+
+Dosya satır satır okunur ve `batch_size`'lık parçalar halinde işlenir. Her parçada müşteriler
+e-posta/telefon anahtarlarıyla tek sorguda eşlenir, çakışmalar mevcut randevulara karşı tek
+`find_conflicts` çağrısıyla, dosya içinde ise sıralı aralık listesiyle denetlenir; geçerli kayıtlar
+tek çok satırlı INSERT ile eklenir. Gelecekteki randevuların hatırlatıcıları parça başına tek
+`schedule_many` çağrısıyla kuyruğa alınır ve hatırlatıcı alanları tek UPDATE ile yazılır.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Iterator, Sequence
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sytefy_backend.core.exceptions import ApplicationError, ConflictError
+from sytefy_backend.core.imports import (
+    CsvColumns,
+    ImportJobRunner,
+    ImportRowError,
+    chunked,
+    clean_text,
+    report_errors,
+    sample_starts_with,
+    unfold_lines,
+)
+from sytefy_backend.modules.appointments.application.interfaces import (
+    IAppointmentImportStorage,
+    IAppointmentRepository,
+)
+from sytefy_backend.modules.appointments.application.reminders import ReminderRequest, ScheduleAppointmentReminder
+from sytefy_backend.modules.appointments.application.use_cases import (
+    SeriesReminderPlanner,
+    find_conflicts,
+    prepare_recurrence,
+    schedule_intervals,
+    validate_duration,
+    build_reminder_payloads,
+)
+from sytefy_backend.modules.appointments.domain.entities import (
+    MAX_APPOINTMENT_DURATION,
+    Appointment,
+    AppointmentImportJob,
+)
+from sytefy_backend.modules.customers.application.contacts import (
+    DEFAULT_COUNTRY_CODE,
+    email_key,
+    normalize_email,
+    normalize_phone,
+    phone_key,
+)
+from sytefy_backend.modules.customers.application.interfaces import ICustomerRepository
+from sytefy_backend.modules.customers.application.loader import CustomerLoader
+from sytefy_backend.modules.customers.application.search import normalize_search_text
+
+ALLOWED_APPOINTMENT_IMPORT_FORMATS = {"ics", "csv"}
+MAX_RECURRENCE_RULE_LENGTH = 255
+
+_CSV_COLUMNS = {
+    "title": {"title", "summary", "subject", "baslik", "konu", "randevu"},
+    "start": {"start", "start_at", "start time", "baslangic", "baslangic zamani", "baslangic tarihi"},
+    "end": {"end", "end_at", "end time", "bitis", "bitis zamani", "bitis tarihi"},
+    "duration": {"duration", "duration minutes", "sure", "sure dk", "dakika"},
+    "description": {"description", "notes", "note", "aciklama", "not", "notlar"},
+    "location": {"location", "place", "yer", "konum", "adres"},
+    "channel": {"channel", "kanal"},
+    "email": {"email", "e-mail", "e-posta", "eposta", "mail", "musteri e-posta"},
+    "phone": {"phone", "mobile", "telefon", "tel", "gsm", "cep", "musteri telefon"},
+    "rrule": {"rrule", "recurrence", "recurrence_rule", "tekrar"},
+    "status": {"status", "durum"},
+}
+_CANCELLED_STATUSES = {"cancelled", "canceled", "iptal", "iptal edildi"}
+# Türkçe yerel ayarlı Excel ve takvim dışa aktarımlarında görülen biçimler; ISO 8601 önce denenir.
+_DATETIME_FORMATS = ("%d.%m.%Y %H:%M", "%d.%m.%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%Y-%m-%d %H:%M")
+_ICS_ESCAPE = re.compile(r"\\(.)")
+_ICS_DURATION = re.compile(r"^([+-])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$")
+
+
+@dataclass(slots=True)
+class AppointmentImportRecord:
+    line: int
+    title: str | None = None
+    start_at: datetime | None = None
+    end_at: datetime | None = None
+    description: str | None = None
+    location: str | None = None
+    channel: str | None = None
+    email: str | None = None
+    phone: str | None = None
+    recurrence_rule: str | None = None
+    recurrence_exceptions: tuple[datetime, ...] = ()
+    # Ayrıştırma hatası satırı başarısız sayar; atlama nedeni (iptal, seri istisnası) eklemeden sayar.
+    error: str | None = None
+    skip_reason: str | None = None
+
+
+@dataclass(slots=True)
+class AppointmentImportResult:
+    processed: int = 0
+    inserted: int = 0
+    conflicts: int = 0
+    skipped: int = 0
+    failed: int = 0
+    reminders: int = 0
+    errors: list[ImportRowError] = field(default_factory=list)
+
+
+def detect_appointment_import_format(sample: bytes) -> str:
+    return "ics" if sample_starts_with(sample, b"BEGIN:VCALENDAR") else "csv"
+
+
+def _zone(tz: str) -> ZoneInfo:
+    try:
+        return ZoneInfo(tz)
+    except (ValueError, ZoneInfoNotFoundError) as exc:
+        raise ApplicationError(f"Geçersiz saat dilimi: {tz}") from exc
+
+
+def parse_local_datetime(value: str, *, tz: str) -> datetime:
+    """ISO 8601 ya da `gg.aa.yyyy ss:dd`; saat dilimi içermeyen değerler takvim saat diliminde yorumlanır."""
+    text = value.strip()
+    if "T" not in text and " " not in text:
+        raise ApplicationError(f"Tarih saat içermeli: {value}")
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        for pattern in _DATETIME_FORMATS:
+            try:
+                parsed = datetime.strptime(text, pattern)
+                break
+            except ValueError:
+                continue
+        else:
+            raise ApplicationError(f"Geçersiz tarih: {value}")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=_zone(tz))
+    return parsed.astimezone(timezone.utc)
+
+
+def iter_csv_records(lines: Iterable[str], *, tz: str) -> Iterator[AppointmentImportRecord]:
+    columns = CsvColumns(lines, _CSV_COLUMNS, normalize=normalize_search_text)
+    if "title" not in columns or "start" not in columns:
+        raise ApplicationError("CSV başlığında başlık (title) ve başlangıç (start) sütunları bulunmalı.")
+    if "end" not in columns and "duration" not in columns:
+        raise ApplicationError("CSV başlığında bitiş (end) ya da süre (duration) sütunu bulunmalı.")
+
+    for line, cells in columns:
+        record = AppointmentImportRecord(
+            line=line,
+            title=cells.get("title"),
+            description=cells.get("description"),
+            location=cells.get("location"),
+            channel=cells.get("channel"),
+            email=cells.get("email"),
+            phone=cells.get("phone"),
+            recurrence_rule=cells.get("rrule"),
+        )
+        if normalize_search_text(cells.get("status")) in _CANCELLED_STATUSES:
+            record.skip_reason = "İptal edilmiş randevu."
+            yield record
+            continue
+        try:
+            start, end, duration = cells.get("start"), cells.get("end"), cells.get("duration")
+            if not start:
+                raise ApplicationError("Başlangıç zamanı gerekli.")
+            record.start_at = parse_local_datetime(start, tz=tz)
+            if end:
+                record.end_at = parse_local_datetime(end, tz=tz)
+            elif duration and duration.isdigit():
+                record.end_at = record.start_at + timedelta(minutes=int(duration))
+            else:
+                raise ApplicationError("Bitiş zamanı ya da dakika cinsinden süre gerekli.")
+        except ApplicationError as exc:
+            record.error = str(exc)
+        yield record
+
+
+def _ics_text(value: str) -> str | None:
+    return clean_text(_ICS_ESCAPE.sub(lambda match: "\n" if match.group(1) in "nN" else match.group(1), value))
+
+
+def _ics_duration(value: str) -> timedelta:
+    match = _ICS_DURATION.match(value.strip().upper())
+    if not match or not any(match.groups()[1:]):
+        raise ApplicationError(f"Geçersiz süre: {value}")
+    weeks, days, hours, minutes, seconds = (int(part or 0) for part in match.groups()[1:])
+    duration = timedelta(weeks=weeks, days=days, hours=hours, minutes=minutes, seconds=seconds)
+    return -duration if match.group(1) == "-" else duration
+
+
+def _ics_datetime(value: str, params: dict[str, str], *, tz: str) -> datetime:
+    text = value.strip()
+    if params.get("VALUE", "").upper() == "DATE" or len(text) == 8:
+        raise ApplicationError("Tüm gün etkinlikleri desteklenmiyor.")
+    try:
+        parsed = datetime.strptime(text.removesuffix("Z"), "%Y%m%dT%H%M%S")
+    except ValueError as exc:
+        raise ApplicationError(f"Geçersiz tarih: {value}") from exc
+    if text.endswith("Z"):
+        return parsed.replace(tzinfo=timezone.utc)
+    zone = _zone(tz)
+    tzid = params.get("TZID", "").strip('"')
+    if tzid:
+        # Outlook'un Windows saat dilimi adları VTIMEZONE çözülmeden takvim saat dilimine düşer.
+        try:
+            zone = ZoneInfo(tzid)
+        except (ValueError, ZoneInfoNotFoundError):
+            pass
+    return parsed.replace(tzinfo=zone).astimezone(timezone.utc)
+
+
+def _ics_params(parts: Sequence[str]) -> dict[str, str]:
+    params: dict[str, str] = {}
+    for part in parts:
+        key, _, value = part.partition("=")
+        params[key.upper()] = value
+    return params
+
+
+Property = tuple[dict[str, str], str]
+
+
+def _ics_record(line: int, props: dict[str, list[Property]], *, tz: str) -> AppointmentImportRecord:
+    def first(name: str) -> Property | None:
+        values = props.get(name)
+        return values[0] if values else None
+
+    def text(name: str) -> str | None:
+        prop = first(name)
+        return _ics_text(prop[1]) if prop else None
+
+    record = AppointmentImportRecord(
+        line=line,
+        title=text("SUMMARY"),
+        description=text("DESCRIPTION"),
+        location=text("LOCATION"),
+    )
+    if "RECURRENCE-ID" in props:
+        record.skip_reason = "Seri tekrarı değişikliği desteklenmiyor."
+        return record
+    if (text("STATUS") or "").upper() == "CANCELLED":
+        record.skip_reason = "İptal edilmiş etkinlik."
+        return record
+    # İlk `mailto:` katılımcısı müşteri eşlemesinde kullanılır.
+    for _, value in props.get("ATTENDEE", ()):
+        if value.lower().startswith("mailto:"):
+            record.email = value[7:].strip() or None
+            break
+    try:
+        start = first("DTSTART")
+        if start is None:
+            raise ApplicationError("DTSTART eksik.")
+        record.start_at = _ics_datetime(start[1], start[0], tz=tz)
+        end = first("DTEND")
+        duration = first("DURATION")
+        if end is not None:
+            record.end_at = _ics_datetime(end[1], end[0], tz=tz)
+        elif duration is not None:
+            record.end_at = record.start_at + _ics_duration(duration[1])
+        else:
+            raise ApplicationError("DTEND ya da DURATION eksik.")
+        rule = first("RRULE")
+        if rule is not None:
+            record.recurrence_rule = rule[1].strip()
+            record.recurrence_exceptions = tuple(
+                _ics_datetime(item, params, tz=tz)
+                for params, value in props.get("EXDATE", ())
+                for item in value.split(",")
+                if item.strip()
+            )
+    except ApplicationError as exc:
+        record.error = str(exc)
+    return record
+
+
+def iter_ics_records(lines: Iterable[str], *, tz: str) -> Iterator[AppointmentImportRecord]:
+    """VEVENT bileşenlerini akışla okur; iç bileşenler (VALARM vb.) yok sayılır."""
+    event: dict[str, list[Property]] | None = None
+    start = 0
+    nested = 0
+    for number, line in unfold_lines(lines):
+        name, _, value = line.partition(":")
+        prop, *params = name.split(";")
+        prop = prop.strip().upper()
+        if prop == "BEGIN":
+            if event is None and value.strip().upper() == "VEVENT":
+                event, start, nested = {}, number, 0
+            elif event is not None:
+                nested += 1
+            continue
+        if event is None:
+            continue
+        if prop == "END":
+            if nested:
+                nested -= 1
+            else:
+                yield _ics_record(start, event, tz=tz)
+                event = None
+            continue
+        if not nested and prop:
+            event.setdefault(prop, []).append((_ics_params(params), value))
+
+
+def parse_appointment_import(lines: Iterable[str], import_format: str, *, tz: str) -> Iterator[AppointmentImportRecord]:
+    if import_format not in ALLOWED_APPOINTMENT_IMPORT_FORMATS:
+        raise ApplicationError("Geçersiz içe aktarma biçimi.")
+    return iter_ics_records(lines, tz=tz) if import_format == "ics" else iter_csv_records(lines, tz=tz)
+
+
+Interval = tuple[datetime, datetime]
+
+
+def _overlapping_line(accepted: list[tuple[datetime, datetime, int]], intervals: Iterable[Interval]) -> int | None:
+    """`accepted` başlangıca göre sıralıdır; süre üst sınırı sayesinde yalnızca kısa bir dilim taranır."""
+    for start, end in intervals:
+        index = bisect_left(accepted, (start - MAX_APPOINTMENT_DURATION,))
+        while index < len(accepted) and accepted[index][0] < end:
+            if accepted[index][1] > start:
+                return accepted[index][2]
+            index += 1
+    return None
+
+
+class ImportAppointments:
+    def __init__(
+        self,
+        repo: IAppointmentRepository,
+        reminder_scheduler: ScheduleAppointmentReminder,
+        customer_repo: ICustomerRepository,
+        *,
+        calendar_timezone: str = "UTC",
+        batch_size: int = 500,
+        default_channels: Sequence[str] | None = None,
+        series_lookahead_seconds: int = 300,
+        country_code: str = DEFAULT_COUNTRY_CODE,
+    ):
+        self._repo = repo
+        self._scheduler = reminder_scheduler
+        self._customer_repo = customer_repo
+        self._customers = CustomerLoader(customer_repo)
+        self._tz = calendar_timezone
+        self._batch_size = max(1, batch_size)
+        self._channels = tuple(default_channels or ("log",))
+        self._country_code = country_code
+        self._series_reminders = SeriesReminderPlanner(
+            repo,
+            reminder_scheduler,
+            tz=calendar_timezone,
+            lookahead_seconds=series_lookahead_seconds,
+            customers=self._customers,
+        )
+
+    def _appointment(self, user_id: int, record: AppointmentImportRecord) -> Appointment:
+        if record.error:
+            raise ApplicationError(record.error)
+        title = (record.title or "").strip()
+        if not title:
+            raise ApplicationError("Başlık boş olamaz.")
+        if record.start_at is None or record.end_at is None:
+            raise ApplicationError("Başlangıç ve bitiş zamanı gerekli.")
+        validate_duration(record.start_at, record.end_at)
+        appointment = Appointment(
+            id=None,
+            user_id=user_id,
+            customer_id=None,
+            title=title[:255],
+            description=record.description,
+            location=(record.location or "")[:255] or None,
+            channel=(record.channel or "in_person")[:20],
+            start_at=record.start_at,
+            end_at=record.end_at,
+            remind_at=None,
+            reminder_channels=self._channels,
+            reminder_task_id=None,
+            recurrence_rule=record.recurrence_rule,
+            recurrence_exceptions=record.recurrence_exceptions,
+        )
+        prepare_recurrence(appointment, tz=self._tz)
+        if appointment.recurrence_rule and len(appointment.recurrence_rule) > MAX_RECURRENCE_RULE_LENGTH:
+            raise ApplicationError("Tekrar kuralı çok uzun.")
+        return appointment
+
+    def _contact_keys(self, record: AppointmentImportRecord) -> tuple[str | None, str | None]:
+        # Müşteri eşlemesi isteğe bağlıdır; geçersiz iletişim bilgisi satırı düşürmez.
+        try:
+            email = email_key(normalize_email(record.email))
+        except ApplicationError:
+            email = None
+        try:
+            phone = phone_key(normalize_phone(record.phone, country_code=self._country_code))
+        except ApplicationError:
+            phone = None
+        return email, phone
+
+    async def _match_customers(
+        self, user_id: int, rows: Sequence[tuple[AppointmentImportRecord, Appointment]]
+    ) -> None:
+        keys = [self._contact_keys(record) for record, _ in rows]
+        if not any(email or phone for email, phone in keys):
+            return
+        customers = await self._customer_repo.find_by_contact_keys(
+            user_id=user_id,
+            email_keys={email for email, _ in keys if email},
+            phone_keys={phone for _, phone in keys if phone},
+        )
+        # Hatırlatıcı yükleri kurulurken müşteriler yeniden sorgulanmaz.
+        self._customers.prime(customers)
+        by_email: dict[str, int] = {}
+        by_phone: dict[str, int] = {}
+        for customer in customers:
+            if email_key(customer.email):
+                by_email.setdefault(email_key(customer.email), customer.id or 0)
+            if phone_key(customer.phone):
+                by_phone.setdefault(phone_key(customer.phone), customer.id or 0)
+        for (_, appointment), (email, phone) in zip(rows, keys):
+            appointment.customer_id = by_email.get(email or "") or by_phone.get(phone or "")
+
+    async def _without_conflicts(
+        self,
+        user_id: int,
+        rows: Sequence[tuple[AppointmentImportRecord, Appointment]],
+        result: AppointmentImportResult,
+        errors: list[ImportRowError],
+    ) -> list[tuple[AppointmentImportRecord, Appointment]]:
+        spans: list[tuple[int, int]] = []
+        intervals: list[Interval] = []
+        for _, appointment in rows:
+            own = schedule_intervals(appointment, tz=self._tz)
+            spans.append((len(intervals), len(intervals) + len(own)))
+            intervals.extend(own)
+        # Parçanın denetimi ve toplu INSERT'i aynı takvim kilidi altında yapılır.
+        await self._repo.lock_schedule(user_id=user_id)
+        existing = await find_conflicts(self._repo, user_id=user_id, intervals=intervals, tz=self._tz)
+        accepted: list[tuple[AppointmentImportRecord, Appointment]] = []
+        taken: list[tuple[datetime, datetime, int]] = []
+        for (record, appointment), (low, high) in zip(rows, spans):
+            ids = sorted({conflict for ids in existing[low:high] for conflict in ids})
+            if ids:
+                result.conflicts += 1
+                listed = ", ".join(f"#{conflict}" for conflict in ids)
+                errors.append(ImportRowError(line=record.line, reason=f"Çakışma: {listed} numaralı randevu"))
+                continue
+            line = _overlapping_line(taken, intervals[low:high])
+            if line is not None:
+                result.conflicts += 1
+                errors.append(ImportRowError(line=record.line, reason=f"Çakışma: dosyadaki {line}. satır"))
+                continue
+            for start, end in intervals[low:high]:
+                insort(taken, (start, end, record.line))
+            accepted.append((record, appointment))
+        return accepted
+
+    async def _insert(
+        self,
+        rows: Sequence[tuple[AppointmentImportRecord, Appointment]],
+        result: AppointmentImportResult,
+        errors: list[ImportRowError],
+    ) -> list[Appointment]:
+        try:
+            stored = await self._repo.bulk_create([appointment for _, appointment in rows])
+        except ConflictError:
+            # Denetimle yazma arasında eşzamanlı bir kayıt eklendi; parça satır satır yeniden denenir.
+            stored = []
+            for record, appointment in rows:
+                try:
+                    stored.append(await self._repo.create(appointment))
+                except ConflictError:
+                    result.conflicts += 1
+                    errors.append(ImportRowError(line=record.line, reason="Çakışma: eşzamanlı eklenen randevu"))
+        result.inserted += len(stored)
+        return stored
+
+    async def _schedule_reminders(self, stored: Sequence[Appointment], *, user_email: str | None, now: datetime) -> int:
+        # Geçmiş randevular (taşınan geçmiş kayıtlar) için hatırlatıcı kurulmaz.
+        singles = [item for item in stored if not item.recurrence_rule and item.reminder_channels and item.start_at > now]
+        payloads = await build_reminder_payloads(singles, user_email=user_email, customers=self._customers)
+        scheduled = self._scheduler.schedule_many(
+            [
+                ReminderRequest(
+                    appointment_id=item.id or 0,
+                    appointment_time=item.start_at,
+                    channels=item.reminder_channels,
+                    payload=payload,
+                )
+                for item, payload in zip(singles, payloads)
+            ]
+        )
+        await self._repo.bulk_update_reminder_metadata(
+            [
+                (reminder.appointment_id, reminder.remind_at, reminder.task_id, item.reminder_channels)
+                for reminder, item in zip(scheduled, singles)
+            ]
+        )
+        count = len(scheduled)
+        for series in stored:
+            if not series.recurrence_rule or not series.reminder_channels:
+                continue
+            if series.recurrence_until is not None and series.recurrence_until <= now:
+                continue
+            updated = await self._series_reminders(series, user_email=user_email, now=now)
+            count += updated.reminder_task_id is not None
+        return count
+
+    async def __call__(
+        self,
+        *,
+        user_id: int,
+        user_email: str | None,
+        records: Iterable[AppointmentImportRecord],
+        on_batch: Callable[[AppointmentImportResult, list[ImportRowError]], None] | None = None,
+        now: datetime | None = None,
+    ) -> AppointmentImportResult:
+        result = AppointmentImportResult()
+        for chunk in chunked(records, self._batch_size):
+            errors: list[ImportRowError] = []
+            valid: list[tuple[AppointmentImportRecord, Appointment]] = []
+            for record in chunk:
+                result.processed += 1
+                if record.skip_reason:
+                    result.skipped += 1
+                    errors.append(ImportRowError(line=record.line, reason=f"Atlandı: {record.skip_reason}"))
+                    continue
+                try:
+                    appointment = self._appointment(user_id, record)
+                except ApplicationError as exc:
+                    result.failed += 1
+                    errors.append(ImportRowError(line=record.line, reason=str(exc)))
+                    continue
+                valid.append((record, appointment))
+
+            accepted = await self._without_conflicts(user_id, valid, result, errors)
+            if accepted:
+                await self._match_customers(user_id, accepted)
+                stored = await self._insert(accepted, result, errors)
+                result.reminders += await self._schedule_reminders(
+                    stored, user_email=user_email, now=now or datetime.now(timezone.utc)
+                )
+
+            report_errors(result.errors, errors)
+            if on_batch is not None:
+                on_batch(result, errors)
+        return result
+
+
+class RunAppointmentImport(ImportJobRunner[AppointmentImportJob, AppointmentImportResult]):
+    """Worker tarafında yüklenen randevu dosyasını işler."""
+
+    progress_fields = ("processed", "inserted", "conflicts", "skipped", "failed", "reminders")
+
+    def __init__(self, importer: ImportAppointments, storage: IAppointmentImportStorage, *, calendar_timezone: str):
+        super().__init__(storage)
+        self._importer = importer
+        self._tz = calendar_timezone
+
+    async def __call__(self, *, user_id: int, user_email: str | None, job_id: str) -> AppointmentImportJob:
+        return await self.run(
+            user_id=user_id,
+            job_id=job_id,
+            process=lambda job, lines, on_batch: self._importer(
+                user_id=user_id,
+                user_email=user_email,
+                records=parse_appointment_import(lines, job.format, tz=self._tz),
+                on_batch=on_batch,
+            ),
+        )
+
+
+__all__ = [
+    "ALLOWED_APPOINTMENT_IMPORT_FORMATS",
+    "AppointmentImportRecord",
+    "AppointmentImportResult",
+    "ImportAppointments",
+    "RunAppointmentImport",
+    "detect_appointment_import_format",
+    "iter_csv_records",
+    "iter_ics_records",
+    "parse_appointment_import",
+    "parse_local_datetime",
+]
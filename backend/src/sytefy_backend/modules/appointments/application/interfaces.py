@@ -2,15 +2,31 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Protocol
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Protocol, Sequence
 
-from sytefy_backend.modules.appointments.domain.entities import Appointment
+from sytefy_backend.core.imports import IImportStorage
+from sytefy_backend.modules.appointments.domain.entities import Appointment, AppointmentImportJob
 
 
 class IAppointmentRepository(Protocol):
+    async def lock_schedule(self, *, user_id: int) -> None:
+        """Kullanıcının takvim yazımlarını işlem sonuna kadar sıralar (Postgres danışma kilidi).
+
+        Dışlama kısıtı yalnızca tekil randevuları kapsar; serilerin tekrarlarıyla çakışmayı
+        eşzamanlı yazımlar arasında bu kilit altında yapılan denetim önler.
+        """
+        ...
+
     async def create(self, appointment: Appointment) -> Appointment: ...
 
+    async def bulk_create(self, appointments: Sequence[Appointment]) -> list[Appointment]:
+        """Tek çok satırlı INSERT ile ekler ve işlemi onaylar; kayıtlar girdi sırasıyla döner.
+
+        Dışlama kısıtı ihlalinde parçanın tamamı geri alınır ve `ConflictError` yükselir.
+        """
+        ...
+
     async def list_by_user(
         self,
         *,
@@ -20,6 +36,7 @@ class IAppointmentRepository(Protocol):
         start_to: datetime | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        recurring: bool | None = None,
     ) -> tuple[int, list[Appointment]]: ...
 
     async def update_reminder_metadata(
@@ -31,6 +48,74 @@ class IAppointmentRepository(Protocol):
         channels: tuple[str, ...],
     ) -> Appointment: ...
 
+    async def bulk_update_reminder_metadata(
+        self, updates: Sequence[tuple[int, datetime | None, str | None, tuple[str, ...]]]
+    ) -> None:
+        """`(appointment_id, remind_at, reminder_task_id, channels)` satırlarını birincil anahtarla tek seferde yazar."""
+        ...
+
     async def update(self, appointment: Appointment) -> Appointment: ...
 
     async def get_by_id(self, appointment_id: int) -> Appointment | None: ...
+
+    async def busy_intervals(
+        self, *, user_id: int, start: datetime, end: datetime, lookback: timedelta
+    ) -> list[tuple[datetime, datetime]]:
+        """`[start, end)` ile kesişen iptal edilmemiş tekil randevuların aralıkları, başlangıca göre sıralı.
+
+        Sorgu `(user_id, start_at)` indeksini `start - lookback` alt sınırıyla tarar; `lookback`tan
+        uzun süren randevular aralığın başından önce başlamışsa görülmez.
+        """
+        ...
+
+    async def find_conflicts(
+        self,
+        *,
+        user_id: int,
+        intervals: Sequence[tuple[datetime, datetime]],
+        lookback: timedelta,
+        exclude_id: int | None = None,
+    ) -> list[list[int]]:
+        """Her `[start, end)` aralığı için çakışan iptal edilmemiş tekil randevu kimlikleri (girdi sırasıyla).
+
+        Tüm aralıklar tek sorguda, aralık başına indeksli bir `start_at` penceresiyle denetlenir.
+        """
+        ...
+
+    async def list_series(
+        self,
+        *,
+        user_id: int,
+        start_from: datetime | None = None,
+        start_to: datetime | None = None,
+        status: str | None = None,
+        blocking_only: bool = False,
+    ) -> list[Appointment]:
+        """`start_to`dan önce başlayan ve `start_from`dan sonra biten (ya da sonsuz) seriler."""
+        ...
+
+    async def due_series(self, *, until: datetime, limit: int) -> list[Appointment]:
+        """Sıradaki hatırlatıcı zamanı `until`ı geçmemiş etkin seriler."""
+        ...
+
+    async def last_modified(self, *, user_id: int) -> datetime | None:
+        """Kullanıcının randevularındaki en büyük `updated_at` (`(user_id, updated_at)` indeksinden)."""
+        ...
+
+    def stream_window(
+        self, *, user_id: int, start: datetime, end: datetime, batch_size: int
+    ) -> AsyncIterator[Appointment]:
+        """Başlangıcı `[start, end)` içindeki tekil randevular; parça parça okunur."""
+        ...
+
+
+class ICalendarFeedTokenRepository(Protocol):
+    async def rotate(self, *, user_id: int, token_hash: str) -> None: ...
+
+    async def revoke(self, *, user_id: int) -> bool: ...
+
+    async def user_id_for(self, token_hash: str) -> int | None: ...
+
+
+class IAppointmentImportStorage(IImportStorage[AppointmentImportJob], Protocol):
+    """Randevu içe aktarma işlerinin durum, kaynak dosya ve hata raporu deposu."""
@@ -0,0 +1,147 @@
+"""Tekrarlayan randevular: RFC 5545 RRULE ayrıştırma ve tembel tekrar üretimi.
+
+Seri tek satır olarak saklanır; `start_at`/`end_at` ilk tekrarı, `recurrence_rule` kuralı,
+`recurrence_exceptions` atlanan tekrarların (UTC) başlangıçlarını tutar. Tekrarlar yerel saat
+diliminde üretilir (yaz saati geçişinde duvar saati korunur) ve yalnızca istenen pencere kadar
+ilerleyen üreteçlerle okunur.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from dateutil.rrule import rrule, rrulestr
+
+from sytefy_backend.core.exceptions import ApplicationError
+from sytefy_backend.modules.appointments.domain.entities import Appointment
+
+SUPPORTED_FREQUENCIES = {"DAILY", "WEEKLY", "MONTHLY", "YEARLY"}
+# Sonu olmayan serilerin bitiş tarihi hesabı ve yazma anı denetimleri bu ufukla sınırlanır.
+MAX_SERIES_OCCURRENCES = 1000
+
+Interval = tuple[datetime, datetime]
+
+
+def normalize_rule(rule: str) -> str:
+    return rule.strip().upper().removeprefix("RRULE:")
+
+
+def parse_recurrence(rule: str, *, start_at: datetime, tz: str) -> rrule:
+    text = normalize_rule(rule)
+    parts = dict(part.partition("=")[::2] for part in text.split(";") if part)
+    if parts.get("FREQ") not in SUPPORTED_FREQUENCIES:
+        raise ApplicationError("Tekrar sıklığı DAILY, WEEKLY, MONTHLY ya da YEARLY olmalı.")
+    if "COUNT" in parts and "UNTIL" in parts:
+        raise ApplicationError("Geçersiz tekrar kuralı.")
+    try:
+        parsed = rrulestr(text, dtstart=start_at.astimezone(ZoneInfo(tz)))
+    except (ValueError, TypeError, ZoneInfoNotFoundError) as exc:
+        raise ApplicationError("Geçersiz tekrar kuralı.") from exc
+    if not isinstance(parsed, rrule):
+        raise ApplicationError("Geçersiz tekrar kuralı.")
+    return parsed
+
+
+def series_until(series: Appointment, *, tz: str) -> datetime | None:
+    """Son tekrarın bitişi; kural sonsuzsa `None`."""
+    if not series.recurrence_rule:
+        return series.end_at
+    text = normalize_rule(series.recurrence_rule)
+    if "COUNT=" not in text and "UNTIL=" not in text:
+        return None
+    rule = parse_recurrence(series.recurrence_rule, start_at=series.start_at, tz=tz)
+    last: datetime | None = None
+    for index, occurrence in enumerate(rule):
+        if index >= MAX_SERIES_OCCURRENCES:
+            raise ApplicationError(f"Bir seri en fazla {MAX_SERIES_OCCURRENCES} tekrar içerebilir.")
+        last = occurrence
+    if last is None:
+        raise ApplicationError("Tekrar kuralı hiçbir tarih üretmiyor.")
+    return last.astimezone(timezone.utc) + (series.end_at - series.start_at)
+
+
+def iter_occurrence_starts(series: Appointment, *, tz: str, after: datetime, inclusive: bool = True) -> Iterator[datetime]:
+    """`after`tan itibaren atlanmamış tekrar başlangıçları (UTC, artan); üreteç sınırsızdır."""
+    rule = parse_recurrence(series.recurrence_rule or "", start_at=series.start_at, tz=tz)
+    skipped = set(series.recurrence_exceptions)
+    for occurrence in rule.xafter(after, inc=inclusive):
+        start = occurrence.astimezone(timezone.utc)
+        if start not in skipped:
+            yield start
+
+
+def iter_occurrences(
+    series: Appointment,
+    *,
+    tz: str,
+    start_from: datetime | None,
+    start_to: datetime,
+) -> Iterator[Appointment]:
+    """Başlangıcı `[start_from, start_to]` içinde kalan tekrarlar; her biri `recurrence_id` taşır."""
+    duration = series.end_at - series.start_at
+    for start in iter_occurrence_starts(series, tz=tz, after=start_from or series.start_at):
+        if start > start_to:
+            return
+        yield replace(series, start_at=start, end_at=start + duration, recurrence_id=start)
+
+
+def occurrence_intervals(series: Appointment, *, tz: str, start: datetime, end: datetime) -> Iterator[Interval]:
+    """`[start, end)` ile kesişen tekrar aralıkları."""
+    duration = series.end_at - series.start_at
+    for occurrence in iter_occurrence_starts(series, tz=tz, after=start - duration, inclusive=False):
+        if occurrence >= end:
+            return
+        yield occurrence, occurrence + duration
+
+
+def next_occurrence(series: Appointment, *, tz: str, not_before: datetime) -> datetime | None:
+    return next(iter_occurrence_starts(series, tz=tz, after=not_before), None)
+
+
+def series_conflicts(series: Iterable[Appointment], intervals: list[Interval], *, tz: str) -> list[list[int]]:
+    """Her aralık için tekrarları çakışan seri kimlikleri (girdi sırasıyla)."""
+    conflicts: list[list[int]] = [[] for _ in intervals]
+    if not intervals:
+        return conflicts
+    window_start = min(start for start, _ in intervals)
+    window_end = max(end for _, end in intervals)
+    order = sorted(range(len(intervals)), key=lambda index: intervals[index][0])
+    for item in series:
+        busy = list(occurrence_intervals(item, tz=tz, start=window_start, end=window_end))
+        cursor = 0
+        for index in order:
+            start, end = intervals[index]
+            while cursor < len(busy) and busy[cursor][1] <= start:
+                cursor += 1
+            if cursor < len(busy) and busy[cursor][0] < end:
+                conflicts[index].append(item.id or 0)
+    return conflicts
+
+
+def write_horizon(series: Appointment, *, tz: str, horizon: timedelta) -> list[Interval]:
+    """Yazma anında çakışma denetimi için ilk tekrarlar (en çok `horizon` ve `MAX_SERIES_OCCURRENCES`)."""
+    duration = series.end_at - series.start_at
+    limit = series.start_at + horizon
+    intervals: list[Interval] = []
+    for start in iter_occurrence_starts(series, tz=tz, after=series.start_at):
+        if start > limit or len(intervals) >= MAX_SERIES_OCCURRENCES:
+            break
+        intervals.append((start, start + duration))
+    return intervals
+
+
+__all__ = [
+    "MAX_SERIES_OCCURRENCES",
+    "iter_occurrence_starts",
+    "iter_occurrences",
+    "next_occurrence",
+    "normalize_rule",
+    "occurrence_intervals",
+    "parse_recurrence",
+    "series_conflicts",
+    "series_until",
+    "write_horizon",
+]
@@ -12,6 +12,10 @@ from sytefy_backend.modules.appointments.domain.entities import AppointmentRemin
 class ReminderTaskClient(Protocol):
     def enqueue(self, *, reminder: AppointmentReminder) -> str: ...
 
+    def enqueue_many(self, *, reminders: Sequence[AppointmentReminder]) -> list[str]:
+        """Hatırlatıcıları tek aracı bağlantısı üzerinden sırayla kuyruğa alır; görev kimlikleri aynı sırayla döner."""
+        ...
+
     def revoke(self, task_id: str) -> None: ...
 
 
@@ -22,19 +26,32 @@ class ReminderScheduled:
     task_id: str
 
 
+@dataclass(slots=True)
+class ReminderRequest:
+    appointment_id: int
+    appointment_time: datetime
+    channels: Sequence[str]
+    payload: Mapping[str, Any] | None = None
+
+
 class ScheduleAppointmentReminder:
     def __init__(self, task_client: ReminderTaskClient, offset_minutes: int):
         self._task_client = task_client
         self._offset = offset_minutes
 
-    def __call__(
+    @property
+    def offset_minutes(self) -> int:
+        return self._offset
+
+    def _reminder(
         self,
         *,
         appointment_id: int,
         appointment_time: datetime,
-        channels: Sequence[str] | None = None,
-        payload: Mapping[str, Any] | None = None,
-    ) -> ReminderScheduled:
+        channels: Sequence[str] | None,
+        payload: Mapping[str, Any] | None,
+        now: datetime,
+    ) -> AppointmentReminder:
         if appointment_time.tzinfo is None:
             appointment_time = appointment_time.replace(tzinfo=timezone.utc)
         else:
@@ -42,19 +59,55 @@ class ScheduleAppointmentReminder:
         remind_at = appointment_time - timedelta(minutes=self._offset)
         if remind_at.tzinfo is None:
             remind_at = remind_at.replace(tzinfo=timezone.utc)
-        now = datetime.now(timezone.utc)
         remind_ts = remind_at.timestamp()
         now_ts = now.timestamp()
         if remind_ts < now_ts:
             remind_at = now
-        reminder = AppointmentReminder(
+        return AppointmentReminder(
             appointment_id=appointment_id,
             remind_at=remind_at,
             channels=tuple(channels or ("log",)),
             payload=dict(payload or {}),
         )
+
+    def __call__(
+        self,
+        *,
+        appointment_id: int,
+        appointment_time: datetime,
+        channels: Sequence[str] | None = None,
+        payload: Mapping[str, Any] | None = None,
+    ) -> ReminderScheduled:
+        reminder = self._reminder(
+            appointment_id=appointment_id,
+            appointment_time=appointment_time,
+            channels=channels,
+            payload=payload,
+            now=datetime.now(timezone.utc),
+        )
         task_id = self._task_client.enqueue(reminder=reminder)
-        return ReminderScheduled(appointment_id=appointment_id, remind_at=remind_at, task_id=task_id)
+        return ReminderScheduled(appointment_id=appointment_id, remind_at=reminder.remind_at, task_id=task_id)
+
+    def schedule_many(self, requests: Sequence[ReminderRequest]) -> list[ReminderScheduled]:
+        """Toplu yollar için: tüm hatırlatıcılar tek `enqueue_many` çağrısıyla kuyruğa alınır."""
+        if not requests:
+            return []
+        now = datetime.now(timezone.utc)
+        reminders = [
+            self._reminder(
+                appointment_id=request.appointment_id,
+                appointment_time=request.appointment_time,
+                channels=request.channels,
+                payload=request.payload,
+                now=now,
+            )
+            for request in requests
+        ]
+        task_ids = self._task_client.enqueue_many(reminders=reminders)
+        return [
+            ReminderScheduled(appointment_id=reminder.appointment_id, remind_at=reminder.remind_at, task_id=task_id)
+            for reminder, task_id in zip(reminders, task_ids)
+        ]
 
     def cancel(self, task_id: str | None) -> None:
         if task_id:
@@ -2,15 +2,31 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any, Sequence
+import heapq
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Sequence
 
-from sytefy_backend.core.exceptions import ApplicationError
+from sytefy_backend.core.exceptions import ApplicationError, ConflictError
 from sytefy_backend.modules.appointments.application.interfaces import IAppointmentRepository
-from sytefy_backend.modules.appointments.domain.entities import Appointment
+from sytefy_backend.modules.appointments.domain.entities import (
+    MAX_APPOINTMENT_DURATION,
+    NON_BLOCKING_STATUSES,
+    Appointment,
+)
+from sytefy_backend.modules.appointments.application.recurrence import (
+    iter_occurrences,
+    next_occurrence,
+    normalize_rule,
+    parse_recurrence,
+    series_conflicts,
+    series_until,
+    write_horizon,
+)
 from sytefy_backend.modules.appointments.application.reminders import ReminderScheduled, ScheduleAppointmentReminder
+from sytefy_backend.modules.auth.application.interfaces import IUserRepository
 from sytefy_backend.modules.customers.application.interfaces import ICustomerRepository
+from sytefy_backend.modules.customers.application.loader import CustomerLoader
 
 
 @dataclass(slots=True)
@@ -23,13 +39,13 @@ async def _build_reminder_payload(
     appointment: Appointment,
     *,
     user_email: str | None,
-    customer_repo: ICustomerRepository | None,
+    customers: CustomerLoader | None,
 ) -> dict[str, Any]:
     customer_name: str | None = None
     customer_email: str | None = None
     customer_phone: str | None = None
-    if customer_repo and appointment.customer_id:
-        customer = await customer_repo.get_by_id(appointment.customer_id)
+    if customers and appointment.customer_id:
+        customer = await customers.load(appointment.customer_id)
         if customer:
             customer_name = customer.name
             customer_email = customer.email
@@ -56,6 +72,181 @@ async def _build_reminder_payload(
     }
 
 
+async def build_reminder_payloads(
+    appointments: Iterable[Appointment],
+    *,
+    user_email: str | None,
+    customers: CustomerLoader | None,
+) -> list[dict[str, Any]]:
+    """Toplu yollar için: müşteriler tek sorguda yüklenir, ardından her randevunun yükü kurulur."""
+    items = list(appointments)
+    if customers:
+        await customers.load_many(item.customer_id for item in items if item.customer_id)
+    return [await _build_reminder_payload(item, user_email=user_email, customers=customers) for item in items]
+
+
+MAX_CONFLICT_CHECK_SLOTS = 200
+# Yeni ya da değişen serinin çakışma denetimi bu ufuktaki tekrarlarla yapılır.
+SERIES_CHECK_HORIZON = timedelta(days=365)
+DEFAULT_EXPANSION_DAYS = 90
+
+
+class AppointmentConflict(ConflictError):
+    def __init__(self, conflicting_ids: Sequence[int]):
+        super().__init__("Randevu başka bir randevuyla çakışıyor.")
+        self.conflicting_ids = list(conflicting_ids)
+        self.detail = {"message": "Randevu başka bir randevuyla çakışıyor.", "conflicting_ids": self.conflicting_ids}
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def validate_duration(start_at: datetime, end_at: datetime) -> None:
+    if end_at <= start_at:
+        raise ApplicationError("Bitiş zamanı başlangıçtan büyük olmalı.")
+    if end_at - start_at > MAX_APPOINTMENT_DURATION:
+        raise ApplicationError("Randevu süresi 24 saati aşamaz.")
+
+
+async def find_conflicts(
+    repo: IAppointmentRepository,
+    *,
+    user_id: int,
+    intervals: list[tuple[datetime, datetime]],
+    tz: str,
+    exclude_id: int | None = None,
+) -> list[list[int]]:
+    """Tekil randevular indeksli sorguyla, seriler pencere içindeki tekrarlarıyla denetlenir.
+
+    Yazımdan önce çağıranlar `repo.lock_schedule` ile kullanıcının takvim kilidini önceden almalıdır.
+    """
+    if not intervals:
+        return []
+    conflicts = await repo.find_conflicts(
+        user_id=user_id,
+        intervals=intervals,
+        lookback=MAX_APPOINTMENT_DURATION,
+        exclude_id=exclude_id,
+    )
+    series = await repo.list_series(
+        user_id=user_id,
+        start_from=min(start for start, _ in intervals),
+        start_to=max(end for _, end in intervals),
+        blocking_only=True,
+    )
+    series = [item for item in series if item.id != exclude_id]
+    for ids, extra in zip(conflicts, series_conflicts(series, intervals, tz=tz)):
+        ids.extend(extra)
+    return conflicts
+
+
+def schedule_intervals(appointment: Appointment, *, tz: str) -> list[tuple[datetime, datetime]]:
+    if appointment.recurrence_rule:
+        return write_horizon(appointment, tz=tz, horizon=SERIES_CHECK_HORIZON)
+    return [(appointment.start_at, appointment.end_at)]
+
+
+async def _ensure_no_conflict(
+    repo: IAppointmentRepository,
+    appointment: Appointment,
+    *,
+    tz: str,
+    exclude_id: int | None = None,
+) -> None:
+    # Kilit yazımı onaylayan commit'e kadar tutulur; eşzamanlı yazımlar denetimi sırayla görür.
+    await repo.lock_schedule(user_id=appointment.user_id)
+    conflicts = await find_conflicts(
+        repo,
+        user_id=appointment.user_id,
+        intervals=schedule_intervals(appointment, tz=tz),
+        tz=tz,
+        exclude_id=exclude_id,
+    )
+    ids = sorted({conflict for ids in conflicts for conflict in ids})
+    if ids:
+        raise AppointmentConflict(ids)
+
+
+def prepare_recurrence(appointment: Appointment, *, tz: str) -> None:
+    """Kuralı doğrular, atlanan tekrarları UTC'ye çevirir ve serinin bitişini hesaplar."""
+    if not appointment.recurrence_rule:
+        appointment.recurrence_rule = None
+        appointment.recurrence_exceptions = ()
+        appointment.recurrence_until = None
+        return
+    appointment.recurrence_rule = normalize_rule(appointment.recurrence_rule)
+    parse_recurrence(appointment.recurrence_rule, start_at=appointment.start_at, tz=tz)
+    appointment.recurrence_exceptions = tuple(sorted({_as_utc(value) for value in appointment.recurrence_exceptions}))
+    appointment.recurrence_until = series_until(appointment, tz=tz)
+
+
+class SeriesReminderPlanner:
+    """Seride yalnızca sıradaki tekrarın hatırlatıcısı, vadesi `lookahead` içine girdiğinde kuyruğa alınır.
+
+    `remind_at` sıradaki kurulmamış hatırlatıcının zamanını tutar; kuyruğa alınan son görev
+    `reminder_task_id`dedir (iptalde geri çekilir).
+    """
+
+    def __init__(
+        self,
+        repo: IAppointmentRepository,
+        reminder_scheduler: ScheduleAppointmentReminder,
+        *,
+        tz: str,
+        lookahead_seconds: int,
+        customers: CustomerLoader | None = None,
+    ):
+        self._repo = repo
+        self._scheduler = reminder_scheduler
+        self._tz = tz
+        self._lookahead = timedelta(seconds=max(0, lookahead_seconds))
+        self._customers = customers
+
+    async def __call__(self, series: Appointment, *, user_email: str | None, now: datetime | None = None) -> Appointment:
+        if not series.reminder_channels or series.status in FINAL_STATUSES:
+            return series
+        now = now or datetime.now(timezone.utc)
+        offset = timedelta(minutes=self._scheduler.offset_minutes)
+        not_before = max(now, series.remind_at + offset) if series.remind_at else now
+        occurrence = next_occurrence(series, tz=self._tz, not_before=not_before)
+        task_id = series.reminder_task_id
+        if occurrence is None or occurrence - offset > now + self._lookahead:
+            remind_at = occurrence - offset if occurrence else None
+            if remind_at == series.remind_at:
+                return series
+            return await self._repo.update_reminder_metadata(
+                appointment_id=series.id or 0,
+                remind_at=remind_at,
+                reminder_task_id=task_id,
+                channels=series.reminder_channels,
+            )
+        duration = series.end_at - series.start_at
+        instance = replace(series, start_at=occurrence, end_at=occurrence + duration, recurrence_id=occurrence)
+        payload = await _build_reminder_payload(instance, user_email=user_email, customers=self._customers)
+        reminder = self._scheduler(
+            appointment_id=series.id or 0,
+            appointment_time=occurrence,
+            channels=series.reminder_channels,
+            payload=payload,
+        )
+        following = next_occurrence(series, tz=self._tz, not_before=occurrence + timedelta(microseconds=1))
+        return await self._repo.update_reminder_metadata(
+            appointment_id=series.id or 0,
+            remind_at=following - offset if following else None,
+            reminder_task_id=reminder.task_id,
+            channels=series.reminder_channels,
+        )
+
+
+def _customer_loader(
+    customer_repo: ICustomerRepository | None, customer_loader: CustomerLoader | None
+) -> CustomerLoader | None:
+    if customer_loader is not None:
+        return customer_loader
+    return CustomerLoader(customer_repo) if customer_repo is not None else None
+
+
 class CreateAppointment:
     def __init__(
         self,
@@ -63,11 +254,23 @@ class CreateAppointment:
         reminder_scheduler: ScheduleAppointmentReminder,
         default_channels: Sequence[str] | None = None,
         customer_repo: ICustomerRepository | None = None,
+        customer_loader: CustomerLoader | None = None,
+        *,
+        calendar_timezone: str = "UTC",
+        series_lookahead_seconds: int = 300,
     ):
         self._repo = repo
         self._scheduler = reminder_scheduler
         self._default_channels = tuple(default_channels or ("log",))
-        self._customer_repo = customer_repo
+        self._customers = _customer_loader(customer_repo, customer_loader)
+        self._tz = calendar_timezone
+        self._series_reminders = SeriesReminderPlanner(
+            repo,
+            reminder_scheduler,
+            tz=calendar_timezone,
+            lookahead_seconds=series_lookahead_seconds,
+            customers=self._customers,
+        )
 
     async def __call__(
         self,
@@ -82,6 +285,8 @@ class CreateAppointment:
         start_at: datetime,
         end_at: datetime,
         reminder_channels: Sequence[str] | None = None,
+        recurrence_rule: str | None = None,
+        recurrence_exceptions: Sequence[datetime] | None = None,
     ) -> CreateAppointmentResult:
         if end_at <= start_at:
             raise ApplicationError("Bitiş zamanı başlangıçtan büyük olmalı.")
@@ -93,6 +298,7 @@ class CreateAppointment:
             end_at = end_at.replace(tzinfo=timezone.utc)
         else:
             end_at = end_at.astimezone(timezone.utc)
+        validate_duration(start_at, end_at)
         channels = tuple(reminder_channels or self._default_channels)
         appointment = Appointment(
             id=None,
@@ -107,14 +313,26 @@ class CreateAppointment:
             remind_at=None,
             reminder_channels=channels,
             reminder_task_id=None,
+            recurrence_rule=recurrence_rule,
+            recurrence_exceptions=tuple(recurrence_exceptions or ()),
         )
-        stored = await self._repo.create(appointment)
+        prepare_recurrence(appointment, tz=self._tz)
+        await _ensure_no_conflict(self._repo, appointment, tz=self._tz)
+        try:
+            stored = await self._repo.create(appointment)
+        except ConflictError:
+            # Denetimle yazma arasında eşzamanlı bir kayıt eklendi (Postgres dışlama kısıtı).
+            await _ensure_no_conflict(self._repo, appointment, tz=self._tz)
+            raise
         reminder: ReminderScheduled | None = None
-        if channels:
+        if stored.recurrence_rule:
+            if channels:
+                stored = await self._series_reminders(stored, user_email=user_email)
+        elif channels:
             payload = await _build_reminder_payload(
                 stored,
                 user_email=user_email,
-                customer_repo=self._customer_repo,
+                customers=self._customers,
             )
             reminder = self._scheduler(
                 appointment_id=stored.id or 0,
@@ -131,9 +349,44 @@ class CreateAppointment:
         return CreateAppointmentResult(appointment=stored, reminder=reminder)
 
 
+class CheckAppointmentConflicts:
+    """Önerilen aralıkların hepsini tek sorguda denetler; sonuç girdi sırasıyla döner."""
+
+    def __init__(self, repo: IAppointmentRepository, *, calendar_timezone: str = "UTC"):
+        self._repo = repo
+        self._tz = calendar_timezone
+
+    async def __call__(
+        self,
+        *,
+        user_id: int,
+        slots: Sequence[tuple[datetime, datetime]],
+        exclude_id: int | None = None,
+    ) -> list[list[int]]:
+        if len(slots) > MAX_CONFLICT_CHECK_SLOTS:
+            raise ApplicationError(f"En fazla {MAX_CONFLICT_CHECK_SLOTS} aralık denetlenebilir.")
+        intervals = [(_as_utc(start), _as_utc(end)) for start, end in slots]
+        for start, end in intervals:
+            validate_duration(start, end)
+        return await find_conflicts(self._repo, user_id=user_id, intervals=intervals, tz=self._tz, exclude_id=exclude_id)
+
+
 class ListAppointments:
-    def __init__(self, repo: IAppointmentRepository):
+    """Seriler istenen pencerede tembel üretilir ve tekil randevularla başlangıç sırasına göre birleştirilir.
+
+    `start_to` verilmezse seriler `expansion_days` günlük ufuk kadar açılır.
+    """
+
+    def __init__(
+        self,
+        repo: IAppointmentRepository,
+        *,
+        calendar_timezone: str = "UTC",
+        expansion_days: int = DEFAULT_EXPANSION_DAYS,
+    ):
         self._repo = repo
+        self._tz = calendar_timezone
+        self._expansion = timedelta(days=expansion_days)
 
     async def __call__(
         self,
@@ -144,15 +397,41 @@ class ListAppointments:
         start_to: datetime | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        now: datetime | None = None,
     ) -> tuple[int, list[Appointment]]:
-        return await self._repo.list_by_user(
+        start_from = _as_utc(start_from) if start_from else None
+        window_end = _as_utc(start_to) if start_to else (start_from or now or datetime.now(timezone.utc)) + self._expansion
+        series = await self._repo.list_series(user_id=user_id, start_from=start_from, start_to=window_end, status=status)
+        if not series:
+            return await self._repo.list_by_user(
+                user_id=user_id,
+                status=status,
+                start_from=start_from,
+                start_to=start_to,
+                limit=limit,
+                offset=offset,
+                recurring=False,
+            )
+        skip = offset or 0
+        total, singles = await self._repo.list_by_user(
             user_id=user_id,
             status=status,
             start_from=start_from,
             start_to=start_to,
-            limit=limit,
-            offset=offset,
+            limit=skip + limit if limit else None,
+            recurring=False,
         )
+        occurrences = [iter_occurrences(item, tz=self._tz, start_from=start_from, start_to=window_end) for item in series]
+        stop = skip + limit if limit else None
+        page: list[Appointment] = []
+        merged = 0
+        # Seriler tek geçişte açılır: sayfa toplanırken birleşen öğeler de sayılır.
+        for item in heapq.merge(singles, *occurrences, key=lambda item: item.start_at):
+            if merged >= skip and (stop is None or merged < stop):
+                page.append(item)
+            merged += 1
+        total += merged - len(singles)
+        return total, page
 
 
 class AppointmentNotFound(ApplicationError):
@@ -185,10 +464,22 @@ class UpdateAppointment:
         repo: IAppointmentRepository,
         reminder_scheduler: ScheduleAppointmentReminder,
         customer_repo: ICustomerRepository | None = None,
+        customer_loader: CustomerLoader | None = None,
+        *,
+        calendar_timezone: str = "UTC",
+        series_lookahead_seconds: int = 300,
     ):
         self._repo = repo
         self._scheduler = reminder_scheduler
-        self._customer_repo = customer_repo
+        self._customers = _customer_loader(customer_repo, customer_loader)
+        self._tz = calendar_timezone
+        self._series_reminders = SeriesReminderPlanner(
+            repo,
+            reminder_scheduler,
+            tz=calendar_timezone,
+            lookahead_seconds=series_lookahead_seconds,
+            customers=self._customers,
+        )
 
     async def __call__(
         self,
@@ -204,11 +495,15 @@ class UpdateAppointment:
         end_at: datetime | None = None,
         reminder_channels: Sequence[str] | None = None,
         status: str | None = None,
+        recurrence_rule: str | None = None,
+        recurrence_exceptions: Sequence[datetime] | None = None,
     ) -> Appointment:
         existing = await self._repo.get_by_id(appointment_id)
         if not existing or existing.user_id != user_id:
             raise AppointmentNotFound()
         original_status = existing.status
+        original_range = (existing.start_at, existing.end_at)
+        original_recurrence = (existing.recurrence_rule, existing.recurrence_exceptions)
         start_changed = False
         channels_changed = False
         status_changed = False
@@ -225,8 +520,22 @@ class UpdateAppointment:
             else:
                 end_at = end_at.astimezone(timezone.utc)
             existing.end_at = end_at
-        if existing.end_at <= existing.start_at:
+        range_changed = (existing.start_at, existing.end_at) != original_range
+        if range_changed:
+            validate_duration(existing.start_at, existing.end_at)
+        elif existing.end_at <= existing.start_at:
             raise ApplicationError("Bitiş zamanı başlangıçtan büyük olmalı.")
+        if recurrence_rule is not None:
+            # Boş kural seriyi tekil randevuya çevirir.
+            existing.recurrence_rule = recurrence_rule or None
+        if recurrence_exceptions is not None:
+            existing.recurrence_exceptions = tuple(recurrence_exceptions)
+        if range_changed or (existing.recurrence_rule, existing.recurrence_exceptions) != original_recurrence:
+            prepare_recurrence(existing, tz=self._tz)
+        recurrence_changed = (existing.recurrence_rule, existing.recurrence_exceptions) != original_recurrence
+        if recurrence_changed:
+            range_changed = True
+            start_changed = True
         if title is not None:
             existing.title = title
         if description is not None:
@@ -251,18 +560,36 @@ class UpdateAppointment:
             existing.remind_at = None
             existing.reminder_channels = tuple()
 
-        updated = await self._repo.update(existing)
-
         should_reschedule = (
             not should_cancel_reminder
             and bool(existing.reminder_channels)
             and (start_changed or channels_changed or status_changed)
         )
-        if should_reschedule:
+        stale_task_id: str | None = None
+        if should_reschedule and (existing.recurrence_rule or original_recurrence[0]):
+            # Seride planlama sıradaki tekrardan yeniden başlar; eski görev yazma başarılı olunca geri çekilir.
+            stale_task_id = existing.reminder_task_id
+            existing.reminder_task_id = None
+            existing.remind_at = None
+
+        blocking = range_changed and existing.status not in NON_BLOCKING_STATUSES
+        if blocking:
+            await _ensure_no_conflict(self._repo, existing, tz=self._tz, exclude_id=appointment_id)
+        try:
+            updated = await self._repo.update(existing)
+        except ConflictError:
+            if blocking:
+                await _ensure_no_conflict(self._repo, existing, tz=self._tz, exclude_id=appointment_id)
+            raise
+        self._scheduler.cancel(stale_task_id)
+
+        if should_reschedule and updated.recurrence_rule:
+            updated = await self._series_reminders(updated, user_email=user_email)
+        elif should_reschedule:
             payload = await _build_reminder_payload(
                 updated,
                 user_email=user_email,
-                customer_repo=self._customer_repo,
+                customers=self._customers,
             )
             reminder = self._scheduler(
                 appointment_id=updated.id or 0,
@@ -297,3 +624,22 @@ class CancelAppointment:
         existing.reminder_task_id = None
         existing.remind_at = None
         return await self._repo.update(existing)
+
+
+class MaterializeSeriesReminders:
+    """Vadesi yaklaşan serilerin sıradaki hatırlatıcılarını kuyruğa alır (Celery beat ile)."""
+
+    def __init__(self, repo: IAppointmentRepository, planner: SeriesReminderPlanner, users: IUserRepository):
+        self._repo = repo
+        self._planner = planner
+        self._users = users
+
+    async def __call__(self, *, now: datetime, lookahead_seconds: int, batch_size: int) -> int:
+        due = await self._repo.due_series(until=now + timedelta(seconds=max(0, lookahead_seconds)), limit=batch_size)
+        emails: dict[int, str | None] = {}
+        for series in due:
+            if series.user_id not in emails:
+                user = await self._users.get_by_id(series.user_id)
+                emails[series.user_id] = user.email if user else None
+            await self._planner(series, user_email=emails[series.user_id], now=now)
+        return len(due)
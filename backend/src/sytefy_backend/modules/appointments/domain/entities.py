@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, time, timedelta
 from typing import Any, Optional, Sequence, Tuple
 
+# Çakışma ve müsaitlik sorguları `start_at` indeksini bu kadar geriden tarar; üst sınır bu yüzden zorunludur.
+MAX_APPOINTMENT_DURATION = timedelta(days=1)
+# İptal edilen randevular takvimde yer tutmaz.
+NON_BLOCKING_STATUSES = frozenset({"cancelled"})
+
 
 @dataclass(slots=True)
 class Appointment:
@@ -24,6 +29,12 @@ class Appointment:
     status: str = "scheduled"
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    # Seri: RFC 5545 RRULE, atlanan tekrar başlangıçları (UTC) ve son tekrarın bitişi (sonsuzsa None).
+    recurrence_rule: Optional[str] = None
+    recurrence_exceptions: Tuple[datetime, ...] = ()
+    recurrence_until: Optional[datetime] = None
+    # Seriden üretilen tekil tekrarın özgün başlangıcı (ICS RECURRENCE-ID).
+    recurrence_id: Optional[datetime] = None
 
 
 @dataclass(slots=True)
@@ -32,3 +43,44 @@ class AppointmentReminder:
     remind_at: datetime
     channels: Sequence[str]
     payload: dict[str, Any] | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class WorkingHours:
+    start: time
+    end: time
+    # ISO haftanın günleri: 1 = Pazartesi ... 7 = Pazar.
+    weekdays: frozenset[int]
+    timezone: str
+
+
+@dataclass(slots=True)
+class AvailabilitySlot:
+    start_at: datetime
+    end_at: datetime
+
+
+@dataclass(slots=True, frozen=True)
+class CalendarFeed:
+    user_id: int
+    window_start: datetime
+    window_end: datetime
+    etag: str
+    last_modified: datetime
+
+
+@dataclass(slots=True)
+class AppointmentImportJob:
+    job_id: str
+    user_id: int
+    format: str
+    status: str
+    size: int = 0
+    position: int = 0
+    processed: int = 0
+    inserted: int = 0
+    conflicts: int = 0
+    skipped: int = 0
+    failed: int = 0
+    reminders: int = 0
+    error: Optional[str] = None
@@ -0,0 +1,21 @@
+"""Randevu içe aktarma işlerinin yerel diskte saklanması (düzen için bkz. `core.imports.storage`)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from sytefy_backend.config.settings import Settings
+from sytefy_backend.core.imports import LocalImportStorage
+from sytefy_backend.modules.appointments.domain.entities import AppointmentImportJob
+
+
+class LocalAppointmentImportStorage(LocalImportStorage[AppointmentImportJob]):
+    def __init__(self, root: str | Path):
+        super().__init__(root, job_type=AppointmentImportJob)
+
+
+def get_appointment_import_storage(settings: Settings) -> LocalAppointmentImportStorage:
+    return LocalAppointmentImportStorage(settings.appointment_import_storage_dir)
+
+
+__all__ = ["LocalAppointmentImportStorage", "get_appointment_import_storage"]
@@ -6,14 +6,30 @@ from datetime import datetime
 
 from typing import List
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, JSON, Index
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, JSON, Index, func, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from sytefy_backend.core.database.base import Base
 
+OVERLAP_CONSTRAINT = "ex_appointments_user_overlap"
+# Kullanıcı başına takvim yazımlarını sıralayan `pg_advisory_xact_lock` anahtar alanı.
+SCHEDULE_LOCK_NAMESPACE = 7_041_848
+
 
 class AppointmentModel(Base):
     __tablename__ = "appointments"
+    __table_args__ = (
+        # Aynı kullanıcının iptal edilmemiş tekil randevuları üst üste binemez (btree_gist gerekir).
+        # Seri satırının aralığı gerçek bir tekrar olmayabileceğinden seriler kilitli denetimle korunur.
+        ExcludeConstraint(
+            ("user_id", "="),
+            (func.tstzrange(text("start_at"), text("end_at"), text("'[)'")), "&&"),
+            name=OVERLAP_CONSTRAINT,
+            using="gist",
+            where=text("status <> 'cancelled' AND recurrence_rule IS NULL"),
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -30,7 +46,34 @@ class AppointmentModel(Base):
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="scheduled")
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+    recurrence_rule: Mapped[str | None] = mapped_column(String(255))
+    recurrence_exceptions: Mapped[List[str] | None] = mapped_column(JSON)
+    recurrence_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
 
 Index("ix_appointments_user_start", AppointmentModel.user_id, AppointmentModel.start_at)
 Index("ix_appointments_customer", AppointmentModel.customer_id)
+Index("ix_appointments_user_updated", AppointmentModel.user_id, AppointmentModel.updated_at)
+# Seriler az sayıda satırdır; kısmi indeksler tekil randevuları taramaz.
+Index(
+    "ix_appointments_series_user_start",
+    AppointmentModel.user_id,
+    AppointmentModel.start_at,
+    postgresql_where=AppointmentModel.recurrence_rule.isnot(None),
+    sqlite_where=AppointmentModel.recurrence_rule.isnot(None),
+)
+Index(
+    "ix_appointments_series_remind",
+    AppointmentModel.remind_at,
+    postgresql_where=AppointmentModel.recurrence_rule.isnot(None),
+    sqlite_where=AppointmentModel.recurrence_rule.isnot(None),
+)
+
+
+class CalendarFeedTokenModel(Base):
+    __tablename__ = "calendar_feed_tokens"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True)
+    token_hash: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
@@ -0,0 +1,111 @@
+"""Kuyruğa alınmış hatırlatıcıların izlenmesi (en eski bekleyen hatırlatıcı metriği için)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Iterable, Protocol
+
+from redis import Redis
+
+from sytefy_backend.config.settings import Settings
+from sytefy_backend.core.observability.queue_metrics import PendingSnapshot
+
+
+class PendingReminderTracker(Protocol):
+    def add(self, task_id: str, remind_at: datetime) -> None: ...
+
+    def add_many(self, items: Iterable[tuple[str, datetime]]) -> None: ...
+
+    def remove(self, task_id: str) -> None: ...
+
+    def snapshot(self) -> PendingSnapshot: ...
+
+
+def _summarize(scores: list[float], now: float) -> PendingSnapshot:
+    overdue = [score for score in scores if score <= now]
+    oldest_age = now - min(overdue) if overdue else None
+    return len(scores), len(overdue), oldest_age
+
+
+class InMemoryPendingReminderTracker(PendingReminderTracker):
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._pending: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._clock = clock
+
+    def add(self, task_id: str, remind_at: datetime) -> None:
+        with self._lock:
+            self._pending[task_id] = remind_at.timestamp()
+
+    def add_many(self, items: Iterable[tuple[str, datetime]]) -> None:
+        with self._lock:
+            self._pending.update((task_id, remind_at.timestamp()) for task_id, remind_at in items)
+
+    def remove(self, task_id: str) -> None:
+        with self._lock:
+            self._pending.pop(task_id, None)
+
+    def snapshot(self) -> PendingSnapshot:
+        with self._lock:
+            scores = list(self._pending.values())
+        return _summarize(scores, self._clock())
+
+
+class RedisPendingReminderTracker(PendingReminderTracker):
+    """Görev kimliklerini remind_at skoruyla sorted set'te tutar."""
+
+    def __init__(self, redis: Redis, key: str = "reminders:pending", clock: Callable[[], float] = time.time):
+        self._redis = redis
+        self._key = key
+        self._clock = clock
+
+    def add(self, task_id: str, remind_at: datetime) -> None:
+        self._redis.zadd(self._key, {task_id: remind_at.timestamp()})
+
+    def add_many(self, items: Iterable[tuple[str, datetime]]) -> None:
+        mapping = {task_id: remind_at.timestamp() for task_id, remind_at in items}
+        if mapping:
+            self._redis.zadd(self._key, mapping)
+
+    def remove(self, task_id: str) -> None:
+        self._redis.zrem(self._key, task_id)
+
+    def snapshot(self) -> PendingSnapshot:
+        now = self._clock()
+        with self._redis.pipeline(transaction=False) as pipe:
+            pipe.zcard(self._key)
+            pipe.zcount(self._key, "-inf", now)
+            pipe.zrange(self._key, 0, 0, withscores=True)
+            pending, overdue, oldest = pipe.execute()
+        oldest_age = now - float(oldest[0][1]) if overdue and oldest else None
+        return int(pending), int(overdue), oldest_age
+
+
+_tracker: PendingReminderTracker | None = None
+
+
+def get_pending_reminder_tracker(settings: Settings) -> PendingReminderTracker | None:
+    """Paylaşılan izleyiciyi döndürür; izleme süreçler arasında paylaşılamıyorsa `None`.
+
+    Bellek içi izleyici yalnızca görevler aynı süreçte (eager) çalışırken tutarlıdır; aksi halde
+    API'nin eklediği kimlikleri worker'daki kopyadan silmek mümkün olmaz ve gösterge sınırsız büyür.
+    """
+    global _tracker
+    if _tracker is not None:
+        return _tracker
+    if settings.reminder_pending_backend == "redis":
+        client = Redis.from_url(settings.redis_url, decode_responses=True, socket_timeout=2)
+        _tracker = RedisPendingReminderTracker(client, key=settings.reminder_pending_key)
+    elif settings.celery_task_always_eager:
+        _tracker = InMemoryPendingReminderTracker()
+    return _tracker
+
+
+__all__ = [
+    "InMemoryPendingReminderTracker",
+    "PendingReminderTracker",
+    "RedisPendingReminderTracker",
+    "get_pending_reminder_tracker",
+]
@@ -3,19 +3,23 @@
 from __future__ import annotations
 
 from datetime import timezone
+from typing import Sequence
 
 from celery import Celery
+from celery.utils import uuid
 
 from sytefy_backend.modules.appointments.application.reminders import ReminderTaskClient
 from sytefy_backend.modules.appointments.domain.entities import AppointmentReminder
+from sytefy_backend.modules.appointments.infrastructure.pending_reminders import PendingReminderTracker
 from sytefy_backend.modules.appointments.tasks import send_appointment_reminder
 
 
 class CeleryReminderTaskClient(ReminderTaskClient):
-    def __init__(self, app: Celery):
+    def __init__(self, app: Celery, tracker: PendingReminderTracker | None = None):
         self._app = app
+        self._tracker = tracker
 
-    def enqueue(self, *, reminder: AppointmentReminder) -> str:
+    def _send(self, reminder: AppointmentReminder, *, task_id: str, producer=None) -> str:
         remind_at = reminder.remind_at.astimezone(timezone.utc)
         result = send_appointment_reminder.apply_async(
             args=[reminder.appointment_id],
@@ -25,12 +29,38 @@ class CeleryReminderTaskClient(ReminderTaskClient):
                 "context": reminder.payload or {},
             },
             eta=remind_at,
+            task_id=task_id,
+            producer=producer,
         )
         return result.id
 
+    def enqueue(self, *, reminder: AppointmentReminder) -> str:
+        # Eager modda görev apply_async içinde çalışıp kaydı silebilsin diye önce izlemeye alınır.
+        task_id = uuid()
+        if self._tracker:
+            self._tracker.add(task_id, reminder.remind_at.astimezone(timezone.utc))
+        return self._send(reminder, task_id=task_id)
+
+    def enqueue_many(self, *, reminders: Sequence[AppointmentReminder]) -> list[str]:
+        if not reminders:
+            return []
+        task_ids = [uuid() for _ in reminders]
+        if self._tracker:
+            self._tracker.add_many(
+                (task_id, reminder.remind_at.astimezone(timezone.utc)) for task_id, reminder in zip(task_ids, reminders)
+            )
+        # Havuzdan alınan tek üretici (ve bağlantı) tüm yayınlarda kullanılır.
+        with self._app.producer_or_acquire() as producer:
+            return [
+                self._send(reminder, task_id=task_id, producer=producer)
+                for task_id, reminder in zip(task_ids, reminders)
+            ]
+
     def revoke(self, task_id: str) -> None:
         if task_id:
             self._app.control.revoke(task_id, terminate=False)
+            if self._tracker:
+                self._tracker.remove(task_id)
 
 
 __all__ = ["CeleryReminderTaskClient"]
@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from bisect import bisect_left
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Sequence
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import Select, and_, delete, func, insert, or_, select, text, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from sytefy_backend.modules.appointments.application.interfaces import IAppointmentRepository
-from sytefy_backend.modules.appointments.domain.entities import Appointment
-from sytefy_backend.modules.appointments.infrastructure.models import AppointmentModel
+from sytefy_backend.core.exceptions import ConflictError
+from sytefy_backend.modules.appointments.application.interfaces import (
+    IAppointmentRepository,
+    ICalendarFeedTokenRepository,
+)
+from sytefy_backend.modules.appointments.domain.entities import NON_BLOCKING_STATUSES, Appointment
+from sytefy_backend.modules.appointments.infrastructure.models import (
+    OVERLAP_CONSTRAINT,
+    SCHEDULE_LOCK_NAMESPACE,
+    AppointmentModel,
+    CalendarFeedTokenModel,
+)
 
 
 def _serialize_channels(channels: tuple[str, ...]) -> list[str]:
@@ -30,6 +43,14 @@ def _normalize(dt: datetime | None) -> datetime | None:
     return dt.astimezone(timezone.utc)
 
 
+def _serialize_exceptions(values: tuple[datetime, ...]) -> list[str] | None:
+    return [_normalize(value).isoformat() for value in values] if values else None
+
+
+def _parse_exceptions(payload) -> tuple[datetime, ...]:
+    return tuple(_normalize(datetime.fromisoformat(value)) for value in payload or ())
+
+
 def _to_entity(model: AppointmentModel) -> Appointment:
     return Appointment(
         id=model.id,
@@ -47,13 +68,45 @@ def _to_entity(model: AppointmentModel) -> Appointment:
         status=model.status,
         created_at=_normalize(model.created_at),
         updated_at=_normalize(model.updated_at),
+        recurrence_rule=model.recurrence_rule,
+        recurrence_exceptions=_parse_exceptions(model.recurrence_exceptions),
+        recurrence_until=_normalize(model.recurrence_until),
     )
 
 
+MAX_OR_WINDOWS = 200
+
+
 class AppointmentRepository(IAppointmentRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
 
+    @asynccontextmanager
+    async def _conflicts_translated(self) -> AsyncIterator[None]:
+        """Dışlama kısıtı ihlalini işlemi geri alarak `ConflictError`a çevirir.
+
+        Kısıt ertelenmez; ihlal INSERT/UPDATE anında da, commit sırasında da yükselebilir.
+        """
+        try:
+            yield
+        except IntegrityError as exc:
+            await self._session.rollback()
+            if OVERLAP_CONSTRAINT in str(exc.orig):
+                raise ConflictError("Randevu başka bir randevuyla çakışıyor.") from exc
+            raise
+
+    async def _commit(self) -> None:
+        async with self._conflicts_translated():
+            await self._session.commit()
+
+    async def lock_schedule(self, *, user_id: int) -> None:
+        if self._session.get_bind().dialect.name != "postgresql":
+            return
+        await self._session.execute(
+            text("SELECT pg_advisory_xact_lock(:namespace, :user_id)"),
+            {"namespace": SCHEDULE_LOCK_NAMESPACE, "user_id": user_id},
+        )
+
     async def create(self, appointment: Appointment) -> Appointment:
         model = AppointmentModel(
             user_id=appointment.user_id,
@@ -68,12 +121,46 @@ class AppointmentRepository(IAppointmentRepository):
             reminder_channels=_serialize_channels(appointment.reminder_channels),
             reminder_task_id=appointment.reminder_task_id,
             status=appointment.status,
+            recurrence_rule=appointment.recurrence_rule,
+            recurrence_exceptions=_serialize_exceptions(appointment.recurrence_exceptions),
+            recurrence_until=appointment.recurrence_until,
         )
         self._session.add(model)
-        await self._session.commit()
+        await self._commit()
         await self._session.refresh(model)
         return _to_entity(model)
 
+    async def bulk_create(self, appointments: Sequence[Appointment]) -> list[Appointment]:
+        if not appointments:
+            return []
+        rows = [
+            {
+                "user_id": appointment.user_id,
+                "customer_id": appointment.customer_id,
+                "title": appointment.title,
+                "description": appointment.description,
+                "location": appointment.location,
+                "channel": appointment.channel,
+                "start_at": appointment.start_at,
+                "end_at": appointment.end_at,
+                "remind_at": appointment.remind_at,
+                "reminder_channels": _serialize_channels(appointment.reminder_channels),
+                "reminder_task_id": appointment.reminder_task_id,
+                "status": appointment.status,
+                "recurrence_rule": appointment.recurrence_rule,
+                "recurrence_exceptions": _serialize_exceptions(appointment.recurrence_exceptions),
+                "recurrence_until": appointment.recurrence_until,
+            }
+            for appointment in appointments
+        ]
+        # Çok satırlı INSERT ... RETURNING; dönen satırlar parametre sırasını korur.
+        stmt = insert(AppointmentModel).returning(AppointmentModel, sort_by_parameter_order=True)
+        async with self._conflicts_translated():
+            models = (await self._session.scalars(stmt, rows)).all()
+            stored = [_to_entity(model) for model in models]
+            await self._session.commit()
+        return stored
+
     async def list_by_user(
         self,
         *,
@@ -83,9 +170,14 @@ class AppointmentRepository(IAppointmentRepository):
         start_to: datetime | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        recurring: bool | None = None,
     ) -> list[Appointment]:
         count_stmt = select(func.count()).select_from(AppointmentModel).where(AppointmentModel.user_id == user_id)
         stmt: Select[AppointmentModel] = select(AppointmentModel).where(AppointmentModel.user_id == user_id)
+        if recurring is not None:
+            condition = AppointmentModel.recurrence_rule.isnot(None) if recurring else AppointmentModel.recurrence_rule.is_(None)
+            stmt = stmt.where(condition)
+            count_stmt = count_stmt.where(condition)
         if status:
             stmt = stmt.where(AppointmentModel.status == status)
             count_stmt = count_stmt.where(AppointmentModel.status == status)
@@ -125,6 +217,25 @@ class AppointmentRepository(IAppointmentRepository):
         await self._session.refresh(model)
         return _to_entity(model)
 
+    async def bulk_update_reminder_metadata(
+        self, updates: Sequence[tuple[int, datetime | None, str | None, tuple[str, ...]]]
+    ) -> None:
+        if not updates:
+            return
+        await self._session.execute(
+            update(AppointmentModel),
+            [
+                {
+                    "id": appointment_id,
+                    "remind_at": remind_at,
+                    "reminder_task_id": task_id,
+                    "reminder_channels": _serialize_channels(channels),
+                }
+                for appointment_id, remind_at, task_id, channels in updates
+            ],
+        )
+        await self._session.commit()
+
     async def update(self, appointment: Appointment) -> Appointment:
         model = await self._session.get(AppointmentModel, appointment.id)
         if not model:
@@ -139,8 +250,11 @@ class AppointmentRepository(IAppointmentRepository):
         model.remind_at = appointment.remind_at
         model.reminder_task_id = appointment.reminder_task_id
         model.reminder_channels = _serialize_channels(appointment.reminder_channels)
+        model.recurrence_rule = appointment.recurrence_rule
+        model.recurrence_exceptions = _serialize_exceptions(appointment.recurrence_exceptions)
+        model.recurrence_until = appointment.recurrence_until
         self._session.add(model)
-        await self._session.commit()
+        await self._commit()
         await self._session.refresh(model)
         return _to_entity(model)
 
@@ -149,3 +263,165 @@ class AppointmentRepository(IAppointmentRepository):
         if not model:
             return None
         return _to_entity(model)
+
+    async def busy_intervals(
+        self, *, user_id: int, start: datetime, end: datetime, lookback: timedelta
+    ) -> list[tuple[datetime, datetime]]:
+        stmt = (
+            select(AppointmentModel.start_at, AppointmentModel.end_at)
+            .where(
+                AppointmentModel.user_id == user_id,
+                AppointmentModel.start_at >= start - lookback,
+                AppointmentModel.start_at < end,
+                AppointmentModel.end_at > start,
+                AppointmentModel.status.not_in(NON_BLOCKING_STATUSES),
+                AppointmentModel.recurrence_rule.is_(None),
+            )
+            .order_by(AppointmentModel.start_at)
+        )
+        rows = (await self._session.execute(stmt)).all()
+        return [(_normalize(row.start_at), _normalize(row.end_at)) for row in rows]
+
+    async def find_conflicts(
+        self,
+        *,
+        user_id: int,
+        intervals: Sequence[tuple[datetime, datetime]],
+        lookback: timedelta,
+        exclude_id: int | None = None,
+    ) -> list[list[int]]:
+        if not intervals:
+            return []
+        if len(intervals) <= MAX_OR_WINDOWS:
+            # Her aralık kendi indeks penceresiyle sorgulanır; planlayıcı bunları tek taramada birleştirir.
+            windows = or_(
+                *(
+                    and_(
+                        AppointmentModel.start_at >= start - lookback,
+                        AppointmentModel.start_at < end,
+                        AppointmentModel.end_at > start,
+                    )
+                    for start, end in intervals
+                )
+            )
+        else:
+            # Seri tekrarları gibi uzun listelerde tek kapsayan pencere taranır, eşleme aşağıda yapılır.
+            windows = and_(
+                AppointmentModel.start_at >= min(start for start, _ in intervals) - lookback,
+                AppointmentModel.start_at < max(end for _, end in intervals),
+            )
+        stmt = (
+            select(AppointmentModel.id, AppointmentModel.start_at, AppointmentModel.end_at)
+            .where(
+                AppointmentModel.user_id == user_id,
+                AppointmentModel.status.not_in(NON_BLOCKING_STATUSES),
+                AppointmentModel.recurrence_rule.is_(None),
+                windows,
+            )
+            .order_by(AppointmentModel.start_at, AppointmentModel.id)
+        )
+        if exclude_id is not None:
+            stmt = stmt.where(AppointmentModel.id != exclude_id)
+        rows = [
+            (_normalize(row.start_at), _normalize(row.end_at), row.id)
+            for row in (await self._session.execute(stmt)).all()
+        ]
+        starts = [row[0] for row in rows]
+        conflicts: list[list[int]] = []
+        for start, end in intervals:
+            ids: list[int] = []
+            for index in range(bisect_left(starts, start - lookback), len(rows)):
+                row_start, row_end, row_id = rows[index]
+                if row_start >= end:
+                    break
+                if row_end > start:
+                    ids.append(row_id)
+            conflicts.append(ids)
+        return conflicts
+
+    async def list_series(
+        self,
+        *,
+        user_id: int,
+        start_from: datetime | None = None,
+        start_to: datetime | None = None,
+        status: str | None = None,
+        blocking_only: bool = False,
+    ) -> list[Appointment]:
+        stmt = select(AppointmentModel).where(
+            AppointmentModel.user_id == user_id,
+            AppointmentModel.recurrence_rule.isnot(None),
+        )
+        if start_to is not None:
+            stmt = stmt.where(AppointmentModel.start_at <= start_to)
+        if start_from is not None:
+            stmt = stmt.where(
+                or_(AppointmentModel.recurrence_until.is_(None), AppointmentModel.recurrence_until > start_from)
+            )
+        if status:
+            stmt = stmt.where(AppointmentModel.status == status)
+        if blocking_only:
+            stmt = stmt.where(AppointmentModel.status.not_in(NON_BLOCKING_STATUSES))
+        result = await self._session.execute(stmt.order_by(AppointmentModel.start_at, AppointmentModel.id))
+        return [_to_entity(model) for model in result.scalars().all()]
+
+    async def due_series(self, *, until: datetime, limit: int) -> list[Appointment]:
+        stmt = (
+            select(AppointmentModel)
+            .where(
+                AppointmentModel.recurrence_rule.isnot(None),
+                AppointmentModel.remind_at.isnot(None),
+                AppointmentModel.remind_at <= until,
+                AppointmentModel.status.in_(("scheduled", "confirmed")),
+            )
+            .order_by(AppointmentModel.remind_at)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return [_to_entity(model) for model in result.scalars().all()]
+
+    async def last_modified(self, *, user_id: int) -> datetime | None:
+        stmt = select(func.max(AppointmentModel.updated_at)).where(AppointmentModel.user_id == user_id)
+        return _normalize((await self._session.execute(stmt)).scalar_one_or_none())
+
+    async def stream_window(
+        self, *, user_id: int, start: datetime, end: datetime, batch_size: int
+    ) -> AsyncIterator[Appointment]:
+        stmt = (
+            select(AppointmentModel)
+            .where(
+                AppointmentModel.user_id == user_id,
+                AppointmentModel.start_at >= start,
+                AppointmentModel.start_at < end,
+                AppointmentModel.recurrence_rule.is_(None),
+            )
+            .order_by(AppointmentModel.start_at, AppointmentModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream_scalars(stmt)
+        try:
+            async for model in result:
+                yield _to_entity(model)
+        finally:
+            await result.close()
+
+
+class CalendarFeedTokenRepository(ICalendarFeedTokenRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def rotate(self, *, user_id: int, token_hash: str) -> None:
+        await self._session.execute(delete(CalendarFeedTokenModel).where(CalendarFeedTokenModel.user_id == user_id))
+        self._session.add(CalendarFeedTokenModel(user_id=user_id, token_hash=token_hash))
+        await self._session.commit()
+
+    async def revoke(self, *, user_id: int) -> bool:
+        result = await self._session.execute(
+            delete(CalendarFeedTokenModel).where(CalendarFeedTokenModel.user_id == user_id)
+        )
+        await self._session.commit()
+        return bool(result.rowcount)
+
+    async def user_id_for(self, token_hash: str) -> int | None:
+        stmt = select(CalendarFeedTokenModel.user_id).where(CalendarFeedTokenModel.token_hash == token_hash)
+        return (await self._session.execute(stmt)).scalar_one_or_none()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from datetime import datetime, timezone
 from typing import Any, Iterable
 
@@ -12,17 +13,23 @@ from celery.utils.log import get_task_logger
 from sytefy_backend.config import get_settings
 from sytefy_backend.core.database.session import _SessionLocal
 from sytefy_backend.core.observability.celery_metrics import (
+    record_channel_send_duration,
     record_reminder_channel_event,
+    record_reminder_delivery,
+    record_reminder_dispatch_lag,
     record_reminder_task_outcome,
 )
+from sytefy_backend.core.resilience import CircuitOpenError, ThrottleTimeoutError
 from sytefy_backend.core.tasks.celery_app import celery_app
+from sytefy_backend.core.tasks.runner import run_async
+from sytefy_backend.modules.appointments.infrastructure.pending_reminders import get_pending_reminder_tracker
 from sytefy_backend.modules.notifications.application.use_cases import CreateNotification
-from sytefy_backend.modules.notifications.infrastructure.channels import (
-    EmailNotificationService,
-    SMSNotificationService,
-    TwilioSMSBackend,
-)
+from sytefy_backend.modules.notifications.domain.entities import NotificationDelivery
+from sytefy_backend.modules.notifications.infrastructure.providers import get_email_service, get_sms_service
 from sytefy_backend.modules.notifications.infrastructure.repository import NotificationRepository
+from sytefy_backend.modules.notifications.infrastructure.stream import get_notification_publisher
+from sytefy_backend.modules.notifications.infrastructure.unread_counter import get_unread_counter
+from sytefy_backend.modules.notifications.tasks import enqueue_delivery, park_delivery
 
 logger = structlog.get_logger("sytefy.tasks.reminders")
 task_logger = get_task_logger(__name__)
@@ -59,7 +66,12 @@ def _persist_notification(
     async def _create() -> None:
         async with _SessionLocal() as session:
             repo = NotificationRepository(session)
-            use_case = CreateNotification(repo)
+            settings = get_settings()
+            use_case = CreateNotification(
+                repo,
+                publisher=get_notification_publisher(settings),
+                counter=get_unread_counter(settings),
+            )
             await use_case(
                 user_id=user_id,
                 title=title,
@@ -69,13 +81,13 @@ def _persist_notification(
             )
 
     try:
-        asyncio.run(_create())
+        run_async(_create())
     except RuntimeError:
         loop = asyncio.get_event_loop()
         if loop.is_running():
             loop.create_task(_create())
         else:  # pragma: no cover - defensive branch
-            asyncio.run(_create())
+            run_async(_create())
 
 
 @celery_app.task(
@@ -96,59 +108,66 @@ def send_appointment_reminder(
     """Görevi tetiklenen randevu için seçili kanallara bildirim gönderir."""
     record_reminder_task_outcome("started")
     settings = get_settings()
-    email_service = EmailNotificationService(
-        sender=settings.notification_email_from,
-        enabled=settings.notification_email_enabled,
-        host=settings.notification_email_host,
-        port=settings.notification_email_port,
-        username=settings.notification_email_username,
-        password=settings.notification_email_password,
-        use_tls=settings.notification_email_use_tls,
-        use_ssl=settings.notification_email_use_ssl,
-        timeout=settings.notification_email_timeout,
-    )
-    sms_backend = None
-    if (
-        settings.notification_sms_account_sid
-        and settings.notification_sms_auth_token
-        and settings.notification_sms_from
-    ):
-        sms_backend = TwilioSMSBackend(
-            account_sid=settings.notification_sms_account_sid,
-            auth_token=settings.notification_sms_auth_token,
-            from_number=settings.notification_sms_from,
-            base_url=settings.notification_sms_base_url,
-            timeout=settings.notification_sms_timeout,
-        )
-    sms_service = SMSNotificationService(
-        sender=settings.notification_sms_from,
-        enabled=settings.notification_sms_enabled,
-        backend=sms_backend,
-    )
+    if not getattr(self.request, "retries", 0):
+        record_reminder_dispatch_lag(remind_at)
+    tracker = get_pending_reminder_tracker(settings)
+    if tracker and self.request.id:
+        tracker.remove(self.request.id)
+    email_service = get_email_service(settings)
+    sms_service = get_sms_service(settings)
     normalized_channels = tuple(channels or ("log",))
     context = context or {}
     subject = context.get("subject") or f"{context.get('title', 'Randevu')} hatırlatıcısı"
     body = context.get("body") or _format_body(context | {"remind_at": remind_at})
     delivered: list[str] = []
+    queued: list[str] = []
+    parked: list[str] = []
     user_id = context.get("user_id")
     outcomes: dict[str, bool] = {}
+    batch_mode = settings.notification_batch_enabled
+
+    def _delivery(channel: str, recipient: str | None) -> NotificationDelivery:
+        return NotificationDelivery(
+            channel=channel,
+            recipient=recipient,
+            subject=subject,
+            body=body,
+            user_id=user_id,
+            appointment_id=appointment_id,
+            remind_at=remind_at,
+        )
+
+    def _send(channel: str, recipient: str | None, send) -> None:
+        if batch_mode:
+            enqueue_delivery(_delivery(channel, recipient), settings)
+            queued.append(channel)
+            return
+        started = time.perf_counter()
+        try:
+            success = send()
+        except (CircuitOpenError, ThrottleTimeoutError) as exc:
+            park_delivery(_delivery(channel, recipient), exc.retry_after)
+            parked.append(channel)
+            return
+        record_channel_send_duration(channel, time.perf_counter() - started)
+        outcomes[channel] = success
+        record_reminder_channel_event(channel, "sent" if success else "failed")
+        if success:
+            delivered.append(channel)
+            record_reminder_delivery(channel, remind_at)
 
     try:
         if "email" in normalized_channels:
             recipient = context.get("customer_email") or context.get("user_email")
-            success = email_service.send(recipient=recipient, subject=subject, body=body)
-            outcomes["email"] = success
-            record_reminder_channel_event("email", "sent" if success else "failed")
-            if success:
-                delivered.append("email")
+            _send(
+                "email",
+                recipient,
+                lambda: email_service.send(recipient=recipient, subject=subject, body=body),
+            )
 
         if "sms" in normalized_channels:
             recipient = context.get("customer_phone")
-            success = sms_service.send(recipient=recipient, body=body)
-            outcomes["sms"] = success
-            record_reminder_channel_event("sms", "sent" if success else "failed")
-            if success:
-                delivered.append("sms")
+            _send("sms", recipient, lambda: sms_service.send(recipient=recipient, body=body))
 
         if "notification" in normalized_channels:
             logger.info(
@@ -172,6 +191,8 @@ def send_appointment_reminder(
             delivered.append("log")
 
         payload["delivered"] = delivered
+        payload["queued"] = queued
+        payload["parked"] = parked
         payload["delivered_at"] = datetime.now(timezone.utc).isoformat()
         payload["context"] = context
 
@@ -192,3 +213,93 @@ def send_appointment_reminder(
     except Exception:
         record_reminder_task_outcome("failed")
         raise
+
+
+@celery_app.task(bind=True, name="appointments.materialize_series_reminders")
+def materialize_series_reminders(self) -> dict[str, Any]:
+    """Vadesi yaklaşan tekrarlayan randevuların sıradaki hatırlatıcılarını kuyruğa alır."""
+    # reminder_queue bu modülü içe aktardığı için bağımlılıklar görev içinde yüklenir.
+    from sytefy_backend.modules.appointments.application.reminders import ScheduleAppointmentReminder
+    from sytefy_backend.modules.appointments.application.use_cases import (
+        MaterializeSeriesReminders,
+        SeriesReminderPlanner,
+    )
+    from sytefy_backend.modules.appointments.infrastructure.reminder_queue import CeleryReminderTaskClient
+    from sytefy_backend.modules.appointments.infrastructure.repository import AppointmentRepository
+    from sytefy_backend.modules.auth.infrastructure.repositories import UserRepository
+    from sytefy_backend.modules.customers.application.loader import CustomerLoader
+    from sytefy_backend.modules.customers.infrastructure.repository import CustomerRepository
+
+    settings = get_settings()
+
+    async def _run() -> int:
+        async with _SessionLocal() as session:
+            repo = AppointmentRepository(session)
+            scheduler = ScheduleAppointmentReminder(
+                CeleryReminderTaskClient(celery_app, tracker=get_pending_reminder_tracker(settings)),
+                offset_minutes=settings.reminder_offset_minutes,
+            )
+            planner = SeriesReminderPlanner(
+                repo,
+                scheduler,
+                tz=settings.availability_timezone,
+                lookahead_seconds=settings.recurring_reminder_scan_seconds,
+                customers=CustomerLoader(CustomerRepository(session)),
+            )
+            return await MaterializeSeriesReminders(repo, planner, UserRepository(session))(
+                now=datetime.now(timezone.utc),
+                lookahead_seconds=settings.recurring_reminder_scan_seconds,
+                batch_size=settings.recurring_reminder_batch_size,
+            )
+
+    scheduled = asyncio.run(_run())
+    logger.info("appointments.materialize_series_reminders", task_id=self.request.id, series=scheduled)
+    return {"series": scheduled}
+
+
+@celery_app.task(bind=True, name="bulk.appointments.import")
+def import_appointments(self, *, user_id: int, job_id: str) -> dict[str, object]:
+    """Paylaşılan depolamaya yüklenmiş ICS/CSV dosyasındaki randevuları parça parça ekler."""
+    from sytefy_backend.modules.appointments.application.imports import ImportAppointments, RunAppointmentImport
+    from sytefy_backend.modules.appointments.application.reminders import ScheduleAppointmentReminder
+    from sytefy_backend.modules.appointments.infrastructure.imports import get_appointment_import_storage
+    from sytefy_backend.modules.appointments.infrastructure.reminder_queue import CeleryReminderTaskClient
+    from sytefy_backend.modules.appointments.infrastructure.repository import AppointmentRepository
+    from sytefy_backend.modules.auth.infrastructure.repositories import UserRepository
+    from sytefy_backend.modules.customers.infrastructure.repository import CustomerRepository
+
+    settings = get_settings()
+
+    async def _import() -> None:
+        async with _SessionLocal() as session:
+            user = await UserRepository(session).get_by_id(user_id)
+            importer = ImportAppointments(
+                AppointmentRepository(session),
+                ScheduleAppointmentReminder(
+                    CeleryReminderTaskClient(celery_app, tracker=get_pending_reminder_tracker(settings)),
+                    offset_minutes=settings.reminder_offset_minutes,
+                ),
+                CustomerRepository(session),
+                calendar_timezone=settings.availability_timezone,
+                batch_size=settings.appointment_import_batch_size,
+                series_lookahead_seconds=settings.recurring_reminder_scan_seconds,
+                country_code=settings.customer_import_default_country_code,
+            )
+            job = await RunAppointmentImport(
+                importer,
+                get_appointment_import_storage(settings),
+                calendar_timezone=settings.availability_timezone,
+            )(user_id=user_id, user_email=user.email if user else None, job_id=job_id)
+        logger.info(
+            "appointments.imported",
+            task_id=self.request.id,
+            job_id=job_id,
+            inserted=job.inserted,
+            conflicts=job.conflicts,
+            skipped=job.skipped,
+            failed=job.failed,
+            reminders=job.reminders,
+        )
+
+    asyncio.run(_import())
+    return {"job_id": job_id}
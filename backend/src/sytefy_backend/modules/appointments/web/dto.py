@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import Field
 
@@ -18,6 +18,8 @@ class AppointmentCreateRequest(StrictModel):
     start_at: datetime
     end_at: datetime
     reminder_channels: list[str] | None = None
+    recurrence_rule: str | None = Field(default=None, max_length=255)
+    recurrence_exceptions: list[datetime] | None = Field(default=None, max_length=500)
 
 
 class AppointmentResponse(StrictModel):
@@ -33,6 +35,9 @@ class AppointmentResponse(StrictModel):
     reminder_channels: list[str]
     customer_id: int | None
     reminder_task_id: str | None
+    recurrence_rule: str | None = None
+    recurrence_exceptions: list[datetime] = Field(default_factory=list)
+    recurrence_id: datetime | None = None
 
 
 class AppointmentUpdateRequest(StrictModel):
@@ -44,8 +49,70 @@ class AppointmentUpdateRequest(StrictModel):
     end_at: datetime | None = None
     reminder_channels: list[str] | None = None
     status: str | None = None
+    recurrence_rule: str | None = Field(default=None, max_length=255)
+    recurrence_exceptions: list[datetime] | None = Field(default=None, max_length=500)
 
 
 class AppointmentListResponse(StrictModel):
     items: list[AppointmentResponse]
     total: int
+
+
+class AvailabilitySlotResponse(StrictModel):
+    start_at: datetime
+    end_at: datetime
+
+
+class AvailabilityResponse(StrictModel):
+    date_from: date
+    date_to: date
+    duration_minutes: int
+    timezone: str
+    slots: list[AvailabilitySlotResponse]
+
+
+class ConflictCheckSlot(StrictModel):
+    start_at: datetime
+    end_at: datetime
+
+
+class ConflictCheckRequest(StrictModel):
+    slots: list[ConflictCheckSlot] = Field(min_length=1, max_length=200)
+    exclude_id: int | None = None
+
+
+class ConflictCheckResult(StrictModel):
+    start_at: datetime
+    end_at: datetime
+    conflicting_ids: list[int]
+
+
+class ConflictCheckResponse(StrictModel):
+    has_conflicts: bool
+    results: list[ConflictCheckResult]
+
+
+class CalendarFeedResponse(StrictModel):
+    url: str
+    token: str
+
+
+class AppointmentImportErrorResponse(StrictModel):
+    line: int
+    reason: str
+
+
+class AppointmentImportResponse(StrictModel):
+    job_id: str | None = None
+    format: str
+    status: str
+    size: int
+    position: int
+    processed: int
+    inserted: int
+    conflicts: int
+    skipped: int
+    failed: int
+    reminders: int
+    error: str | None = None
+    errors: list[AppointmentImportErrorResponse] = Field(default_factory=list)
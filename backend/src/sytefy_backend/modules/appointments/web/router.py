@@ -2,30 +2,72 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import io
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime
+from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sytefy_backend.config import get_settings
 from sytefy_backend.core.database import get_db
+from sytefy_backend.core.imports import iter_text_lines
 from sytefy_backend.core.tasks import celery_app
+from sytefy_backend.core.web import not_modified, open_streaming_session, stream_and_close
 from sytefy_backend.modules.auth.domain.entities import User
 from sytefy_backend.modules.auth.web.router import get_current_user
 from sytefy_backend.modules.appointments.application.interfaces import IAppointmentRepository
+from sytefy_backend.modules.appointments.application.availability import GetAvailability, parse_working_hours
+from sytefy_backend.modules.appointments.application.feed import (
+    GetCalendarFeed,
+    RevokeCalendarFeedToken,
+    RotateCalendarFeedToken,
+)
 from sytefy_backend.modules.appointments.application.ics import generate_ics
+from sytefy_backend.modules.appointments.application.imports import (
+    ImportAppointments,
+    detect_appointment_import_format,
+    parse_appointment_import,
+)
+from sytefy_backend.modules.appointments.application.recurrence import iter_occurrences
 from sytefy_backend.modules.appointments.application.reminders import ScheduleAppointmentReminder
 from sytefy_backend.modules.appointments.application.use_cases import (
     CancelAppointment,
+    CheckAppointmentConflicts,
     CreateAppointment,
     ListAppointments,
     UpdateAppointment,
 )
+from sytefy_backend.modules.appointments.domain.entities import AppointmentImportJob
+from sytefy_backend.modules.appointments.infrastructure.imports import (
+    LocalAppointmentImportStorage,
+    get_appointment_import_storage,
+)
+from sytefy_backend.modules.appointments.infrastructure.pending_reminders import get_pending_reminder_tracker
 from sytefy_backend.modules.appointments.infrastructure.reminder_queue import CeleryReminderTaskClient
-from sytefy_backend.modules.appointments.infrastructure.repository import AppointmentRepository
+from sytefy_backend.modules.appointments.infrastructure.repository import (
+    AppointmentRepository,
+    CalendarFeedTokenRepository,
+)
+from sytefy_backend.modules.appointments.tasks import import_appointments as import_appointments_task
+from sytefy_backend.modules.customers.application.loader import CustomerLoader
 from sytefy_backend.modules.customers.infrastructure.repository import CustomerRepository
-from sytefy_backend.modules.appointments.web.dto import AppointmentCreateRequest, AppointmentResponse, AppointmentUpdateRequest
+from sytefy_backend.modules.appointments.web.dto import (
+    AppointmentCreateRequest,
+    AppointmentImportErrorResponse,
+    AppointmentImportResponse,
+    AppointmentResponse,
+    AppointmentUpdateRequest,
+    AvailabilityResponse,
+    AvailabilitySlotResponse,
+    CalendarFeedResponse,
+    ConflictCheckRequest,
+    ConflictCheckResponse,
+    ConflictCheckResult,
+)
+from sytefy_backend.modules.services.infrastructure.repository import ServiceRepository
 from sytefy_backend.core.exceptions import ApplicationError
 
 settings = get_settings()
@@ -37,30 +79,89 @@ async def get_repo(db: AsyncSession = Depends(get_db)) -> IAppointmentRepository
 
 
 def get_scheduler() -> ScheduleAppointmentReminder:
-    client = CeleryReminderTaskClient(celery_app)
+    client = CeleryReminderTaskClient(celery_app, tracker=get_pending_reminder_tracker(settings))
     return ScheduleAppointmentReminder(client, offset_minutes=settings.reminder_offset_minutes)
 
 
+async def get_customer_loader(db: AsyncSession = Depends(get_db)) -> CustomerLoader:
+    # FastAPI bağımlılıkları istek başına önbelleğe aldığından yükleyici istek içinde paylaşılır.
+    return CustomerLoader(CustomerRepository(db))
+
+
 async def get_create_use_case(
     db: AsyncSession = Depends(get_db),
     scheduler: ScheduleAppointmentReminder = Depends(get_scheduler),
+    customers: CustomerLoader = Depends(get_customer_loader),
 ) -> CreateAppointment:
     repo = AppointmentRepository(db)
-    customer_repo = CustomerRepository(db)
-    return CreateAppointment(repo, scheduler, customer_repo=customer_repo)
+    return CreateAppointment(
+        repo,
+        scheduler,
+        customer_loader=customers,
+        calendar_timezone=settings.availability_timezone,
+        series_lookahead_seconds=settings.recurring_reminder_scan_seconds,
+    )
 
 
 def get_list_use_case(repo: IAppointmentRepository = Depends(get_repo)) -> ListAppointments:
-    return ListAppointments(repo)
+    return ListAppointments(
+        repo,
+        calendar_timezone=settings.availability_timezone,
+        expansion_days=settings.recurrence_expansion_days,
+    )
 
 
 async def get_update_use_case(
     db: AsyncSession = Depends(get_db),
     scheduler: ScheduleAppointmentReminder = Depends(get_scheduler),
+    customers: CustomerLoader = Depends(get_customer_loader),
 ) -> UpdateAppointment:
     repo = AppointmentRepository(db)
-    customer_repo = CustomerRepository(db)
-    return UpdateAppointment(repo, scheduler, customer_repo=customer_repo)
+    return UpdateAppointment(
+        repo,
+        scheduler,
+        customer_loader=customers,
+        calendar_timezone=settings.availability_timezone,
+        series_lookahead_seconds=settings.recurring_reminder_scan_seconds,
+    )
+
+
+def get_conflict_check_use_case(repo: IAppointmentRepository = Depends(get_repo)) -> CheckAppointmentConflicts:
+    return CheckAppointmentConflicts(repo, calendar_timezone=settings.availability_timezone)
+
+
+def get_availability_use_case(db: AsyncSession = Depends(get_db)) -> GetAvailability:
+    hours = parse_working_hours(
+        settings.availability_work_start,
+        settings.availability_work_end,
+        settings.availability_work_days,
+        settings.availability_timezone,
+    )
+    return GetAvailability(
+        AppointmentRepository(db),
+        ServiceRepository(db),
+        hours,
+        default_buffer_minutes=settings.availability_buffer_minutes,
+        default_step_minutes=settings.availability_step_minutes,
+    )
+
+
+def _calendar_feed(session: AsyncSession) -> GetCalendarFeed:
+    return GetCalendarFeed(
+        AppointmentRepository(session),
+        CalendarFeedTokenRepository(session),
+        tz=settings.availability_timezone,
+        past_days=settings.calendar_feed_past_days,
+        future_days=settings.calendar_feed_future_days,
+        domain=settings.host or "sytefy.local",
+        product_name=settings.app_name,
+        refresh_minutes=settings.calendar_feed_refresh_minutes,
+        batch_size=settings.calendar_feed_batch_size,
+    )
+
+
+def get_import_storage() -> LocalAppointmentImportStorage:
+    return get_appointment_import_storage(settings)
 
 
 def get_cancel_use_case(
@@ -84,6 +185,9 @@ def _to_response(entity) -> AppointmentResponse:
         reminder_channels=list(entity.reminder_channels),
         customer_id=entity.customer_id,
         reminder_task_id=entity.reminder_task_id,
+        recurrence_rule=entity.recurrence_rule,
+        recurrence_exceptions=list(entity.recurrence_exceptions),
+        recurrence_id=entity.recurrence_id,
     )
 
 
@@ -92,6 +196,24 @@ def _handle_app_error(exc: ApplicationError) -> None:
     raise HTTPException(status_code=exc.status_code, detail=detail)
 
 
+def _import_response(job: AppointmentImportJob, errors=()) -> AppointmentImportResponse:
+    return AppointmentImportResponse(
+        job_id=job.job_id or None,
+        format=job.format,
+        status=job.status,
+        size=job.size,
+        position=job.position,
+        processed=job.processed,
+        inserted=job.inserted,
+        conflicts=job.conflicts,
+        skipped=job.skipped,
+        failed=job.failed,
+        reminders=job.reminders,
+        error=job.error,
+        errors=[AppointmentImportErrorResponse(line=error.line, reason=error.reason) for error in errors],
+    )
+
+
 @router.post("/", response_model=AppointmentResponse, status_code=201)
 async def create_appointment(
     payload: AppointmentCreateRequest,
@@ -110,6 +232,8 @@ async def create_appointment(
             start_at=payload.start_at,
             end_at=payload.end_at,
             reminder_channels=payload.reminder_channels,
+            recurrence_rule=payload.recurrence_rule,
+            recurrence_exceptions=payload.recurrence_exceptions,
         )
     except ApplicationError as exc:
         _handle_app_error(exc)
@@ -143,6 +267,210 @@ async def list_appointments(
     }
 
 
+@router.get("/availability", response_model=AvailabilityResponse)
+async def get_availability(
+    date_from: date,
+    date_to: date,
+    service_id: int | None = None,
+    duration_minutes: int | None = Query(default=None, gt=0, le=600),
+    buffer_minutes: int | None = Query(default=None, ge=0, le=240),
+    step_minutes: int | None = Query(default=None, ge=5, le=240),
+    current_user: User = Depends(get_current_user),
+    use_case: GetAvailability = Depends(get_availability_use_case),
+):
+    try:
+        minutes, slots = await use_case(
+            user_id=current_user.id or 0,
+            date_from=date_from,
+            date_to=date_to,
+            service_id=service_id,
+            duration_minutes=duration_minutes,
+            buffer_minutes=buffer_minutes,
+            step_minutes=step_minutes,
+        )
+    except ApplicationError as exc:
+        _handle_app_error(exc)
+    return AvailabilityResponse(
+        date_from=date_from,
+        date_to=date_to,
+        duration_minutes=minutes,
+        timezone=settings.availability_timezone,
+        slots=[AvailabilitySlotResponse(start_at=slot.start_at, end_at=slot.end_at) for slot in slots],
+    )
+
+
+@router.post("/conflicts", response_model=ConflictCheckResponse)
+async def check_appointment_conflicts(
+    payload: ConflictCheckRequest,
+    current_user: User = Depends(get_current_user),
+    use_case: CheckAppointmentConflicts = Depends(get_conflict_check_use_case),
+):
+    try:
+        conflicts = await use_case(
+            user_id=current_user.id or 0,
+            slots=[(slot.start_at, slot.end_at) for slot in payload.slots],
+            exclude_id=payload.exclude_id,
+        )
+    except ApplicationError as exc:
+        _handle_app_error(exc)
+    results = [
+        ConflictCheckResult(start_at=slot.start_at, end_at=slot.end_at, conflicting_ids=ids)
+        for slot, ids in zip(payload.slots, conflicts)
+    ]
+    return ConflictCheckResponse(has_conflicts=any(conflicts), results=results)
+
+
+@router.post("/feed", response_model=CalendarFeedResponse, status_code=201)
+async def rotate_calendar_feed(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    token = await RotateCalendarFeedToken(CalendarFeedTokenRepository(db))(user_id=current_user.id or 0)
+    url = str(request.url_for("get_calendar_feed", token=token))
+    return CalendarFeedResponse(url="webcal://" + url.split("://", 1)[1], token=token)
+
+
+@router.delete("/feed", status_code=204)
+async def revoke_calendar_feed(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    try:
+        await RevokeCalendarFeedToken(CalendarFeedTokenRepository(db))(user_id=current_user.id or 0)
+    except ApplicationError as exc:
+        _handle_app_error(exc)
+    return Response(status_code=204)
+
+
+@router.get("/feed/{token}.ics", name="get_calendar_feed")
+async def get_calendar_feed(token: str, request: Request, db: AsyncSession = Depends(get_db)):
+    """Oturum gerektirmez; adres belirteci kimlik yerine geçer."""
+    try:
+        feed = await _calendar_feed(db).resolve(token)
+    except ApplicationError as exc:
+        _handle_app_error(exc)
+    etag = f'"{feed.etag}"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(feed.last_modified, usegmt=True),
+        "Cache-Control": "private, no-cache",
+    }
+    if not_modified(request, etag, feed.last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    session = open_streaming_session(db)
+    return StreamingResponse(
+        stream_and_close(_calendar_feed(session).stream(feed), session),
+        media_type="text/calendar; charset=utf-8",
+        headers=headers | {"Content-Disposition": 'inline; filename="calendar.ics"'},
+    )
+
+
+@router.post("/imports", response_model=AppointmentImportResponse)
+async def import_appointments(
+    request: Request,
+    response: Response,
+    import_format: str | None = Query(default=None, alias="format", pattern="^(ics|csv)$"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    scheduler: ScheduleAppointmentReminder = Depends(get_scheduler),
+    storage: LocalAppointmentImportStorage = Depends(get_import_storage),
+):
+    """Küçük dosyalar istek içinde işlenir; `APPOINTMENT_IMPORT_INLINE_MAX_BYTES` aşılırsa gövde diske akıtılıp kuyruğa alınır."""
+    user_id = current_user.id or 0
+    stream = request.stream()
+    head = bytearray()
+    async for chunk in stream:
+        head.extend(chunk)
+        if len(head) > settings.appointment_import_inline_max_bytes:
+            break
+    if not head.strip():
+        raise HTTPException(status_code=400, detail="İçe aktarma dosyası boş.")
+    import_format = import_format or detect_appointment_import_format(bytes(head[:64]))
+
+    if len(head) <= settings.appointment_import_inline_max_bytes:
+        importer = ImportAppointments(
+            AppointmentRepository(db),
+            scheduler,
+            CustomerRepository(db),
+            calendar_timezone=settings.availability_timezone,
+            batch_size=settings.appointment_import_batch_size,
+            series_lookahead_seconds=settings.recurring_reminder_scan_seconds,
+            country_code=settings.customer_import_default_country_code,
+        )
+        try:
+            result = await importer(
+                user_id=user_id,
+                user_email=current_user.email,
+                records=parse_appointment_import(
+                    iter_text_lines(io.BytesIO(bytes(head))), import_format, tz=settings.availability_timezone
+                ),
+            )
+        except ApplicationError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        job = AppointmentImportJob(
+            job_id="",
+            user_id=user_id,
+            format=import_format,
+            status="completed",
+            size=len(head),
+            position=len(head),
+            processed=result.processed,
+            inserted=result.inserted,
+            conflicts=result.conflicts,
+            skipped=result.skipped,
+            failed=result.failed,
+            reminders=result.reminders,
+        )
+        return _import_response(job, result.errors)
+
+    job = AppointmentImportJob(job_id=uuid4().hex, user_id=user_id, format=import_format, status="queued")
+    source = storage.source_path(job)
+    source.parent.mkdir(parents=True, exist_ok=True)
+    size = len(head)
+    with source.open("wb") as handle:
+        handle.write(head)
+        async for chunk in stream:
+            size += len(chunk)
+            if size > settings.appointment_import_max_bytes:
+                handle.close()
+                source.unlink(missing_ok=True)
+                raise HTTPException(status_code=413, detail="İçe aktarma dosyası çok büyük.")
+            handle.write(chunk)
+    job.size = size
+    storage.save(job)
+    import_appointments_task.delay(user_id=user_id, job_id=job.job_id)
+    response.status_code = status.HTTP_202_ACCEPTED
+    return _import_response(storage.get(user_id=user_id, job_id=job.job_id) or job)
+
+
+@router.get("/imports/{job_id}", response_model=AppointmentImportResponse)
+async def get_import_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    storage: LocalAppointmentImportStorage = Depends(get_import_storage),
+):
+    job = storage.get(user_id=current_user.id or 0, job_id=job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="İçe aktarma işi bulunamadı")
+    return _import_response(job)
+
+
+@router.get("/imports/{job_id}/errors")
+async def download_import_errors(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    storage: LocalAppointmentImportStorage = Depends(get_import_storage),
+):
+    job = storage.get(user_id=current_user.id or 0, job_id=job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="İçe aktarma işi bulunamadı")
+    path = storage.errors_path(job)
+    if not path.exists():
+        raise HTTPException(status_code=404, detail="Hata raporu yok")
+    return FileResponse(path, media_type="text/csv", filename=f"appointment-import-{job_id}-errors.csv")
+
+
 @router.put("/{appointment_id}", response_model=AppointmentResponse)
 async def update_appointment(
     appointment_id: int,
@@ -163,6 +491,8 @@ async def update_appointment(
             end_at=payload.end_at,
             reminder_channels=payload.reminder_channels,
             status=payload.status,
+            recurrence_rule=payload.recurrence_rule,
+            recurrence_exceptions=payload.recurrence_exceptions,
         )
     except ApplicationError as exc:
         _handle_app_error(exc)
@@ -185,16 +515,28 @@ async def cancel_appointment(
 @router.get("/{appointment_id}/ics")
 async def download_appointment_ics(
     appointment_id: int,
+    start_from: datetime | None = None,
+    start_to: datetime | None = None,
     current_user: User = Depends(get_current_user),
     repo: IAppointmentRepository = Depends(get_repo),
 ):
     appointment = await repo.get_by_id(appointment_id)
     if not appointment or appointment.user_id != (current_user.id or 0):
         raise HTTPException(status_code=404, detail="Randevu bulunamadı.")
+    occurrences = None
+    if appointment.recurrence_rule:
+        window_start = start_from or datetime.now(timezone.utc)
+        occurrences = iter_occurrences(
+            appointment,
+            tz=settings.availability_timezone,
+            start_from=window_start,
+            start_to=start_to or window_start + timedelta(days=settings.recurrence_expansion_days),
+        )
     ics = generate_ics(
         appointment,
         domain=settings.host or "sytefy.local",
         product_name=settings.app_name,
+        occurrences=occurrences,
     )
     filename = f"appointment-{appointment_id}.ics"
     return Response(
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Protocol, Sequence
 
 from sytefy_backend.modules.auth.domain.entities import User
 from sytefy_backend.core.security.tokens import RefreshTokenPayload
@@ -21,6 +21,15 @@ class IUserRepository(Protocol):
 
     async def update_role(self, user_id: int, role: str) -> User: ...
 
+    async def list_active_ids(
+        self,
+        *,
+        role: str | None = None,
+        user_ids: Sequence[int] | None = None,
+        after_id: int = 0,
+        limit: int = 500,
+    ) -> list[int]: ...
+
 
 class IPasswordHasher(Protocol):
     def hash(self, password: str) -> str: ...
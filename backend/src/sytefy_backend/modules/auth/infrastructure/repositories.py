@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Sequence
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -82,6 +84,23 @@ class UserRepository(IUserRepository):
         await self._session.refresh(model)
         return _to_entity(model)
 
+    async def list_active_ids(
+        self,
+        *,
+        role: str | None = None,
+        user_ids: Sequence[int] | None = None,
+        after_id: int = 0,
+        limit: int = 500,
+    ) -> list[int]:
+        """Aktif kullanıcı kimliklerini id sırasıyla keyset sayfalar halinde döndürür."""
+        stmt = select(UserModel.id).where(UserModel.is_active.is_(True), UserModel.id > after_id)
+        if role is not None:
+            stmt = stmt.where(UserModel.role == role)
+        if user_ids is not None:
+            stmt = stmt.where(UserModel.id.in_(list(user_ids)))
+        stmt = stmt.order_by(UserModel.id).limit(limit)
+        return list((await self._session.execute(stmt)).scalars().all())
+
 
 class RoleRepository:
     def __init__(self, session: AsyncSession):
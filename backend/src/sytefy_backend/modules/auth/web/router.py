@@ -174,6 +174,13 @@ def require_roles(*roles: str):
     return dependency
 
 
+async def require_platform_admin(user: User = Depends(get_current_user)) -> User:
+    """Kiracılar arası işlemleri `PLATFORM_ADMIN_EMAILS` listesindeki hesaplarla sınırlar."""
+    if user.email.lower() not in settings.platform_admin_emails:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Bu işlem için yetkiniz yok")
+    return user
+
+
 @router.get("/csrf-token")
 async def get_csrf_token(response: Response):
     if not settings.enable_csrf_protection:
@@ -277,4 +284,4 @@ async def get_me(current_user: User = Depends(require_roles("owner", "admin"))):
     return UserResponse(id=current_user.id or 0, email=current_user.email, username=current_user.username, role=current_user.role)
 
 
-__all__ = ["router", "get_current_user", "require_roles", "get_user_repo", "get_role_repo"]
+__all__ = ["router", "get_current_user", "require_roles", "require_platform_admin", "get_user_repo", "get_role_repo"]
@@ -0,0 +1,72 @@
+"""E-posta ve telefon normalizasyonu; içe aktarma ve mükerrer kontrolünde kullanılır."""
+
+from __future__ import annotations
+
+import re
+
+from sytefy_backend.core.exceptions import ApplicationError
+
+_EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_NON_DIGITS = re.compile(r"\D+")
+
+DEFAULT_COUNTRY_CODE = "90"
+# Mükerrer anahtarı ulusal numaranın son 10 hanesidir; "+90 555..." ve "0555..." aynı anahtara düşer.
+PHONE_KEY_DIGITS = 10
+MIN_PHONE_DIGITS = 7
+MAX_PHONE_DIGITS = 15
+
+
+def normalize_email(value: str | None) -> str | None:
+    text = (value or "").strip()
+    if text.lower().startswith("mailto:"):
+        text = text[7:]
+    if not text:
+        return None
+    text = text.lower()
+    if len(text) > 255 or not _EMAIL.match(text):
+        raise ApplicationError(f"Geçersiz e-posta: {value}")
+    return text
+
+
+def normalize_phone(value: str | None, *, country_code: str = DEFAULT_COUNTRY_CODE) -> str | None:
+    """Numarayı `+<ülke kodu><numara>` biçimine getirir; ülke kodu yoksa `country_code` eklenir."""
+    text = (value or "").strip()
+    digits = _NON_DIGITS.sub("", text)
+    if not digits:
+        if text:
+            raise ApplicationError(f"Geçersiz telefon: {value}")
+        return None
+    if text.startswith("+"):
+        international = digits
+    elif digits.startswith("00"):
+        international = digits[2:]
+    elif digits.startswith("0"):
+        international = country_code + digits[1:]
+    elif digits.startswith(country_code) and len(digits) > PHONE_KEY_DIGITS:
+        international = digits
+    else:
+        international = country_code + digits
+    if not MIN_PHONE_DIGITS <= len(international) <= MAX_PHONE_DIGITS:
+        raise ApplicationError(f"Geçersiz telefon: {value}")
+    return f"+{international}"
+
+
+def email_key(email: str | None) -> str | None:
+    text = (email or "").strip().lower()
+    return text or None
+
+
+def phone_key(phone: str | None) -> str | None:
+    digits = _NON_DIGITS.sub("", phone or "")
+    if len(digits) < MIN_PHONE_DIGITS:
+        return None
+    return digits[-PHONE_KEY_DIGITS:]
+
+
+__all__ = [
+    "DEFAULT_COUNTRY_CODE",
+    "email_key",
+    "normalize_email",
+    "normalize_phone",
+    "phone_key",
+]
@@ -0,0 +1,233 @@
+"""Müşteri içe aktarma: CSV/vCard akış ayrıştırma, normalizasyon ve mükerrer eleme.
+
+Dosya satır satır okunur ve `batch_size`'lık parçalar halinde işlenir; her parça için mevcut
+müşterilerdeki e-posta/telefon anahtarları tek sorguda çekilir ve yeni kayıtlar çok satırlı tek
+INSERT ile eklenir. Bellekte yalnızca parça ve dosya içi mükerrer kontrolü için anahtarlar tutulur.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator
+
+from sytefy_backend.core.exceptions import ApplicationError
+from sytefy_backend.core.imports import (
+    CsvColumns,
+    ImportJobRunner,
+    ImportRowError,
+    chunked,
+    clean_text,
+    report_errors,
+    sample_starts_with,
+    unfold_lines,
+)
+from sytefy_backend.modules.customers.application.contacts import (
+    DEFAULT_COUNTRY_CODE,
+    email_key,
+    normalize_email,
+    normalize_phone,
+    phone_key,
+)
+from sytefy_backend.modules.customers.application.interfaces import ICustomerImportStorage, ICustomerRepository
+from sytefy_backend.modules.customers.application.search import normalize_search_text
+from sytefy_backend.modules.customers.domain.entities import Customer, CustomerImportJob
+
+ALLOWED_IMPORT_FORMATS = {"csv", "vcard"}
+
+_CSV_COLUMNS = {
+    "name": {"name", "full name", "ad", "ad soyad", "adi soyadi", "isim", "musteri"},
+    "email": {"email", "e-mail", "e-posta", "eposta", "mail"},
+    "phone": {"phone", "mobile", "telefon", "tel", "gsm", "cep"},
+    "notes": {"notes", "note", "not", "notlar", "aciklama"},
+}
+_VCARD_FIELDS = {"FN", "N", "EMAIL", "TEL", "NOTE"}
+_VCARD_ESCAPE = re.compile(r"\\(.)")
+
+
+@dataclass(slots=True)
+class ImportRecord:
+    line: int
+    name: str | None
+    email: str | None
+    phone: str | None
+    notes: str | None
+
+
+@dataclass(slots=True)
+class CustomerImportResult:
+    processed: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    errors: list[ImportRowError] = field(default_factory=list)
+
+
+def detect_import_format(sample: bytes) -> str:
+    return "vcard" if sample_starts_with(sample, b"BEGIN:VCARD") else "csv"
+
+
+def iter_csv_records(lines: Iterable[str]) -> Iterator[ImportRecord]:
+    columns = CsvColumns(lines, _CSV_COLUMNS, normalize=normalize_search_text)
+    if "name" not in columns:
+        raise ApplicationError("CSV başlığında ad (name) sütunu bulunamadı.")
+    for line, cells in columns:
+        yield ImportRecord(
+            line=line,
+            name=cells.get("name"),
+            email=cells.get("email"),
+            phone=cells.get("phone"),
+            notes=cells.get("notes"),
+        )
+
+
+def _vcard_text(value: str) -> str:
+    return _VCARD_ESCAPE.sub(lambda match: "\n" if match.group(1) in "nN" else match.group(1), value)
+
+
+def _vcard_name(card: dict[str, str]) -> str | None:
+    if clean_text(card.get("FN")):
+        return clean_text(_vcard_text(card["FN"]))
+    parts = [_vcard_text(part).strip() for part in card.get("N", "").split(";")]
+    # N: soyad;ad;ikinci ad;önek;sonek
+    ordered = [*parts[3:4], *parts[1:3], *parts[0:1], *parts[4:5]]
+    return clean_text(" ".join(part for part in ordered if part))
+
+
+def iter_vcard_records(lines: Iterable[str]) -> Iterator[ImportRecord]:
+    card: dict[str, str] | None = None
+    start = 0
+    for number, line in unfold_lines(lines):
+        name, _, value = line.partition(":")
+        prop = name.split(";", 1)[0].rsplit(".", 1)[-1].upper()
+        if prop == "BEGIN" and value.strip().upper() == "VCARD":
+            card, start = {}, number
+        elif card is None:
+            continue
+        elif prop == "END":
+            yield ImportRecord(
+                line=start,
+                name=_vcard_name(card),
+                email=clean_text(_vcard_text(card.get("EMAIL", ""))),
+                phone=clean_text(_vcard_text(card.get("TEL", "")).removeprefix("tel:")),
+                notes=clean_text(_vcard_text(card.get("NOTE", ""))),
+            )
+            card = None
+        elif prop in _VCARD_FIELDS:
+            # Birden çok EMAIL/TEL varsa ilki kullanılır.
+            card.setdefault(prop, value)
+
+
+def parse_import(lines: Iterable[str], import_format: str) -> Iterator[ImportRecord]:
+    if import_format not in ALLOWED_IMPORT_FORMATS:
+        raise ApplicationError("Geçersiz içe aktarma biçimi.")
+    return iter_vcard_records(lines) if import_format == "vcard" else iter_csv_records(lines)
+
+
+class ImportCustomers:
+    def __init__(
+        self,
+        repo: ICustomerRepository,
+        *,
+        batch_size: int = 500,
+        country_code: str = DEFAULT_COUNTRY_CODE,
+    ):
+        self._repo = repo
+        self._batch_size = max(1, batch_size)
+        self._country_code = country_code
+
+    def _customer(self, user_id: int, record: ImportRecord) -> Customer:
+        name = (record.name or "").strip()
+        if len(name) < 2:
+            raise ApplicationError("Ad en az 2 karakter olmalı.")
+        return Customer(
+            id=None,
+            user_id=user_id,
+            name=name[:255],
+            email=normalize_email(record.email),
+            phone=normalize_phone(record.phone, country_code=self._country_code),
+            notes=(record.notes or "")[:500] or None,
+        )
+
+    async def __call__(
+        self,
+        *,
+        user_id: int,
+        records: Iterable[ImportRecord],
+        on_batch: Callable[[CustomerImportResult, list[ImportRowError]], None] | None = None,
+    ) -> CustomerImportResult:
+        result = CustomerImportResult()
+        seen_emails: set[str] = set()
+        seen_phones: set[str] = set()
+        for chunk in chunked(records, self._batch_size):
+            errors: list[ImportRowError] = []
+            valid: list[tuple[int, Customer, str | None, str | None]] = []
+            for record in chunk:
+                result.processed += 1
+                try:
+                    customer = self._customer(user_id, record)
+                except ApplicationError as exc:
+                    result.failed += 1
+                    errors.append(ImportRowError(line=record.line, reason=str(exc)))
+                    continue
+                valid.append((record.line, customer, email_key(customer.email), phone_key(customer.phone)))
+
+            emails, phones = await self._repo.existing_contact_keys(
+                user_id=user_id,
+                email_keys={item[2] for item in valid if item[2]},
+                phone_keys={item[3] for item in valid if item[3]},
+            )
+            fresh: list[Customer] = []
+            for line, customer, ekey, pkey in valid:
+                if ekey and (ekey in emails or ekey in seen_emails):
+                    result.duplicates += 1
+                    errors.append(ImportRowError(line=line, reason=f"Mükerrer kayıt: {customer.email}"))
+                    continue
+                if pkey and (pkey in phones or pkey in seen_phones):
+                    result.duplicates += 1
+                    errors.append(ImportRowError(line=line, reason=f"Mükerrer kayıt: {customer.phone}"))
+                    continue
+                if ekey:
+                    seen_emails.add(ekey)
+                if pkey:
+                    seen_phones.add(pkey)
+                fresh.append(customer)
+            if fresh:
+                result.inserted += await self._repo.bulk_insert(user_id=user_id, customers=fresh)
+
+            report_errors(result.errors, errors)
+            if on_batch is not None:
+                on_batch(result, errors)
+        return result
+
+
+class RunCustomerImport(ImportJobRunner[CustomerImportJob, CustomerImportResult]):
+    """Worker tarafında yüklenen müşteri dosyasını işler."""
+
+    progress_fields = ("processed", "inserted", "duplicates", "failed")
+
+    def __init__(self, importer: ImportCustomers, storage: ICustomerImportStorage):
+        super().__init__(storage)
+        self._importer = importer
+
+    async def __call__(self, *, user_id: int, job_id: str) -> CustomerImportJob:
+        return await self.run(
+            user_id=user_id,
+            job_id=job_id,
+            process=lambda job, lines, on_batch: self._importer(
+                user_id=user_id, records=parse_import(lines, job.format), on_batch=on_batch
+            ),
+        )
+
+
+__all__ = [
+    "ALLOWED_IMPORT_FORMATS",
+    "CustomerImportResult",
+    "ImportCustomers",
+    "ImportRecord",
+    "RunCustomerImport",
+    "detect_import_format",
+    "iter_csv_records",
+    "iter_vcard_records",
+    "parse_import",
+]
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Protocol, Sequence
+from typing import Iterable, Protocol, Sequence
 
-from sytefy_backend.modules.customers.domain.entities import Customer
+from sytefy_backend.core.imports import IImportStorage
+from sytefy_backend.modules.customers.domain.entities import Customer, CustomerImportJob, CustomerMatch
 
 
 class ICustomerRepository(Protocol):
@@ -21,3 +22,33 @@ class ICustomerRepository(Protocol):
     ) -> Customer: ...
 
     async def get_by_id(self, customer_id: int) -> Customer | None: ...
+
+    async def get_many(self, customer_ids: Iterable[int]) -> dict[int, Customer]:
+        """Tek `IN (...)` sorgusuyla yükler; bulunamayan kimlikler sonuçta yer almaz."""
+        ...
+
+    async def existing_contact_keys(
+        self, *, user_id: int, email_keys: Iterable[str], phone_keys: Iterable[str]
+    ) -> tuple[set[str], set[str]]:
+        """Kullanıcının müşterilerinde zaten bulunan e-posta ve telefon anahtarları."""
+        ...
+
+    async def find_by_contact_keys(
+        self, *, user_id: int, email_keys: Iterable[str], phone_keys: Iterable[str]
+    ) -> list[Customer]:
+        """E-posta ya da telefon anahtarı eşleşen etkin müşteriler (kimlik sırasıyla)."""
+        ...
+
+    async def bulk_insert(self, *, user_id: int, customers: Sequence[Customer]) -> int:
+        """Çok satırlı tek INSERT ile ekler ve işlemi onaylar; eklenen satır sayısını döner."""
+        ...
+
+
+class ICustomerSearch(Protocol):
+    async def search(self, *, user_id: int, query: str, limit: int) -> list[CustomerMatch]:
+        """`query` normalize edilmiş metindir; sonuçlar skora göre azalan sıradadır."""
+        ...
+
+
+class ICustomerImportStorage(IImportStorage[CustomerImportJob], Protocol):
+    """Müşteri içe aktarma işlerinin durum, kaynak dosya ve hata raporu deposu."""
@@ -0,0 +1,90 @@
+"""İstek kapsamlı müşteri yükleyicisi (DataLoader)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Iterable
+
+from sytefy_backend.modules.customers.application.interfaces import ICustomerRepository
+from sytefy_backend.modules.customers.domain.entities import Customer
+
+
+class CustomerLoader:
+    """Aynı döngü turunda istenen müşterileri tek `get_many` sorgusunda toplar.
+
+    Sonuçlar kimlik haritasında tutulur; aynı müşteri istek boyunca yeniden sorgulanmaz.
+    Toplu sorgular kilitle sıralanır, böylece paylaşılan oturum eşzamanlı kullanılmaz.
+    Gönderim görevleri tamamlanana kadar referansları tutulur; kuyruğa anahtar ekleyen çağıran
+    görevin kendisini bekler, böylece görev iptal edilirse ya da hata verirse askıda kalmaz.
+    Örnek istek başına oluşturulmalıdır; güncel olmayan veri süreçler arasında taşınmaz.
+    """
+
+    def __init__(self, repo: ICustomerRepository):
+        self._repo = repo
+        self._cache: dict[int, asyncio.Future[Customer | None]] = {}
+        self._queue: list[int] = []
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._dispatching: asyncio.Task[None] | None = None
+
+    def prime(self, customers: Iterable[Customer]) -> None:
+        loop = asyncio.get_running_loop()
+        for customer in customers:
+            if customer.id is None or customer.id in self._cache:
+                continue
+            future = loop.create_future()
+            future.set_result(customer)
+            self._cache[customer.id] = future
+
+    async def load(self, customer_id: int) -> Customer | None:
+        future = self._cache.get(customer_id)
+        if future is not None:
+            return await asyncio.shield(future)
+        future = self._cache[customer_id] = asyncio.get_running_loop().create_future()
+        if not self._queue:
+            # İlk bekleyen anahtar toplu gönderimi planlar; görev bu turdaki diğer çağıranlardan
+            # sonra çalışır, onların anahtarları da aynı kuyruğa eklenir.
+            task = asyncio.create_task(self._dispatch())
+            self._tasks.add(task)
+            task.add_done_callback(self._on_dispatch_done)
+            self._dispatching = task
+        self._queue.append(customer_id)
+        # Kalkan, bir çağıranın iptalinin aynı partiyi bekleyen diğerlerini etkilemesini önler.
+        await asyncio.shield(self._dispatching)  # type: ignore[arg-type]
+        return future.result()
+
+    async def load_many(self, customer_ids: Iterable[int]) -> dict[int, Customer]:
+        ids = list(dict.fromkeys(customer_ids))
+        results = await asyncio.gather(*(self.load(customer_id) for customer_id in ids))
+        return {customer_id: customer for customer_id, customer in zip(ids, results) if customer is not None}
+
+    def _on_dispatch_done(self, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        if task.cancelled() and task is self._dispatching:
+            # Başlamadan iptal edilen görev partiyi hiç almamıştır; anahtarlar yeniden denenebilsin.
+            batch, self._queue = self._queue, []
+            for customer_id in batch:
+                self._cache.pop(customer_id).cancel()
+
+    async def _dispatch(self) -> None:
+        batch, self._queue = self._queue, []
+        try:
+            async with self._lock:
+                found = await self._repo.get_many(batch)
+        except asyncio.CancelledError:
+            for customer_id in batch:
+                self._cache.pop(customer_id).cancel()
+            raise
+        except Exception as exc:  # noqa: BLE001 - hata bekleyen tüm çağıranlara iletilir
+            for customer_id in batch:
+                future = self._cache.pop(customer_id)
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for customer_id in batch:
+            future = self._cache[customer_id]
+            if not future.done():
+                future.set_result(found.get(customer_id))
+
+
+__all__ = ["CustomerLoader"]
@@ -0,0 +1,52 @@
+"""Müşteri araması için metin normalizasyonu.
+
+Veritabanındaki `search_text` sütunu ve sorgular aynı kurallarla üretilir: Türkçe
+karakterler ASCII karşılığına indirgenir, küçük harfe çevrilir, telefonlarda yalnızca
+rakamlar tutulur. Böylece "ayse" sorgusu "Ayşe" kaydını bulur.
+"""
+
+from __future__ import annotations
+
+import re
+
+_FOLD = str.maketrans("ıİşŞğĞüÜöÖçÇâÂîÎûÛ", "iissgguuoocciiaauu")
+_SEPARATORS = re.compile(r"[^a-z0-9@._+-]+")
+_NON_DIGITS = re.compile(r"\D+")
+
+MIN_QUERY_LENGTH = 1
+MAX_QUERY_LENGTH = 100
+
+
+def normalize_search_text(value: str | None) -> str:
+    if not value:
+        return ""
+    folded = value.translate(_FOLD).lower()
+    return " ".join(_SEPARATORS.sub(" ", folded).split())
+
+
+def customer_search_text(name: str, email: str | None, phone: str | None) -> str:
+    parts = [normalize_search_text(name), normalize_search_text(email)]
+    digits = _NON_DIGITS.sub("", phone or "")
+    if digits:
+        parts.append(digits)
+    return " ".join(part for part in parts if part)
+
+
+def normalize_query(query: str) -> str:
+    """Sorguyu `search_text` ile karşılaştırılabilir hale getirir; harfsiz sorgular telefon sayılır."""
+    text = normalize_search_text(query[:MAX_QUERY_LENGTH])
+    if text and not any(char.isalpha() for char in text):
+        # "0555 123 45" → "55512345": baştaki trunk sıfırı kayıtlı "+90..." yazımıyla da eşleşsin diye atılır.
+        digits = _NON_DIGITS.sub("", text).lstrip("0")
+        if digits:
+            return digits
+    return text
+
+
+__all__ = [
+    "MAX_QUERY_LENGTH",
+    "MIN_QUERY_LENGTH",
+    "customer_search_text",
+    "normalize_query",
+    "normalize_search_text",
+]
@@ -4,8 +4,12 @@ from __future__ import annotations
 
 from typing import Sequence
 
-from sytefy_backend.modules.customers.application.interfaces import ICustomerRepository
-from sytefy_backend.modules.customers.domain.entities import Customer
+from sytefy_backend.core.exceptions import ApplicationError
+from sytefy_backend.modules.customers.application.interfaces import ICustomerRepository, ICustomerSearch
+from sytefy_backend.modules.customers.application.search import MIN_QUERY_LENGTH, normalize_query
+from sytefy_backend.modules.customers.domain.entities import Customer, CustomerMatch
+
+MAX_SEARCH_LIMIT = 50
 
 
 class ListCustomers:
@@ -36,3 +40,18 @@ class CreateCustomer:
             phone=phone,
             notes=notes,
         )
+
+
+class SearchCustomers:
+    def __init__(self, search: ICustomerSearch):
+        self._search = search
+
+    async def __call__(self, *, user_id: int, query: str, limit: int = 20) -> list[CustomerMatch]:
+        normalized = normalize_query(query)
+        if len(normalized) < MIN_QUERY_LENGTH:
+            raise ApplicationError("Arama metni boş olamaz.")
+        return await self._search.search(
+            user_id=user_id,
+            query=normalized,
+            limit=max(1, min(limit, MAX_SEARCH_LIMIT)),
+        )
@@ -18,3 +18,24 @@ class Customer:
     is_active: bool = True
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class CustomerMatch:
+    customer: Customer
+    score: float
+
+
+@dataclass(slots=True)
+class CustomerImportJob:
+    job_id: str
+    user_id: int
+    format: str
+    status: str
+    size: int = 0
+    position: int = 0
+    processed: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    error: Optional[str] = None
@@ -0,0 +1,21 @@
+"""Müşteri içe aktarma işlerinin yerel diskte saklanması (düzen için bkz. `core.imports.storage`)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from sytefy_backend.config.settings import Settings
+from sytefy_backend.core.imports import LocalImportStorage
+from sytefy_backend.modules.customers.domain.entities import CustomerImportJob
+
+
+class LocalCustomerImportStorage(LocalImportStorage[CustomerImportJob]):
+    def __init__(self, root: str | Path):
+        super().__init__(root, job_type=CustomerImportJob)
+
+
+def get_customer_import_storage(settings: Settings) -> LocalCustomerImportStorage:
+    return LocalCustomerImportStorage(settings.customer_import_storage_dir)
+
+
+__all__ = ["LocalCustomerImportStorage", "get_customer_import_storage"]
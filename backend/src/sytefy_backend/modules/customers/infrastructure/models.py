@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, event
 from sqlalchemy.orm import Mapped, mapped_column
 
 from sytefy_backend.core.database.base import Base
+from sytefy_backend.modules.customers.application.contacts import email_key, phone_key
+from sytefy_backend.modules.customers.application.search import customer_search_text
 
 
 class CustomerModel(Base):
@@ -19,6 +21,37 @@ class CustomerModel(Base):
     email: Mapped[str | None] = mapped_column(String(255), nullable=True)
     phone: Mapped[str | None] = mapped_column(String(50), nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Ad, e-posta ve telefonun normalize birleşimi; PostgreSQL'de trigram GIN indeksiyle aranır.
+    search_text: Mapped[str] = mapped_column(String(600), nullable=False, default="")
+    # Mükerrer kontrolü anahtarları: küçük harf e-posta ve telefonun son 10 hanesi.
+    email_key: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    phone_key: Mapped[str | None] = mapped_column(String(16), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+Index(
+    "ix_customers_search_trgm",
+    CustomerModel.search_text,
+    postgresql_using="gin",
+    postgresql_ops={"search_text": "gin_trgm_ops"},
+)
+Index(
+    "ix_customers_user_search_prefix",
+    CustomerModel.user_id,
+    CustomerModel.search_text,
+    postgresql_ops={"search_text": "text_pattern_ops"},
+)
+
+# Eşitlik aramasında PostgreSQL hash indeksi B-tree'den küçüktür; diğer veritabanlarında B-tree kullanılır.
+Index("ix_customers_email_key", CustomerModel.email_key, postgresql_using="hash")
+Index("ix_customers_phone_key", CustomerModel.phone_key, postgresql_using="hash")
+
+
+@event.listens_for(CustomerModel, "before_insert")
+@event.listens_for(CustomerModel, "before_update")
+def _fill_search_text(mapper, connection, target: CustomerModel) -> None:
+    target.search_text = customer_search_text(target.name, target.email, target.phone)
+    target.email_key = email_key(target.email)
+    target.phone_key = phone_key(target.phone)
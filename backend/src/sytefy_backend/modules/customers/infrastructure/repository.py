@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
-from typing import Sequence
+from datetime import datetime
+from typing import Iterable, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import insert, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from sytefy_backend.modules.customers.application.contacts import email_key, phone_key
 from sytefy_backend.modules.customers.application.interfaces import ICustomerRepository
+from sytefy_backend.modules.customers.application.search import customer_search_text
 from sytefy_backend.modules.customers.domain.entities import Customer
 from sytefy_backend.modules.customers.infrastructure.models import CustomerModel
 
+# SQLite'ın bağlı parametre sınırının (999) altında kalınır.
+GET_MANY_CHUNK_SIZE = 500
+
 
 def _to_entity(model: CustomerModel) -> Customer:
     return Customer(
@@ -67,3 +73,80 @@ class CustomerRepository(ICustomerRepository):
         if not model:
             return None
         return _to_entity(model)
+
+    async def get_many(self, customer_ids: Iterable[int]) -> dict[int, Customer]:
+        ids = sorted(set(customer_ids))
+        found: dict[int, Customer] = {}
+        for start in range(0, len(ids), GET_MANY_CHUNK_SIZE):
+            chunk = ids[start : start + GET_MANY_CHUNK_SIZE]
+            result = await self._session.execute(select(CustomerModel).where(CustomerModel.id.in_(chunk)))
+            found.update((model.id, _to_entity(model)) for model in result.scalars().all())
+        return found
+
+    async def existing_contact_keys(
+        self, *, user_id: int, email_keys: Iterable[str], phone_keys: Iterable[str]
+    ) -> tuple[set[str], set[str]]:
+        emails, phones = sorted(set(email_keys)), sorted(set(phone_keys))
+        found_emails: set[str] = set()
+        found_phones: set[str] = set()
+        for start in range(0, max(len(emails), len(phones)), GET_MANY_CHUNK_SIZE):
+            email_chunk = emails[start : start + GET_MANY_CHUNK_SIZE]
+            phone_chunk = phones[start : start + GET_MANY_CHUNK_SIZE]
+            result = await self._session.execute(
+                select(CustomerModel.email_key, CustomerModel.phone_key).where(
+                    CustomerModel.user_id == user_id,
+                    CustomerModel.is_active.is_(True),
+                    or_(CustomerModel.email_key.in_(email_chunk), CustomerModel.phone_key.in_(phone_chunk)),
+                )
+            )
+            for found_email, found_phone in result.all():
+                if found_email:
+                    found_emails.add(found_email)
+                if found_phone:
+                    found_phones.add(found_phone)
+        return found_emails, found_phones
+
+    async def find_by_contact_keys(
+        self, *, user_id: int, email_keys: Iterable[str], phone_keys: Iterable[str]
+    ) -> list[Customer]:
+        emails, phones = sorted(set(email_keys)), sorted(set(phone_keys))
+        found: dict[int, Customer] = {}
+        for start in range(0, max(len(emails), len(phones)), GET_MANY_CHUNK_SIZE):
+            email_chunk = emails[start : start + GET_MANY_CHUNK_SIZE]
+            phone_chunk = phones[start : start + GET_MANY_CHUNK_SIZE]
+            result = await self._session.execute(
+                select(CustomerModel)
+                .where(
+                    CustomerModel.user_id == user_id,
+                    CustomerModel.is_active.is_(True),
+                    or_(CustomerModel.email_key.in_(email_chunk), CustomerModel.phone_key.in_(phone_chunk)),
+                )
+                .order_by(CustomerModel.id)
+            )
+            found.update((model.id, _to_entity(model)) for model in result.scalars().all())
+        return list(found.values())
+
+    async def bulk_insert(self, *, user_id: int, customers: Sequence[Customer]) -> int:
+        if not customers:
+            return 0
+        # Çekirdek INSERT eşleyici olaylarını tetiklemez; türetilmiş sütunlar burada doldurulur.
+        now = datetime.utcnow()
+        rows = [
+            {
+                "user_id": user_id,
+                "name": customer.name,
+                "email": customer.email,
+                "phone": customer.phone,
+                "notes": customer.notes,
+                "search_text": customer_search_text(customer.name, customer.email, customer.phone),
+                "email_key": email_key(customer.email),
+                "phone_key": phone_key(customer.phone),
+                "is_active": True,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for customer in customers
+        ]
+        await self._session.execute(insert(CustomerModel).values(rows))
+        await self._session.commit()
+        return len(rows)
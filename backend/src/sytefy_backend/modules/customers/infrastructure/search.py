@@ -0,0 +1,311 @@
+"""Müşteri arama arka uçları.
+
+PostgreSQL'de `customers.search_text` üzerindeki pg_trgm GIN indeksi (içerik/benzerlik) ve
+`(user_id, search_text text_pattern_ops)` B-tree indeksi (kısa önek) kullanılır. Diğer
+veritabanlarında kullanıcı başına süreç içi n-gram indeksi kurulur; indeks, kullanıcının
+müşteri sayısı ve son güncelleme zamanı değişince yeniden oluşturulur.
+"""
+
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from datetime import datetime
+from math import ceil
+from typing import Iterable, Iterator
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Row, case, func, literal, or_, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sytefy_backend.modules.customers.application.interfaces import ICustomerSearch
+from sytefy_backend.modules.customers.domain.entities import Customer, CustomerMatch
+from sytefy_backend.modules.customers.infrastructure.models import CustomerModel
+
+TRIGRAM_MIN_LENGTH = 3
+# pg_trgm `word_similarity_threshold` varsayılanı.
+SIMILARITY_THRESHOLD = 0.6
+# Sıralama katmanları; skor = katman + trigram benzerliği.
+PREFIX_TIER = 3.0
+WORD_PREFIX_TIER = 2.0
+CONTAINS_TIER = 1.0
+MAX_CACHED_USERS = 32
+
+_COLUMNS = (
+    CustomerModel.id,
+    CustomerModel.user_id,
+    CustomerModel.name,
+    CustomerModel.email,
+    CustomerModel.phone,
+    CustomerModel.notes,
+    CustomerModel.is_active,
+    CustomerModel.created_at,
+    CustomerModel.updated_at,
+    CustomerModel.search_text,
+)
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def trigrams(text: str) -> set[str]:
+    """pg_trgm ile aynı biçimde: her kelime "  kelime " olarak doldurulup 3'lü parçalara ayrılır."""
+    grams: set[str] = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[index : index + 3] for index in range(len(padded) - 2))
+    return grams
+
+
+def _padded(text: str) -> str:
+    # Kelimeler pg_trgm dolgusuyla yan yana yazılır; sorgu trigramları bu metinde alt dize olarak aranır.
+    return "".join(f"  {word} " for word in text.split())
+
+
+def _customer(row) -> Customer:
+    return Customer(
+        id=row.id,
+        user_id=row.user_id,
+        name=row.name,
+        email=row.email,
+        phone=row.phone,
+        notes=row.notes,
+        is_active=row.is_active,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+
+
+class PostgresCustomerSearch(ICustomerSearch):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def search(self, *, user_id: int, query: str, limit: int) -> list[CustomerMatch]:
+        text = CustomerModel.search_text
+        escaped = _escape_like(query)
+        filters = [CustomerModel.user_id == user_id, CustomerModel.is_active.is_(True)]
+        prefix = text.like(f"{escaped}%", escape="\\")
+        if len(query) < TRIGRAM_MIN_LENGTH:
+            # Trigram indeksi 1-2 karakterde işe yaramaz; B-tree önek taraması kullanılır.
+            stmt = (
+                select(*_COLUMNS, literal(PREFIX_TIER).label("score"))
+                .where(*filters, prefix)
+                .order_by(text, CustomerModel.id)
+            )
+        else:
+            contains = text.like(f"%{escaped}%", escape="\\")
+            tier = case(
+                (prefix, PREFIX_TIER),
+                (text.like(f"% {escaped}%", escape="\\"), WORD_PREFIX_TIER),
+                (contains, CONTAINS_TIER),
+                else_=0.0,
+            )
+            similarity = func.word_similarity(query, text)
+            stmt = (
+                select(*_COLUMNS, (tier + similarity).label("score"))
+                .where(*filters, or_(contains, literal(query).op("<%")(text)))
+                .order_by(tier.desc(), case((contains, 0.0), else_=similarity).desc(), text, CustomerModel.id)
+            )
+        rows = (await self._session.execute(stmt.limit(limit))).all()
+        return [CustomerMatch(customer=_customer(row), score=round(float(row.score), 4)) for row in rows]
+
+
+class NgramIndex:
+    """Tek kullanıcının aktif müşterileri için sıralı metin/kelime listeleri ve trigram ters indeksi.
+
+    Sonuçlar katman katman doldurulur (ad öneki, kelime öneki, alt dize ya da benzerlik); alt
+    katmanlar yalnızca üsttekiler `limit`i doldurmazsa hesaplanır. Güncellemeler yalnızca
+    ekleme yapar; eskiyen girdiler güncel metinle karşılaştırılarak elenir, böylece tek
+    müşteri değişikliği tüm indeksi yeniden kurdurmaz.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.latest: datetime | None = None
+        self._rows: dict[int, Row] = {}
+        self._padded: dict[int, str] = {}
+        self._seen: set[int] = set()
+        self._texts: list[tuple[str, int]] = []
+        self._words: list[tuple[str, int]] = []
+        self._grams: dict[str, list[int]] = {}
+
+    @property
+    def seen(self) -> int:
+        return len(self._seen)
+
+    def apply(self, rows: Iterable[Row], *, bulk: bool = False) -> None:
+        texts: list[tuple[str, int]] = []
+        words: list[tuple[str, int]] = []
+        for row in rows:
+            self._seen.add(row.id)
+            if row.updated_at is not None and (self.latest is None or row.updated_at > self.latest):
+                self.latest = row.updated_at
+            if not row.is_active:
+                self._rows.pop(row.id, None)
+                self._padded.pop(row.id, None)
+                continue
+            text = row.search_text or ""
+            previous = self._rows.get(row.id)
+            self._rows[row.id] = row
+            if previous is not None and previous.search_text == text:
+                continue
+            self._padded[row.id] = _padded(text)
+            texts.append((text, row.id))
+            words.extend((word, row.id) for word in set(text.split()))
+            for gram in trigrams(text):
+                self._grams.setdefault(gram, []).append(row.id)
+        for target, items in ((self._texts, texts), (self._words, words)):
+            if bulk:
+                target.extend(items)
+                target.sort()
+            else:
+                for item in items:
+                    insort(target, item)
+
+    @staticmethod
+    def _range(items: list[tuple[str, int]], query: str) -> Iterator[tuple[str, int]]:
+        index = bisect_left(items, (query, -1))
+        while index < len(items) and items[index][0].startswith(query):
+            yield items[index]
+            index += 1
+
+    def _is_current(self, customer_id: int, text: str) -> bool:
+        row = self._rows.get(customer_id)
+        return row is not None and row.search_text == text
+
+    def _similarity(self, customer_id: int, query_grams: set[str]) -> float:
+        padded = self._padded[customer_id]
+        return sum(1 for gram in query_grams if gram in padded) / len(query_grams)
+
+    def _word_prefix_hits(self, query: str, exclude: set[int], limit: int) -> list[int]:
+        needle = f"  {query}"
+        hits = {
+            customer_id
+            for _, customer_id in self._range(self._words, query)
+            if customer_id not in exclude and needle in self._padded.get(customer_id, "")
+        }
+        return heapq.nsmallest(limit, hits, key=lambda customer_id: (self._rows[customer_id].search_text, customer_id))
+
+    def _contains_or_similar(self, query: str, query_grams: set[str], exclude: set[int], limit: int) -> list[int]:
+        # Eşiği geçen her kayıt en nadir (n - gerekli + 1) trigramdan en az birini içerir.
+        ordered = sorted(query_grams, key=lambda gram: len(self._grams.get(gram, ())))
+        needed = ceil(SIMILARITY_THRESHOLD * len(ordered))
+        candidates: set[int] = set()
+        for gram in ordered[: len(ordered) - needed + 1]:
+            candidates.update(self._grams.get(gram, ()))
+        inner = [gram for gram in ordered if " " not in gram]
+        if inner:
+            # Alt dize eşleşmeleri kelime içi trigramların hepsini, dolayısıyla en nadirini de içerir.
+            candidates.update(self._grams.get(inner[0], ()))
+        matches = []
+        for customer_id in candidates - exclude:
+            row = self._rows.get(customer_id)
+            if row is None:
+                continue
+            if query in row.search_text:
+                matches.append((-CONTAINS_TIER, 0.0, row.search_text, customer_id))
+                continue
+            similarity = self._similarity(customer_id, query_grams)
+            if similarity >= SIMILARITY_THRESHOLD:
+                matches.append((0.0, -similarity, row.search_text, customer_id))
+        return [item[3] for item in heapq.nsmallest(limit, matches)]
+
+    def search(self, query: str, limit: int) -> list[CustomerMatch]:
+        query_grams = trigrams(query)
+        picked: dict[int, float] = {}
+
+        def take(tier: float, customer_ids: Iterable[int]) -> None:
+            for customer_id in customer_ids:
+                if len(picked) >= limit:
+                    return
+                if customer_id not in picked:
+                    picked[customer_id] = tier + self._similarity(customer_id, query_grams)
+
+        take(
+            PREFIX_TIER,
+            (customer_id for text, customer_id in self._range(self._texts, query) if self._is_current(customer_id, text)),
+        )
+        if len(query) >= TRIGRAM_MIN_LENGTH:
+            if len(picked) < limit:
+                take(WORD_PREFIX_TIER, self._word_prefix_hits(query, set(picked), limit - len(picked)))
+            if len(picked) < limit:
+                for customer_id in self._contains_or_similar(query, query_grams, set(picked), limit - len(picked)):
+                    tier = CONTAINS_TIER if query in self._rows[customer_id].search_text else 0.0
+                    take(tier, (customer_id,))
+        return [
+            CustomerMatch(customer=_customer(self._rows[customer_id]), score=round(score, 4))
+            for customer_id, score in picked.items()
+        ]
+
+
+class NgramCustomerSearch(ICustomerSearch):
+    def __init__(self, session: AsyncSession, cache: OrderedDict[int, NgramIndex]):
+        self._session = session
+        self._cache = cache
+
+    async def _stamp(self, user_id: int) -> tuple[int, datetime | None]:
+        row = (
+            await self._session.execute(
+                select(func.count(CustomerModel.id), func.max(CustomerModel.updated_at)).where(
+                    CustomerModel.user_id == user_id
+                )
+            )
+        ).one()
+        return int(row[0]), row[1]
+
+    async def _rows(self, user_id: int, since: datetime | None = None):
+        # Pasif satırlar da okunur; indekse girmezler ama sayım karşılaştırmasında gerekir.
+        stmt = select(*_COLUMNS).where(CustomerModel.user_id == user_id)
+        if since is not None:
+            stmt = stmt.where(CustomerModel.updated_at >= since)
+        return (await self._session.execute(stmt)).all()
+
+    async def _index(self, user_id: int) -> NgramIndex:
+        count, latest = await self._stamp(user_id)
+        index = self._cache.get(user_id)
+        if index is not None and (index.count, index.latest) != (count, latest):
+            # Yalnızca son görülen güncellemeden sonra değişen satırlar uygulanır.
+            index.apply(await self._rows(user_id, since=index.latest))
+            index.count = count
+            if index.seen != count:
+                # Silinen ya da eski zaman damgalı satırlar: fark hesaplanamaz, yeniden kurulur.
+                index = None
+        if index is None:
+            index = NgramIndex()
+            index.apply(await self._rows(user_id), bulk=True)
+            index.count = count
+        self._cache[user_id] = index
+        self._cache.move_to_end(user_id)
+        while len(self._cache) > MAX_CACHED_USERS:
+            self._cache.popitem(last=False)
+        return index
+
+    async def search(self, *, user_id: int, query: str, limit: int) -> list[CustomerMatch]:
+        return (await self._index(user_id)).search(query, limit)
+
+
+_indexes: WeakKeyDictionary[Engine, OrderedDict[int, NgramIndex]] = WeakKeyDictionary()
+
+
+def get_customer_search(session: AsyncSession) -> ICustomerSearch:
+    """PostgreSQL'de indeksli SQL araması, diğer veritabanlarında motor başına paylaşılan n-gram indeksi."""
+    bind = session.get_bind()
+    if bind.dialect.name == "postgresql":
+        return PostgresCustomerSearch(session)
+    engine = bind if isinstance(bind, Engine) else bind.engine
+    cache = _indexes.get(engine)
+    if cache is None:
+        cache = _indexes[engine] = OrderedDict()
+    return NgramCustomerSearch(session, cache)
+
+
+__all__ = [
+    "NgramCustomerSearch",
+    "NgramIndex",
+    "PostgresCustomerSearch",
+    "get_customer_search",
+    "trigrams",
+]
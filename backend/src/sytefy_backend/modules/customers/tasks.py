@@ -0,0 +1,47 @@
+"""Celery tasks for large customer imports."""
+
+from __future__ import annotations
+
+import asyncio
+
+import structlog
+
+from sytefy_backend.config import get_settings
+from sytefy_backend.core.database.session import _SessionLocal
+from sytefy_backend.core.tasks.celery_app import celery_app
+from sytefy_backend.modules.customers.application.imports import ImportCustomers, RunCustomerImport
+from sytefy_backend.modules.customers.infrastructure.imports import get_customer_import_storage
+from sytefy_backend.modules.customers.infrastructure.repository import CustomerRepository
+
+logger = structlog.get_logger("sytefy.customers.imports")
+
+
+@celery_app.task(bind=True, name="bulk.customers.import")
+def import_customers(self, *, user_id: int, job_id: str) -> dict[str, object]:
+    """Paylaşılan depolamaya yüklenmiş dosyadaki müşterileri parça parça ekler."""
+    settings = get_settings()
+
+    async def _import() -> None:
+        async with _SessionLocal() as session:
+            importer = ImportCustomers(
+                CustomerRepository(session),
+                batch_size=settings.customer_import_batch_size,
+                country_code=settings.customer_import_default_country_code,
+            )
+            job = await RunCustomerImport(importer, get_customer_import_storage(settings))(
+                user_id=user_id, job_id=job_id
+            )
+        logger.info(
+            "customers.imported",
+            task_id=self.request.id,
+            job_id=job_id,
+            inserted=job.inserted,
+            duplicates=job.duplicates,
+            failed=job.failed,
+        )
+
+    asyncio.run(_import())
+    return {"job_id": job_id}
+
+
+__all__ = ["import_customers"]
@@ -18,3 +18,30 @@ class CustomerResponse(StrictModel):
     email: EmailStr | None
     phone: str | None
     notes: str | None
+
+
+class CustomerSearchResponse(StrictModel):
+    id: int
+    name: str
+    email: EmailStr | None
+    phone: str | None
+    score: float
+
+
+class CustomerImportErrorResponse(StrictModel):
+    line: int
+    reason: str
+
+
+class CustomerImportResponse(StrictModel):
+    job_id: str | None = None
+    format: str
+    status: str
+    size: int
+    position: int
+    processed: int
+    inserted: int
+    duplicates: int
+    failed: int
+    error: str | None = None
+    errors: list[CustomerImportErrorResponse] = Field(default_factory=list)
@@ -1,15 +1,48 @@
 """Customer routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import io
+from uuid import uuid4
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from sytefy_backend.config import get_settings
 from sytefy_backend.core.database import get_db
+from sytefy_backend.core.exceptions import ApplicationError
+from sytefy_backend.core.imports import iter_text_lines
 from sytefy_backend.modules.auth.web.router import get_current_user
 from sytefy_backend.modules.auth.domain.entities import User
-from sytefy_backend.modules.customers.application.use_cases import CreateCustomer, ListCustomers
+from sytefy_backend.modules.customers.application.imports import (
+    ImportCustomers,
+    detect_import_format,
+    parse_import,
+)
+from sytefy_backend.modules.customers.application.interfaces import ICustomerSearch
+from sytefy_backend.modules.customers.application.search import MAX_QUERY_LENGTH
+from sytefy_backend.modules.customers.application.use_cases import (
+    MAX_SEARCH_LIMIT,
+    CreateCustomer,
+    ListCustomers,
+    SearchCustomers,
+)
+from sytefy_backend.modules.customers.domain.entities import CustomerImportJob
+from sytefy_backend.modules.customers.infrastructure.imports import (
+    LocalCustomerImportStorage,
+    get_customer_import_storage,
+)
 from sytefy_backend.modules.customers.infrastructure.repository import CustomerRepository
-from sytefy_backend.modules.customers.web.dto import CustomerCreateRequest, CustomerResponse
+from sytefy_backend.modules.customers.infrastructure.search import get_customer_search
+from sytefy_backend.modules.customers.tasks import import_customers as import_customers_task
+from sytefy_backend.modules.customers.web.dto import (
+    CustomerCreateRequest,
+    CustomerImportErrorResponse,
+    CustomerImportResponse,
+    CustomerResponse,
+    CustomerSearchResponse,
+)
 
+settings = get_settings()
 router = APIRouter(prefix="/customers", tags=["Customers"])
 
 
@@ -21,6 +54,14 @@ def get_list_use_case(repo: CustomerRepository = Depends(get_customer_repo)) ->
     return ListCustomers(repo)
 
 
+def get_search(db: AsyncSession = Depends(get_db)) -> ICustomerSearch:
+    return get_customer_search(db)
+
+
+def get_import_storage() -> LocalCustomerImportStorage:
+    return get_customer_import_storage(settings)
+
+
 def get_create_use_case(repo: CustomerRepository = Depends(get_customer_repo)) -> CreateCustomer:
     return CreateCustomer(repo)
 
@@ -43,6 +84,29 @@ async def list_customers(
     ]
 
 
+@router.get("/search", response_model=list[CustomerSearchResponse])
+async def search_customers(
+    q: str = Query(min_length=1, max_length=MAX_QUERY_LENGTH),
+    limit: int = Query(default=20, ge=1, le=MAX_SEARCH_LIMIT),
+    current_user: User = Depends(get_current_user),
+    search: ICustomerSearch = Depends(get_search),
+):
+    try:
+        matches = await SearchCustomers(search)(user_id=current_user.id or 0, query=q, limit=limit)
+    except ApplicationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return [
+        CustomerSearchResponse(
+            id=match.customer.id or 0,
+            name=match.customer.name,
+            email=match.customer.email,
+            phone=match.customer.phone,
+            score=match.score,
+        )
+        for match in matches
+    ]
+
+
 @router.post("/", response_model=CustomerResponse, status_code=status.HTTP_201_CREATED)
 async def create_customer(
     payload: CustomerCreateRequest,
@@ -65,3 +129,114 @@ async def create_customer(
         phone=customer.phone,
         notes=customer.notes,
     )
+
+
+def _import_response(job: CustomerImportJob, errors=()) -> CustomerImportResponse:
+    return CustomerImportResponse(
+        job_id=job.job_id or None,
+        format=job.format,
+        status=job.status,
+        size=job.size,
+        position=job.position,
+        processed=job.processed,
+        inserted=job.inserted,
+        duplicates=job.duplicates,
+        failed=job.failed,
+        error=job.error,
+        errors=[CustomerImportErrorResponse(line=error.line, reason=error.reason) for error in errors],
+    )
+
+
+@router.post("/imports", response_model=CustomerImportResponse)
+async def import_customers(
+    request: Request,
+    response: Response,
+    import_format: str | None = Query(default=None, alias="format", pattern="^(csv|vcard)$"),
+    current_user: User = Depends(get_current_user),
+    repo: CustomerRepository = Depends(get_customer_repo),
+    storage: LocalCustomerImportStorage = Depends(get_import_storage),
+):
+    """Küçük dosyalar istek içinde işlenir; `CUSTOMER_IMPORT_INLINE_MAX_BYTES` aşılırsa gövde diske akıtılıp kuyruğa alınır."""
+    user_id = current_user.id or 0
+    stream = request.stream()
+    head = bytearray()
+    async for chunk in stream:
+        head.extend(chunk)
+        if len(head) > settings.customer_import_inline_max_bytes:
+            break
+    if not head.strip():
+        raise HTTPException(status_code=400, detail="İçe aktarma dosyası boş.")
+    import_format = import_format or detect_import_format(bytes(head[:64]))
+
+    if len(head) <= settings.customer_import_inline_max_bytes:
+        importer = ImportCustomers(
+            repo,
+            batch_size=settings.customer_import_batch_size,
+            country_code=settings.customer_import_default_country_code,
+        )
+        try:
+            result = await importer(
+                user_id=user_id,
+                records=parse_import(iter_text_lines(io.BytesIO(bytes(head))), import_format),
+            )
+        except ApplicationError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        job = CustomerImportJob(
+            job_id="",
+            user_id=user_id,
+            format=import_format,
+            status="completed",
+            size=len(head),
+            position=len(head),
+            processed=result.processed,
+            inserted=result.inserted,
+            duplicates=result.duplicates,
+            failed=result.failed,
+        )
+        return _import_response(job, result.errors)
+
+    job = CustomerImportJob(job_id=uuid4().hex, user_id=user_id, format=import_format, status="queued")
+    source = storage.source_path(job)
+    source.parent.mkdir(parents=True, exist_ok=True)
+    size = len(head)
+    with source.open("wb") as handle:
+        handle.write(head)
+        async for chunk in stream:
+            size += len(chunk)
+            if size > settings.customer_import_max_bytes:
+                handle.close()
+                source.unlink(missing_ok=True)
+                raise HTTPException(status_code=413, detail="İçe aktarma dosyası çok büyük.")
+            handle.write(chunk)
+    job.size = size
+    storage.save(job)
+    import_customers_task.delay(user_id=user_id, job_id=job.job_id)
+    response.status_code = status.HTTP_202_ACCEPTED
+    return _import_response(storage.get(user_id=user_id, job_id=job.job_id) or job)
+
+
+@router.get("/imports/{job_id}", response_model=CustomerImportResponse)
+async def get_import_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    storage: LocalCustomerImportStorage = Depends(get_import_storage),
+):
+    job = storage.get(user_id=current_user.id or 0, job_id=job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="İçe aktarma işi bulunamadı")
+    return _import_response(job)
+
+
+@router.get("/imports/{job_id}/errors")
+async def download_import_errors(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    storage: LocalCustomerImportStorage = Depends(get_import_storage),
+):
+    job = storage.get(user_id=current_user.id or 0, job_id=job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="İçe aktarma işi bulunamadı")
+    path = storage.errors_path(job)
+    if not path.exists():
+        raise HTTPException(status_code=404, detail="Hata raporu yok")
+    return FileResponse(path, media_type="text/csv", filename=f"customer-import-{job_id}-errors.csv")
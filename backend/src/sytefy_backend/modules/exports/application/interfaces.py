@@ -0,0 +1,38 @@
+"""Dışa aktarma bağımlılık arayüzleri."""
+
+from __future__ import annotations
+
+from typing import AsyncIterator, Protocol, Sequence
+
+from sytefy_backend.modules.exports.domain.entities import ExportJob
+
+
+class IExportRowSource(Protocol):
+    def columns(self, dataset: str) -> list[str]: ...
+
+    def batches(self, *, dataset: str, user_id: int, batch_size: int) -> AsyncIterator[Sequence[Sequence[object]]]: ...
+
+
+class IExportEncoder(Protocol):
+    media_type: str
+    extension: str
+
+    def begin(self, header: Sequence[str]) -> bytes: ...
+
+    def rows(self, rows: Sequence[Sequence[object]]) -> bytes: ...
+
+    def end(self) -> bytes: ...
+
+
+class IExportStorage(Protocol):
+    def create(self, job: ExportJob) -> None: ...
+
+    def get(self, *, user_id: int, job_id: str) -> ExportJob | None: ...
+
+    def open_part(self, job: ExportJob): ...
+
+    def complete(self, job: ExportJob) -> None: ...
+
+    def fail(self, job: ExportJob, error: str) -> None: ...
+
+    def path(self, job: ExportJob): ...
@@ -0,0 +1,110 @@
+"""Dışa aktarma kullanım senaryoları."""
+
+from __future__ import annotations
+
+from typing import AsyncIterator, Callable
+
+from sytefy_backend.core.exceptions import ApplicationError
+from sytefy_backend.modules.exports.application.interfaces import (
+    IExportEncoder,
+    IExportRowSource,
+    IExportStorage,
+)
+from sytefy_backend.modules.exports.domain.entities import ExportJob
+
+ALLOWED_DATASETS = {"invoices", "appointments", "customers"}
+ALLOWED_FORMATS = {"csv", "xlsx"}
+
+
+def _validate(dataset: str, export_format: str) -> None:
+    if dataset not in ALLOWED_DATASETS:
+        raise ApplicationError("Geçersiz veri kümesi.")
+    if export_format not in ALLOWED_FORMATS:
+        raise ApplicationError("Geçersiz dışa aktarma biçimi.")
+
+
+async def encode_export(
+    source: IExportRowSource,
+    encoder: IExportEncoder,
+    *,
+    dataset: str,
+    user_id: int,
+    batch_size: int,
+) -> AsyncIterator[bytes]:
+    """Başlığı hemen, ardından her veritabanı parçasını kodlanmış olarak üretir."""
+    yield encoder.begin(source.columns(dataset))
+    async for rows in source.batches(dataset=dataset, user_id=user_id, batch_size=batch_size):
+        chunk = encoder.rows(rows)
+        if chunk:
+            yield chunk
+    tail = encoder.end()
+    if tail:
+        yield tail
+
+
+class StreamExport:
+    def __init__(self, source: IExportRowSource, encoder_factory: Callable[[str], IExportEncoder]):
+        self._source = source
+        self._encoder_factory = encoder_factory
+
+    def __call__(
+        self,
+        *,
+        dataset: str,
+        export_format: str,
+        user_id: int,
+        batch_size: int,
+    ) -> tuple[IExportEncoder, AsyncIterator[bytes]]:
+        _validate(dataset, export_format)
+        encoder = self._encoder_factory(export_format)
+        stream = encode_export(self._source, encoder, dataset=dataset, user_id=user_id, batch_size=batch_size)
+        return encoder, stream
+
+
+class StartExportJob:
+    def __init__(self, storage: IExportStorage):
+        self._storage = storage
+
+    def __call__(self, *, job_id: str, user_id: int, dataset: str, export_format: str) -> ExportJob:
+        _validate(dataset, export_format)
+        job = ExportJob(
+            job_id=job_id,
+            user_id=user_id,
+            dataset=dataset,
+            format=export_format,
+            status="queued",
+            filename=f"{dataset}-{job_id}.{export_format}",
+        )
+        self._storage.create(job)
+        return job
+
+
+class RunExportJob:
+    """Worker tarafında dosyayı parça parça diske yazar."""
+
+    def __init__(
+        self,
+        source: IExportRowSource,
+        storage: IExportStorage,
+        encoder_factory: Callable[[str], IExportEncoder],
+    ):
+        self._source = source
+        self._storage = storage
+        self._encoder_factory = encoder_factory
+
+    async def __call__(self, *, user_id: int, job_id: str, batch_size: int) -> ExportJob:
+        job = self._storage.get(user_id=user_id, job_id=job_id)
+        if job is None:
+            raise ApplicationError("Dışa aktarma işi bulunamadı.")
+        encoder = self._encoder_factory(job.format)
+        try:
+            with self._storage.open_part(job) as handle:
+                async for chunk in encode_export(
+                    self._source, encoder, dataset=job.dataset, user_id=user_id, batch_size=batch_size
+                ):
+                    handle.write(chunk)
+        except Exception as exc:
+            self._storage.fail(job, str(exc))
+            raise
+        self._storage.complete(job)
+        return self._storage.get(user_id=user_id, job_id=job_id) or job
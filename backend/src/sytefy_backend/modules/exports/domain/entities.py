@@ -0,0 +1,18 @@
+"""Dışa aktarma alan nesneleri."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class ExportJob:
+    job_id: str
+    user_id: int
+    dataset: str
+    format: str
+    status: str
+    filename: str
+    size: Optional[int] = None
+    error: Optional[str] = None
@@ -0,0 +1,102 @@
+"""Dışa aktarılabilir veri kümeleri; satırlar sunucu taraflı imleçle parça parça okunur."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sytefy_backend.modules.appointments.infrastructure.models import AppointmentModel
+from sytefy_backend.modules.customers.infrastructure.models import CustomerModel
+from sytefy_backend.modules.exports.application.interfaces import IExportRowSource
+from sytefy_backend.modules.finances.infrastructure.models import InvoiceModel
+
+
+@dataclass(frozen=True, slots=True)
+class ExportDataset:
+    name: str
+    model: Any
+    columns: tuple[str, ...]
+    filters: Callable[[Any], list] = field(default=lambda model: [])
+
+
+DATASETS: dict[str, ExportDataset] = {
+    dataset.name: dataset
+    for dataset in (
+        ExportDataset(
+            name="invoices",
+            model=InvoiceModel,
+            columns=(
+                "id",
+                "number",
+                "title",
+                "customer_id",
+                "amount",
+                "currency",
+                "status",
+                "issued_at",
+                "due_date",
+                "created_at",
+            ),
+        ),
+        ExportDataset(
+            name="appointments",
+            model=AppointmentModel,
+            columns=(
+                "id",
+                "title",
+                "customer_id",
+                "channel",
+                "location",
+                "status",
+                "start_at",
+                "end_at",
+                "remind_at",
+                "created_at",
+            ),
+        ),
+        ExportDataset(
+            name="customers",
+            model=CustomerModel,
+            columns=("id", "name", "email", "phone", "notes", "created_at"),
+            filters=lambda model: [model.is_active.is_(True)],
+        ),
+    )
+}
+
+
+class SqlExportRowSource(IExportRowSource):
+    """`yield_per` ile akış; asyncpg'de sunucu taraflı imleç, bellekte en fazla bir parça tutulur."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    def columns(self, dataset: str) -> list[str]:
+        return list(DATASETS[dataset].columns)
+
+    async def batches(
+        self,
+        *,
+        dataset: str,
+        user_id: int,
+        batch_size: int,
+    ) -> AsyncIterator[Sequence[Sequence[object]]]:
+        spec = DATASETS[dataset]
+        model = spec.model
+        stmt = (
+            select(*(getattr(model, column) for column in spec.columns))
+            .where(model.user_id == user_id, *spec.filters(model))
+            .order_by(model.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream(stmt)
+        try:
+            async for partition in result.partitions(batch_size):
+                yield partition
+        finally:
+            await result.close()
+
+
+__all__ = ["DATASETS", "ExportDataset", "SqlExportRowSource"]
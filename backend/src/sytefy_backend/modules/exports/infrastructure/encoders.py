@@ -0,0 +1,160 @@
+"""Artımlı CSV ve XLSX kodlayıcılar; her çağrı yalnızca yeni üretilen baytları döndürür."""
+
+from __future__ import annotations
+
+import csv
+import io
+import zipfile
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Sequence
+from xml.sax.saxutils import escape
+
+from sytefy_backend.modules.exports.application.interfaces import IExportEncoder
+
+
+def _text(value: object) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return ",".join(str(item) for item in value)
+    return str(value)
+
+
+class CsvEncoder(IExportEncoder):
+    media_type = "text/csv; charset=utf-8"
+    extension = "csv"
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\r\n")
+
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def begin(self, header: Sequence[str]) -> bytes:
+        self._writer.writerow(header)
+        # BOM, Excel'in UTF-8 (Türkçe karakterler) algılaması için.
+        return b"\xef\xbb\xbf" + self._drain()
+
+    def rows(self, rows: Sequence[Sequence[object]]) -> bytes:
+        self._writer.writerows([_text(value) for value in row] for row in rows)
+        return self._drain()
+
+    def end(self) -> bytes:
+        return b""
+
+
+class _Sink:
+    """Seek desteklemeyen yazma hedefi; zipfile veri tanımlayıcılarıyla akış modunda yazar."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    "</Types>"
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Export" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    "</Relationships>"
+)
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_TAIL = "</sheetData></worksheet>"
+
+
+def _cell(value: object) -> str:
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return f"<c><v>{value}</v></c>"
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{escape(_text(value))}</t></is></c>'
+
+
+class XlsxEncoder(IExportEncoder):
+    """Harici kütüphane olmadan tek sayfalık XLSX; satırlar sayfa XML'ine sıkıştırılarak akıtılır."""
+
+    media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    extension = "xlsx"
+
+    def __init__(self):
+        self._sink = _Sink()
+        self._zip = zipfile.ZipFile(self._sink, mode="w", compression=zipfile.ZIP_DEFLATED)
+        self._sheet = None
+
+    def _row(self, values: Sequence[object]) -> str:
+        return "<row>" + "".join(_cell(value) for value in values) + "</row>"
+
+    def begin(self, header: Sequence[str]) -> bytes:
+        self._zip.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        self._zip.writestr("_rels/.rels", _ROOT_RELS)
+        self._zip.writestr("xl/workbook.xml", _WORKBOOK)
+        self._zip.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        self._sheet = self._zip.open("xl/worksheets/sheet1.xml", mode="w", force_zip64=True)
+        self._sheet.write((_SHEET_HEAD + self._row(header)).encode("utf-8"))
+        return self._sink.drain()
+
+    def rows(self, rows: Sequence[Sequence[object]]) -> bytes:
+        self._sheet.write("".join(self._row(row) for row in rows).encode("utf-8"))
+        return self._sink.drain()
+
+    def end(self) -> bytes:
+        self._sheet.write(_SHEET_TAIL.encode("utf-8"))
+        self._sheet.close()
+        self._zip.close()
+        return self._sink.drain()
+
+
+ENCODERS: dict[str, type[IExportEncoder]] = {"csv": CsvEncoder, "xlsx": XlsxEncoder}
+
+
+def get_encoder(export_format: str) -> IExportEncoder:
+    return ENCODERS[export_format]()
+
+
+__all__ = ["CsvEncoder", "ENCODERS", "XlsxEncoder", "get_encoder"]
@@ -0,0 +1,76 @@
+"""Arka plan dışa aktarımlarının yerel diskte saklanması.
+
+Dosya `<kök>/<user_id>/<job_id>.<uzantı>.part` olarak yazılır ve tamamlanınca atomik olarak
+yeniden adlandırılır; iş durumu yanındaki `<job_id>.json` dosyasında tutulur. Kök dizin
+web ve worker süreçleri arasında paylaşılan bir birim olmalıdır.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import asdict, replace
+from pathlib import Path
+from typing import BinaryIO
+
+from sytefy_backend.config.settings import Settings
+from sytefy_backend.modules.exports.application.interfaces import IExportStorage
+from sytefy_backend.modules.exports.domain.entities import ExportJob
+
+_JOB_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+class LocalExportStorage(IExportStorage):
+    def __init__(self, root: str | Path):
+        self._root = Path(root)
+
+    def _dir(self, user_id: int) -> Path:
+        return self._root / str(user_id)
+
+    def _meta(self, user_id: int, job_id: str) -> Path:
+        return self._dir(user_id) / f"{job_id}.json"
+
+    def path(self, job: ExportJob) -> Path:
+        return self._dir(job.user_id) / job.filename
+
+    def _write_meta(self, job: ExportJob) -> None:
+        target = self._meta(job.user_id, job.job_id)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(asdict(job)), encoding="utf-8")
+        os.replace(tmp, target)
+
+    def create(self, job: ExportJob) -> None:
+        self._write_meta(job)
+
+    def get(self, *, user_id: int, job_id: str) -> ExportJob | None:
+        if not _JOB_ID.match(job_id):
+            return None
+        try:
+            data = json.loads(self._meta(user_id, job_id).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        return ExportJob(**data)
+
+    def open_part(self, job: ExportJob) -> BinaryIO:
+        self._write_meta(replace(job, status="running"))
+        part = self.path(job).with_name(job.filename + ".part")
+        part.parent.mkdir(parents=True, exist_ok=True)
+        return part.open("wb")
+
+    def complete(self, job: ExportJob) -> None:
+        target = self.path(job)
+        os.replace(target.with_name(job.filename + ".part"), target)
+        self._write_meta(replace(job, status="completed", size=target.stat().st_size))
+
+    def fail(self, job: ExportJob, error: str) -> None:
+        self.path(job).with_name(job.filename + ".part").unlink(missing_ok=True)
+        self._write_meta(replace(job, status="failed", error=error))
+
+
+def get_export_storage(settings: Settings) -> LocalExportStorage:
+    return LocalExportStorage(settings.export_storage_dir)
+
+
+__all__ = ["LocalExportStorage", "get_export_storage"]
@@ -0,0 +1,38 @@
+"""Celery tasks for large exports."""
+
+from __future__ import annotations
+
+import asyncio
+
+import structlog
+
+from sytefy_backend.config import get_settings
+from sytefy_backend.core.database.session import _SessionLocal
+from sytefy_backend.core.tasks.celery_app import celery_app
+from sytefy_backend.modules.exports.application.use_cases import RunExportJob
+from sytefy_backend.modules.exports.infrastructure.datasets import SqlExportRowSource
+from sytefy_backend.modules.exports.infrastructure.encoders import get_encoder
+from sytefy_backend.modules.exports.infrastructure.storage import get_export_storage
+
+logger = structlog.get_logger("sytefy.exports")
+
+
+@celery_app.task(bind=True, name="bulk.exports.generate")
+def generate_export(self, *, user_id: int, job_id: str) -> dict[str, object]:
+    """Dışa aktarma dosyasını paylaşılan depolama dizinine yazar."""
+    settings = get_settings()
+
+    async def _generate() -> None:
+        async with _SessionLocal() as session:
+            job = await RunExportJob(
+                SqlExportRowSource(session),
+                get_export_storage(settings),
+                get_encoder,
+            )(user_id=user_id, job_id=job_id, batch_size=settings.export_batch_size)
+        logger.info("exports.generated", task_id=self.request.id, job_id=job_id, dataset=job.dataset, size=job.size)
+
+    asyncio.run(_generate())
+    return {"job_id": job_id}
+
+
+__all__ = ["generate_export"]
@@ -0,0 +1,15 @@
+"""DTOs for exports."""
+
+from __future__ import annotations
+
+from sytefy_backend.shared.validators import StrictModel
+
+
+class ExportJobResponse(StrictModel):
+    job_id: str
+    dataset: str
+    format: str
+    status: str
+    filename: str
+    size: int | None = None
+    error: str | None = None
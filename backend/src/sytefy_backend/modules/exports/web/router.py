@@ -0,0 +1,116 @@
+"""Export routes."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sytefy_backend.config import get_settings
+from sytefy_backend.core.database import get_db
+from sytefy_backend.core.exceptions import ApplicationError
+from sytefy_backend.core.web import open_streaming_session, stream_and_close
+from sytefy_backend.modules.auth.domain.entities import User
+from sytefy_backend.modules.auth.web.router import get_current_user
+from sytefy_backend.modules.exports.application.use_cases import StartExportJob, StreamExport
+from sytefy_backend.modules.exports.domain.entities import ExportJob
+from sytefy_backend.modules.exports.infrastructure.datasets import SqlExportRowSource
+from sytefy_backend.modules.exports.infrastructure.encoders import get_encoder
+from sytefy_backend.modules.exports.infrastructure.storage import LocalExportStorage, get_export_storage
+from sytefy_backend.modules.exports.tasks import generate_export
+from sytefy_backend.modules.exports.web.dto import ExportJobResponse
+
+settings = get_settings()
+router = APIRouter(prefix="/exports", tags=["Exports"])
+
+
+def get_storage() -> LocalExportStorage:
+    return get_export_storage(settings)
+
+
+def _to_response(job: ExportJob) -> ExportJobResponse:
+    return ExportJobResponse(
+        job_id=job.job_id,
+        dataset=job.dataset,
+        format=job.format,
+        status=job.status,
+        filename=job.filename,
+        size=job.size,
+        error=job.error,
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=ExportJobResponse)
+async def get_export_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    storage: LocalExportStorage = Depends(get_storage),
+):
+    job = storage.get(user_id=current_user.id or 0, job_id=job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Dışa aktarma işi bulunamadı")
+    return _to_response(job)
+
+
+@router.get("/jobs/{job_id}/download")
+async def download_export_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    storage: LocalExportStorage = Depends(get_storage),
+):
+    job = storage.get(user_id=current_user.id or 0, job_id=job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Dışa aktarma işi bulunamadı")
+    if job.status != "completed":
+        raise HTTPException(status_code=409, detail="Dışa aktarma henüz hazır değil")
+    return FileResponse(storage.path(job), media_type=get_encoder(job.format).media_type, filename=job.filename)
+
+
+@router.get("/{dataset}")
+async def stream_export(
+    dataset: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    export_format: str = Query(default="csv", alias="format"),
+):
+    session = open_streaming_session(db)
+    try:
+        encoder, stream = StreamExport(SqlExportRowSource(session), get_encoder)(
+            dataset=dataset,
+            export_format=export_format,
+            user_id=current_user.id or 0,
+            batch_size=settings.export_batch_size,
+        )
+    except ApplicationError as exc:
+        await session.close()
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    filename = f"{dataset}-{datetime.now(timezone.utc):%Y%m%d}.{encoder.extension}"
+    return StreamingResponse(
+        stream_and_close(stream, session),
+        media_type=encoder.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/{dataset}/jobs", response_model=ExportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def start_export_job(
+    dataset: str,
+    current_user: User = Depends(get_current_user),
+    storage: LocalExportStorage = Depends(get_storage),
+    export_format: str = Query(default="csv", alias="format"),
+):
+    user_id = current_user.id or 0
+    try:
+        job = StartExportJob(storage)(
+            job_id=uuid4().hex,
+            user_id=user_id,
+            dataset=dataset,
+            export_format=export_format,
+        )
+    except ApplicationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    generate_export.delay(user_id=user_id, job_id=job.job_id)
+    return _to_response(storage.get(user_id=user_id, job_id=job.job_id) or job)
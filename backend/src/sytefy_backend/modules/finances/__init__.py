@@ -1,5 +1,7 @@
 """Finances module package."""
 
+from .web.router import fx_router as finance_fx_router
+from .web.router import reports_router as finance_reports_router
 from .web.router import router as finances_router
 
-__all__ = ["finances_router"]
+__all__ = ["finance_fx_router", "finance_reports_router", "finances_router"]
@@ -0,0 +1,126 @@
+"""Kur tablosu ayrıştırma ve para birimi toplamlarının çevrimi."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Iterable, Sequence
+
+from sytefy_backend.core.exceptions import ApplicationError
+from sytefy_backend.modules.finances.application.interfaces import IFxRateCache, IFxRateRepository
+from sytefy_backend.modules.finances.domain.entities import ConvertedTotal, FxRateTable, InvoiceTotal
+
+CURRENCY_PATTERN = re.compile(r"^[A-Z]{3,8}$")
+CENT = Decimal("0.01")
+
+
+def normalize_currency(value: str) -> str:
+    code = (value or "").strip().upper()
+    if not CURRENCY_PATTERN.match(code):
+        raise ApplicationError(f"Geçersiz para birimi: {value}")
+    return code
+
+
+def _rate(currency: str, raw: object) -> Decimal:
+    try:
+        value = Decimal(str(raw).strip())
+    except InvalidOperation as exc:
+        raise ApplicationError(f"Geçersiz kur değeri: {currency}") from exc
+    if not value.is_finite() or value <= 0:
+        raise ApplicationError(f"Kur 0'dan büyük olmalı: {currency}")
+    return value
+
+
+def parse_fx_rates(content: str) -> tuple[str | None, dict[str, Decimal]]:
+    """JSON (`{"base": "TRY", "rates": {"USD": 32.1}}` veya düz eşleme) ya da `currency,rate` CSV okur."""
+    text = content.lstrip("\ufeff").strip()
+    if not text:
+        raise ApplicationError("Kur dosyası boş.")
+    base: str | None = None
+    pairs: list[tuple[str, object]] = []
+    if text[0] == "{":
+        try:
+            payload = json.loads(text)
+        except json.JSONDecodeError as exc:
+            raise ApplicationError("Kur dosyası geçerli JSON değil.") from exc
+        if "rates" in payload:
+            base = payload.get("base")
+            payload = payload["rates"]
+        if not isinstance(payload, dict):
+            raise ApplicationError("Kur dosyası geçerli JSON değil.")
+        pairs = list(payload.items())
+    else:
+        for row in csv.reader(io.StringIO(text)):
+            if not row or not row[0].strip() or row[0].lstrip().startswith("#"):
+                continue
+            if len(row) < 2:
+                raise ApplicationError(f"Geçersiz kur satırı: {','.join(row)}")
+            if row[0].strip().lower() == "currency":
+                continue
+            pairs.append((row[0], row[1]))
+    rates: dict[str, Decimal] = {}
+    for currency, raw in pairs:
+        code = normalize_currency(currency)
+        rates[code] = _rate(code, raw)
+    if not rates:
+        raise ApplicationError("Kur dosyasında kur bulunamadı.")
+    return (normalize_currency(base) if base else None), rates
+
+
+def currency_factors(
+    table: FxRateTable, currencies: Iterable[str], target: str
+) -> tuple[dict[str, Decimal], list[str]]:
+    """Her para biriminin hedefe çevrim katsayısı; tabloda olmayanlar ayrıca döner."""
+    target_rate = table.rates.get(target)
+    factors: dict[str, Decimal] = {}
+    missing: list[str] = []
+    for currency in sorted(set(currencies)):
+        rate = table.rates.get(currency.upper())
+        if rate is None or target_rate is None:
+            missing.append(currency)
+        else:
+            factors[currency] = rate / target_rate
+    return factors, missing
+
+
+class CurrencyConverter:
+    """Para birimi bazında SQL'de toplanmış tutarları tek çarpım turunda hedef para birimine çevirir."""
+
+    def __init__(self, repo: IFxRateRepository, cache: IFxRateCache):
+        self._repo = repo
+        self._cache = cache
+
+    async def table(self) -> FxRateTable:
+        table = await self._cache.current(self._repo)
+        if table is None:
+            raise ApplicationError("Kur tablosu yüklenmemiş.")
+        return table
+
+    async def convert(self, totals: Sequence[InvoiceTotal], target: str | None = None) -> ConvertedTotal:
+        table = await self.table()
+        target_code = normalize_currency(target) if target else table.base
+        if target_code not in table.rates:
+            raise ApplicationError(f"Kur tablosunda {target_code} yok.")
+        factors, missing = self._cache.factors(table, (item.currency for item in totals), target_code)
+        amount = sum(
+            (Decimal(str(item.amount)) * factors[item.currency] for item in totals if item.currency in factors),
+            Decimal("0"),
+        )
+        return ConvertedTotal(
+            currency=target_code,
+            count=sum(item.count for item in totals if item.currency in factors),
+            amount=float(amount.quantize(CENT)),
+            rate_version=table.version,
+            missing_currencies=list(missing),
+        )
+
+
+__all__ = [
+    "CurrencyConverter",
+    "currency_factors",
+    "normalize_currency",
+    "parse_fx_rates",
+]
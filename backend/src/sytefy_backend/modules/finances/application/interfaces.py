@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Protocol
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Iterable, Mapping, Protocol, Sequence
 
-from sytefy_backend.modules.finances.domain.entities import Invoice
+from sytefy_backend.modules.finances.domain.entities import FinanceReport, FxRateTable, Invoice, InvoiceTotal
 
 
 class IInvoiceRepository(Protocol):
@@ -17,3 +19,84 @@ class IInvoiceRepository(Protocol):
     async def update(self, invoice: Invoice) -> Invoice: ...
 
     async def delete(self, invoice_id: int, user_id: int) -> None: ...
+
+    async def list_overdue(
+        self,
+        *,
+        now: datetime,
+        after: tuple[datetime, int] | None = None,
+        limit: int,
+    ) -> list[Invoice]: ...
+
+    async def mark_overdue(self, invoices: Sequence[Invoice], *, now: datetime) -> list[Invoice]: ...
+
+
+class IOverdueInvoiceNotifier(Protocol):
+    async def notify(self, invoices_by_user: Mapping[int, Sequence[Invoice]]) -> int:
+        """Her fatura sahibine tek özet bildirim gönderir; bildirilen kullanıcı sayısını döndürür."""
+        ...
+
+
+class IInvoiceNumberAllocator(Protocol):
+    async def allocate(self, *, user_id: int, issued_at: datetime) -> str: ...
+
+    async def discard(self, user_id: int) -> None:
+        """Önbellekteki numara bloğunu bırakır; çakışmadan sonra yeni blok ayrılır."""
+        ...
+
+
+class IInvoiceSequenceSource(Protocol):
+    async def reserve(self, user_id: int, size: int) -> int:
+        """`size` adetlik bloğu ayırır ve ilk sıra numarasını döndürür."""
+        ...
+
+
+class IInvoicePdfStore(Protocol):
+    def get_path(self, key: str) -> str | None: ...
+
+    def put(self, key: str, data: bytes) -> str: ...
+
+    def discard(self, key: str) -> None: ...
+
+
+class IInvoicePdfRenderer(Protocol):
+    async def render(self, *, key: str, fields: dict[str, str]) -> bytes | None:
+        """PDF baytlarını döndürür; işi arka plana bırakan uygulamalar `None` döner."""
+        ...
+
+
+class IInvoiceReportRepository(Protocol):
+    async def summarize(
+        self,
+        *,
+        user_id: int,
+        today: date,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> FinanceReport: ...
+
+    async def totals(self, *, user_id: int, status: str | None = None) -> list[InvoiceTotal]:
+        """Düzenlenmiş faturaların para birimi bazında toplamları."""
+        ...
+
+
+class IFxRateRepository(Protocol):
+    async def current_version(self) -> int | None: ...
+
+    async def load(self, version: int) -> FxRateTable | None: ...
+
+    async def store(self, *, base: str, rates: Mapping[str, Decimal]) -> FxRateTable: ...
+
+
+class IFxRateCache(Protocol):
+    async def current(self, repo: IFxRateRepository) -> FxRateTable | None:
+        """Süreç içi tabloyu döndürür; sürüm değiştiyse depodan yeniler."""
+        ...
+
+    def factors(
+        self, table: FxRateTable, currencies: Iterable[str], target: str
+    ) -> tuple[dict[str, Decimal], list[str]]:
+        """(para birimi kümesi, hedef, sürüm) başına önbelleğe alınmış çevrim katsayıları ve eksik kurlar."""
+        ...
+
+    def replace(self, table: FxRateTable) -> None: ...
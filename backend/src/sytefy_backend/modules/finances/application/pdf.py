@@ -0,0 +1,104 @@
+"""Fatura PDF alanları, içerik anahtarı ve bağımlılıksız PDF üretimi."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import textwrap
+from datetime import datetime, timezone
+
+from sytefy_backend.modules.finances.domain.entities import Invoice
+
+# Çıktı biçimi değiştiğinde artırılır; eski önbellek girdileri kendiliğinden geçersizleşir.
+RENDERER_VERSION = 1
+
+# Standart Helvetica (WinAnsi) Türkçe'ye özgü bu harfleri içermez.
+_TRANSLITERATION = str.maketrans({"ğ": "g", "Ğ": "G", "ı": "i", "İ": "I", "ş": "s", "Ş": "S"})
+
+
+def _date(value: datetime) -> str:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%d")
+
+
+def invoice_pdf_fields(invoice: Invoice) -> dict[str, str]:
+    """PDF'e basılan alanlar; anahtar yalnızca bunlardan türetilir."""
+    return {
+        "number": invoice.number,
+        "title": invoice.title,
+        "description": invoice.description or "",
+        "amount": f"{invoice.amount:.2f}",
+        "currency": invoice.currency,
+        "status": invoice.status,
+        "issued_at": _date(invoice.issued_at),
+        "due_date": _date(invoice.due_date),
+        "customer_id": str(invoice.customer_id or ""),
+    }
+
+
+def invoice_pdf_key(fields: dict[str, str]) -> str:
+    payload = json.dumps({"version": RENDERER_VERSION, **fields}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _pdf_text(value: str) -> bytes:
+    encoded = value.translate(_TRANSLITERATION).encode("cp1252", errors="replace")
+    return encoded.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+def _content(fields: dict[str, str]) -> bytes:
+    lines: list[tuple[str, int, str]] = [
+        ("F2", 20, "FATURA"),
+        ("F1", 11, f"No: {fields['number']}"),
+        ("F1", 11, f"Duzenlenme: {fields['issued_at']}    Vade: {fields['due_date']}"),
+        ("F1", 11, f"Durum: {fields['status']}"),
+    ]
+    if fields["customer_id"]:
+        lines.append(("F1", 11, f"Musteri: #{fields['customer_id']}"))
+    lines.append(("F2", 13, fields["title"]))
+    for paragraph in fields["description"].splitlines():
+        for chunk in textwrap.wrap(paragraph, width=90) or [""]:
+            lines.append(("F1", 10, chunk))
+    lines.append(("F2", 14, f"Toplam: {fields['amount']} {fields['currency']}"))
+
+    commands = [b"BT", b"50 790 Td"]
+    for index, (font, size, text) in enumerate(lines):
+        if index:
+            commands.append(f"0 -{size + 8} Td".encode())
+        commands.append(f"/{font} {size} Tf".encode())
+        commands.append(b"(" + _pdf_text(text) + b") Tj")
+    commands.append(b"ET")
+    return b"\n".join(commands)
+
+
+def render_invoice_pdf(fields: dict[str, str]) -> bytes:
+    """Tek sayfalık PDF 1.4; aynı alanlar için bayt bayt aynı çıktı üretir (zaman damgası yok)."""
+    content = _content(fields)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+        b"/Resources << /Font << /F1 4 0 R /F2 5 0 R >> >> /Contents 6 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+        b"<< /Length " + str(len(content)).encode() + b" >>\nstream\n" + content + b"\nendstream",
+        b"<< /Title (" + _pdf_text(fields["number"]) + b") /Producer (Sytefy) >>",
+    ]
+    output = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode()
+    output += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R /Info {len(objects)} 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+    return bytes(output)
+
+
+__all__ = ["RENDERER_VERSION", "invoice_pdf_fields", "invoice_pdf_key", "render_invoice_pdf"]
@@ -2,14 +2,33 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 
-from sytefy_backend.core.exceptions import ApplicationError
-from sytefy_backend.modules.finances.application.interfaces import IInvoiceRepository
-from sytefy_backend.modules.finances.domain.entities import Invoice
+from sytefy_backend.core.exceptions import ApplicationError, ConflictError
+from sytefy_backend.modules.finances.application.fx import CurrencyConverter, normalize_currency, parse_fx_rates
+from sytefy_backend.modules.finances.application.interfaces import (
+    IFxRateCache,
+    IFxRateRepository,
+    IInvoiceNumberAllocator,
+    IInvoicePdfRenderer,
+    IInvoicePdfStore,
+    IInvoiceReportRepository,
+    IInvoiceRepository,
+    IOverdueInvoiceNotifier,
+)
+from sytefy_backend.modules.finances.application.pdf import invoice_pdf_fields, invoice_pdf_key
+from sytefy_backend.modules.finances.domain.entities import (
+    ConvertedTotal,
+    FinanceReport,
+    FxRateTable,
+    Invoice,
+    InvoiceTotal,
+)
 
-ALLOWED_STATUSES = {"draft", "sent", "paid", "void"}
+ALLOWED_STATUSES = {"draft", "sent", "overdue", "paid", "void"}
+NUMBER_ALLOCATION_ATTEMPTS = 3
 
 
 def _ensure_amount(amount: float | None) -> float:
@@ -41,18 +60,15 @@ def _ensure_issued_at(issued_at: datetime | None) -> datetime:
     return issued_at.astimezone(timezone.utc)
 
 
-def _generate_number(user_id: int, issued_at: datetime) -> str:
-    return f"INV-{user_id}-{issued_at.strftime('%Y%m%d%H%M%S')}"
-
-
 @dataclass(slots=True)
 class CreateInvoiceResult:
     invoice: Invoice
 
 
 class CreateInvoice:
-    def __init__(self, repo: IInvoiceRepository):
+    def __init__(self, repo: IInvoiceRepository, numbers: IInvoiceNumberAllocator):
         self._repo = repo
+        self._numbers = numbers
 
     async def __call__(
         self,
@@ -80,7 +96,7 @@ class CreateInvoice:
             id=None,
             user_id=user_id,
             customer_id=customer_id,
-            number=number or _generate_number(user_id, issued_at),
+            number=number or "",
             title=title,
             description=description,
             amount=amount,
@@ -89,8 +105,20 @@ class CreateInvoice:
             due_date=due_date,
             issued_at=issued_at,
         )
-        stored = await self._repo.create(invoice)
-        return CreateInvoiceResult(invoice=stored)
+        if number:
+            return CreateInvoiceResult(invoice=await self._repo.create(invoice))
+        # Ayrılan numara nadiren çakışırsa (ör. Redis kesintisi sonrası) önbellekteki blok da aynı
+        # aralıktadır; blok bırakılır ve yeni ayrılan bloktan bir numarayla tekrar denenir.
+        attempts = NUMBER_ALLOCATION_ATTEMPTS
+        while True:
+            invoice.number = await self._numbers.allocate(user_id=user_id, issued_at=issued_at)
+            try:
+                return CreateInvoiceResult(invoice=await self._repo.create(invoice))
+            except ConflictError:
+                attempts -= 1
+                if not attempts:
+                    raise
+                await self._numbers.discard(user_id)
 
 
 class ListInvoices:
@@ -105,8 +133,9 @@ class ListInvoices:
 
 
 class UpdateInvoice:
-    def __init__(self, repo: IInvoiceRepository):
+    def __init__(self, repo: IInvoiceRepository, pdfs: IInvoicePdfStore | None = None):
         self._repo = repo
+        self._pdfs = pdfs
 
     async def __call__(
         self,
@@ -123,6 +152,7 @@ class UpdateInvoice:
         existing = await self._repo.get_by_id(invoice_id)
         if not existing or existing.user_id != user_id:
             raise ApplicationError("Fatura bulunamadı.")
+        previous_pdf_key = invoice_pdf_key(invoice_pdf_fields(existing))
         if title is not None:
             if not title.strip():
                 raise ApplicationError("Başlık boş olamaz.")
@@ -140,12 +170,170 @@ class UpdateInvoice:
             existing.due_date = normalized
         if status is not None:
             existing.status = _normalize_status(status)
-        return await self._repo.update(existing)
+        updated = await self._repo.update(existing)
+        if self._pdfs is not None and invoice_pdf_key(invoice_pdf_fields(updated)) != previous_pdf_key:
+            # Yeni içerik yeni anahtar üretir; eski PDF yalnızca yer kaplamasın diye silinir.
+            self._pdfs.discard(previous_pdf_key)
+        return updated
+
+
+@dataclass(slots=True)
+class InvoicePdf:
+    key: str
+    path: str | None
+
+
+class GetInvoicePdf:
+    """Önbellekte yoksa çizer; arka planda çizim sürüyorsa `path` boş döner."""
+
+    def __init__(self, repo: IInvoiceRepository, store: IInvoicePdfStore, renderer: IInvoicePdfRenderer):
+        self._repo = repo
+        self._store = store
+        self._renderer = renderer
+
+    async def __call__(self, *, invoice_id: int, user_id: int) -> InvoicePdf:
+        invoice = await self._repo.get_by_id(invoice_id)
+        if not invoice or invoice.user_id != user_id:
+            raise ApplicationError("Fatura bulunamadı.")
+        fields = invoice_pdf_fields(invoice)
+        key = invoice_pdf_key(fields)
+        path = self._store.get_path(key)
+        if path is None:
+            data = await self._renderer.render(key=key, fields=fields)
+            path = self._store.put(key, data) if data is not None else self._store.get_path(key)
+        return InvoicePdf(key=key, path=path)
 
 
 class DeleteInvoice:
-    def __init__(self, repo: IInvoiceRepository):
+    def __init__(self, repo: IInvoiceRepository, pdfs: IInvoicePdfStore | None = None):
         self._repo = repo
+        self._pdfs = pdfs
 
     async def __call__(self, *, invoice_id: int, user_id: int) -> None:
+        existing = await self._repo.get_by_id(invoice_id) if self._pdfs is not None else None
         await self._repo.delete(invoice_id, user_id)
+        if self._pdfs is not None and existing is not None:
+            # Silinen faturanın önbellekteki PDF'i artık hiçbir istekle eşleşmez.
+            self._pdfs.discard(invoice_pdf_key(invoice_pdf_fields(existing)))
+
+
+class GetFinanceReport:
+    def __init__(self, repo: IInvoiceReportRepository, converter: CurrencyConverter | None = None):
+        self._repo = repo
+        self._converter = converter
+
+    async def __call__(
+        self,
+        *,
+        user_id: int,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        today: date | None = None,
+        currency: str | None = None,
+    ) -> FinanceReport:
+        if date_from and date_to and date_from > date_to:
+            raise ApplicationError("Başlangıç tarihi bitiş tarihinden sonra olamaz.")
+        report = await self._repo.summarize(
+            user_id=user_id,
+            today=today or datetime.now(timezone.utc).date(),
+            date_from=date_from,
+            date_to=date_to,
+        )
+        if currency is not None:
+            if self._converter is None:
+                raise ApplicationError("Kur çevrimi kullanılamıyor.")
+            report.converted_total = await self._converter.convert(report.by_currency, currency)
+            report.converted_overdue = await self._converter.convert(report.overdue, currency)
+        return report
+
+
+@dataclass(slots=True)
+class InvoiceTotals:
+    by_currency: list[InvoiceTotal]
+    converted: ConvertedTotal | None = None
+
+
+class GetInvoiceTotals:
+    """Fatura listesinin toplamları: para birimi bazında SQL'de toplanır, ardından tek seferde çevrilir."""
+
+    def __init__(self, repo: IInvoiceReportRepository, converter: CurrencyConverter | None = None):
+        self._repo = repo
+        self._converter = converter
+
+    async def __call__(self, *, user_id: int, status: str | None = None, currency: str | None = None) -> InvoiceTotals:
+        status_value = status.lower() if status else None
+        if status_value and status_value not in ALLOWED_STATUSES:
+            raise ApplicationError("Geçersiz fatura statüsü.")
+        totals = InvoiceTotals(by_currency=await self._repo.totals(user_id=user_id, status=status_value))
+        if currency is not None:
+            if self._converter is None:
+                raise ApplicationError("Kur çevrimi kullanılamıyor.")
+            totals.converted = await self._converter.convert(totals.by_currency, currency)
+        return totals
+
+
+class GetFxRates:
+    def __init__(self, converter: CurrencyConverter):
+        self._converter = converter
+
+    async def __call__(self) -> FxRateTable:
+        return await self._converter.table()
+
+
+class ImportFxRates:
+    """Yüklenen kur dosyasını yeni sürüm olarak yazar ve bu süreçteki önbelleği hemen günceller."""
+
+    def __init__(self, repo: IFxRateRepository, cache: IFxRateCache, default_base: str = "TRY"):
+        self._repo = repo
+        self._cache = cache
+        self._default_base = default_base
+
+    async def __call__(self, *, content: str, base: str | None = None) -> FxRateTable:
+        file_base, rates = parse_fx_rates(content)
+        table = await self._repo.store(
+            base=normalize_currency(base or file_base or self._default_base),
+            rates=rates,
+        )
+        self._cache.replace(table)
+        return table
+
+
+@dataclass(slots=True)
+class OverdueScanResult:
+    scanned: int = 0
+    updated: int = 0
+    notified_users: int = 0
+    batches: int = 0
+
+
+class MarkOverdueInvoices:
+    """Vadesi geçen `sent` faturaları parça parça `overdue` yapar ve sahiplerine özet bildirir.
+
+    Her parça ayrı işlemde güncellenir ve hemen bildirilir; tarama yarıda kesilirse
+    işaretlenen faturalar bildirimsiz kalmaz, kalanlar bir sonraki çalışmada devam eder.
+    """
+
+    def __init__(self, repo: IInvoiceRepository, notifier: IOverdueInvoiceNotifier | None = None):
+        self._repo = repo
+        self._notifier = notifier
+
+    async def __call__(self, *, now: datetime, batch_size: int, max_batches: int) -> OverdueScanResult:
+        result = OverdueScanResult()
+        after: tuple[datetime, int] | None = None
+        for _ in range(max_batches):
+            batch = await self._repo.list_overdue(now=now, after=after, limit=batch_size)
+            if not batch:
+                break
+            result.batches += 1
+            result.scanned += len(batch)
+            updated = await self._repo.mark_overdue(batch, now=now)
+            result.updated += len(updated)
+            if updated and self._notifier is not None:
+                by_user: dict[int, list[Invoice]] = defaultdict(list)
+                for invoice in updated:
+                    by_user[invoice.user_id].append(invoice)
+                result.notified_users += await self._notifier.notify(by_user)
+            if len(batch) < batch_size:
+                break
+            after = (batch[-1].due_date, batch[-1].id or 0)
+        return result
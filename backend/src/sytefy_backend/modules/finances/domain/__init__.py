@@ -1,5 +1,5 @@
 """Finances domain package."""
 
-from .entities import Invoice
+from .entities import ConvertedTotal, FinanceReport, FxRateTable, Invoice, InvoiceTotal
 
-__all__ = ["Invoice"]
+__all__ = ["ConvertedTotal", "FinanceReport", "FxRateTable", "Invoice", "InvoiceTotal"]
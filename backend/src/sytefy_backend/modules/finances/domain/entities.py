@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from decimal import Decimal
 from typing import Optional
 
 
@@ -22,3 +23,45 @@ class Invoice:
     issued_at: datetime
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class InvoiceTotal:
+    currency: str
+    count: int
+    amount: float
+    status: Optional[str] = None
+    month: Optional[str] = None
+    customer_id: Optional[int] = None
+
+
+@dataclass(slots=True)
+class ConvertedTotal:
+    """Para birimi toplamlarının tek hedef para birimine çevrilmiş hali."""
+
+    currency: str
+    count: int
+    amount: float
+    rate_version: int
+    missing_currencies: list[str]
+
+
+@dataclass(slots=True)
+class FxRateTable:
+    """Kur tablosunun bir sürümü; `rates[c]`, 1 birim `c`'nin `base` karşılığıdır."""
+
+    version: int
+    base: str
+    rates: dict[str, Decimal]
+    created_at: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class FinanceReport:
+    by_status: list[InvoiceTotal]
+    by_currency: list[InvoiceTotal]
+    by_month: list[InvoiceTotal]
+    by_customer: list[InvoiceTotal]
+    overdue: list[InvoiceTotal]
+    converted_total: Optional[ConvertedTotal] = None
+    converted_overdue: Optional[ConvertedTotal] = None
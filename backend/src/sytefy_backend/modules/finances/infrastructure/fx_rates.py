@@ -0,0 +1,142 @@
+"""Sürümlü kur tablosu deposu ve süreç içi önbelleği."""
+
+from __future__ import annotations
+
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Iterable, Mapping
+
+import structlog
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sytefy_backend.config.settings import Settings
+from sytefy_backend.core.exceptions import ConflictError
+from sytefy_backend.modules.finances.application.fx import currency_factors, normalize_currency, parse_fx_rates
+from sytefy_backend.modules.finances.application.interfaces import IFxRateCache, IFxRateRepository
+from sytefy_backend.modules.finances.domain.entities import FxRateTable
+from sytefy_backend.modules.finances.infrastructure.models import FxRateModel
+
+logger = structlog.get_logger("sytefy.finances.fx")
+
+FactorKey = tuple[int, frozenset[str], str]
+
+
+class FxRateRepository(IFxRateRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def current_version(self) -> int | None:
+        return (await self._session.execute(select(func.max(FxRateModel.version)))).scalar()
+
+    async def load(self, version: int) -> FxRateTable | None:
+        rows = (await self._session.execute(select(FxRateModel).where(FxRateModel.version == version))).scalars().all()
+        if not rows:
+            return None
+        return FxRateTable(
+            version=version,
+            base=rows[0].base_currency,
+            rates={row.currency: Decimal(str(row.rate)) for row in rows},
+            created_at=rows[0].created_at,
+        )
+
+    async def store(self, *, base: str, rates: Mapping[str, Decimal]) -> FxRateTable:
+        version = (await self.current_version() or 0) + 1
+        base = normalize_currency(base)
+        values = {**rates, base: Decimal("1")}
+        self._session.add_all(
+            [
+                FxRateModel(version=version, currency=currency, base_currency=base, rate=rate)
+                for currency, rate in sorted(values.items())
+            ]
+        )
+        try:
+            await self._session.commit()
+        except IntegrityError as exc:
+            await self._session.rollback()
+            raise ConflictError("Kur tablosu aynı anda güncellendi; yeniden deneyin.") from exc
+        return FxRateTable(version=version, base=base, rates=dict(values))
+
+
+class FxRateCache(IFxRateCache):
+    """Tabloyu süreçte tutar; `ttl_seconds` aralıklarla yalnızca sürüm numarası sorgulanır.
+
+    Çevrim katsayıları (sürüm, para birimi kümesi, hedef) anahtarıyla saklanır; sürüm
+    değişince anahtarlar kendiliğinden geçersiz kalır ve eski girdiler temizlenir.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 60.0,
+        seed_path: str | None = None,
+        default_base: str = "TRY",
+        max_factor_entries: int = 256,
+    ):
+        self._ttl = ttl_seconds
+        self._seed_path = seed_path
+        self._default_base = default_base
+        self._max_entries = max_factor_entries
+        self._table: FxRateTable | None = None
+        self._checked_at = 0.0
+        self._factors: dict[FactorKey, tuple[dict[str, Decimal], list[str]]] = {}
+
+    async def current(self, repo: IFxRateRepository) -> FxRateTable | None:
+        now = time.monotonic()
+        if self._table is not None and now - self._checked_at < self._ttl:
+            return self._table
+        version = await repo.current_version()
+        if version is None and self._seed_path:
+            self.replace(await self._seed(repo))
+            return self._table
+        if version is None:
+            return None
+        if self._table is None or self._table.version != version:
+            table = await repo.load(version)
+            if table is None:
+                return self._table
+            self.replace(table)
+        self._checked_at = now
+        return self._table
+
+    async def _seed(self, repo: IFxRateRepository) -> FxRateTable:
+        base, rates = parse_fx_rates(Path(self._seed_path or "").read_text(encoding="utf-8"))
+        table = await repo.store(base=base or self._default_base, rates=rates)
+        logger.info("finances.fx_rates.seeded", path=self._seed_path, version=table.version, currencies=len(rates))
+        return table
+
+    def factors(
+        self, table: FxRateTable, currencies: Iterable[str], target: str
+    ) -> tuple[dict[str, Decimal], list[str]]:
+        key = (table.version, frozenset(currencies), target)
+        cached = self._factors.get(key)
+        if cached is None:
+            if len(self._factors) >= self._max_entries:
+                self._factors.clear()
+            cached = self._factors[key] = currency_factors(table, key[1], target)
+        return cached
+
+    def replace(self, table: FxRateTable) -> None:
+        if self._table is None or self._table.version != table.version:
+            self._factors = {key: value for key, value in self._factors.items() if key[0] == table.version}
+        self._table = table
+        self._checked_at = time.monotonic()
+
+
+_cache: FxRateCache | None = None
+
+
+def get_fx_rate_cache(settings: Settings) -> FxRateCache:
+    global _cache
+    if _cache is None:
+        _cache = FxRateCache(
+            ttl_seconds=settings.fx_rate_cache_ttl_seconds,
+            seed_path=settings.fx_rates_file,
+            default_base=settings.fx_base_currency,
+        )
+    return _cache
+
+
+__all__ = ["FxRateCache", "FxRateRepository", "get_fx_rate_cache"]
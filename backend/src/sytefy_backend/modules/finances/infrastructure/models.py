@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import BigInteger, Date, DateTime, ForeignKey, Index, Integer, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from sytefy_backend.core.database.base import Base
@@ -26,3 +26,59 @@ class InvoiceModel(Base):
     issued_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class InvoiceNumberSequenceModel(Base):
+    """Kullanıcı başına bir sonraki ayrılmamış fatura sıra numarası."""
+
+    __tablename__ = "invoice_number_sequences"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    next_value: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1)
+
+
+class FxRateModel(Base):
+    """Kur tablosu sürümleri; her yükleme tüm kurları yeni sürüm numarasıyla yazar."""
+
+    __tablename__ = "fx_rates"
+
+    version: Mapped[int] = mapped_column(Integer, primary_key=True)
+    currency: Mapped[str] = mapped_column(String(8), primary_key=True)
+    base_currency: Mapped[str] = mapped_column(String(8), nullable=False)
+    # 1 birim `currency`'nin `base_currency` karşılığı.
+    rate: Mapped[float] = mapped_column(Numeric(20, 10), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+
+
+class InvoiceDailyRollupModel(Base):
+    """Fatura toplamlarının gün/statü/para birimi/müşteri kırılımında artımlı özetleri."""
+
+    __tablename__ = "invoice_daily_rollups"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    # "issued": düzenlenme günü, "due": vade günü kırılımı.
+    bucket: Mapped[str] = mapped_column(String(8), nullable=False)
+    day: Mapped[date] = mapped_column(Date(), nullable=False)
+    month: Mapped[date] = mapped_column(Date(), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    currency: Mapped[str] = mapped_column(String(8), nullable=False)
+    # Müşterisiz faturalar 0 ile tutulur; benzersiz anahtarda NULL kullanılmaz.
+    customer_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    invoice_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    amount_total: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+
+
+Index(
+    "uq_invoice_rollups_key",
+    InvoiceDailyRollupModel.user_id,
+    InvoiceDailyRollupModel.bucket,
+    InvoiceDailyRollupModel.day,
+    InvoiceDailyRollupModel.status,
+    InvoiceDailyRollupModel.currency,
+    InvoiceDailyRollupModel.customer_id,
+    unique=True,
+)
+
+# Vade taraması `status = 'sent' AND due_date < now` koşulunu (due_date, id) sırasıyla sayfalar.
+Index("ix_invoices_status_due", InvoiceModel.status, InvoiceModel.due_date, InvoiceModel.id)
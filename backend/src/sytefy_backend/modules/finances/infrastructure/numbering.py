@@ -0,0 +1,219 @@
+"""Kullanıcı başına çakışmasız fatura numarası ayırıcı.
+
+Numaralar bellekte blok halinde tutulur; blok bittiğinde veritabanındaki (veya Redis'teki)
+sayaç tek atomik artışla ilerletilir. Süreç yeniden başlarsa kullanılmamış blok kısmı
+boşluk olarak kalır; numaralar artan ve benzersizdir ancak ardışık olmaları garanti edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from weakref import WeakKeyDictionary
+
+import structlog
+from redis import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import case, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from sytefy_backend.config.settings import Settings
+from sytefy_backend.modules.finances.application.interfaces import IInvoiceNumberAllocator, IInvoiceSequenceSource
+from sytefy_backend.modules.finances.infrastructure.models import InvoiceNumberSequenceModel
+
+logger = structlog.get_logger("sytefy.finances.numbering")
+
+Sequence = InvoiceNumberSequenceModel
+DEFAULT_FORMAT = "INV-{user_id}-{year}-{seq:06d}"
+
+
+def _dialect_insert(session: AsyncSession):
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:  # pragma: no cover - desteklenen veritabanları dışı
+        return None
+    return insert
+
+
+class DatabaseSequenceSource(IInvoiceSequenceSource):
+    """`invoice_number_sequences` satırını tek UPSERT ... RETURNING ile ilerletir."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self._session_factory = session_factory
+
+    async def reserve(self, user_id: int, size: int) -> int:
+        # Fatura işleminden bağımsız kısa işlem; satır kilidi yalnızca artış süresince tutulur.
+        async with self._session_factory() as session:
+            insert = _dialect_insert(session)
+            if insert is None:  # pragma: no cover
+                end = await self._reserve_generic(session, user_id, size)
+            else:
+                stmt = insert(Sequence).values(user_id=user_id, next_value=1 + size)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Sequence.user_id],
+                    set_={"next_value": Sequence.next_value + size},
+                ).returning(Sequence.next_value)
+                end = (await session.execute(stmt)).scalar_one()
+            await session.commit()
+        return end - size
+
+    async def _reserve_generic(self, session: AsyncSession, user_id: int, size: int) -> int:  # pragma: no cover
+        current = (
+            await session.execute(select(Sequence.next_value).where(Sequence.user_id == user_id).with_for_update())
+        ).scalar_one_or_none()
+        if current is None:
+            session.add(Sequence(user_id=user_id, next_value=1 + size))
+            await session.flush()
+            return 1 + size
+        await session.execute(update(Sequence).where(Sequence.user_id == user_id).values(next_value=current + size))
+        return current + size
+
+    async def current(self, user_id: int) -> int:
+        """Henüz ayrılmamış ilk sıra numarası."""
+        async with self._session_factory() as session:
+            value = (await session.execute(select(Sequence.next_value).where(Sequence.user_id == user_id))).scalar()
+        return value or 1
+
+    async def raise_to(self, user_id: int, next_value: int) -> int:
+        """Sayacı en az `next_value` olacak şekilde ileri taşır (geri almaz)."""
+        async with self._session_factory() as session:
+            insert = _dialect_insert(session)
+            if insert is None:  # pragma: no cover
+                value = await self._raise_to_generic(session, user_id, next_value)
+            else:
+                stmt = insert(Sequence).values(user_id=user_id, next_value=next_value)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Sequence.user_id],
+                    set_={
+                        "next_value": case(
+                            (Sequence.next_value < stmt.excluded.next_value, stmt.excluded.next_value),
+                            else_=Sequence.next_value,
+                        )
+                    },
+                ).returning(Sequence.next_value)
+                value = (await session.execute(stmt)).scalar_one()
+            await session.commit()
+        return value
+
+    async def _raise_to_generic(self, session: AsyncSession, user_id: int, next_value: int) -> int:  # pragma: no cover
+        current = (
+            await session.execute(select(Sequence.next_value).where(Sequence.user_id == user_id).with_for_update())
+        ).scalar_one_or_none()
+        if current is None:
+            session.add(Sequence(user_id=user_id, next_value=next_value))
+            await session.flush()
+            return next_value
+        if current >= next_value:
+            return current
+        await session.execute(update(Sequence).where(Sequence.user_id == user_id).values(next_value=next_value))
+        return next_value
+
+
+class RedisSequenceSource(IInvoiceSequenceSource):
+    """Blokları Redis INCRBY ile ayırır; veritabanı sayacı yalnızca üst sınır kaydı olarak ilerletilir.
+
+    Redis anahtarı kaybolursa veritabanındaki üst sınırdan devam edilir. Redis erişilemezse
+    bloklar doğrudan veritabanından alınır; olası nadir çakışmaları `number` benzersiz kısıtı
+    yakalar ve numara yeniden ayrılır.
+    """
+
+    def __init__(self, redis: Redis, fallback: DatabaseSequenceSource, prefix: str = "invoices:sequence"):
+        self._redis = redis
+        self._fallback = fallback
+        self._prefix = prefix.rstrip(":")
+
+    def _key(self, user_id: int) -> str:
+        return f"{self._prefix}:{user_id}"
+
+    async def reserve(self, user_id: int, size: int) -> int:
+        key = self._key(user_id)
+        try:
+            if not self._redis.exists(key):
+                # NX eşzamanlı tohumlamada yalnızca ilk yazanı korur.
+                self._redis.set(key, await self._fallback.current(user_id) - 1, nx=True)
+            last = int(self._redis.incrby(key, size))
+        except RedisError as exc:
+            logger.warning("invoices.numbering.redis_unavailable", user_id=user_id, error=str(exc))
+            return await self._fallback.reserve(user_id, size)
+        await self._fallback.raise_to(user_id, last + 1)
+        return last - size + 1
+
+
+class InvoiceNumberAllocator(IInvoiceNumberAllocator):
+    """Süreç içi blok önbelleği; her kullanıcı için ayrı kilitle sıra numarası dağıtır."""
+
+    def __init__(
+        self,
+        source: IInvoiceSequenceSource,
+        *,
+        block_size: int = 20,
+        number_format: str = DEFAULT_FORMAT,
+    ):
+        if block_size < 1:
+            raise ValueError("block_size en az 1 olmalı")
+        try:
+            number_format.format(user_id=1, seq=1, year=2000, month=1)
+        except (KeyError, IndexError, ValueError) as exc:
+            raise ValueError(f"Geçersiz fatura numarası biçimi: {number_format}") from exc
+        if "{seq" not in number_format:
+            raise ValueError("Fatura numarası biçimi {seq} alanını içermeli")
+        self._source = source
+        self._block_size = block_size
+        self._format = number_format
+        self._blocks: dict[int, tuple[int, int]] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+
+    async def next_sequence(self, user_id: int) -> int:
+        lock = self._locks.setdefault(user_id, asyncio.Lock())
+        async with lock:
+            next_value, end = self._blocks.get(user_id, (0, 0))
+            if next_value >= end:
+                next_value = await self._source.reserve(user_id, self._block_size)
+                end = next_value + self._block_size
+            self._blocks[user_id] = (next_value + 1, end)
+            return next_value
+
+    async def discard(self, user_id: int) -> None:
+        """Kullanıcının önbellekteki bloğunu bırakır; sonraki numara yeni ayrılan bloktan gelir."""
+        lock = self._locks.setdefault(user_id, asyncio.Lock())
+        async with lock:
+            self._blocks.pop(user_id, None)
+
+    async def allocate(self, *, user_id: int, issued_at: datetime) -> str:
+        seq = await self.next_sequence(user_id)
+        return self._format.format(user_id=user_id, seq=seq, year=issued_at.year, month=issued_at.month)
+
+
+_allocators: WeakKeyDictionary[Engine, InvoiceNumberAllocator] = WeakKeyDictionary()
+
+
+def get_invoice_number_allocator(settings: Settings, engine: AsyncEngine) -> InvoiceNumberAllocator:
+    """Motor başına tek ayırıcı; bloklar aynı veritabanını kullanan istekler arasında paylaşılır."""
+    allocator = _allocators.get(engine.sync_engine)
+    if allocator is not None:
+        return allocator
+    database = DatabaseSequenceSource(async_sessionmaker(bind=engine, expire_on_commit=False))
+    source: IInvoiceSequenceSource = database
+    if settings.invoice_number_backend == "redis":
+        client = Redis.from_url(settings.redis_url, decode_responses=True, socket_timeout=2)
+        source = RedisSequenceSource(client, database, prefix=settings.invoice_number_prefix)
+    allocator = InvoiceNumberAllocator(
+        source,
+        block_size=settings.invoice_number_block_size,
+        number_format=settings.invoice_number_format,
+    )
+    _allocators[engine.sync_engine] = allocator
+    return allocator
+
+
+__all__ = [
+    "DEFAULT_FORMAT",
+    "DatabaseSequenceSource",
+    "InvoiceNumberAllocator",
+    "RedisSequenceSource",
+    "get_invoice_number_allocator",
+]
@@ -0,0 +1,72 @@
+"""Vadesi geçen faturalar için kullanıcı başına özet bildirim."""
+
+from __future__ import annotations
+
+from typing import Mapping, Sequence
+
+from sytefy_backend.modules.finances.application.interfaces import IOverdueInvoiceNotifier
+from sytefy_backend.modules.finances.domain.entities import Invoice
+from sytefy_backend.modules.notifications.application.interfaces import (
+    INotificationRepository,
+    IUnreadCounter,
+    NotificationPublisher,
+)
+from sytefy_backend.modules.notifications.application.use_cases import NotificationDispatcher
+from sytefy_backend.modules.notifications.domain.entities import Notification
+
+OVERDUE_TITLE = "Vadesi geçen faturalar"
+LISTED_NUMBERS = 5
+
+
+def overdue_reminder_body(invoices: Sequence[Invoice]) -> str:
+    numbers = ", ".join(invoice.number for invoice in invoices[:LISTED_NUMBERS])
+    remaining = len(invoices) - LISTED_NUMBERS
+    if remaining > 0:
+        numbers = f"{numbers} ve {remaining} fatura daha"
+    return f"{len(invoices)} faturanın vadesi geçti: {numbers}"
+
+
+class NotificationOverdueNotifier(IOverdueInvoiceNotifier):
+    """Bildirimleri tek INSERT ile yazar, teslimatları tek gruplu görevle kuyruğa alır."""
+
+    def __init__(
+        self,
+        repo: INotificationRepository,
+        dispatcher: NotificationDispatcher,
+        *,
+        channel: str = "log",
+        publisher: NotificationPublisher | None = None,
+        counter: IUnreadCounter | None = None,
+    ):
+        self._repo = repo
+        self._dispatcher = dispatcher
+        self._channel = channel
+        self._publisher = publisher
+        self._counter = counter
+
+    async def notify(self, invoices_by_user: Mapping[int, Sequence[Invoice]]) -> int:
+        pending = [
+            Notification(
+                id=None,
+                user_id=user_id,
+                title=OVERDUE_TITLE,
+                body=overdue_reminder_body(invoices),
+                channel=self._channel,
+                status="pending",
+                read_at=None,
+                created_at=None,
+            )
+            for user_id, invoices in invoices_by_user.items()
+            if invoices
+        ]
+        stored = await self._repo.create_many(pending)
+        self._dispatcher.dispatch_many(stored)
+        for notification in stored:
+            if self._counter:
+                await self._counter.adjust(notification.user_id, 1)
+            if self._publisher:
+                await self._publisher.publish(notification)
+        return len(stored)
+
+
+__all__ = ["NotificationOverdueNotifier", "OVERDUE_TITLE", "overdue_reminder_body"]
@@ -0,0 +1,68 @@
+"""Fatura PDF üretimini olay döngüsünün dışına taşıyan çizici uygulamaları."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from sytefy_backend.config.settings import Settings
+from sytefy_backend.modules.finances.application.interfaces import IInvoicePdfRenderer
+from sytefy_backend.modules.finances.application.pdf import render_invoice_pdf
+
+
+class ProcessPoolPdfRenderer(IInvoicePdfRenderer):
+    """İstek içinde, ayrı süreçte çizer; GIL ve olay döngüsü bloklanmaz."""
+
+    def __init__(self, max_workers: int = 2):
+        self._max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def render(self, *, key: str, fields: dict[str, str]) -> bytes | None:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, render_invoice_pdf, fields)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class CeleryPdfRenderer(IInvoicePdfRenderer):
+    """Çizimi worker'a bırakır; sonuç paylaşılan önbelleğe yazılır."""
+
+    async def render(self, *, key: str, fields: dict[str, str]) -> bytes | None:
+        from sytefy_backend.modules.finances.tasks import render_invoice_pdf_task
+
+        render_invoice_pdf_task.delay(key=key, fields=fields)
+        return None
+
+
+_renderer: IInvoicePdfRenderer | None = None
+
+
+def get_invoice_pdf_renderer(settings: Settings) -> IInvoicePdfRenderer:
+    global _renderer
+    if _renderer is not None:
+        return _renderer
+    if settings.invoice_pdf_renderer == "celery":
+        _renderer = CeleryPdfRenderer()
+    else:
+        _renderer = ProcessPoolPdfRenderer(max_workers=settings.invoice_pdf_process_workers)
+    return _renderer
+
+
+def shutdown_invoice_pdf_renderer() -> None:
+    global _renderer
+    if isinstance(_renderer, ProcessPoolPdfRenderer):
+        _renderer.shutdown()
+    _renderer = None
+
+
+__all__ = [
+    "CeleryPdfRenderer",
+    "ProcessPoolPdfRenderer",
+    "get_invoice_pdf_renderer",
+    "shutdown_invoice_pdf_renderer",
+]
@@ -0,0 +1,52 @@
+"""İçerik adresli fatura PDF önbelleği (yerel disk; nesne deposu yerine geçer)."""
+
+from __future__ import annotations
+
+import os
+import re
+import tempfile
+from pathlib import Path
+
+from sytefy_backend.config.settings import Settings
+from sytefy_backend.modules.finances.application.interfaces import IInvoicePdfStore
+
+_KEY = re.compile(r"^[0-9a-f]{64}$")
+
+
+class LocalInvoicePdfStore(IInvoicePdfStore):
+    """Nesneler `<kök>/<anahtarın ilk 2 hanesi>/<anahtar>.pdf` altında, atomik yazımla tutulur."""
+
+    def __init__(self, root: str | Path):
+        self._root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        if not _KEY.match(key):
+            raise ValueError("Geçersiz PDF anahtarı")
+        return self._root / key[:2] / f"{key}.pdf"
+
+    def get_path(self, key: str) -> str | None:
+        path = self._path(key)
+        return str(path) if path.is_file() else None
+
+    def put(self, key: str, data: bytes) -> str:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return str(path)
+
+    def discard(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+
+def get_invoice_pdf_store(settings: Settings) -> LocalInvoicePdfStore:
+    return LocalInvoicePdfStore(settings.invoice_pdf_cache_dir)
+
+
+__all__ = ["LocalInvoicePdfStore", "get_invoice_pdf_store"]
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from sytefy_backend.core.exceptions import ConflictError
 from sytefy_backend.modules.finances.application.interfaces import IInvoiceRepository
 from sytefy_backend.modules.finances.domain.entities import Invoice
 from sytefy_backend.modules.finances.infrastructure.models import InvoiceModel
+from sytefy_backend.modules.finances.infrastructure.rollups import OVERDUE_STATUS, InvoiceRollupWriter
 
 
 def _normalize(dt: datetime) -> datetime:
@@ -54,7 +58,16 @@ class InvoiceRepository(IInvoiceRepository):
             issued_at=invoice.issued_at,
         )
         self._session.add(model)
-        await self._session.commit()
+        rollups = InvoiceRollupWriter(self._session)
+        rollups.add(model)
+        try:
+            await rollups.flush()
+            await self._session.commit()
+        except IntegrityError as exc:
+            await self._session.rollback()
+            if "number" in str(exc.orig):
+                raise ConflictError("Fatura numarası zaten kullanılıyor.") from exc
+            raise
         await self._session.refresh(model)
         return _to_entity(model)
 
@@ -75,6 +88,8 @@ class InvoiceRepository(IInvoiceRepository):
         model = await self._session.get(InvoiceModel, invoice.id)
         if not model:
             raise ValueError("Invoice not found")
+        rollups = InvoiceRollupWriter(self._session)
+        rollups.remove(model)
         model.title = invoice.title
         model.description = invoice.description
         model.amount = invoice.amount
@@ -82,14 +97,61 @@ class InvoiceRepository(IInvoiceRepository):
         model.status = invoice.status
         model.due_date = invoice.due_date
         model.issued_at = invoice.issued_at
+        rollups.add(model)
         self._session.add(model)
+        await rollups.flush()
         await self._session.commit()
         await self._session.refresh(model)
         return _to_entity(model)
 
+    async def list_overdue(
+        self,
+        *,
+        now: datetime,
+        after: tuple[datetime, int] | None = None,
+        limit: int,
+    ) -> list[Invoice]:
+        """`ix_invoices_status_due` üzerinde (due_date, id) anahtar kümesiyle sayfalar; OFFSET kullanılmaz."""
+        stmt = (
+            select(InvoiceModel)
+            .where(InvoiceModel.status == "sent", InvoiceModel.due_date < now)
+            .order_by(InvoiceModel.due_date, InvoiceModel.id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(InvoiceModel.due_date, InvoiceModel.id) > tuple_(*after))
+        result = await self._session.execute(stmt)
+        return [_to_entity(model) for model in result.scalars().all()]
+
+    async def mark_overdue(self, invoices: Sequence[Invoice], *, now: datetime) -> list[Invoice]:
+        """Tek UPDATE ile `overdue` yapar; bu arada statüsü değişenler atlanır ve döndürülmez.
+
+        Özetler taramadaki anlık görüntüden değil, RETURNING ile dönen güncel satırlardan taşınır;
+        tarama ile UPDATE arasında tutarı ya da tarihi değişen fatura doğru kovaya yazılır.
+        """
+        if not invoices:
+            return []
+        result = await self._session.execute(
+            update(InvoiceModel)
+            .where(InvoiceModel.id.in_([item.id for item in invoices]), InvoiceModel.status == "sent")
+            .values(status=OVERDUE_STATUS, updated_at=now)
+            .returning(*InvoiceModel.__table__.columns)
+            .execution_options(synchronize_session=False)
+        )
+        rows = sorted(result.all(), key=lambda row: row.id)
+        rollups = InvoiceRollupWriter(self._session)
+        for row in rows:
+            rollups.move(row, OVERDUE_STATUS, previous="sent")
+        await rollups.flush()
+        await self._session.commit()
+        return [_to_entity(row) for row in rows]
+
     async def delete(self, invoice_id: int, user_id: int) -> None:
         model = await self._session.get(InvoiceModel, invoice_id)
         if not model or model.user_id != user_id:
             raise ValueError("Invoice not found")
+        rollups = InvoiceRollupWriter(self._session)
+        rollups.remove(model)
+        await rollups.flush()
         await self._session.delete(model)
         await self._session.commit()
@@ -0,0 +1,209 @@
+"""`invoice_daily_rollups` tablosunun artımlı bakımı ve rapor sorguları."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sytefy_backend.modules.finances.application.interfaces import IInvoiceReportRepository
+from sytefy_backend.modules.finances.domain.entities import FinanceReport, InvoiceTotal
+from sytefy_backend.modules.finances.infrastructure.models import InvoiceDailyRollupModel, InvoiceModel
+
+ISSUED_BUCKET = "issued"
+DUE_BUCKET = "due"
+OVERDUE_STATUSES = ("sent",)
+OVERDUE_STATUS = "overdue"
+
+Rollup = InvoiceDailyRollupModel
+RollupKey = tuple[int, str, date, str, str, int]
+
+
+@dataclass(slots=True)
+class _Delta:
+    count: int = 0
+    amount: Decimal = Decimal("0")
+
+
+def _utc_day(value: datetime) -> date:
+    if value.tzinfo is None:
+        return value.date()
+    return value.astimezone(timezone.utc).date()
+
+
+def _keys(invoice: InvoiceModel, status: str | None = None) -> list[RollupKey]:
+    customer = invoice.customer_id or 0
+    status = status or invoice.status
+    return [
+        (invoice.user_id, ISSUED_BUCKET, _utc_day(invoice.issued_at), status, invoice.currency, customer),
+        (invoice.user_id, DUE_BUCKET, _utc_day(invoice.due_date), status, invoice.currency, customer),
+    ]
+
+
+class InvoiceRollupWriter:
+    """Fatura yazımıyla aynı işlemde özet satırlarını +/- farklarla günceller."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        self._deltas: dict[RollupKey, _Delta] = defaultdict(_Delta)
+
+    def add(self, invoice: InvoiceModel) -> None:
+        self._track(invoice, 1)
+
+    def remove(self, invoice: InvoiceModel) -> None:
+        self._track(invoice, -1)
+
+    def move(self, invoice: InvoiceModel, status: str, *, previous: str | None = None) -> None:
+        """Toplu UPDATE ile statüsü değişen faturayı eski statüden yenisine taşır.
+
+        `previous` verilirse eski kova ondan hesaplanır; RETURNING satırı zaten yeni statüyü taşır.
+        """
+        self._track(invoice, -1, status=previous)
+        self._track(invoice, 1, status=status)
+
+    def _track(self, invoice: InvoiceModel, sign: int, status: str | None = None) -> None:
+        amount = Decimal(str(invoice.amount)) * sign
+        for key in _keys(invoice, status):
+            delta = self._deltas[key]
+            delta.count += sign
+            delta.amount += amount
+
+    async def flush(self) -> None:
+        """Birikmiş farkları uygular; commit çağırana aittir."""
+        changes = {key: delta for key, delta in self._deltas.items() if delta.count or delta.amount}
+        self._deltas.clear()
+        if not changes:
+            return
+        await self._upsert(changes)
+        user_ids = {key[0] for key in changes}
+        await self._session.execute(
+            delete(Rollup).where(Rollup.user_id.in_(user_ids), Rollup.invoice_count <= 0)
+        )
+
+    async def _upsert(self, changes: dict[RollupKey, _Delta]) -> None:
+        rows = [
+            {
+                "user_id": user_id,
+                "bucket": bucket,
+                "day": day,
+                "month": day.replace(day=1),
+                "status": status,
+                "currency": currency,
+                "customer_id": customer_id,
+                "invoice_count": delta.count,
+                "amount_total": delta.amount,
+            }
+            for (user_id, bucket, day, status, currency, customer_id), delta in changes.items()
+        ]
+        dialect = self._session.get_bind().dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:  # pragma: no cover - desteklenen veritabanları dışı
+            await self._upsert_generic(rows)
+            return
+        stmt = insert(Rollup).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Rollup.user_id, Rollup.bucket, Rollup.day, Rollup.status, Rollup.currency, Rollup.customer_id],
+            set_={
+                "invoice_count": Rollup.invoice_count + stmt.excluded.invoice_count,
+                "amount_total": Rollup.amount_total + stmt.excluded.amount_total,
+            },
+        )
+        await self._session.execute(stmt)
+
+    async def _upsert_generic(self, rows: list[dict]) -> None:
+        for row in rows:
+            match = and_(
+                Rollup.user_id == row["user_id"],
+                Rollup.bucket == row["bucket"],
+                Rollup.day == row["day"],
+                Rollup.status == row["status"],
+                Rollup.currency == row["currency"],
+                Rollup.customer_id == row["customer_id"],
+            )
+            result = await self._session.execute(
+                update(Rollup)
+                .where(match)
+                .values(
+                    invoice_count=Rollup.invoice_count + row["invoice_count"],
+                    amount_total=Rollup.amount_total + row["amount_total"],
+                )
+            )
+            if not result.rowcount:
+                self._session.add(Rollup(**row))
+        await self._session.flush()
+
+
+def _total(row, **extra: object) -> InvoiceTotal:
+    return InvoiceTotal(currency=row.currency, count=int(row.count), amount=float(row.amount), **extra)
+
+
+class InvoiceReportRepository(IInvoiceReportRepository):
+    """Raporlar yalnızca özet tablosundan okunur; maliyet fatura geçmişinden bağımsızdır."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def _grouped(self, filters: list, *columns) -> list:
+        count = func.sum(Rollup.invoice_count).label("count")
+        amount = func.sum(Rollup.amount_total).label("amount")
+        stmt = (
+            select(*columns, Rollup.currency, count, amount)
+            .where(*filters)
+            .group_by(*columns, Rollup.currency)
+            .order_by(*columns, Rollup.currency)
+        )
+        return list((await self._session.execute(stmt)).all())
+
+    async def summarize(
+        self,
+        *,
+        user_id: int,
+        today: date,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> FinanceReport:
+        issued = [Rollup.user_id == user_id, Rollup.bucket == ISSUED_BUCKET]
+        if date_from is not None:
+            issued.append(Rollup.day >= date_from)
+        if date_to is not None:
+            issued.append(Rollup.day <= date_to)
+        overdue = [
+            Rollup.user_id == user_id,
+            Rollup.bucket == DUE_BUCKET,
+            # Tarama henüz işaretlemediyse vadesi geçmiş `sent` faturalar da sayılır.
+            or_(Rollup.status == OVERDUE_STATUS, and_(Rollup.status.in_(OVERDUE_STATUSES), Rollup.day < today)),
+        ]
+        return FinanceReport(
+            by_status=[_total(row, status=row.status) for row in await self._grouped(issued, Rollup.status)],
+            by_currency=[_total(row) for row in await self._grouped(issued)],
+            by_month=[
+                _total(row, month=row.month.strftime("%Y-%m")) for row in await self._grouped(issued, Rollup.month)
+            ],
+            by_customer=[
+                _total(row, customer_id=row.customer_id or None)
+                for row in await self._grouped(issued, Rollup.customer_id)
+            ],
+            overdue=[_total(row) for row in await self._grouped(overdue)],
+        )
+
+    async def totals(self, *, user_id: int, status: str | None = None) -> list[InvoiceTotal]:
+        filters = [Rollup.user_id == user_id, Rollup.bucket == ISSUED_BUCKET]
+        if status:
+            filters.append(Rollup.status == status)
+        return [_total(row) for row in await self._grouped(filters)]
+
+
+__all__ = [
+    "DUE_BUCKET",
+    "ISSUED_BUCKET",
+    "InvoiceReportRepository",
+    "InvoiceRollupWriter",
+    "OVERDUE_STATUS",
+    "OVERDUE_STATUSES",
+]
@@ -0,0 +1,70 @@
+"""Celery tasks for finances."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Any
+
+import structlog
+
+from sytefy_backend.config import get_settings
+from sytefy_backend.core.database.session import _SessionLocal
+from sytefy_backend.core.observability.celery_metrics import record_invoice_overdue_run
+from sytefy_backend.core.tasks.celery_app import celery_app
+from sytefy_backend.core.tasks.runner import run_async
+from sytefy_backend.modules.finances.application.pdf import render_invoice_pdf
+from sytefy_backend.modules.finances.application.use_cases import MarkOverdueInvoices
+from sytefy_backend.modules.finances.infrastructure.overdue_notifier import NotificationOverdueNotifier
+from sytefy_backend.modules.finances.infrastructure.pdf_store import get_invoice_pdf_store
+from sytefy_backend.modules.finances.infrastructure.repository import InvoiceRepository
+from sytefy_backend.modules.notifications.infrastructure.dispatcher import CeleryNotificationDispatcher
+from sytefy_backend.modules.notifications.infrastructure.repository import NotificationRepository
+from sytefy_backend.modules.notifications.infrastructure.stream import get_notification_publisher
+from sytefy_backend.modules.notifications.infrastructure.unread_counter import get_unread_counter
+
+logger = structlog.get_logger("sytefy.finances")
+
+
+@celery_app.task(bind=True, name="finances.render_invoice_pdf")
+def render_invoice_pdf_task(self, *, key: str, fields: dict[str, str]) -> dict[str, object]:
+    """Fatura PDF'ini çizip içerik adresli önbelleğe yazar; önbellekte varsa atlar."""
+    store = get_invoice_pdf_store(get_settings())
+    if store.get_path(key) is None:
+        data = render_invoice_pdf(fields)
+        store.put(key, data)
+        logger.info("finances.invoice_pdf.rendered", task_id=self.request.id, key=key, size=len(data))
+    return {"key": key}
+
+
+@celery_app.task(bind=True, name="finances.mark_overdue")
+def mark_overdue_invoices(self) -> dict[str, Any]:
+    """Vadesi geçen `sent` faturaları toplu UPDATE ile `overdue` yapar ve sahiplerine özet bildirir."""
+    settings = get_settings()
+
+    async def _scan():
+        async with _SessionLocal() as session:
+            notifier = NotificationOverdueNotifier(
+                NotificationRepository(session),
+                CeleryNotificationDispatcher(),
+                channel=settings.invoice_overdue_notification_channel,
+                publisher=get_notification_publisher(settings),
+                counter=get_unread_counter(settings),
+            )
+            return await MarkOverdueInvoices(InvoiceRepository(session), notifier)(
+                now=datetime.now(timezone.utc),
+                batch_size=settings.invoice_overdue_batch_size,
+                max_batches=settings.invoice_overdue_max_batches,
+            )
+
+    started = time.perf_counter()
+    result = run_async(_scan())
+    duration = time.perf_counter() - started
+    record_invoice_overdue_run(result.updated, duration)
+    summary = asdict(result)
+    logger.info("finances.mark_overdue", task_id=self.request.id, duration=round(duration, 3), **summary)
+    return summary
+
+
+__all__ = ["mark_overdue_invoices", "render_invoice_pdf_task"]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import Field
 
@@ -43,3 +43,44 @@ class InvoiceUpdateRequest(StrictModel):
     currency: str | None = Field(default=None, max_length=8)
     due_date: datetime | None = None
     status: str | None = Field(default=None, max_length=20)
+
+
+class InvoiceTotalResponse(StrictModel):
+    currency: str
+    count: int
+    amount: float
+    status: str | None = None
+    month: str | None = None
+    customer_id: int | None = None
+
+
+class ConvertedTotalResponse(StrictModel):
+    currency: str
+    count: int
+    amount: float
+    rate_version: int
+    missing_currencies: list[str]
+
+
+class FinanceReportResponse(StrictModel):
+    date_from: date | None
+    date_to: date | None
+    by_status: list[InvoiceTotalResponse]
+    by_currency: list[InvoiceTotalResponse]
+    by_month: list[InvoiceTotalResponse]
+    by_customer: list[InvoiceTotalResponse]
+    overdue: list[InvoiceTotalResponse]
+    converted_total: ConvertedTotalResponse | None = None
+    converted_overdue: ConvertedTotalResponse | None = None
+
+
+class InvoiceTotalsResponse(StrictModel):
+    by_currency: list[InvoiceTotalResponse]
+    converted: ConvertedTotalResponse | None = None
+
+
+class FxRatesResponse(StrictModel):
+    version: int
+    base: str
+    rates: dict[str, float]
+    created_at: datetime | None = None
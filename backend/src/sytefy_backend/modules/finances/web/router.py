@@ -2,25 +2,102 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from dataclasses import asdict
+from datetime import date
+
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from sytefy_backend.config import get_settings
 from sytefy_backend.core.database import get_db
-from sytefy_backend.core.exceptions import ApplicationError
+from sytefy_backend.core.exceptions import ApplicationError, ConflictError
+from sytefy_backend.core.web import not_modified
 from sytefy_backend.modules.auth.domain.entities import User
-from sytefy_backend.modules.auth.web.router import get_current_user, require_roles
-from sytefy_backend.modules.finances.application.interfaces import IInvoiceRepository
-from sytefy_backend.modules.finances.application.use_cases import CreateInvoice, DeleteInvoice, ListInvoices, UpdateInvoice
+from sytefy_backend.modules.auth.web.router import get_current_user, require_platform_admin, require_roles
+from sytefy_backend.modules.finances.application.fx import CurrencyConverter
+from sytefy_backend.modules.finances.application.interfaces import (
+    IFxRateCache,
+    IFxRateRepository,
+    IInvoiceNumberAllocator,
+    IInvoicePdfRenderer,
+    IInvoicePdfStore,
+    IInvoiceReportRepository,
+    IInvoiceRepository,
+)
+from sytefy_backend.modules.finances.application.use_cases import (
+    CreateInvoice,
+    DeleteInvoice,
+    GetFinanceReport,
+    GetFxRates,
+    GetInvoicePdf,
+    GetInvoiceTotals,
+    ImportFxRates,
+    InvoicePdf,
+    ListInvoices,
+    UpdateInvoice,
+)
+from sytefy_backend.modules.finances.infrastructure.fx_rates import FxRateRepository, get_fx_rate_cache
+from sytefy_backend.modules.finances.infrastructure.numbering import get_invoice_number_allocator
+from sytefy_backend.modules.finances.infrastructure.pdf_renderer import get_invoice_pdf_renderer
+from sytefy_backend.modules.finances.infrastructure.pdf_store import get_invoice_pdf_store
 from sytefy_backend.modules.finances.infrastructure.repository import InvoiceRepository
-from sytefy_backend.modules.finances.web.dto import InvoiceCreateRequest, InvoiceResponse, InvoiceUpdateRequest
+from sytefy_backend.modules.finances.infrastructure.rollups import InvoiceReportRepository
+from sytefy_backend.modules.finances.web.dto import (
+    FinanceReportResponse,
+    FxRatesResponse,
+    InvoiceCreateRequest,
+    InvoiceResponse,
+    InvoiceTotalsResponse,
+    InvoiceUpdateRequest,
+)
 
+settings = get_settings()
 router = APIRouter(prefix="/finances/invoices", tags=["Finances"])
+reports_router = APIRouter(prefix="/finances/reports", tags=["Finances"])
+fx_router = APIRouter(prefix="/finances/fx-rates", tags=["Finances"])
+
+MAX_FX_UPLOAD_BYTES = 1024 * 1024
 
 
 def get_repo(db: AsyncSession = Depends(get_db)) -> IInvoiceRepository:
     return InvoiceRepository(db)
 
 
+def get_number_allocator(db: AsyncSession = Depends(get_db)) -> IInvoiceNumberAllocator:
+    return get_invoice_number_allocator(settings, db.bind)
+
+
+def get_pdf_store() -> IInvoicePdfStore:
+    return get_invoice_pdf_store(settings)
+
+
+def get_pdf_renderer() -> IInvoicePdfRenderer:
+    return get_invoice_pdf_renderer(settings)
+
+
+def get_report_repo(db: AsyncSession = Depends(get_db)) -> IInvoiceReportRepository:
+    return InvoiceReportRepository(db)
+
+
+def get_fx_repo(db: AsyncSession = Depends(get_db)) -> IFxRateRepository:
+    return FxRateRepository(db)
+
+
+def get_fx_cache() -> IFxRateCache:
+    return get_fx_rate_cache(settings)
+
+
+def get_currency_converter(
+    repo: IFxRateRepository = Depends(get_fx_repo),
+    cache: IFxRateCache = Depends(get_fx_cache),
+) -> CurrencyConverter:
+    return CurrencyConverter(repo, cache)
+
+
 def to_response(invoice) -> InvoiceResponse:
     return InvoiceResponse(
         id=invoice.id or 0,
@@ -52,13 +129,30 @@ async def list_invoices(
     return [to_response(inv) for inv in invoices]
 
 
+@router.get("/totals", response_model=InvoiceTotalsResponse)
+async def invoice_totals(
+    current_user: User = Depends(get_current_user),
+    repo: IInvoiceReportRepository = Depends(get_report_repo),
+    converter: CurrencyConverter = Depends(get_currency_converter),
+    status_filter: str | None = None,
+    currency: str | None = None,
+):
+    use_case = GetInvoiceTotals(repo, converter)
+    try:
+        totals = await use_case(user_id=current_user.id or 0, status=status_filter, currency=currency)
+    except ApplicationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return InvoiceTotalsResponse(**asdict(totals))
+
+
 @router.post("/", response_model=InvoiceResponse, status_code=status.HTTP_201_CREATED)
 async def create_invoice(
     payload: InvoiceCreateRequest,
     current_user: User = Depends(require_roles("owner", "admin")),
     repo: IInvoiceRepository = Depends(get_repo),
+    numbers: IInvoiceNumberAllocator = Depends(get_number_allocator),
 ):
-    use_case = CreateInvoice(repo)
+    use_case = CreateInvoice(repo, numbers)
     try:
         result = await use_case(
             user_id=current_user.id or 0,
@@ -83,8 +177,9 @@ async def update_invoice(
     payload: InvoiceUpdateRequest,
     current_user: User = Depends(require_roles("owner", "admin")),
     repo: IInvoiceRepository = Depends(get_repo),
+    pdfs: IInvoicePdfStore = Depends(get_pdf_store),
 ):
-    use_case = UpdateInvoice(repo)
+    use_case = UpdateInvoice(repo, pdfs)
     try:
         updated = await use_case(
             invoice_id=invoice_id,
@@ -101,14 +196,160 @@ async def update_invoice(
     return to_response(updated)
 
 
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Tek aralıklı `bytes=` başlığını (başlangıç, bitiş) olarak çözer; çoklu aralık desteklenmez."""
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        raise ValueError("unsupported range")
+    first, _, last = spec.strip().partition("-")
+    if not first:
+        length = int(last)
+        if length <= 0:
+            return None
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def _read_slice(path: str, start: int, length: int) -> bytes:
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        return handle.read(length)
+
+
+async def _pdf_response(request: Request, pdf: InvoicePdf, filename: str) -> Response:
+    etag = f'"{pdf.key}"'
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "private, no-cache",
+        "Content-Disposition": f'inline; filename="{filename}"',
+    }
+    if not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range == etag):
+        size = os.path.getsize(pdf.path)
+        try:
+            bounds = _parse_range(range_header, size)
+        except ValueError:
+            bounds = (0, size - 1)
+        if bounds is None:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, headers=headers)
+        start, end = bounds
+        if (start, end) != (0, size - 1):
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            body = await run_in_threadpool(_read_slice, pdf.path, start, end - start + 1)
+            return Response(
+                content=body,
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type="application/pdf",
+                headers=headers,
+            )
+    return FileResponse(pdf.path, media_type="application/pdf", headers=headers)
+
+
+@router.get("/{invoice_id}/pdf")
+async def download_invoice_pdf(
+    invoice_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    repo: IInvoiceRepository = Depends(get_repo),
+    store: IInvoicePdfStore = Depends(get_pdf_store),
+    renderer: IInvoicePdfRenderer = Depends(get_pdf_renderer),
+):
+    try:
+        pdf = await GetInvoicePdf(repo, store, renderer)(invoice_id=invoice_id, user_id=current_user.id or 0)
+    except ApplicationError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    if pdf.path is None:
+        return Response(status_code=status.HTTP_202_ACCEPTED, headers={"Retry-After": "2"})
+    return await _pdf_response(request, pdf, f"invoice-{invoice_id}.pdf")
+
+
 @router.delete("/{invoice_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_invoice(
     invoice_id: int,
     current_user: User = Depends(require_roles("owner", "admin")),
     repo: IInvoiceRepository = Depends(get_repo),
+    pdfs: IInvoicePdfStore = Depends(get_pdf_store),
 ):
-    use_case = DeleteInvoice(repo)
+    use_case = DeleteInvoice(repo, pdfs)
     try:
         await use_case(invoice_id=invoice_id, user_id=current_user.id or 0)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
+@reports_router.get("/", response_model=FinanceReportResponse)
+async def finance_report(
+    current_user: User = Depends(get_current_user),
+    repo: IInvoiceReportRepository = Depends(get_report_repo),
+    converter: CurrencyConverter = Depends(get_currency_converter),
+    date_from: date | None = None,
+    date_to: date | None = None,
+    currency: str | None = None,
+):
+    use_case = GetFinanceReport(repo, converter)
+    try:
+        report = await use_case(
+            user_id=current_user.id or 0,
+            date_from=date_from,
+            date_to=date_to,
+            currency=currency,
+        )
+    except ApplicationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return FinanceReportResponse(date_from=date_from, date_to=date_to, **asdict(report))
+
+
+def _fx_response(table) -> FxRatesResponse:
+    return FxRatesResponse(
+        version=table.version,
+        base=table.base,
+        rates={currency: float(rate) for currency, rate in sorted(table.rates.items())},
+        created_at=table.created_at,
+    )
+
+
+@fx_router.get("/", response_model=FxRatesResponse)
+async def get_fx_rates(
+    _: User = Depends(get_current_user),
+    converter: CurrencyConverter = Depends(get_currency_converter),
+):
+    try:
+        table = await GetFxRates(converter)()
+    except ApplicationError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return _fx_response(table)
+
+
+@fx_router.put("/", response_model=FxRatesResponse)
+async def upload_fx_rates(
+    request: Request,
+    _: User = Depends(require_platform_admin),
+    repo: IFxRateRepository = Depends(get_fx_repo),
+    cache: IFxRateCache = Depends(get_fx_cache),
+    base: str | None = None,
+):
+    """Gövde JSON (`{"base": ..., "rates": {...}}`) veya `currency,rate` CSV olabilir."""
+    body = await request.body()
+    if len(body) > MAX_FX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="Kur dosyası çok büyük")
+    try:
+        table = await ImportFxRates(repo, cache, default_base=settings.fx_base_currency)(
+            content=body.decode("utf-8"),
+            base=base,
+        )
+    except UnicodeDecodeError as exc:
+        raise HTTPException(status_code=400, detail="Kur dosyası UTF-8 olmalı") from exc
+    except ConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    except ApplicationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _fx_response(table)
@@ -2,14 +2,78 @@
 
 from __future__ import annotations
 
-from typing import Protocol
+from datetime import datetime
+from typing import Protocol, Sequence
 
-from sytefy_backend.modules.notifications.domain.entities import Notification
+from sytefy_backend.modules.notifications.domain.entities import BroadcastJob, Notification
 
 
 class INotificationRepository(Protocol):
     async def create(self, notification: Notification) -> Notification: ...
 
+    async def create_many(self, notifications: Sequence[Notification]) -> list[Notification]: ...
+
     async def list_for_user(self, *, user_id: int, status: str | None = None) -> list[Notification]: ...
 
+    async def count_unread(self, *, user_id: int) -> int: ...
+
+    async def get_for_user(self, *, notification_id: int, user_id: int) -> Notification | None: ...
+
+    async def mark_read_many(self, *, user_id: int, notification_ids: Sequence[int] | None = None) -> int: ...
+
+    async def insert_for_users(
+        self,
+        *,
+        user_ids: Sequence[int],
+        title: str,
+        body: str,
+        channel: str,
+        status: str = "pending",
+    ) -> list[Notification]: ...
+
+    async def purge_created_before(self, *, cutoff: datetime, limit: int) -> tuple[int, dict[int, int]]:
+        """Silinen bildirim sayısı ve kullanıcı başına silinen okunmamış bildirim sayısı."""
+        ...
+
+    async def list_after(self, *, user_id: int, after_id: int, limit: int) -> list[Notification]: ...
+
     async def mark_read(self, *, notification_id: int, user_id: int) -> Notification: ...
+
+
+class NotificationPublisher(Protocol):
+    """Yeni bildirimi canlı akış abonelerine iletir; kalıcı kayıt depoya aittir."""
+
+    async def publish(self, notification: Notification) -> None: ...
+
+
+class IUnreadCounter(Protocol):
+    async def get(self, user_id: int) -> int | None:
+        """Sayaç hiç hesaplanmamışsa `None` döner; çağıran COUNT ile başlatır."""
+        ...
+
+    async def initialize(self, user_id: int, value: int) -> None: ...
+
+    async def adjust(self, user_id: int, delta: int) -> None:
+        """Yalnızca başlatılmış sayacı değiştirir; eksiye düşerse sayaç geçersiz kılınır."""
+        ...
+
+
+class IRecipientDirectory(Protocol):
+    async def list_active_ids(
+        self,
+        *,
+        role: str | None = None,
+        user_ids: Sequence[int] | None = None,
+        after_id: int = 0,
+        limit: int = 500,
+    ) -> list[int]: ...
+
+
+class IBroadcastJobStore(Protocol):
+    def create(self, job: BroadcastJob) -> None: ...
+
+    def get(self, job_id: str) -> BroadcastJob | None: ...
+
+    def update(self, job_id: str, **changes: object) -> None: ...
+
+    def increment(self, job_id: str, *, created: int, chunks: int) -> None: ...
@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Sequence
 
 from sytefy_backend.core.exceptions import ApplicationError
-from sytefy_backend.modules.notifications.application.interfaces import INotificationRepository
-from sytefy_backend.modules.notifications.domain.entities import Notification
+from sytefy_backend.modules.notifications.application.interfaces import (
+    IBroadcastJobStore,
+    INotificationRepository,
+    IRecipientDirectory,
+    IUnreadCounter,
+    NotificationPublisher,
+)
+from sytefy_backend.modules.notifications.domain.entities import BroadcastJob, Notification
 
 
 class NotificationDispatcher:
@@ -17,6 +24,10 @@ class NotificationDispatcher:
         # Future: route to email/SMS providers.
         return None
 
+    def dispatch_many(self, notifications: Sequence[Notification]) -> None:
+        for notification in notifications:
+            self.dispatch(notification)
+
 
 @dataclass(slots=True)
 class CreateNotificationResult:
@@ -24,9 +35,17 @@ class CreateNotificationResult:
 
 
 class CreateNotification:
-    def __init__(self, repo: INotificationRepository, dispatcher: NotificationDispatcher | None = None):
+    def __init__(
+        self,
+        repo: INotificationRepository,
+        dispatcher: NotificationDispatcher | None = None,
+        publisher: NotificationPublisher | None = None,
+        counter: IUnreadCounter | None = None,
+    ):
         self._repo = repo
         self._dispatcher = dispatcher or NotificationDispatcher()
+        self._publisher = publisher
+        self._counter = counter
 
     async def __call__(
         self,
@@ -51,9 +70,105 @@ class CreateNotification:
         )
         stored = await self._repo.create(notification)
         self._dispatcher.dispatch(stored)
+        if self._counter and stored.status != "read":
+            await self._counter.adjust(stored.user_id, 1)
+        if self._publisher:
+            await self._publisher.publish(stored)
         return CreateNotificationResult(notification=stored)
 
 
+class StartBroadcast:
+    """Yayın işini kaydeder; asıl ekleme arka plan görevinde yapılır."""
+
+    def __init__(self, jobs: IBroadcastJobStore):
+        self._jobs = jobs
+
+    def __call__(
+        self,
+        *,
+        job_id: str,
+        requested_by: int,
+        title: str,
+        channel: str,
+        role: str | None,
+        user_ids: Sequence[int] | None,
+    ) -> BroadcastJob:
+        if not title.strip():
+            raise ApplicationError("Başlık zorunlu.")
+        if (role is None) == (user_ids is None):
+            raise ApplicationError("Rol veya kullanıcı listesinden yalnızca biri belirtilmeli.")
+        job = BroadcastJob(job_id=job_id, status="queued", title=title, channel=channel, requested_by=requested_by)
+        self._jobs.create(job)
+        return job
+
+
+class BroadcastNotifications:
+    """Alıcıları keyset sayfalarla okur; her parça tek INSERT ve tek teslimat görevi üretir."""
+
+    def __init__(
+        self,
+        repo: INotificationRepository,
+        directory: IRecipientDirectory,
+        jobs: IBroadcastJobStore,
+        dispatcher: NotificationDispatcher | None = None,
+        publisher: NotificationPublisher | None = None,
+        counter: IUnreadCounter | None = None,
+    ):
+        self._repo = repo
+        self._directory = directory
+        self._jobs = jobs
+        self._dispatcher = dispatcher or NotificationDispatcher()
+        self._publisher = publisher
+        self._counter = counter
+
+    async def __call__(
+        self,
+        *,
+        job_id: str,
+        title: str,
+        body: str,
+        channel: str,
+        role: str | None = None,
+        user_ids: Sequence[int] | None = None,
+        chunk_size: int = 500,
+    ) -> int:
+        self._jobs.update(job_id, status="running")
+        total = 0
+        after_id = 0
+        try:
+            while True:
+                recipients = await self._directory.list_active_ids(
+                    role=role,
+                    user_ids=user_ids,
+                    after_id=after_id,
+                    limit=chunk_size,
+                )
+                if not recipients:
+                    break
+                stored = await self._repo.insert_for_users(
+                    user_ids=recipients,
+                    title=title,
+                    body=body,
+                    channel=channel,
+                )
+                self._dispatcher.dispatch_many(stored)
+                for notification in stored:
+                    if self._counter:
+                        await self._counter.adjust(notification.user_id, 1)
+                    if self._publisher:
+                        await self._publisher.publish(notification)
+                total += len(stored)
+                self._jobs.increment(job_id, created=len(stored), chunks=1)
+                after_id = recipients[-1]
+                if len(recipients) < chunk_size:
+                    break
+        except Exception as exc:
+            self._jobs.update(job_id, status="failed", error=str(exc))
+            raise
+        self._jobs.update(job_id, status="completed")
+        return total
+
+
 class ListNotifications:
     def __init__(self, repo: INotificationRepository):
         self._repo = repo
@@ -62,12 +177,79 @@ class ListNotifications:
         return await self._repo.list_for_user(user_id=user_id, status=status)
 
 
-class MarkNotificationRead:
+class PurgeExpiredNotifications:
+    """Saklama süresi dolan bildirimleri sınırlı parçalar halinde siler.
+
+    Her parçadan sonra silinen okunmamış bildirimler etkilenen kullanıcıların sayaçlarından düşülür.
+    """
+
+    def __init__(self, repo: INotificationRepository, counter: IUnreadCounter | None = None):
+        self._repo = repo
+        self._counter = counter
+
+    async def __call__(self, *, cutoff: datetime, batch_size: int, max_batches: int) -> int:
+        total = 0
+        for _ in range(max_batches):
+            deleted, unread = await self._repo.purge_created_before(cutoff=cutoff, limit=batch_size)
+            if self._counter:
+                for user_id, count in unread.items():
+                    await self._counter.adjust(user_id, -count)
+            total += deleted
+            if deleted < batch_size:
+                break
+        return total
+
+
+class ResumeNotifications:
+    """SSE yeniden bağlanmasında Last-Event-ID sonrasındaki bildirimleri döndürür."""
+
     def __init__(self, repo: INotificationRepository):
         self._repo = repo
 
+    async def __call__(self, *, user_id: int, after_id: int, limit: int) -> list[Notification]:
+        return await self._repo.list_after(user_id=user_id, after_id=after_id, limit=limit)
+
+
+class MarkNotificationRead:
+    def __init__(self, repo: INotificationRepository, counter: IUnreadCounter | None = None):
+        self._repo = repo
+        self._counter = counter
+
     async def __call__(self, *, notification_id: int, user_id: int) -> Notification:
-        try:
-            return await self._repo.mark_read(notification_id=notification_id, user_id=user_id)
-        except ValueError as exc:
-            raise ApplicationError("Bildirim bulunamadı") from exc
+        updated = await self._repo.mark_read_many(user_id=user_id, notification_ids=[notification_id])
+        if updated and self._counter:
+            await self._counter.adjust(user_id, -updated)
+        notification = await self._repo.get_for_user(notification_id=notification_id, user_id=user_id)
+        if notification is None:
+            raise ApplicationError("Bildirim bulunamadı")
+        return notification
+
+
+class MarkNotificationsRead:
+    """Seçili (veya `notification_ids=None` ile tüm) bildirimleri tek UPDATE ile okundu yapar."""
+
+    def __init__(self, repo: INotificationRepository, counter: IUnreadCounter | None = None):
+        self._repo = repo
+        self._counter = counter
+
+    async def __call__(self, *, user_id: int, notification_ids: Sequence[int] | None = None) -> int:
+        updated = await self._repo.mark_read_many(user_id=user_id, notification_ids=notification_ids)
+        if updated and self._counter:
+            await self._counter.adjust(user_id, -updated)
+        return updated
+
+
+class GetUnreadCount:
+    def __init__(self, repo: INotificationRepository, counter: IUnreadCounter | None = None):
+        self._repo = repo
+        self._counter = counter
+
+    async def __call__(self, *, user_id: int) -> int:
+        if self._counter:
+            cached = await self._counter.get(user_id)
+            if cached is not None:
+                return cached
+        value = await self._repo.count_unread(user_id=user_id)
+        if self._counter:
+            await self._counter.initialize(user_id, value)
+        return value
@@ -17,3 +17,33 @@ class Notification:
     status: str
     read_at: Optional[datetime]
     created_at: Optional[datetime]
+
+
+@dataclass(slots=True)
+class NotificationDelivery:
+    """E-posta/SMS sağlayıcısına gönderilecek tek alıcılı teslimat."""
+
+    channel: str
+    recipient: Optional[str]
+    subject: str
+    body: str
+    user_id: Optional[int] = None
+    appointment_id: Optional[int] = None
+    remind_at: Optional[str] = None
+    attempt: int = 0
+
+
+@dataclass(slots=True)
+class BroadcastJob:
+    """Toplu bildirim işinin takip edilebilir durumu."""
+
+    job_id: str
+    status: str
+    title: str
+    channel: str
+    requested_by: int
+    created: int = 0
+    chunks: int = 0
+    error: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
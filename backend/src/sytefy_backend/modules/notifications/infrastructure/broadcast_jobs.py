@@ -0,0 +1,132 @@
+"""Toplu bildirim işlerinin ilerleme kayıtları."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import asdict, fields, replace
+from datetime import datetime, timezone
+
+from redis import Redis
+
+from sytefy_backend.config.settings import Settings
+from sytefy_backend.modules.notifications.application.interfaces import IBroadcastJobStore
+from sytefy_backend.modules.notifications.domain.entities import BroadcastJob
+
+_INT_FIELDS = {"created", "chunks", "requested_by"}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class InMemoryBroadcastJobStore(IBroadcastJobStore):
+    def __init__(self):
+        self._jobs: dict[str, BroadcastJob] = {}
+        self._lock = threading.Lock()
+
+    def create(self, job: BroadcastJob) -> None:
+        with self._lock:
+            self._jobs[job.job_id] = replace(job, created_at=job.created_at or _now(), updated_at=_now())
+
+    def get(self, job_id: str) -> BroadcastJob | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return replace(job) if job else None
+
+    def update(self, job_id: str, **changes: object) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job:
+                self._jobs[job_id] = replace(job, **changes, updated_at=_now())
+
+    def increment(self, job_id: str, *, created: int, chunks: int) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job:
+                self._jobs[job_id] = replace(
+                    job,
+                    created=job.created + created,
+                    chunks=job.chunks + chunks,
+                    updated_at=_now(),
+                )
+
+
+class RedisBroadcastJobStore(IBroadcastJobStore):
+    """İş durumunu TTL'li Redis hash'inde tutar; sayaçlar HINCRBY ile atomik artar."""
+
+    def __init__(self, redis: Redis, prefix: str = "notifications:broadcast", ttl_seconds: int = 86400):
+        self._redis = redis
+        self._prefix = prefix.rstrip(":")
+        self._ttl = ttl_seconds
+
+    def _key(self, job_id: str) -> str:
+        return f"{self._prefix}:{job_id}"
+
+    def create(self, job: BroadcastJob) -> None:
+        now = _now()
+        payload = asdict(replace(job, created_at=job.created_at or now, updated_at=now))
+        key = self._key(job.job_id)
+        with self._redis.pipeline() as pipe:
+            pipe.hset(key, mapping={name: value for name, value in payload.items() if value is not None})
+            pipe.expire(key, self._ttl)
+            pipe.execute()
+
+    def get(self, job_id: str) -> BroadcastJob | None:
+        raw = self._redis.hgetall(self._key(job_id))
+        if not raw:
+            return None
+        data: dict[str, object] = {}
+        for item in fields(BroadcastJob):
+            value = raw.get(item.name)
+            if value is None:
+                continue
+            data[item.name] = int(value) if item.name in _INT_FIELDS else value
+        return BroadcastJob(**data)  # type: ignore[arg-type]
+
+    def update(self, job_id: str, **changes: object) -> None:
+        key = self._key(job_id)
+        mapping = {name: value for name, value in changes.items() if value is not None}
+        mapping["updated_at"] = _now()
+        with self._redis.pipeline() as pipe:
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, self._ttl)
+            pipe.execute()
+
+    def increment(self, job_id: str, *, created: int, chunks: int) -> None:
+        key = self._key(job_id)
+        with self._redis.pipeline() as pipe:
+            pipe.hincrby(key, "created", created)
+            pipe.hincrby(key, "chunks", chunks)
+            pipe.hset(key, "updated_at", _now())
+            pipe.execute()
+
+
+_store: IBroadcastJobStore | None = None
+
+
+def get_broadcast_job_store(settings: Settings) -> IBroadcastJobStore:
+    global _store
+    if _store is not None:
+        return _store
+    if settings.notification_broadcast_backend == "redis":
+        client = Redis.from_url(settings.redis_url, decode_responses=True, socket_timeout=2)
+        _store = RedisBroadcastJobStore(
+            client,
+            prefix=settings.notification_broadcast_prefix,
+            ttl_seconds=settings.notification_broadcast_ttl_seconds,
+        )
+    else:
+        if not settings.celery_task_always_eager:
+            # Görev ayrı bir worker'da çalışırken API süreci bellek içi ilerlemeyi hiç göremez.
+            raise RuntimeError(
+                "NOTIFICATION_BROADCAST_BACKEND=memory yalnızca CELERY_TASK_ALWAYS_EAGER açıkken kullanılabilir"
+            )
+        _store = InMemoryBroadcastJobStore()
+    return _store
+
+
+__all__ = [
+    "InMemoryBroadcastJobStore",
+    "RedisBroadcastJobStore",
+    "get_broadcast_job_store",
+]
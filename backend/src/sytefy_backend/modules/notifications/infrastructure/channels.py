@@ -2,17 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from email.message import EmailMessage
 import smtplib
-from typing import Callable, Protocol
+from smtplib import SMTPRecipientsRefused, SMTPServerDisconnected
+import time
+from typing import Callable, Protocol, Sequence
 
 import httpx
 import structlog
 
+from sytefy_backend.core.observability.celery_metrics import record_provider_latency
+from sytefy_backend.core.resilience import CircuitBreaker, CircuitOpenError, Throttle, ThrottleTimeoutError
+from sytefy_backend.modules.notifications.domain.entities import NotificationDelivery
 
 logger = structlog.get_logger("sytefy.notifications")
 
 
+def _is_smtp_provider_failure(exc: Exception) -> bool:
+    # Alıcı reddi veya yerel hız sınırı sağlayıcının çöktüğü anlamına gelmez; devreyi açmamalı.
+    return not isinstance(exc, (SMTPRecipientsRefused, ThrottleTimeoutError))
+
+
+def _is_twilio_provider_failure(exc: Exception) -> bool:
+    if isinstance(exc, ThrottleTimeoutError):
+        return False
+    if isinstance(exc, httpx.HTTPStatusError):
+        status_code = exc.response.status_code
+        return status_code == 429 or status_code >= 500
+    return True
+
+
 class EmailBackend(Protocol):
     def send(self, message: EmailMessage) -> None: ...
 
@@ -30,6 +51,7 @@ class SMTPEmailBackend:
         use_tls: bool = True,
         use_ssl: bool = False,
         timeout: float = 10.0,
+        throttle: Throttle | None = None,
     ):
         self._host = host
         self._port = port
@@ -38,17 +60,65 @@ class SMTPEmailBackend:
         self._use_tls = use_tls
         self._use_ssl = use_ssl
         self._timeout = timeout
+        self._throttle = throttle
 
-    def send(self, message: EmailMessage) -> None:
+    def _connect(self):
         smtp_cls = smtplib.SMTP_SSL if self._use_ssl else smtplib.SMTP
-        with smtp_cls(self._host, self._port, timeout=self._timeout) as server:
+        server = smtp_cls(self._host, self._port, timeout=self._timeout)
+        server.ehlo()
+        if self._use_tls and not self._use_ssl:
+            server.starttls()
             server.ehlo()
-            if self._use_tls and not self._use_ssl:
-                server.starttls()
-                server.ehlo()
-            if self._username and self._password:
-                server.login(self._username, self._password)
-            server.send_message(message)
+        if self._username and self._password:
+            server.login(self._username, self._password)
+        return server
+
+    def send(self, message: EmailMessage) -> None:
+        error = self.send_many([message])[0]
+        if error is not None:
+            raise error
+
+    def send_many(self, messages: Sequence[EmailMessage]) -> list[Exception | None]:
+        """Tek SMTP oturumu üzerinden mesajları gönderir; mesaj başına hata döner."""
+        if not messages:
+            return []
+        granted = len(messages)
+        throttled: list[Exception | None] = []
+        if self._throttle:
+            # İzinler bağlantı açılmadan alınır; bekleme sırasında SMTP oturumu boşta tutulmaz.
+            for index in range(len(messages)):
+                try:
+                    self._throttle.acquire()
+                except ThrottleTimeoutError as exc:
+                    granted = index
+                    throttled = [exc for _ in messages[index:]]
+                    break
+        if not granted:
+            return throttled
+        messages = messages[:granted]
+        started = time.perf_counter()
+        try:
+            server = self._connect()
+        except Exception as exc:
+            record_provider_latency("smtp", "error", time.perf_counter() - started)
+            return [exc for _ in messages] + throttled
+        results: list[Exception | None] = []
+        with server:
+            for index, message in enumerate(messages):
+                try:
+                    server.send_message(message)
+                except SMTPServerDisconnected as exc:
+                    record_provider_latency("smtp", "error", time.perf_counter() - started)
+                    results.extend(exc for _ in messages[index:])
+                    break
+                except Exception as exc:
+                    record_provider_latency("smtp", "error", time.perf_counter() - started)
+                    results.append(exc)
+                else:
+                    record_provider_latency("smtp", "success", time.perf_counter() - started)
+                    results.append(None)
+                started = time.perf_counter()
+        return results + throttled
 
 
 class EmailNotificationService:
@@ -67,11 +137,14 @@ class EmailNotificationService:
         use_tls: bool = True,
         use_ssl: bool = False,
         timeout: float = 10.0,
+        breaker: CircuitBreaker | None = None,
+        throttle: Throttle | None = None,
     ):
         self._sender = sender
         self._enabled = enabled
         self._logger = structlog.get_logger("sytefy.notifications.email")
         self._backend = backend
+        self._breaker = breaker
         if backend is None and host:
             self._backend = SMTPEmailBackend(
                 host=host,
@@ -81,9 +154,11 @@ class EmailNotificationService:
                 use_tls=use_tls,
                 use_ssl=use_ssl,
                 timeout=timeout,
+                throttle=throttle,
             )
 
     def send(self, *, recipient: str | None, subject: str, body: str) -> bool:
+        """E-postayı gönderir; devre açıksa `CircuitOpenError`, izin alınamazsa `ThrottleTimeoutError` fırlatır."""
         if not recipient:
             self._logger.warning("email_missing_recipient", subject=subject)
             return False
@@ -99,14 +174,19 @@ class EmailNotificationService:
                 body=body,
             )
             return False
-        message = EmailMessage()
-        message["From"] = self._sender
-        message["To"] = recipient
-        message["Subject"] = subject
-        message.set_content(body)
+        message = self._build_message(recipient=recipient, subject=subject, body=body)
+        if self._breaker:
+            self._breaker.before_call()
         try:
             self._backend.send(message)
+        except ThrottleTimeoutError as exc:
+            if self._breaker:
+                self._breaker.release()
+            self._logger.warning("email_throttled", recipient=recipient, subject=subject, retry_after=exc.retry_after)
+            raise
         except Exception as exc:  # pragma: no cover - defensive logging path
+            if self._breaker and _is_smtp_provider_failure(exc):
+                self._breaker.record_failure()
             self._logger.exception(
                 "email_send_failed",
                 recipient=recipient,
@@ -114,16 +194,89 @@ class EmailNotificationService:
                 exc=exc,
             )
             return False
+        if self._breaker:
+            self._breaker.record_success()
         self._logger.info("email_sent", recipient=recipient, subject=subject)
         return True
 
+    def _build_message(self, *, recipient: str, subject: str, body: str) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self._sender
+        message["To"] = recipient
+        message["Subject"] = subject
+        message.set_content(body)
+        return message
+
+    def _send_or_short_circuit(self, item: NotificationDelivery) -> bool | None:
+        try:
+            return self.send(recipient=item.recipient, subject=item.subject, body=item.body)
+        except (CircuitOpenError, ThrottleTimeoutError):
+            return None
+
+    def send_many(self, deliveries: Sequence[NotificationDelivery]) -> list[bool | None]:
+        """Toplu gönderim; backend destekliyorsa tek SMTP oturumu kullanılır.
+
+        Devre açık olduğu ya da gönderim izni alınamadığı için denenmeyen teslimatlar için `None` döner.
+        """
+        send_many = getattr(self._backend, "send_many", None)
+        if not self._enabled or send_many is None:
+            return [self._send_or_short_circuit(item) for item in deliveries]
+        results: list[bool | None] = [False] * len(deliveries)
+        pending: list[int] = []
+        messages: list[EmailMessage] = []
+        for index, item in enumerate(deliveries):
+            if not item.recipient:
+                self._logger.warning("email_missing_recipient", subject=item.subject)
+                continue
+            pending.append(index)
+            messages.append(self._build_message(recipient=item.recipient, subject=item.subject, body=item.body))
+        if not pending:
+            return results
+        if self._breaker:
+            try:
+                self._breaker.before_call()
+            except CircuitOpenError:
+                for index in pending:
+                    results[index] = None
+                return results
+        reached_provider = False
+        for index, error in zip(pending, send_many(messages)):
+            item = deliveries[index]
+            if isinstance(error, ThrottleTimeoutError):
+                self._logger.warning("email_throttled", recipient=item.recipient, retry_after=error.retry_after)
+                results[index] = None
+                continue
+            reached_provider = True
+            if error is not None:
+                if self._breaker and _is_smtp_provider_failure(error):
+                    self._breaker.record_failure()
+                self._logger.error(
+                    "email_send_failed",
+                    recipient=item.recipient,
+                    subject=item.subject,
+                    exc=error,
+                )
+                continue
+            if self._breaker:
+                self._breaker.record_success()
+            self._logger.info("email_sent", recipient=item.recipient, subject=item.subject)
+            results[index] = True
+        if self._breaker and not reached_provider:
+            # Hiçbir mesaj kısıtlamayı geçemediyse deneme hakkı sonuçsuz kalmasın.
+            self._breaker.release()
+        return results
+
 
 class SMSBackend(Protocol):
     def send(self, *, to: str, body: str) -> dict | None: ...
 
 
 class TwilioSMSBackend:
-    """Twilio REST client wrapper (sync)."""
+    """Twilio REST client wrapper.
+
+    Worker başına paylaşılan `httpx.Client`/`httpx.AsyncClient` verildiğinde
+    bağlantılar (keep-alive, TLS oturumu) mesajlar arasında yeniden kullanılır.
+    """
 
     def __init__(
         self,
@@ -134,27 +287,77 @@ class TwilioSMSBackend:
         base_url: str = "https://api.twilio.com",
         timeout: float = 10.0,
         request_func: Callable[..., httpx.Response] | None = None,
+        client: httpx.Client | None = None,
+        async_client: httpx.AsyncClient | None = None,
+        throttle: Throttle | None = None,
     ):
         self._account_sid = account_sid
         self._auth_token = auth_token
         self._from = from_number
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
-        self._request = request_func or httpx.post
+        self._async_client = async_client
+        self._throttle = throttle
+        if request_func is not None:
+            self._request = request_func
+        elif client is not None:
+            self._request = client.post
+        else:
+            self._request = httpx.post
+
+    def _messages_url(self) -> str:
+        return f"{self._base_url}/2010-04-01/Accounts/{self._account_sid}/Messages.json"
+
+    def _form(self, *, to: str, body: str) -> dict[str, str]:
+        return {
+            "To": to,
+            "From": self._from,
+            "Body": body,
+        }
 
     def send(self, *, to: str, body: str) -> dict:
-        url = f"{self._base_url}/2010-04-01/Accounts/{self._account_sid}/Messages.json"
-        response = self._request(
-            url,
-            data={
-                "To": to,
-                "From": self._from,
-                "Body": body,
-            },
-            auth=(self._account_sid, self._auth_token),
-            timeout=self._timeout,
-        )
-        response.raise_for_status()
+        if self._throttle:
+            self._throttle.acquire()
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            response = self._request(
+                self._messages_url(),
+                data=self._form(to=to, body=body),
+                auth=(self._account_sid, self._auth_token),
+                timeout=self._timeout,
+            )
+            response.raise_for_status()
+            outcome = "success"
+        finally:
+            record_provider_latency("twilio", outcome, time.perf_counter() - started)
+        return response.json()
+
+    async def send_async(self, *, to: str, body: str) -> dict:
+        if self._throttle:
+            await asyncio.to_thread(self._throttle.acquire)
+        client = self._async_client
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            if client is not None:
+                response = await client.post(
+                    self._messages_url(),
+                    data=self._form(to=to, body=body),
+                    auth=(self._account_sid, self._auth_token),
+                    timeout=self._timeout,
+                )
+            else:
+                async with httpx.AsyncClient(timeout=self._timeout) as client:
+                    response = await client.post(
+                        self._messages_url(),
+                        data=self._form(to=to, body=body),
+                        auth=(self._account_sid, self._auth_token),
+                    )
+            response.raise_for_status()
+            outcome = "success"
+        finally:
+            record_provider_latency("twilio", outcome, time.perf_counter() - started)
         return response.json()
 
 
@@ -167,13 +370,16 @@ class SMSNotificationService:
         sender: str,
         enabled: bool = False,
         backend: SMSBackend | None = None,
+        breaker: CircuitBreaker | None = None,
     ):
         self._sender = sender
         self._enabled = enabled
         self._backend = backend
+        self._breaker = breaker
         self._logger = structlog.get_logger("sytefy.notifications.sms")
 
     def send(self, *, recipient: str | None, body: str) -> bool:
+        """SMS gönderir; devre açıksa `CircuitOpenError`, izin alınamazsa `ThrottleTimeoutError` fırlatır."""
         if not recipient:
             self._logger.warning("sms_missing_recipient")
             return False
@@ -188,17 +394,85 @@ class SMSNotificationService:
                 body=body,
             )
             return False
+        if self._breaker:
+            self._breaker.before_call()
         try:
             self._backend.send(to=recipient, body=body)
+        except ThrottleTimeoutError as exc:
+            if self._breaker:
+                self._breaker.release()
+            self._logger.warning("sms_throttled", recipient=recipient, retry_after=exc.retry_after)
+            raise
         except Exception as exc:  # pragma: no cover - defensive logging path
-            self._logger.exception(
-                "sms_send_failed",
+            return self._on_failure(recipient, exc)
+        return self._on_success(recipient)
+
+    def _on_failure(self, recipient: str, exc: Exception) -> bool:
+        if self._breaker and _is_twilio_provider_failure(exc):
+            self._breaker.record_failure()
+        self._logger.exception(
+            "sms_send_failed",
+            recipient=recipient,
+            exc=exc,
+        )
+        return False
+
+    def _on_success(self, recipient: str) -> bool:
+        if self._breaker:
+            self._breaker.record_success()
+        self._logger.info("sms_sent", recipient=recipient)
+        return True
+
+    def _send_or_short_circuit(self, item: NotificationDelivery) -> bool | None:
+        try:
+            return self.send(recipient=item.recipient, body=item.body)
+        except (CircuitOpenError, ThrottleTimeoutError):
+            return None
+
+    def send_many(self, deliveries: Sequence[NotificationDelivery], *, concurrency: int = 8) -> list[bool | None]:
+        """Paylaşılan HTTP istemcisi üzerinden sınırlı eşzamanlılıkla toplu SMS gönderir.
+
+        Devre açık olduğu ya da gönderim izni alınamadığı için denenmeyen teslimatlar için `None` döner.
+        """
+        if not deliveries:
+            return []
+        workers = max(1, min(concurrency, len(deliveries)))
+        if workers == 1:
+            return [self._send_or_short_circuit(item) for item in deliveries]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sms-batch") as executor:
+            return list(executor.map(self._send_or_short_circuit, deliveries))
+
+    async def send_async(self, *, recipient: str | None, body: str) -> bool:
+        if not recipient:
+            self._logger.warning("sms_missing_recipient")
+            return False
+        if not self._enabled:
+            self._logger.info("sms_disabled", recipient=recipient)
+            return False
+        if not self._backend:
+            self._logger.info(
+                "sms_backend_missing",
+                sender=self._sender,
                 recipient=recipient,
-                exc=exc,
+                body=body,
             )
             return False
-        self._logger.info("sms_sent", recipient=recipient)
-        return True
+        if self._breaker:
+            self._breaker.before_call()
+        send_async = getattr(self._backend, "send_async", None)
+        try:
+            if send_async is None:
+                self._backend.send(to=recipient, body=body)
+            else:
+                await send_async(to=recipient, body=body)
+        except ThrottleTimeoutError as exc:
+            if self._breaker:
+                self._breaker.release()
+            self._logger.warning("sms_throttled", recipient=recipient, retry_after=exc.retry_after)
+            raise
+        except Exception as exc:  # pragma: no cover - defensive logging path
+            return self._on_failure(recipient, exc)
+        return self._on_success(recipient)
 
 
 __all__ = [
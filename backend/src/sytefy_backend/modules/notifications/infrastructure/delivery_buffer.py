@@ -0,0 +1,88 @@
+"""Toplu gönderim için kanal bazlı teslimat tamponları."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import defaultdict, deque
+from dataclasses import asdict
+from typing import Deque, DefaultDict, Protocol
+
+from redis import Redis
+
+from sytefy_backend.config.settings import Settings
+from sytefy_backend.modules.notifications.domain.entities import NotificationDelivery
+
+
+class DeliveryBuffer(Protocol):
+    def push(self, delivery: NotificationDelivery) -> int: ...
+
+    def pop_batch(self, channel: str, size: int) -> list[NotificationDelivery]: ...
+
+
+class InMemoryDeliveryBuffer(DeliveryBuffer):
+    def __init__(self):
+        self._queues: DefaultDict[str, Deque[NotificationDelivery]] = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    def push(self, delivery: NotificationDelivery) -> int:
+        with self._lock:
+            queue = self._queues[delivery.channel]
+            queue.append(delivery)
+            return len(queue)
+
+    def pop_batch(self, channel: str, size: int) -> list[NotificationDelivery]:
+        with self._lock:
+            queue = self._queues[channel]
+            return [queue.popleft() for _ in range(min(size, len(queue)))]
+
+
+class RedisDeliveryBuffer(DeliveryBuffer):
+    """Redis listeleri üzerinde worker'lar arası paylaşılan tampon."""
+
+    def __init__(self, redis: Redis, prefix: str = "notifications:batch"):
+        self._redis = redis
+        self._prefix = prefix.rstrip(":")
+
+    def _key(self, channel: str) -> str:
+        return f"{self._prefix}:{channel}"
+
+    def push(self, delivery: NotificationDelivery) -> int:
+        return int(self._redis.rpush(self._key(delivery.channel), json.dumps(asdict(delivery))))
+
+    def pop_batch(self, channel: str, size: int) -> list[NotificationDelivery]:
+        key = self._key(channel)
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.lrange(key, 0, size - 1)
+        pipe.ltrim(key, size, -1)
+        raw_items, _ = pipe.execute()
+        return [NotificationDelivery(**json.loads(item)) for item in raw_items]
+
+
+_buffer: DeliveryBuffer | None = None
+
+
+def get_delivery_buffer(settings: Settings) -> DeliveryBuffer:
+    global _buffer
+    if _buffer is not None:
+        return _buffer
+    if settings.notification_batch_backend == "redis":
+        client = Redis.from_url(settings.redis_url, decode_responses=True)
+        _buffer = RedisDeliveryBuffer(client, prefix=settings.notification_batch_prefix)
+    else:
+        if settings.notification_batch_enabled and not settings.celery_task_always_eager:
+            # Hatırlatıcı worker'ının tamponladığı teslimatları `flush_batches` çalıştıran süreç göremez.
+            raise RuntimeError(
+                "NOTIFICATION_BATCH_ENABLED=true iken NOTIFICATION_BATCH_BACKEND=memory "
+                "yalnızca CELERY_TASK_ALWAYS_EAGER açıkken kullanılabilir"
+            )
+        _buffer = InMemoryDeliveryBuffer()
+    return _buffer
+
+
+__all__ = [
+    "DeliveryBuffer",
+    "InMemoryDeliveryBuffer",
+    "RedisDeliveryBuffer",
+    "get_delivery_buffer",
+]
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from typing import Sequence
+
 from sytefy_backend.modules.notifications.application.use_cases import NotificationDispatcher
 from sytefy_backend.modules.notifications.domain.entities import Notification
-from sytefy_backend.modules.notifications.tasks import deliver_notification
+from sytefy_backend.modules.notifications.tasks import deliver_notification, deliver_notifications
 
 
 class CeleryNotificationDispatcher(NotificationDispatcher):
@@ -15,3 +17,13 @@ class CeleryNotificationDispatcher(NotificationDispatcher):
             channel=notification.channel,
             title=notification.title,
         )
+
+    def dispatch_many(self, notifications: Sequence[Notification]) -> None:
+        if not notifications:
+            return
+        first = notifications[0]
+        deliver_notifications.delay(
+            recipients=[[item.id or 0, item.user_id] for item in notifications],
+            channel=first.channel,
+            title=first.title,
+        )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from sytefy_backend.core.database.base import Base
@@ -21,3 +21,13 @@ class NotificationModel(Base):
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
     read_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+
+
+Index(
+    "ix_notifications_user_status_created",
+    NotificationModel.user_id,
+    NotificationModel.status,
+    NotificationModel.created_at,
+)
+Index("ix_notifications_user_created", NotificationModel.user_id, NotificationModel.created_at)
+Index("ix_notifications_created", NotificationModel.created_at)
@@ -0,0 +1,176 @@
+"""PostgreSQL üzerinde `notifications` tablosunun aylık aralık bölümlemesi için DDL yardımcıları."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+TABLE = "notifications"
+DEFAULT_PARTITION = f"{TABLE}_pdefault"
+COLUMNS = "id, user_id, title, body, channel, status, read_at, created_at"
+
+LIST_PARTITIONS_SQL = f"""
+SELECT child.relname
+FROM pg_inherits
+JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+WHERE parent.relname = '{TABLE}'
+"""
+IS_PARTITIONED_SQL = f"SELECT EXISTS (SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = '{TABLE}')"
+
+
+def month_start(value: date | datetime) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{TABLE}_p{month:%Y%m}"
+
+
+def partition_month(name: str) -> date | None:
+    suffix = name.removeprefix(f"{TABLE}_p")
+    if len(suffix) != 6 or not suffix.isdigit():
+        return None
+    return date(int(suffix[:4]), int(suffix[4:]), 1)
+
+
+def create_partition_sql(month: date) -> str:
+    upper = add_months(month, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF {TABLE} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+    )
+
+
+def _month_range_condition(months: list[date]) -> str:
+    lower, upper = min(months), add_months(max(months), 1)
+    return f"created_at >= '{lower.isoformat()}' AND created_at < '{upper.isoformat()}'"
+
+
+def default_has_rows_sql(months: list[date]) -> str:
+    return f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {_month_range_condition(months)})"
+
+
+def split_default_partition_sql(months: list[date]) -> list[str]:
+    """Varsayılan bölümde satırı bulunan ayları açar.
+
+    Bakım gecikip satırlar varsayılan bölüme düştüyse `PARTITION OF` başarısız olur;
+    varsayılan ayrılır, aylar açılır, satırlar taşınır ve varsayılan geri bağlanır.
+    Var olan bölümlerin aralığında varsayılanda satır olamayacağından aralık silmesi
+    yalnızca yeni ayların satırlarını yakalar.
+    """
+    return [
+        f"ALTER TABLE {TABLE} DETACH PARTITION {DEFAULT_PARTITION}",
+        *(create_partition_sql(month) for month in months),
+        f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE {_month_range_condition(months)} RETURNING {COLUMNS}) "
+        f"INSERT INTO {TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM moved",
+        f"ALTER TABLE {TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT",
+    ]
+
+
+def drop_partition_sql(name: str) -> list[str]:
+    # Önce ayrılır; DROP ana tabloda uzun kilit tutmaz.
+    return [f"ALTER TABLE {TABLE} DETACH PARTITION {name}", f"DROP TABLE IF EXISTS {name}"]
+
+
+def months_to_create(now: date | datetime, months_ahead: int, start: date | None = None) -> list[date]:
+    first = month_start(start or now)
+    last = add_months(month_start(now), months_ahead)
+    months: list[date] = []
+    current = first
+    while current <= last:
+        months.append(current)
+        current = add_months(current, 1)
+    return months
+
+
+def expired_partitions(existing: list[str], cutoff: date | datetime) -> list[str]:
+    """Tüm satırları `cutoff` öncesinde kalan (üst sınırı cutoff'a eşit/küçük) bölümler."""
+    cutoff_month = month_start(cutoff)
+    expired = []
+    for name in existing:
+        month = partition_month(name)
+        if month is not None and add_months(month, 1) <= cutoff_month:
+            expired.append(name)
+    return sorted(expired)
+
+
+@dataclass(slots=True)
+class PartitionMaintenanceResult:
+    created: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+
+
+class NotificationPartitionManager:
+    """Bölümlenmiş tabloda gelecek ayları açar, saklama süresi dolan ayları kaldırır."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def is_partitioned(self) -> bool:
+        if self._session.bind.dialect.name != "postgresql":
+            return False
+        return bool((await self._session.execute(text(IS_PARTITIONED_SQL))).scalar())
+
+    async def _default_has_rows(self, months: list[date]) -> bool:
+        return bool((await self._session.execute(text(default_has_rows_sql(months)))).scalar())
+
+    async def maintain(
+        self,
+        *,
+        now: datetime,
+        months_ahead: int,
+        cutoff: datetime | None,
+    ) -> PartitionMaintenanceResult:
+        result = PartitionMaintenanceResult()
+        if not await self.is_partitioned():
+            return result
+        existing = set((await self._session.execute(text(LIST_PARTITIONS_SQL))).scalars().all())
+        missing = [month for month in months_to_create(now, months_ahead) if partition_name(month) not in existing]
+        if missing:
+            if DEFAULT_PARTITION in existing and await self._default_has_rows(missing):
+                statements = split_default_partition_sql(missing)
+            else:
+                statements = [create_partition_sql(month) for month in missing]
+            # Ayırma, taşıma ve geri bağlama tek işlemdedir; araya giren eklemeler kilidi bekler.
+            for statement in statements:
+                await self._session.execute(text(statement))
+            result.created.extend(partition_name(month) for month in missing)
+        await self._session.commit()
+        if cutoff is not None:
+            for name in expired_partitions(sorted(existing), cutoff):
+                for statement in drop_partition_sql(name):
+                    await self._session.execute(text(statement))
+                # Her bölüm ayrı işlemde kaldırılır; kilitler kısa tutulur.
+                await self._session.commit()
+                result.dropped.append(name)
+        return result
+
+
+__all__ = [
+    "COLUMNS",
+    "DEFAULT_PARTITION",
+    "IS_PARTITIONED_SQL",
+    "LIST_PARTITIONS_SQL",
+    "NotificationPartitionManager",
+    "PartitionMaintenanceResult",
+    "TABLE",
+    "add_months",
+    "create_partition_sql",
+    "default_has_rows_sql",
+    "drop_partition_sql",
+    "expired_partitions",
+    "month_start",
+    "months_to_create",
+    "partition_month",
+    "partition_name",
+    "split_default_partition_sql",
+]
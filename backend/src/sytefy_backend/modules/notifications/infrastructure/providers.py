@@ -0,0 +1,267 @@
+"""Worker süreci başına paylaşılan bildirim sağlayıcı istemcileri."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+import httpx
+from redis import Redis
+
+from sytefy_backend.config.settings import Settings
+from sytefy_backend.core.observability.celery_metrics import record_provider_circuit_state, record_throttle_wait
+from sytefy_backend.core.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerStore,
+    InMemoryCircuitBreakerStore,
+    RedisCircuitBreakerStore,
+)
+from sytefy_backend.core.resilience.throttle import (
+    InMemoryTokenBucketStore,
+    RedisTokenBucketStore,
+    Throttle,
+    TokenBucketConfig,
+    TokenBucketStore,
+)
+from sytefy_backend.modules.notifications.infrastructure.channels import (
+    EmailNotificationService,
+    SMSNotificationService,
+    TwilioSMSBackend,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class HTTPPoolConfig:
+    timeout: float
+    http2: bool = True
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+
+    @classmethod
+    def for_sms(cls, settings: Settings) -> "HTTPPoolConfig":
+        return cls(
+            timeout=settings.notification_sms_timeout,
+            http2=settings.notification_sms_http2,
+            max_connections=settings.notification_sms_max_connections,
+            max_keepalive_connections=settings.notification_sms_max_keepalive_connections,
+            keepalive_expiry=settings.notification_sms_keepalive_expiry,
+        )
+
+
+_sync_clients: dict[HTTPPoolConfig, httpx.Client] = {}
+_email_services: dict[tuple, EmailNotificationService] = {}
+_sms_services: dict[tuple, SMSNotificationService] = {}
+_circuit_store: CircuitBreakerStore | None = None
+_throttle_store: TokenBucketStore | None = None
+
+
+def _client_kwargs(config: HTTPPoolConfig) -> dict:
+    return {
+        "timeout": config.timeout,
+        # `h2` paketi `httpx[http2]` ile gelir; eksikse httpx istemciyi kurarken ImportError verir.
+        "http2": config.http2,
+        "limits": httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+    }
+
+
+def get_sms_http_client(config: HTTPPoolConfig) -> httpx.Client:
+    client = _sync_clients.get(config)
+    if client is None or client.is_closed:
+        client = httpx.Client(**_client_kwargs(config))
+        _sync_clients[config] = client
+    return client
+
+
+def _get_circuit_store(settings: Settings) -> CircuitBreakerStore:
+    global _circuit_store
+    if _circuit_store is not None:
+        return _circuit_store
+    if settings.notification_circuit_backend == "redis":
+        client = Redis.from_url(settings.redis_url, decode_responses=True)
+        _circuit_store = RedisCircuitBreakerStore(client, prefix=settings.notification_circuit_prefix)
+    else:
+        _circuit_store = InMemoryCircuitBreakerStore()
+    return _circuit_store
+
+
+def _circuit_key(settings: Settings) -> tuple:
+    return (
+        settings.notification_circuit_failure_threshold,
+        settings.notification_circuit_recovery_seconds,
+        settings.notification_circuit_half_open_max_calls,
+    )
+
+
+def get_circuit_breaker(provider: str, settings: Settings) -> CircuitBreaker:
+    return CircuitBreaker(
+        name=provider,
+        store=_get_circuit_store(settings),
+        config=CircuitBreakerConfig(
+            failure_threshold=settings.notification_circuit_failure_threshold,
+            recovery_timeout=settings.notification_circuit_recovery_seconds,
+            half_open_max_calls=settings.notification_circuit_half_open_max_calls,
+        ),
+        on_state_change=record_provider_circuit_state,
+    )
+
+
+def _get_throttle_store(settings: Settings) -> TokenBucketStore:
+    global _throttle_store
+    if _throttle_store is not None:
+        return _throttle_store
+    if settings.notification_throttle_backend == "redis":
+        client = Redis.from_url(settings.redis_url, decode_responses=True)
+        _throttle_store = RedisTokenBucketStore(client, prefix=settings.notification_throttle_prefix)
+    else:
+        _throttle_store = InMemoryTokenBucketStore()
+    return _throttle_store
+
+
+def get_throttle(provider: str, account: str, *, rate_per_second: float, burst: int, settings: Settings) -> Throttle | None:
+    """Sağlayıcı hesabı için paylaşılan gönderim sınırlayıcısı; oran 0 ise sınırlama yapılmaz."""
+    if rate_per_second <= 0:
+        return None
+    return Throttle(
+        name=provider,
+        key=f"{provider}:{account}",
+        store=_get_throttle_store(settings),
+        config=TokenBucketConfig(rate_per_second=rate_per_second, capacity=max(1, burst)),
+        max_wait=settings.notification_throttle_max_wait_seconds,
+        on_wait=record_throttle_wait,
+    )
+
+
+def _throttle_key(settings: Settings) -> tuple:
+    return (
+        settings.notification_throttle_max_wait_seconds,
+        settings.notification_email_rate_per_second,
+        settings.notification_email_burst,
+        settings.notification_sms_rate_per_second,
+        settings.notification_sms_burst,
+    )
+
+
+def build_sms_backend(settings: Settings, *, async_client: httpx.AsyncClient | None = None) -> TwilioSMSBackend | None:
+    if not (
+        settings.notification_sms_account_sid
+        and settings.notification_sms_auth_token
+        and settings.notification_sms_from
+    ):
+        return None
+    return TwilioSMSBackend(
+        account_sid=settings.notification_sms_account_sid,
+        auth_token=settings.notification_sms_auth_token,
+        from_number=settings.notification_sms_from,
+        base_url=settings.notification_sms_base_url,
+        timeout=settings.notification_sms_timeout,
+        client=get_sms_http_client(HTTPPoolConfig.for_sms(settings)),
+        async_client=async_client,
+        throttle=get_throttle(
+            "twilio",
+            settings.notification_sms_account_sid,
+            rate_per_second=settings.notification_sms_rate_per_second,
+            burst=settings.notification_sms_burst,
+            settings=settings,
+        ),
+    )
+
+
+def get_email_service(settings: Settings) -> EmailNotificationService:
+    key = (
+        settings.notification_email_from,
+        settings.notification_email_enabled,
+        settings.notification_email_host,
+        settings.notification_email_port,
+        settings.notification_email_username,
+        settings.notification_email_password,
+        settings.notification_email_use_tls,
+        settings.notification_email_use_ssl,
+        settings.notification_email_timeout,
+        _circuit_key(settings),
+        _throttle_key(settings),
+    )
+    service = _email_services.get(key)
+    if service is None:
+        service = EmailNotificationService(
+            sender=settings.notification_email_from,
+            enabled=settings.notification_email_enabled,
+            host=settings.notification_email_host,
+            port=settings.notification_email_port,
+            username=settings.notification_email_username,
+            password=settings.notification_email_password,
+            use_tls=settings.notification_email_use_tls,
+            use_ssl=settings.notification_email_use_ssl,
+            timeout=settings.notification_email_timeout,
+            breaker=get_circuit_breaker("smtp", settings),
+            throttle=get_throttle(
+                "smtp",
+                f"{settings.notification_email_host}:{settings.notification_email_username or ''}",
+                rate_per_second=settings.notification_email_rate_per_second,
+                burst=settings.notification_email_burst,
+                settings=settings,
+            ),
+        )
+        _email_services[key] = service
+    return service
+
+
+def get_sms_service(settings: Settings) -> SMSNotificationService:
+    key = (
+        settings.notification_sms_from,
+        settings.notification_sms_enabled,
+        settings.notification_sms_account_sid,
+        settings.notification_sms_auth_token,
+        settings.notification_sms_base_url,
+        HTTPPoolConfig.for_sms(settings),
+        _circuit_key(settings),
+        _throttle_key(settings),
+    )
+    service = _sms_services.get(key)
+    if service is None:
+        service = SMSNotificationService(
+            sender=settings.notification_sms_from,
+            enabled=settings.notification_sms_enabled,
+            backend=build_sms_backend(settings),
+            breaker=get_circuit_breaker("twilio", settings),
+        )
+        _sms_services[key] = service
+    return service
+
+
+def _forget_provider_clients() -> None:
+    # Fork sonrası ebeveynin soketleri paylaşılmamalı; kapatmadan unut.
+    global _circuit_store, _throttle_store
+    _circuit_store = None
+    _throttle_store = None
+    _sync_clients.clear()
+    _email_services.clear()
+    _sms_services.clear()
+
+
+def reset_provider_clients() -> None:
+    """Havuzlanmış istemcileri kapatır ve önbelleği temizler."""
+    for client in _sync_clients.values():
+        client.close()
+    _forget_provider_clients()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_provider_clients)
+
+
+__all__ = [
+    "HTTPPoolConfig",
+    "build_sms_backend",
+    "get_circuit_breaker",
+    "get_email_service",
+    "get_sms_http_client",
+    "get_sms_service",
+    "get_throttle",
+    "reset_provider_clients",
+]
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sytefy_backend.modules.notifications.application.interfaces import INotificationRepository
@@ -42,6 +43,23 @@ class NotificationRepository(INotificationRepository):
         await self._session.refresh(model)
         return _to_entity(model)
 
+    async def create_many(self, notifications: Sequence[Notification]) -> list[Notification]:
+        if not notifications:
+            return []
+        models = [
+            NotificationModel(
+                user_id=item.user_id,
+                title=item.title,
+                body=item.body,
+                channel=item.channel,
+                status=item.status,
+            )
+            for item in notifications
+        ]
+        self._session.add_all(models)
+        await self._session.commit()
+        return [_to_entity(model) for model in models]
+
     async def list_for_user(self, *, user_id: int, status: str | None = None) -> list[Notification]:
         stmt = select(NotificationModel).where(NotificationModel.user_id == user_id)
         if status:
@@ -50,6 +68,119 @@ class NotificationRepository(INotificationRepository):
         result = await self._session.execute(stmt)
         return [_to_entity(model) for model in result.scalars().all()]
 
+    async def count_unread(self, *, user_id: int) -> int:
+        stmt = (
+            select(func.count())
+            .select_from(NotificationModel)
+            .where(NotificationModel.user_id == user_id, NotificationModel.status != "read")
+        )
+        return int((await self._session.execute(stmt)).scalar_one())
+
+    async def get_for_user(self, *, notification_id: int, user_id: int) -> Notification | None:
+        stmt = select(NotificationModel).where(
+            NotificationModel.id == notification_id,
+            NotificationModel.user_id == user_id,
+        )
+        model = (await self._session.execute(stmt)).scalar_one_or_none()
+        return _to_entity(model) if model else None
+
+    async def mark_read_many(self, *, user_id: int, notification_ids: Sequence[int] | None = None) -> int:
+        stmt = (
+            update(NotificationModel)
+            .where(NotificationModel.user_id == user_id, NotificationModel.status != "read")
+            .values(status="read", read_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
+        if notification_ids is not None:
+            if not notification_ids:
+                return 0
+            stmt = stmt.where(NotificationModel.id.in_(notification_ids))
+        result = await self._session.execute(stmt)
+        await self._session.commit()
+        return result.rowcount or 0
+
+    async def insert_for_users(
+        self,
+        *,
+        user_ids: Sequence[int],
+        title: str,
+        body: str,
+        channel: str,
+        status: str = "pending",
+    ) -> list[Notification]:
+        """Tek çok satırlı INSERT ... RETURNING ile parça başına tek gidiş-dönüş yapar."""
+        if not user_ids:
+            return []
+        created_at = datetime.now(timezone.utc)
+        stmt = (
+            insert(NotificationModel)
+            .values(
+                [
+                    {
+                        "user_id": user_id,
+                        "title": title,
+                        "body": body,
+                        "channel": channel,
+                        "status": status,
+                        "created_at": created_at,
+                    }
+                    for user_id in user_ids
+                ]
+            )
+            .returning(NotificationModel.id, NotificationModel.user_id)
+        )
+        rows = (await self._session.execute(stmt)).all()
+        await self._session.commit()
+        return [
+            Notification(
+                id=row.id,
+                user_id=row.user_id,
+                title=title,
+                body=body,
+                channel=channel,
+                status=status,
+                read_at=None,
+                created_at=created_at,
+            )
+            for row in rows
+        ]
+
+    async def purge_created_before(self, *, cutoff: datetime, limit: int) -> tuple[int, dict[int, int]]:
+        """`cutoff` öncesindeki en fazla `limit` bildirimi tek kısa işlemde siler.
+
+        Silinen sayıyla birlikte kullanıcı başına silinen okunmamış bildirim sayısını döndürür.
+        """
+        expired_ids = (
+            select(NotificationModel.id)
+            .where(NotificationModel.created_at < cutoff)
+            .order_by(NotificationModel.created_at)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        stmt = (
+            delete(NotificationModel)
+            .where(NotificationModel.id.in_(expired_ids))
+            .returning(NotificationModel.user_id, NotificationModel.status)
+            .execution_options(synchronize_session=False)
+        )
+        rows = (await self._session.execute(stmt)).all()
+        await self._session.commit()
+        unread: dict[int, int] = {}
+        for user_id, status in rows:
+            if status != "read":
+                unread[user_id] = unread.get(user_id, 0) + 1
+        return len(rows), unread
+
+    async def list_after(self, *, user_id: int, after_id: int, limit: int) -> list[Notification]:
+        stmt = (
+            select(NotificationModel)
+            .where(NotificationModel.user_id == user_id, NotificationModel.id > after_id)
+            .order_by(NotificationModel.id.asc())
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return [_to_entity(model) for model in result.scalars().all()]
+
     async def mark_read(self, *, notification_id: int, user_id: int) -> Notification:
         model = await self._session.get(NotificationModel, notification_id)
         if not model or model.user_id != user_id:
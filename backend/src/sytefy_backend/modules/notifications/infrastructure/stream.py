@@ -0,0 +1,249 @@
+"""Bildirimlerin kullanıcı bazlı kanallara yayınlanması ve SSE aboneliklerine dağıtımı."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Protocol
+
+import structlog
+from redis.asyncio import Redis as AsyncRedis
+
+from sytefy_backend.config.settings import Settings
+from sytefy_backend.core.redis import get_async_redis
+from sytefy_backend.modules.notifications.application.interfaces import NotificationPublisher
+from sytefy_backend.modules.notifications.domain.entities import Notification
+
+logger = structlog.get_logger("sytefy.notifications.stream")
+
+
+def serialize_notification(notification: Notification) -> dict[str, Any]:
+    def _iso(value: datetime | None) -> str | None:
+        return value.isoformat() if value else None
+
+    return {
+        "id": notification.id,
+        "title": notification.title,
+        "body": notification.body,
+        "channel": notification.channel,
+        "status": notification.status,
+        "read_at": _iso(notification.read_at),
+        "created_at": _iso(notification.created_at),
+    }
+
+
+def format_sse(payload: dict[str, Any], *, event: str = "notification") -> str:
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    event_id = payload.get("id")
+    prefix = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{prefix}event: {event}\ndata: {data}\n\n"
+
+
+class StreamSubscription:
+    """Tek SSE bağlantısının sınırlı tamponu; taşarsa bağlantı kapatılıp istemci yeniden bağlanır."""
+
+    def __init__(self, user_id: int, max_buffer: int):
+        self.user_id = user_id
+        self._max_buffer = max_buffer
+        self._buffer: deque[dict[str, Any]] = deque()
+        self._event = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self.overflowed = False
+        self.closed = False
+
+    def offer(self, payload: dict[str, Any]) -> None:
+        """Başka thread/event loop'tan da güvenle çağrılabilir."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._push(payload)
+        else:
+            self._loop.call_soon_threadsafe(self._push, payload)
+
+    def close(self) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._close()
+        else:
+            self._loop.call_soon_threadsafe(self._close)
+
+    def _push(self, payload: dict[str, Any]) -> None:
+        if self.closed:
+            return
+        if len(self._buffer) >= self._max_buffer:
+            # Olaylar düşürülmez; istemci Last-Event-ID ile kaldığı yerden devam eder.
+            self.overflowed = True
+            self._close()
+            return
+        self._buffer.append(payload)
+        self._event.set()
+
+    def _close(self) -> None:
+        self.closed = True
+        self._event.set()
+
+    async def get(self, timeout: float) -> dict[str, Any] | None:
+        """Sıradaki olayı döndürür; zaman aşımında veya kapanışta `None`."""
+        if not self._buffer and not self.closed:
+            self._event.clear()
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return None
+        if self._buffer:
+            return self._buffer.popleft()
+        return None
+
+
+class NotificationHub(Protocol):
+    async def subscribe(self, user_id: int) -> StreamSubscription: ...
+
+    async def unsubscribe(self, subscription: StreamSubscription) -> None: ...
+
+
+class InMemoryNotificationHub(NotificationHub, NotificationPublisher):
+    """Tek süreçli geliştirme/test ortamı için yayıncı ve dağıtıcı."""
+
+    def __init__(self, max_buffer: int = 100):
+        self._max_buffer = max_buffer
+        self._subscribers: dict[int, set[StreamSubscription]] = {}
+
+    async def subscribe(self, user_id: int) -> StreamSubscription:
+        subscription = StreamSubscription(user_id, self._max_buffer)
+        self._subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    async def unsubscribe(self, subscription: StreamSubscription) -> None:
+        subscribers = self._subscribers.get(subscription.user_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            self._subscribers.pop(subscription.user_id, None)
+
+    def deliver(self, user_id: int, payload: dict[str, Any]) -> None:
+        for subscription in list(self._subscribers.get(user_id, ())):
+            subscription.offer(payload)
+
+    def close_all(self) -> None:
+        for subscribers in list(self._subscribers.values()):
+            for subscription in list(subscribers):
+                subscription.close()
+
+    async def publish(self, notification: Notification) -> None:
+        self.deliver(notification.user_id, serialize_notification(notification))
+
+
+class RedisNotificationPublisher(NotificationPublisher):
+    """İstemci her yayında fabrikadan alınır; böylece çalışan event loop'a bağlı olan kullanılır."""
+
+    def __init__(self, redis: Callable[[], AsyncRedis], prefix: str = "notifications:user"):
+        self._redis = redis
+        self._prefix = prefix.rstrip(":")
+
+    async def publish(self, notification: Notification) -> None:
+        message = json.dumps(serialize_notification(notification), ensure_ascii=False)
+        try:
+            await self._redis().publish(f"{self._prefix}:{notification.user_id}", message)
+        except Exception as exc:  # pragma: no cover - yayın hatası kaydı engellememeli
+            logger.warning("notifications.stream.publish_failed", user_id=notification.user_id, error=str(exc))
+
+
+class RedisNotificationHub(InMemoryNotificationHub):
+    """Süreç başına tek pattern aboneliğiyle Redis kanallarını yerel SSE bağlantılarına dağıtır."""
+
+    def __init__(self, redis: AsyncRedis, prefix: str = "notifications:user", max_buffer: int = 100):
+        super().__init__(max_buffer=max_buffer)
+        self._redis = redis
+        self._prefix = prefix.rstrip(":")
+        self._reader: asyncio.Task | None = None
+
+    async def subscribe(self, user_id: int) -> StreamSubscription:
+        subscription = await super().subscribe(user_id)
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._read())
+        return subscription
+
+    async def _read(self) -> None:
+        pubsub = self._redis.pubsub()
+        try:
+            await pubsub.psubscribe(f"{self._prefix}:*")
+            async for message in pubsub.listen():
+                if message.get("type") != "pmessage":
+                    continue
+                channel = message["channel"]
+                try:
+                    user_id = int(channel.rsplit(":", 1)[1])
+                    payload = json.loads(message["data"])
+                except (ValueError, IndexError):
+                    continue
+                self.deliver(user_id, payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # Bağlantılar kapatılır; istemciler Last-Event-ID ile yeniden bağlanıp eksikleri tamamlar.
+            logger.warning("notifications.stream.reader_failed", error=str(exc))
+            self.close_all()
+        finally:
+            await pubsub.aclose()
+
+
+_hub: NotificationHub | None = None
+_publisher: NotificationPublisher | None = None
+
+
+def get_notification_hub(settings: Settings) -> NotificationHub:
+    global _hub
+    if _hub is not None:
+        return _hub
+    if settings.notification_stream_backend == "redis":
+        client = AsyncRedis.from_url(settings.redis_url, decode_responses=True)
+        _hub = RedisNotificationHub(
+            client,
+            prefix=settings.notification_stream_prefix,
+            max_buffer=settings.notification_stream_buffer_size,
+        )
+    else:
+        _hub = InMemoryNotificationHub(max_buffer=settings.notification_stream_buffer_size)
+    return _hub
+
+
+def get_notification_publisher(settings: Settings) -> NotificationPublisher:
+    global _publisher
+    if _publisher is not None:
+        return _publisher
+    if settings.notification_stream_backend == "redis":
+        _publisher = RedisNotificationPublisher(
+            lambda: get_async_redis(settings.redis_url),
+            prefix=settings.notification_stream_prefix,
+        )
+    else:
+        if not settings.celery_task_always_eager:
+            # Worker'daki yayınlar worker'ın kendi dağıtıcısına gider; API'deki SSE istemcileri görmez.
+            raise RuntimeError(
+                "NOTIFICATION_STREAM_BACKEND=memory yalnızca CELERY_TASK_ALWAYS_EAGER açıkken kullanılabilir"
+            )
+        # Bellek modunda yayıncı ve dağıtıcı aynı süreç içi nesnedir.
+        _publisher = get_notification_hub(settings)  # type: ignore[assignment]
+    return _publisher
+
+
+__all__ = [
+    "InMemoryNotificationHub",
+    "NotificationHub",
+    "NotificationPublisher",
+    "RedisNotificationHub",
+    "RedisNotificationPublisher",
+    "StreamSubscription",
+    "format_sse",
+    "get_notification_hub",
+    "get_notification_publisher",
+    "serialize_notification",
+]
@@ -0,0 +1,113 @@
+"""Kullanıcı başına okunmamış bildirim sayacı (tarama yapmadan rozet değeri)."""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable
+
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from sytefy_backend.config.settings import Settings
+from sytefy_backend.core.redis import get_async_redis
+from sytefy_backend.modules.notifications.application.interfaces import IUnreadCounter
+
+
+class InMemoryUnreadCounter(IUnreadCounter):
+    def __init__(self):
+        self._values: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, user_id: int) -> int | None:
+        with self._lock:
+            return self._values.get(user_id)
+
+    async def initialize(self, user_id: int, value: int) -> None:
+        with self._lock:
+            self._values.setdefault(user_id, value)
+
+    async def adjust(self, user_id: int, delta: int) -> None:
+        if not delta:
+            return
+        with self._lock:
+            current = self._values.get(user_id)
+            if current is None:
+                return
+            if current + delta < 0:
+                self._values.pop(user_id, None)
+            else:
+                self._values[user_id] = current + delta
+
+
+class RedisUnreadCounter(IUnreadCounter):
+    """Sayaçlar TTL ile tutulur; olası sapmalar en geç TTL sonunda COUNT ile düzelir.
+
+    İstemci her çağrıda `redis` fabrikasından alınır; böylece çalışan event loop'a bağlı olan kullanılır.
+    """
+
+    def __init__(self, redis: Callable[[], Redis], prefix: str = "notifications:unread", ttl_seconds: int = 86400):
+        self._redis = redis
+        self._prefix = prefix.rstrip(":")
+        self._ttl = ttl_seconds
+
+    def _key(self, user_id: int) -> str:
+        return f"{self._prefix}:{user_id}"
+
+    async def get(self, user_id: int) -> int | None:
+        value = await self._redis().get(self._key(user_id))
+        return int(value) if value is not None else None
+
+    async def initialize(self, user_id: int, value: int) -> None:
+        await self._redis().set(self._key(user_id), value, ex=self._ttl, nx=True)
+
+    async def adjust(self, user_id: int, delta: int) -> None:
+        if not delta:
+            return
+        key = self._key(user_id)
+        async with self._redis().pipeline() as pipe:
+            while True:
+                try:
+                    await pipe.watch(key)
+                    current = await pipe.get(key)
+                    if current is None:
+                        await pipe.unwatch()
+                        return
+                    pipe.multi()
+                    if int(current) + delta < 0:
+                        pipe.delete(key)
+                    else:
+                        pipe.incrby(key, delta)
+                    await pipe.execute()
+                    return
+                except WatchError:
+                    continue
+
+
+_counter: IUnreadCounter | None = None
+
+
+def get_unread_counter(settings: Settings) -> IUnreadCounter:
+    global _counter
+    if _counter is not None:
+        return _counter
+    if settings.notification_unread_backend == "redis":
+        _counter = RedisUnreadCounter(
+            lambda: get_async_redis(settings.redis_url),
+            prefix=settings.notification_unread_prefix,
+            ttl_seconds=settings.notification_unread_ttl_seconds,
+        )
+    else:
+        if not settings.celery_task_always_eager:
+            # Worker'da oluşturulan bildirimler worker'ın kopyasını artırır; API'nin rozeti hiç değişmez.
+            raise RuntimeError(
+                "NOTIFICATION_UNREAD_BACKEND=memory yalnızca CELERY_TASK_ALWAYS_EAGER açıkken kullanılabilir"
+            )
+        _counter = InMemoryUnreadCounter()
+    return _counter
+
+
+__all__ = [
+    "InMemoryUnreadCounter",
+    "RedisUnreadCounter",
+    "get_unread_counter",
+]
@@ -2,14 +2,55 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Sequence
+
 import structlog
+from celery.signals import worker_process_shutdown
 from celery.utils.log import get_task_logger
+from celery.utils.time import get_exponential_backoff_interval
 
+from sytefy_backend.config import get_settings
+from sytefy_backend.config.settings import Settings
+from sytefy_backend.core.database.session import _SessionLocal
+from sytefy_backend.core.observability.celery_metrics import (
+    record_channel_send_duration,
+    record_reminder_channel_event,
+    record_reminder_delivery,
+)
 from sytefy_backend.core.tasks.celery_app import celery_app
+from sytefy_backend.core.tasks.runner import run_async
+from sytefy_backend.modules.notifications.application.use_cases import (
+    BroadcastNotifications,
+    PurgeExpiredNotifications,
+)
+from sytefy_backend.modules.notifications.domain.entities import Notification, NotificationDelivery
+from sytefy_backend.modules.notifications.infrastructure.broadcast_jobs import get_broadcast_job_store
+from sytefy_backend.modules.notifications.infrastructure.delivery_buffer import get_delivery_buffer
+from sytefy_backend.modules.notifications.infrastructure.partitions import NotificationPartitionManager
+from sytefy_backend.modules.notifications.infrastructure.providers import (
+    get_email_service,
+    get_sms_service,
+    reset_provider_clients,
+)
+from sytefy_backend.modules.notifications.infrastructure.repository import NotificationRepository
+from sytefy_backend.modules.notifications.infrastructure.stream import get_notification_publisher
+from sytefy_backend.modules.notifications.infrastructure.unread_counter import get_unread_counter
 
 logger = structlog.get_logger("sytefy.notifications")
 task_logger = get_task_logger(__name__)
 
+BATCH_CHANNELS = ("email", "sms")
+FAILURE_SUFFIX = " Gönderim başarısız."
+
+
+@worker_process_shutdown.connect
+def _close_provider_clients(**_: object) -> None:
+    reset_provider_clients()
+
 
 @celery_app.task(
     bind=True,
@@ -29,3 +70,286 @@ def deliver_notification(self, *, notification_id: int, user_id: int, channel: s
     task_logger.info("notifications.deliver %s", payload)
     logger.info("notifications.deliver", **payload)
     return payload
+
+
+@celery_app.task(
+    bind=True,
+    name="notifications.deliver_many",
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_kwargs={"max_retries": 3},
+)
+def deliver_notifications(self, *, recipients: list[list[int]], channel: str, title: str):
+    """Toplu yayın parçasını tek görevde teslim eder; `recipients` [bildirim_id, kullanıcı_id] çiftleridir."""
+    payload = {
+        "count": len(recipients),
+        "notification_ids": [notification_id for notification_id, _ in recipients],
+        "channel": channel,
+        "title": title,
+        "task_id": self.request.id,
+    }
+    task_logger.info("notifications.deliver_many %s", payload)
+    logger.info("notifications.deliver_many", **payload)
+    return payload
+
+
+def _persist_outcomes(deliveries: Sequence[NotificationDelivery], results: Sequence[bool]) -> None:
+    records = [
+        Notification(
+            id=None,
+            user_id=item.user_id,
+            title=item.subject,
+            body=item.body if success else f"{item.body}{FAILURE_SUFFIX}",
+            channel=item.channel,
+            status="sent" if success else "failed",
+            read_at=None,
+            created_at=None,
+        )
+        for item, success in zip(deliveries, results)
+        if item.user_id
+    ]
+    if not records:
+        return
+
+    async def _create() -> None:
+        async with _SessionLocal() as session:
+            stored = await NotificationRepository(session).create_many(records)
+        settings = get_settings()
+        publisher = get_notification_publisher(settings)
+        counter = get_unread_counter(settings)
+        for notification in stored:
+            await counter.adjust(notification.user_id, 1)
+            await publisher.publish(notification)
+
+    try:
+        run_async(_create())
+    except RuntimeError:
+        loop = asyncio.get_event_loop()
+        if loop.is_running():
+            loop.create_task(_create())
+        else:  # pragma: no cover - defensive branch
+            run_async(_create())
+
+
+def send_delivery_batch(
+    channel: str,
+    deliveries: Sequence[NotificationDelivery],
+    settings: Settings,
+) -> list[bool | None]:
+    """Tek kanal için toplu gönderim yapar; alıcı başına sonuç döner (`None`: devre açık)."""
+    started = time.perf_counter()
+    if channel == "email":
+        results = get_email_service(settings).send_many(deliveries)
+    elif channel == "sms":
+        results = get_sms_service(settings).send_many(
+            deliveries,
+            concurrency=settings.notification_sms_batch_concurrency,
+        )
+    else:
+        raise ValueError(f"Toplu gönderim desteklenmeyen kanal: {channel}")
+    if deliveries:
+        # Parti süresi alıcılara bölünerek tekil gönderimlerle karşılaştırılabilir tutulur.
+        share = (time.perf_counter() - started) / len(deliveries)
+        for _ in deliveries:
+            record_channel_send_duration(channel, share)
+    return results
+
+
+def enqueue_delivery(delivery: NotificationDelivery, settings: Settings | None = None) -> None:
+    """Teslimatı tampona ekler; parti dolduğunda hemen boşaltma görevi tetiklenir."""
+    settings = settings or get_settings()
+    pending = get_delivery_buffer(settings).push(delivery)
+    record_reminder_channel_event(delivery.channel, "queued")
+    if pending >= settings.notification_batch_size:
+        flush_delivery_batches.delay(channel=delivery.channel)
+
+
+def park_delivery(delivery: NotificationDelivery, retry_after: float) -> None:
+    """Devresi açık ya da hız sınırına takılan sağlayıcının teslimatını worker'ı meşgul etmeden ertelenmiş kuyruğa alır."""
+    record_reminder_channel_event(delivery.channel, "parked")
+    retry_delivery.apply_async(kwargs={"delivery": asdict(delivery)}, countdown=max(1.0, retry_after))
+
+
+def _handle_outcomes(
+    deliveries: Sequence[NotificationDelivery],
+    results: Sequence[bool | None],
+    settings: Settings,
+    *,
+    can_park: bool = True,
+) -> dict[str, int]:
+    summary = {"sent": 0, "failed": 0, "retrying": 0, "parked": 0}
+    final_items: list[NotificationDelivery] = []
+    final_results: list[bool] = []
+    for item, success in zip(deliveries, results):
+        if success is None and can_park:
+            summary["parked"] += 1
+            park_delivery(item, settings.notification_circuit_recovery_seconds)
+            continue
+        if success:
+            summary["sent"] += 1
+            record_reminder_channel_event(item.channel, "sent")
+            record_reminder_delivery(item.channel, item.remind_at)
+        elif success is not None and item.attempt < settings.reminder_max_retries:
+            summary["retrying"] += 1
+            record_reminder_channel_event(item.channel, "retrying")
+            item.attempt += 1
+            retry_delivery.apply_async(
+                kwargs={"delivery": asdict(item)},
+                countdown=get_exponential_backoff_interval(
+                    factor=1,
+                    retries=item.attempt,
+                    maximum=600,
+                    full_jitter=True,
+                ),
+            )
+            continue
+        else:
+            summary["failed"] += 1
+            record_reminder_channel_event(item.channel, "failed")
+        final_items.append(item)
+        final_results.append(bool(success))
+    _persist_outcomes(final_items, final_results)
+    return summary
+
+
+@celery_app.task(bind=True, name="notifications.flush_batches")
+def flush_delivery_batches(self, channel: str | None = None) -> dict[str, Any]:
+    """Tamponda bekleyen teslimatları kanal bazında partiler halinde gönderir."""
+    settings = get_settings()
+    buffer = get_delivery_buffer(settings)
+    channels = (channel,) if channel else BATCH_CHANNELS
+    summary: dict[str, Any] = {}
+    for name in channels:
+        totals = {"batches": 0, "sent": 0, "failed": 0, "retrying": 0, "parked": 0}
+        while True:
+            batch = buffer.pop_batch(name, settings.notification_batch_size)
+            if not batch:
+                break
+            results = send_delivery_batch(name, batch, settings)
+            outcome = _handle_outcomes(batch, results, settings)
+            totals["batches"] += 1
+            for key, value in outcome.items():
+                totals[key] += value
+            if outcome["parked"]:
+                # Sağlayıcı devresi açık; kalan teslimatlar tamponda beklesin.
+                break
+        summary[name] = totals
+    logger.info("notifications.flush_batches", task_id=self.request.id, summary=summary)
+    return summary
+
+
+@celery_app.task(bind=True, name="notifications.retry_delivery")
+def retry_delivery(self, delivery: dict[str, Any]) -> bool:
+    """Partide başarısız olan tek alıcıyı bağımsız olarak yeniden dener."""
+    settings = get_settings()
+    item = NotificationDelivery(**delivery)
+    results = send_delivery_batch(item.channel, [item], settings)
+    # Eager modda erteleme anında yeniden çalışacağı için sonsuz döngüye girmemek adına park edilmez.
+    _handle_outcomes([item], results, settings, can_park=not self.request.is_eager)
+    return bool(results[0])
+
+
+def _retention_cutoff(settings: Settings) -> datetime | None:
+    if settings.notification_retention_days <= 0:
+        return None
+    return datetime.now(timezone.utc) - timedelta(days=settings.notification_retention_days)
+
+
+@celery_app.task(bind=True, name="notifications.purge_expired")
+def purge_expired_notifications(self) -> dict[str, Any]:
+    """Saklama süresi dolan bildirimleri kısa işlemlerle parça parça siler."""
+    settings = get_settings()
+    cutoff = _retention_cutoff(settings)
+    if cutoff is None:
+        return {"deleted": 0, "cutoff": None}
+
+    async def _purge() -> int:
+        async with _SessionLocal() as session:
+            purge = PurgeExpiredNotifications(NotificationRepository(session), counter=get_unread_counter(settings))
+            return await purge(
+                cutoff=cutoff,
+                batch_size=settings.notification_purge_batch_size,
+                max_batches=settings.notification_purge_max_batches,
+            )
+
+    deleted = run_async(_purge())
+    summary = {"deleted": deleted, "cutoff": cutoff.isoformat()}
+    logger.info("notifications.purge_expired", task_id=self.request.id, **summary)
+    return summary
+
+
+@celery_app.task(bind=True, name="notifications.maintain_partitions")
+def maintain_notification_partitions(self) -> dict[str, Any]:
+    """Bölümlenmiş tabloda gelecek ayları açar ve saklama süresi dolan ayları düşürür."""
+    settings = get_settings()
+
+    async def _maintain():
+        async with _SessionLocal() as session:
+            return await NotificationPartitionManager(session).maintain(
+                now=datetime.now(timezone.utc),
+                months_ahead=settings.notification_partition_months_ahead,
+                cutoff=_retention_cutoff(settings),
+            )
+
+    result = asyncio.run(_maintain())
+    summary = {"created": result.created, "dropped": result.dropped}
+    logger.info("notifications.maintain_partitions", task_id=self.request.id, **summary)
+    return summary
+
+
+@celery_app.task(bind=True, name="bulk.notifications.broadcast")
+def broadcast_notifications(
+    self,
+    *,
+    job_id: str,
+    title: str,
+    body: str,
+    channel: str,
+    role: str | None = None,
+    user_ids: list[int] | None = None,
+) -> dict[str, Any]:
+    """Yönetici yayınını parça parça ekler ve teslimatları gruplar halinde kuyruğa alır."""
+    # Döngüsel içe aktarmayı önlemek için (dispatcher bu modüldeki görevleri kullanır).
+    from sytefy_backend.modules.auth.infrastructure.repositories import UserRepository
+    from sytefy_backend.modules.notifications.infrastructure.dispatcher import CeleryNotificationDispatcher
+
+    settings = get_settings()
+
+    async def _broadcast() -> None:
+        async with _SessionLocal() as session:
+            use_case = BroadcastNotifications(
+                NotificationRepository(session),
+                UserRepository(session),
+                get_broadcast_job_store(settings),
+                dispatcher=CeleryNotificationDispatcher(),
+                publisher=get_notification_publisher(settings),
+                counter=get_unread_counter(settings),
+            )
+            total = await use_case(
+                job_id=job_id,
+                title=title,
+                body=body,
+                channel=channel,
+                role=role,
+                user_ids=user_ids,
+                chunk_size=settings.notification_broadcast_chunk_size,
+            )
+        logger.info("notifications.broadcast", task_id=self.request.id, job_id=job_id, created=total)
+
+    run_async(_broadcast())
+    return {"job_id": job_id}
+
+
+__all__ = [
+    "BATCH_CHANNELS",
+    "broadcast_notifications",
+    "deliver_notification",
+    "deliver_notifications",
+    "enqueue_delivery",
+    "flush_delivery_batches",
+    "maintain_notification_partitions",
+    "park_delivery",
+    "purge_expired_notifications",
+    "retry_delivery",
+    "send_delivery_batch",
+]
@@ -25,3 +25,37 @@ class NotificationResponse(StrictModel):
     status: str
     read_at: datetime | None
     created_at: datetime | None
+
+
+class NotificationMarkReadRequest(StrictModel):
+    ids: list[int] = Field(min_length=1, max_length=500)
+
+
+class NotificationMarkReadResponse(StrictModel):
+    updated: int
+    unread: int
+
+
+class UnreadCountResponse(StrictModel):
+    unread: int
+
+
+class NotificationBroadcastRequest(StrictModel):
+    title: str = Field(max_length=255)
+    body: str = Field(max_length=4000)
+    channel: str = Field(default="log", max_length=20)
+    role: str | None = Field(default=None, max_length=50)
+    user_ids: list[int] | None = Field(default=None, min_length=1, max_length=10000)
+
+
+class BroadcastJobResponse(StrictModel):
+    job_id: str
+    status: str
+    title: str
+    channel: str
+    requested_by: int
+    created: int
+    chunks: int
+    error: str | None = None
+    created_at: str | None = None
+    updated_at: str | None = None
@@ -2,19 +2,53 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from dataclasses import asdict
+from typing import AsyncIterator
+from uuid import uuid4
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from sytefy_backend.config import get_settings
 from sytefy_backend.core.database import get_db
 from sytefy_backend.modules.auth.domain.entities import User
-from sytefy_backend.modules.auth.web.router import get_current_user, require_roles
+from sytefy_backend.modules.auth.web.router import get_current_user, require_platform_admin, require_roles
 from sytefy_backend.core.exceptions import ApplicationError
-from sytefy_backend.modules.notifications.application.interfaces import INotificationRepository
-from sytefy_backend.modules.notifications.application.use_cases import CreateNotification, ListNotifications, MarkNotificationRead
+from sytefy_backend.modules.notifications.application.interfaces import IBroadcastJobStore, INotificationRepository
+from sytefy_backend.modules.notifications.application.use_cases import (
+    CreateNotification,
+    GetUnreadCount,
+    ListNotifications,
+    MarkNotificationRead,
+    MarkNotificationsRead,
+    ResumeNotifications,
+    StartBroadcast,
+)
+from sytefy_backend.modules.notifications.infrastructure.broadcast_jobs import get_broadcast_job_store
 from sytefy_backend.modules.notifications.infrastructure.dispatcher import CeleryNotificationDispatcher
 from sytefy_backend.modules.notifications.infrastructure.repository import NotificationRepository
-from sytefy_backend.modules.notifications.web.dto import NotificationCreateRequest, NotificationResponse
+from sytefy_backend.modules.notifications.infrastructure.stream import (
+    NotificationHub,
+    StreamSubscription,
+    format_sse,
+    get_notification_hub,
+    get_notification_publisher,
+    serialize_notification,
+)
+from sytefy_backend.modules.notifications.infrastructure.unread_counter import get_unread_counter
+from sytefy_backend.modules.notifications.tasks import broadcast_notifications
+from sytefy_backend.modules.notifications.web.dto import (
+    BroadcastJobResponse,
+    NotificationBroadcastRequest,
+    NotificationCreateRequest,
+    NotificationMarkReadRequest,
+    NotificationMarkReadResponse,
+    NotificationResponse,
+    UnreadCountResponse,
+)
 
+settings = get_settings()
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
 
@@ -23,15 +57,40 @@ def get_repo(db: AsyncSession = Depends(get_db)) -> INotificationRepository:
 
 
 def get_create_use_case(repo: INotificationRepository = Depends(get_repo)) -> CreateNotification:
-    return CreateNotification(repo, dispatcher=CeleryNotificationDispatcher())
+    return CreateNotification(
+        repo,
+        dispatcher=CeleryNotificationDispatcher(),
+        publisher=get_notification_publisher(settings),
+        counter=get_unread_counter(settings),
+    )
 
 
 def get_list_use_case(repo: INotificationRepository = Depends(get_repo)) -> ListNotifications:
     return ListNotifications(repo)
 
 
+def get_resume_use_case(repo: INotificationRepository = Depends(get_repo)) -> ResumeNotifications:
+    return ResumeNotifications(repo)
+
+
+def get_hub() -> NotificationHub:
+    return get_notification_hub(settings)
+
+
 def get_mark_read_use_case(repo: INotificationRepository = Depends(get_repo)) -> MarkNotificationRead:
-    return MarkNotificationRead(repo)
+    return MarkNotificationRead(repo, counter=get_unread_counter(settings))
+
+
+def get_bulk_mark_read_use_case(repo: INotificationRepository = Depends(get_repo)) -> MarkNotificationsRead:
+    return MarkNotificationsRead(repo, counter=get_unread_counter(settings))
+
+
+def get_unread_count_use_case(repo: INotificationRepository = Depends(get_repo)) -> GetUnreadCount:
+    return GetUnreadCount(repo, counter=get_unread_counter(settings))
+
+
+def get_broadcast_jobs() -> IBroadcastJobStore:
+    return get_broadcast_job_store(settings)
 
 
 def _to_response(notification) -> NotificationResponse:
@@ -56,6 +115,103 @@ async def list_notifications(
     return [_to_response(item) for item in notifications]
 
 
+@router.get("/unread-count", response_model=UnreadCountResponse)
+async def unread_count(
+    current_user: User = Depends(get_current_user),
+    use_case: GetUnreadCount = Depends(get_unread_count_use_case),
+):
+    return UnreadCountResponse(unread=await use_case(user_id=current_user.id or 0))
+
+
+@router.post("/mark-read", response_model=NotificationMarkReadResponse)
+async def mark_notifications_read(
+    payload: NotificationMarkReadRequest,
+    current_user: User = Depends(get_current_user),
+    use_case: MarkNotificationsRead = Depends(get_bulk_mark_read_use_case),
+    count_use_case: GetUnreadCount = Depends(get_unread_count_use_case),
+):
+    user_id = current_user.id or 0
+    updated = await use_case(user_id=user_id, notification_ids=payload.ids)
+    return NotificationMarkReadResponse(updated=updated, unread=await count_use_case(user_id=user_id))
+
+
+@router.post("/mark-all-read", response_model=NotificationMarkReadResponse)
+async def mark_all_notifications_read(
+    current_user: User = Depends(get_current_user),
+    use_case: MarkNotificationsRead = Depends(get_bulk_mark_read_use_case),
+    count_use_case: GetUnreadCount = Depends(get_unread_count_use_case),
+):
+    user_id = current_user.id or 0
+    updated = await use_case(user_id=user_id)
+    return NotificationMarkReadResponse(updated=updated, unread=await count_use_case(user_id=user_id))
+
+
+async def _event_stream(
+    request: Request,
+    hub: NotificationHub,
+    subscription: StreamSubscription,
+    backlog: list[dict],
+    last_event_id: int | None,
+) -> AsyncIterator[str]:
+    try:
+        yield f"retry: {int(settings.notification_stream_heartbeat_seconds * 1000)}\n\n"
+        for payload in backlog:
+            last_event_id = payload["id"]
+            yield format_sse(payload)
+        if len(backlog) >= settings.notification_stream_backlog_limit:
+            # Kaçırılan olay sayısı sınırı aştı; istemci listeyi yeniden çekmeli.
+            yield format_sse({"last_event_id": last_event_id}, event="resync")
+        while not await request.is_disconnected():
+            payload = await subscription.get(timeout=settings.notification_stream_heartbeat_seconds)
+            if payload is None:
+                if subscription.closed:
+                    break
+                yield ": heartbeat\n\n"
+                continue
+            if last_event_id is not None and payload["id"] <= last_event_id:
+                continue
+            last_event_id = payload["id"]
+            yield format_sse(payload)
+        if subscription.overflowed:
+            yield format_sse({"last_event_id": last_event_id}, event="overflow")
+    finally:
+        await hub.unsubscribe(subscription)
+
+
+@router.get("/stream")
+async def stream_notifications(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    hub: NotificationHub = Depends(get_hub),
+    resume: ResumeNotifications = Depends(get_resume_use_case),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+):
+    try:
+        after_id = int(last_event_id) if last_event_id else None
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Last-Event-ID geçersiz") from exc
+    user_id = current_user.id or 0
+    # Kaçırılan olaylar okunmadan önce abone olunur; aradaki yayınlar id ile elenir.
+    subscription = await hub.subscribe(user_id)
+    backlog: list[dict] = []
+    if after_id is not None:
+        try:
+            missed = await resume(
+                user_id=user_id,
+                after_id=after_id,
+                limit=settings.notification_stream_backlog_limit,
+            )
+        except Exception:
+            await hub.unsubscribe(subscription)
+            raise
+        backlog = [serialize_notification(item) for item in missed]
+    return StreamingResponse(
+        _event_stream(request, hub, subscription, backlog, after_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/", response_model=NotificationResponse, status_code=status.HTTP_201_CREATED)
 async def create_notification(
     payload: NotificationCreateRequest,
@@ -72,6 +228,46 @@ async def create_notification(
     return _to_response(result.notification)
 
 
+@router.post("/broadcast", response_model=BroadcastJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def start_broadcast(
+    payload: NotificationBroadcastRequest,
+    current_user: User = Depends(require_platform_admin),
+    jobs: IBroadcastJobStore = Depends(get_broadcast_jobs),
+):
+    try:
+        job = StartBroadcast(jobs)(
+            job_id=uuid4().hex,
+            requested_by=current_user.id or 0,
+            title=payload.title,
+            channel=payload.channel,
+            role=payload.role,
+            user_ids=payload.user_ids,
+        )
+    except ApplicationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    broadcast_notifications.delay(
+        job_id=job.job_id,
+        title=payload.title,
+        body=payload.body,
+        channel=payload.channel,
+        role=payload.role,
+        user_ids=payload.user_ids,
+    )
+    return BroadcastJobResponse(**asdict(jobs.get(job.job_id) or job))
+
+
+@router.get("/broadcast/{job_id}", response_model=BroadcastJobResponse)
+async def get_broadcast(
+    job_id: str,
+    _: User = Depends(require_platform_admin),
+    jobs: IBroadcastJobStore = Depends(get_broadcast_jobs),
+):
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Yayın işi bulunamadı")
+    return BroadcastJobResponse(**asdict(job))
+
+
 @router.post("/{notification_id}/read", response_model=NotificationResponse)
 async def mark_notification_read(
     notification_id: int,
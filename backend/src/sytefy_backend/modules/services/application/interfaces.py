@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Protocol
 
-from sytefy_backend.modules.services.domain.entities import Service
+from sytefy_backend.modules.services.domain.entities import Service, ServiceCatalog
 
 
 class IServiceRepository(Protocol):
@@ -17,3 +17,17 @@ class IServiceRepository(Protocol):
     async def list_by_user(self, *, user_id: int, status: str | None = None) -> list[Service]: ...
 
     async def get_by_id(self, service_id: int) -> Service | None: ...
+
+
+class IServiceCatalogCache(Protocol):
+    async def version(self, user_id: int) -> int: ...
+
+    async def get(self, user_id: int) -> ServiceCatalog | None:
+        """Yalnızca güncel sürüme ait anlık görüntüyü döner."""
+        ...
+
+    async def put(self, catalog: ServiceCatalog) -> None:
+        """Oluşturulurken sürüm değiştiyse (araya yazma girdiyse) görüntü saklanmaz."""
+        ...
+
+    async def invalidate(self, user_id: int) -> None: ...
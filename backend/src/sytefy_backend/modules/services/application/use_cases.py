@@ -2,11 +2,30 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass
 
 from sytefy_backend.core.exceptions import ApplicationError
-from sytefy_backend.modules.services.application.interfaces import IServiceRepository
-from sytefy_backend.modules.services.domain.entities import Service
+from sytefy_backend.modules.services.application.interfaces import IServiceCatalogCache, IServiceRepository
+from sytefy_backend.modules.services.domain.entities import Service, ServiceCatalog
+
+
+def catalog_etag(services: tuple[Service, ...]) -> str:
+    """Yanıtta görünen alanların özeti; sürüm sayaçları sıfırlansa da içerik aynıysa ETag değişmez."""
+    payload = [
+        (
+            service.id,
+            service.name,
+            service.description,
+            service.price_amount,
+            service.price_currency,
+            service.duration_minutes,
+            service.status,
+        )
+        for service in services
+    ]
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False).encode("utf-8")).hexdigest()[:32]
 
 
 @dataclass(slots=True)
@@ -15,8 +34,9 @@ class CreateServiceResult:
 
 
 class CreateService:
-    def __init__(self, repo: IServiceRepository):
+    def __init__(self, repo: IServiceRepository, catalog: IServiceCatalogCache | None = None):
         self._repo = repo
+        self._catalog = catalog
 
     async def __call__(
         self,
@@ -42,6 +62,8 @@ class CreateService:
             duration_minutes=duration_minutes,
         )
         stored = await self._repo.create(service)
+        if self._catalog is not None:
+            await self._catalog.invalidate(user_id)
         return CreateServiceResult(service=stored)
 
 
@@ -53,9 +75,29 @@ class ListServices:
         return await self._repo.list_by_user(user_id=user_id, status=status)
 
 
+class GetServiceCatalog:
+    """Hizmet listesini kullanıcı başına sürümlü anlık görüntüden sunar; önbellek isabetinde DB'ye gidilmez."""
+
+    def __init__(self, repo: IServiceRepository, catalog: IServiceCatalogCache):
+        self._repo = repo
+        self._catalog = catalog
+
+    async def __call__(self, *, user_id: int) -> ServiceCatalog:
+        cached = await self._catalog.get(user_id)
+        if cached is not None:
+            return cached
+        # Sürüm sorgudan önce okunur; sorgu sırasında yazma olursa görüntü saklanmaz.
+        version = await self._catalog.version(user_id)
+        services = tuple(await self._repo.list_by_user(user_id=user_id))
+        catalog = ServiceCatalog(user_id=user_id, version=version, services=services, etag=catalog_etag(services))
+        await self._catalog.put(catalog)
+        return catalog
+
+
 class UpdateService:
-    def __init__(self, repo: IServiceRepository):
+    def __init__(self, repo: IServiceRepository, catalog: IServiceCatalogCache | None = None):
         self._repo = repo
+        self._catalog = catalog
 
     async def __call__(
         self,
@@ -88,12 +130,18 @@ class UpdateService:
             existing.duration_minutes = duration_minutes
         if status is not None:
             existing.status = status
-        return await self._repo.update(existing)
+        updated = await self._repo.update(existing)
+        if self._catalog is not None:
+            await self._catalog.invalidate(user_id)
+        return updated
 
 
 class DeleteService:
-    def __init__(self, repo: IServiceRepository):
+    def __init__(self, repo: IServiceRepository, catalog: IServiceCatalogCache | None = None):
         self._repo = repo
+        self._catalog = catalog
 
     async def __call__(self, *, service_id: int, user_id: int) -> None:
         await self._repo.delete(service_id, user_id)
+        if self._catalog is not None:
+            await self._catalog.invalidate(user_id)
@@ -19,3 +19,13 @@ class Service:
     status: str = "active"
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class ServiceCatalog:
+    """Kullanıcının tüm hizmetlerinin ada göre sıralı anlık görüntüsü."""
+
+    user_id: int
+    version: int
+    services: tuple[Service, ...]
+    etag: str
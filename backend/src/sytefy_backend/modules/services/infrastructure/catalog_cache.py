@@ -0,0 +1,186 @@
+"""Kullanıcı başına hizmet kataloğu anlık görüntü önbelleği.
+
+Bellek arka ucu tek süreçlik ve veritabanı motoru başınadır; başka bir worker'daki yazma bu
+süreçteki sürümü ilerletemediğinden görüntüler `SERVICE_CATALOG_MEMORY_TTL_SECONDS` sonra
+yeniden okunur. Birden çok worker'da tutarlılık için `SERVICE_CATALOG_BACKEND=redis` kullanılır. Redis'te sürüm sayacı (`<önek>:<user_id>:v`) ve
+JSON anlık görüntü tutulur; her süreç ayrıca sınırlı bir yerel kopya saklar ve isabet için
+yalnızca sürüm anahtarını okur.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from datetime import datetime
+from typing import Callable
+from weakref import WeakKeyDictionary
+
+from redis.asyncio import Redis
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sytefy_backend.config.settings import Settings
+from sytefy_backend.core.redis import get_async_redis
+from sytefy_backend.modules.services.application.interfaces import IServiceCatalogCache
+from sytefy_backend.modules.services.domain.entities import Service, ServiceCatalog
+
+
+class InMemoryServiceCatalogCache(IServiceCatalogCache):
+    def __init__(
+        self,
+        max_users: int = 1024,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_users = max(1, max_users)
+        self._ttl = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self._clock = clock
+        self._entries: OrderedDict[int, tuple[ServiceCatalog, float | None]] = OrderedDict()
+        self._versions: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    async def version(self, user_id: int) -> int:
+        with self._lock:
+            return self._versions.get(user_id, 0)
+
+    async def get(self, user_id: int) -> ServiceCatalog | None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            catalog, expires_at = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[user_id]
+                return None
+            if catalog.version != self._versions.get(user_id, 0):
+                return None
+            self._entries.move_to_end(user_id)
+            return catalog
+
+    async def put(self, catalog: ServiceCatalog) -> None:
+        with self._lock:
+            if catalog.version != self._versions.get(catalog.user_id, 0):
+                return
+            expires_at = self._clock() + self._ttl if self._ttl is not None else None
+            self._entries[catalog.user_id] = (catalog, expires_at)
+            self._entries.move_to_end(catalog.user_id)
+            while len(self._entries) > self._max_users:
+                self._entries.popitem(last=False)
+
+    async def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+            self._entries.pop(user_id, None)
+
+    async def replace(self, catalog: ServiceCatalog) -> None:
+        """Sürümü dışarıda (Redis'te) tutulan görüntüyü koşulsuz saklar."""
+        with self._lock:
+            self._versions[catalog.user_id] = catalog.version
+        await self.put(catalog)
+
+
+def _service_from_dict(data: dict) -> Service:
+    for field in ("created_at", "updated_at"):
+        if data.get(field):
+            data[field] = datetime.fromisoformat(data[field])
+    return Service(**data)
+
+
+class RedisServiceCatalogCache(IServiceCatalogCache):
+    """İstemci her çağrıda `redis` fabrikasından alınır; böylece çalışan event loop'a bağlı olan kullanılır."""
+
+    def __init__(
+        self,
+        redis: Callable[[], Redis],
+        *,
+        prefix: str = "services:catalog",
+        ttl_seconds: int = 3600,
+        max_users: int = 1024,
+    ):
+        self._redis = redis
+        self._prefix = prefix.rstrip(":")
+        self._ttl = ttl_seconds
+        self._local = InMemoryServiceCatalogCache(max_users=max_users)
+
+    def _version_key(self, user_id: int) -> str:
+        return f"{self._prefix}:{user_id}:v"
+
+    def _snapshot_key(self, user_id: int) -> str:
+        return f"{self._prefix}:{user_id}"
+
+    async def version(self, user_id: int) -> int:
+        return int(await self._redis().get(self._version_key(user_id)) or 0)
+
+    async def get(self, user_id: int) -> ServiceCatalog | None:
+        version = await self.version(user_id)
+        local = await self._local.get(user_id)
+        if local is not None and local.version == version:
+            return local
+        raw = await self._redis().get(self._snapshot_key(user_id))
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        if data["version"] != version:
+            return None
+        catalog = ServiceCatalog(
+            user_id=user_id,
+            version=version,
+            services=tuple(_service_from_dict(item) for item in data["services"]),
+            etag=data["etag"],
+        )
+        await self._local.replace(catalog)
+        return catalog
+
+    async def put(self, catalog: ServiceCatalog) -> None:
+        if await self.version(catalog.user_id) != catalog.version:
+            return
+        payload = {
+            "version": catalog.version,
+            "etag": catalog.etag,
+            "services": [asdict(service) for service in catalog.services],
+        }
+        await self._redis().set(self._snapshot_key(catalog.user_id), json.dumps(payload, default=str), ex=self._ttl)
+        await self._local.replace(catalog)
+
+    async def invalidate(self, user_id: int) -> None:
+        async with self._redis().pipeline() as pipe:
+            pipe.incr(self._version_key(user_id))
+            pipe.delete(self._snapshot_key(user_id))
+            await pipe.execute()
+        await self._local.invalidate(user_id)
+
+
+_redis_cache: RedisServiceCatalogCache | None = None
+_memory_caches: WeakKeyDictionary[Engine, InMemoryServiceCatalogCache] = WeakKeyDictionary()
+
+
+def get_service_catalog_cache(settings: Settings, session: AsyncSession) -> IServiceCatalogCache:
+    global _redis_cache
+    if settings.service_catalog_backend == "redis":
+        if _redis_cache is None:
+            _redis_cache = RedisServiceCatalogCache(
+                lambda: get_async_redis(settings.redis_url),
+                prefix=settings.service_catalog_prefix,
+                ttl_seconds=settings.service_catalog_ttl_seconds,
+                max_users=settings.service_catalog_max_users,
+            )
+        return _redis_cache
+    bind = session.get_bind()
+    engine = bind if isinstance(bind, Engine) else bind.engine
+    cache = _memory_caches.get(engine)
+    if cache is None:
+        cache = _memory_caches[engine] = InMemoryServiceCatalogCache(
+            max_users=settings.service_catalog_max_users,
+            ttl_seconds=settings.service_catalog_memory_ttl_seconds,
+        )
+    return cache
+
+
+__all__ = [
+    "InMemoryServiceCatalogCache",
+    "RedisServiceCatalogCache",
+    "get_service_catalog_cache",
+]
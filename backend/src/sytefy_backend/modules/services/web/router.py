@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from sytefy_backend.config import get_settings
 from sytefy_backend.core.database import get_db
+from sytefy_backend.core.web import not_modified
 from sytefy_backend.modules.auth.domain.entities import User
 from sytefy_backend.modules.auth.web.router import get_current_user, require_roles
-from sytefy_backend.modules.services.application.interfaces import IServiceRepository
-from sytefy_backend.modules.services.application.use_cases import CreateService, DeleteService, ListServices, UpdateService
+from sytefy_backend.modules.services.application.interfaces import IServiceCatalogCache, IServiceRepository
+from sytefy_backend.modules.services.application.use_cases import (
+    CreateService,
+    DeleteService,
+    GetServiceCatalog,
+    UpdateService,
+)
+from sytefy_backend.modules.services.infrastructure.catalog_cache import get_service_catalog_cache
 from sytefy_backend.modules.services.infrastructure.repository import ServiceRepository
 from sytefy_backend.modules.services.web.dto import ServiceCreateRequest, ServiceResponse, ServiceUpdateRequest
 
+settings = get_settings()
 router = APIRouter(prefix="/services", tags=["Services"])
 
 
@@ -20,20 +29,36 @@ def get_repo(db: AsyncSession = Depends(get_db)) -> IServiceRepository:
     return ServiceRepository(db)
 
 
-def get_create_use_case(repo: IServiceRepository = Depends(get_repo)) -> CreateService:
-    return CreateService(repo)
+def get_catalog_cache(db: AsyncSession = Depends(get_db)) -> IServiceCatalogCache:
+    return get_service_catalog_cache(settings, db)
 
 
-def get_list_use_case(repo: IServiceRepository = Depends(get_repo)) -> ListServices:
-    return ListServices(repo)
+def get_create_use_case(
+    repo: IServiceRepository = Depends(get_repo),
+    catalog: IServiceCatalogCache = Depends(get_catalog_cache),
+) -> CreateService:
+    return CreateService(repo, catalog)
 
 
-def get_update_use_case(repo: IServiceRepository = Depends(get_repo)) -> UpdateService:
-    return UpdateService(repo)
+def get_catalog_use_case(
+    repo: IServiceRepository = Depends(get_repo),
+    catalog: IServiceCatalogCache = Depends(get_catalog_cache),
+) -> GetServiceCatalog:
+    return GetServiceCatalog(repo, catalog)
 
 
-def get_delete_use_case(repo: IServiceRepository = Depends(get_repo)) -> DeleteService:
-    return DeleteService(repo)
+def get_update_use_case(
+    repo: IServiceRepository = Depends(get_repo),
+    catalog: IServiceCatalogCache = Depends(get_catalog_cache),
+) -> UpdateService:
+    return UpdateService(repo, catalog)
+
+
+def get_delete_use_case(
+    repo: IServiceRepository = Depends(get_repo),
+    catalog: IServiceCatalogCache = Depends(get_catalog_cache),
+) -> DeleteService:
+    return DeleteService(repo, catalog)
 
 
 def _to_response(service) -> ServiceResponse:
@@ -50,12 +75,19 @@ def _to_response(service) -> ServiceResponse:
 
 @router.get("/", response_model=list[ServiceResponse])
 async def list_services(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
-    use_case: ListServices = Depends(get_list_use_case),
+    use_case: GetServiceCatalog = Depends(get_catalog_use_case),
     status_filter: str | None = None,
 ):
-    services = await use_case(user_id=current_user.id or 0, status=status_filter)
-    return [_to_response(service) for service in services]
+    catalog = await use_case(user_id=current_user.id or 0)
+    etag = f'"{catalog.etag}-{status_filter}"' if status_filter else f'"{catalog.etag}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return [_to_response(service) for service in catalog.services if not status_filter or service.status == status_filter]
 
 
 @router.post("/", response_model=ServiceResponse, status_code=status.HTTP_201_CREATED)
@@ -1,3 +1,9 @@
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
 import pytest_asyncio
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
@@ -25,3 +31,53 @@ async def test_client():
 
     async with AsyncClient(app=app, base_url="http://testserver") as client:
         yield client
+
+
+class BackgroundTasks:
+    """Kuyruğa alınan görevleri yakalar ve test veritabanıyla ayrı bir iş parçacığında çalıştırır.
+
+    Görevler `asyncio.run` ile kendi döngülerini açtığından isteğin döngüsü içinde çalıştırılamaz.
+    """
+
+    def __init__(self, app: Any, monkeypatch: pytest.MonkeyPatch, storage_dir: Path):
+        self._app = app
+        self._monkeypatch = monkeypatch
+        self.storage_dir = storage_dir
+        self.queued: list[tuple[Any, dict[str, Any]]] = []
+        override = app.dependency_overrides[real_get_db]
+
+        @asynccontextmanager
+        async def session_local():
+            async for session in override():
+                yield session
+
+        self.session_local = session_local
+
+    def capture(
+        self,
+        tasks_module: Any,
+        task: Any,
+        *,
+        storage_env: str | None = None,
+        storage_dependency: Callable[..., Any] | None = None,
+        storage: Any = None,
+    ) -> None:
+        self._monkeypatch.setattr(tasks_module, "_SessionLocal", self.session_local)
+        self._monkeypatch.setattr(task, "delay", lambda **kwargs: self.queued.append((task, kwargs)))
+        if storage_env:
+            self._monkeypatch.setenv(storage_env, str(self.storage_dir))
+        if storage_dependency is not None:
+            self._app.dependency_overrides[storage_dependency] = lambda: storage
+
+    async def run(self) -> int:
+        ran = 0
+        while self.queued:
+            task, kwargs = self.queued.pop(0)
+            await asyncio.to_thread(task.apply, kwargs=kwargs, throw=True)
+            ran += 1
+        return ran
+
+
+@pytest.fixture
+def background_tasks(test_client: AsyncClient, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> BackgroundTasks:
+    return BackgroundTasks(test_client._transport.app, monkeypatch, tmp_path)  # type: ignore[attr-defined]
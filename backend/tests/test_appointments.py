@@ -116,3 +116,590 @@ async def test_download_appointment_ics(test_client: AsyncClient):
     body = ics_resp.text
     assert "BEGIN:VEVENT" in body
     assert "SUMMARY:Takip Görüşmesi" in body
+
+
+class _FakeReminderClient:
+    def __init__(self):
+        self.enqueued = []
+        self.batches = []
+
+    def enqueue(self, *, reminder) -> str:
+        self.enqueued.append(reminder)
+        return f"task-{len(self.enqueued)}"
+
+    def enqueue_many(self, *, reminders) -> list[str]:
+        self.batches.append(len(reminders))
+        return [self.enqueue(reminder=reminder) for reminder in reminders]
+
+    def revoke(self, task_id: str) -> None:
+        pass
+
+
+def _use_fake_scheduler(test_client: AsyncClient) -> _FakeReminderClient:
+    from sytefy_backend.modules.appointments.application.reminders import ScheduleAppointmentReminder
+    from sytefy_backend.modules.appointments.web.router import get_scheduler
+
+    client = _FakeReminderClient()
+    app = test_client._transport.app  # type: ignore[attr-defined]
+    app.dependency_overrides[get_scheduler] = lambda: ScheduleAppointmentReminder(client, offset_minutes=30)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_availability_skips_booked_intervals_with_buffers(test_client: AsyncClient):
+    _use_fake_scheduler(test_client)
+    user_payload = {"email": "slots@example.com", "username": "slotsuser", "password": "StrongPass123!"}
+    assert (await test_client.post("/api/auth/register", json=user_payload)).status_code == 201
+    login = await test_client.post("/api/auth/login", json={"email": user_payload["email"], "password": user_payload["password"]})
+    assert login.status_code == 200
+
+    service = await test_client.post(
+        "/api/services/", json={"name": "Seans", "price_amount": 100.0, "duration_minutes": 60}
+    )
+    service_id = service.json()["id"]
+
+    # 2030-01-07 Pazartesi; Europe/Istanbul UTC+3 → çalışma penceresi 06:00-15:00 UTC.
+    booked = [("07:00", "08:00"), ("08:00", "08:30"), ("12:00", "12:30")]
+    ids = []
+    for start, end in booked:
+        resp = await test_client.post(
+            "/api/appointments/",
+            json={"title": "Dolu", "start_at": f"2030-01-07T{start}:00+00:00", "end_at": f"2030-01-07T{end}:00+00:00"},
+        )
+        assert resp.status_code == 201
+        ids.append(resp.json()["id"])
+    assert (await test_client.post(f"/api/appointments/{ids[2]}/cancel")).status_code == 200
+
+    resp = await test_client.get(
+        "/api/appointments/availability",
+        params={
+            "date_from": "2030-01-05",
+            "date_to": "2030-01-07",
+            "service_id": service_id,
+            "buffer_minutes": 15,
+            "step_minutes": 30,
+        },
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["duration_minutes"] == 60 and body["timezone"] == "Europe/Istanbul"
+    starts = [slot["start_at"][11:16] for slot in body["slots"]]
+    # Hafta sonu yok; 06:45-08:45 (tamponlu) dolu, iptal edilen randevu boş sayılır.
+    assert starts == ["09:00", "09:30", "10:00", "10:30", "11:00", "11:30", "12:00", "12:30", "13:00", "13:30", "14:00"]
+    assert all(slot["start_at"].startswith("2030-01-07") for slot in body["slots"])
+
+    resp = await test_client.get(
+        "/api/appointments/availability",
+        params={"date_from": "2030-01-07", "date_to": "2030-01-07", "duration_minutes": 30},
+    )
+    assert [slot["start_at"][11:16] for slot in resp.json()["slots"]][:3] == ["06:00", "06:15", "06:30"]
+    assert "07:00" not in [slot["start_at"][11:16] for slot in resp.json()["slots"]]
+
+    bad_range = {"date_from": "2030-01-01", "date_to": "2030-04-01", "duration_minutes": 30}
+    assert (await test_client.get("/api/appointments/availability", params=bad_range)).status_code == 400
+    missing = {"date_from": "2030-01-07", "date_to": "2030-01-07", "service_id": 999}
+    assert (await test_client.get("/api/appointments/availability", params=missing)).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_overlapping_appointments_are_rejected_with_conflicting_ids(test_client: AsyncClient):
+    _use_fake_scheduler(test_client)
+    user_payload = {"email": "overlap@example.com", "username": "overlapuser", "password": "StrongPass123!"}
+    assert (await test_client.post("/api/auth/register", json=user_payload)).status_code == 201
+    login = await test_client.post("/api/auth/login", json={"email": user_payload["email"], "password": user_payload["password"]})
+    assert login.status_code == 200
+
+    async def create(start: str, end: str):
+        return await test_client.post(
+            "/api/appointments/",
+            json={"title": "Seans", "start_at": f"2030-02-04T{start}:00+00:00", "end_at": f"2030-02-04T{end}:00+00:00"},
+        )
+
+    first = (await create("09:00", "10:00")).json()["id"]
+    second = (await create("10:00", "11:00")).json()["id"]
+    clash = await create("09:30", "10:30")
+    assert clash.status_code == 409
+    assert clash.json()["detail"]["conflicting_ids"] == [first, second]
+    assert (await create("10:00", "11:30")).status_code == 409
+    assert (await create("08:00", "09:00")).status_code == 201
+    too_long = await test_client.post(
+        "/api/appointments/",
+        json={"title": "Uzun", "start_at": "2030-02-10T09:00:00+00:00", "end_at": "2030-02-11T10:00:00+00:00"},
+    )
+    assert too_long.status_code == 400
+
+    # Kendi aralığı içinde kaydırma serbest, komşuya taşma reddedilir.
+    moved = await test_client.put(f"/api/appointments/{first}", json={"start_at": "2030-02-04T09:15:00+00:00"})
+    assert moved.status_code == 200
+    blocked = await test_client.put(f"/api/appointments/{first}", json={"end_at": "2030-02-04T10:15:00+00:00"})
+    assert blocked.status_code == 409 and blocked.json()["detail"]["conflicting_ids"] == [second]
+
+    # İptal edilen randevu yer tutmaz.
+    assert (await test_client.post(f"/api/appointments/{second}/cancel")).status_code == 200
+    assert (await create("10:00", "11:00")).status_code == 201
+
+    resp = await test_client.post(
+        "/api/appointments/conflicts",
+        json={
+            "slots": [
+                {"start_at": "2030-02-04T09:45:00+03:00", "end_at": "2030-02-04T10:30:00+03:00"},
+                {"start_at": "2030-02-04T12:00:00+00:00", "end_at": "2030-02-04T13:00:00+00:00"},
+                {"start_at": "2030-02-04T09:30:00+00:00", "end_at": "2030-02-04T10:30:00+00:00"},
+            ],
+            "exclude_id": first,
+        },
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["has_conflicts"] is True
+    assert [len(item["conflicting_ids"]) for item in body["results"]] == [0, 0, 1]
+    assert first not in body["results"][2]["conflicting_ids"]
+
+
+def test_free_slots_sweep_handles_month_of_bookings():
+    from sytefy_backend.modules.appointments.application.availability import (
+        free_slots,
+        merge_intervals,
+        parse_working_hours,
+        working_windows,
+    )
+
+    hours = parse_working_hours("09:00", "17:00", "1,2,3,4,5,6,7", "UTC")
+    day = datetime(2030, 3, 1, tzinfo=timezone.utc)
+    busy = []
+    for offset in range(31):
+        base = day + timedelta(days=offset)
+        busy += [(base + timedelta(hours=9), base + timedelta(hours=12)), (base + timedelta(hours=11), base + timedelta(hours=16))]
+    windows = list(working_windows(day.date(), (day + timedelta(days=30)).date(), hours))
+    merged = merge_intervals(busy)
+    assert len(merged) == 31
+    slots = free_slots(merged, windows, duration=timedelta(minutes=45), step=timedelta(minutes=15))
+    assert len(slots) == 62
+    assert {(slot.start_at.hour, slot.start_at.minute) for slot in slots} == {(16, 0), (16, 15)}
+
+
+@pytest.mark.asyncio
+async def test_recurring_series_expands_lazily_in_list_ics_and_conflicts(test_client: AsyncClient):
+    client = _use_fake_scheduler(test_client)
+    user_payload = {"email": "series@example.com", "username": "seriesuser", "password": "StrongPass123!"}
+    assert (await test_client.post("/api/auth/register", json=user_payload)).status_code == 201
+    login = await test_client.post("/api/auth/login", json={"email": user_payload["email"], "password": user_payload["password"]})
+    assert login.status_code == 200
+
+    created = await test_client.post(
+        "/api/appointments/",
+        json={
+            "title": "Haftalık seans",
+            "start_at": "2030-03-04T09:00:00+00:00",
+            "end_at": "2030-03-04T10:00:00+00:00",
+            "recurrence_rule": "rrule:freq=weekly;count=4",
+            "recurrence_exceptions": ["2030-03-11T12:00:00+03:00"],
+        },
+    )
+    assert created.status_code == 201
+    series = created.json()
+    assert series["recurrence_rule"] == "FREQ=WEEKLY;COUNT=4"
+    # Uzak tekrar için ETA görevi kurulmaz; yalnızca sıradaki hatırlatıcı zamanı saklanır.
+    assert client.enqueued == [] and series["reminder_task_id"] is None
+    assert series["remind_at"].startswith("2030-03-04T08:30")
+
+    async def create(start: str, end: str):
+        return await test_client.post("/api/appointments/", json={"title": "Tekil", "start_at": start, "end_at": end})
+
+    assert (await create("2030-03-18T12:00:00+00:00", "2030-03-18T13:00:00+00:00")).status_code == 201
+    clash = await create("2030-03-25T09:30:00+00:00", "2030-03-25T10:30:00+00:00")
+    assert clash.status_code == 409 and clash.json()["detail"]["conflicting_ids"] == [series["id"]]
+    # Atlanan tekrarın saati boştur.
+    assert (await create("2030-03-11T09:00:00+00:00", "2030-03-11T10:00:00+00:00")).status_code == 201
+    overlapping_series = await test_client.post(
+        "/api/appointments/",
+        json={
+            "title": "Çakışan seri",
+            "start_at": "2030-02-25T09:30:00+00:00",
+            "end_at": "2030-02-25T10:00:00+00:00",
+            "recurrence_rule": "FREQ=WEEKLY;COUNT=2",
+        },
+    )
+    assert overlapping_series.status_code == 409
+    invalid = await test_client.post(
+        "/api/appointments/",
+        json={"title": "X", "start_at": "2030-05-01T09:00:00+00:00", "end_at": "2030-05-01T10:00:00+00:00", "recurrence_rule": "FREQ=HOURLY"},
+    )
+    assert invalid.status_code == 400
+
+    params = {"start_from": "2030-03-01T00:00:00+00:00", "start_to": "2030-03-31T00:00:00+00:00", "limit": 20}
+    listing = (await test_client.get("/api/appointments/", params=params)).json()
+    assert listing["total"] == 5
+    assert [(item["start_at"][:16], item["recurrence_id"] is not None) for item in listing["items"]] == [
+        ("2030-03-04T09:00", True),
+        ("2030-03-11T09:00", False),
+        ("2030-03-18T09:00", True),
+        ("2030-03-18T12:00", False),
+        ("2030-03-25T09:00", True),
+    ]
+    page = (await test_client.get("/api/appointments/", params=params | {"limit": 2, "offset": 2})).json()
+    assert page["total"] == 5 and [item["start_at"][:16] for item in page["items"]] == ["2030-03-18T09:00", "2030-03-18T12:00"]
+
+    ics = await test_client.get(
+        f"/api/appointments/{series['id']}/ics",
+        params={"start_from": "2030-03-10T00:00:00+00:00", "start_to": "2030-04-30T00:00:00+00:00"},
+    )
+    assert ics.status_code == 200
+    assert ics.text.count("BEGIN:VEVENT") == 2
+    assert f"UID:appointment-{series['id']}-20300318T090000Z@" in ics.text
+
+    availability = await test_client.get(
+        "/api/appointments/availability",
+        params={"date_from": "2030-03-25", "date_to": "2030-03-25", "duration_minutes": 60, "step_minutes": 60},
+    )
+    assert "2030-03-25T09:00:00Z" not in [slot["start_at"] for slot in availability.json()["slots"]]
+
+
+@pytest.mark.asyncio
+async def test_series_reminder_is_materialized_only_for_next_due_occurrence():
+    from dataclasses import replace
+
+    from sytefy_backend.modules.appointments.application.reminders import ScheduleAppointmentReminder
+    from sytefy_backend.modules.appointments.application.use_cases import SeriesReminderPlanner
+    from sytefy_backend.modules.appointments.domain.entities import Appointment
+
+    class Repo:
+        async def update_reminder_metadata(self, *, appointment_id, remind_at, reminder_task_id, channels):
+            return replace(series, remind_at=remind_at, reminder_task_id=reminder_task_id)
+
+    client = _FakeReminderClient()
+    start = datetime(2030, 3, 4, 9, tzinfo=timezone.utc)
+    series = Appointment(
+        id=7,
+        user_id=1,
+        customer_id=None,
+        title="Haftalık",
+        description=None,
+        location=None,
+        channel="in_person",
+        start_at=start,
+        end_at=start + timedelta(hours=1),
+        remind_at=None,
+        reminder_channels=("log",),
+        reminder_task_id=None,
+        recurrence_rule="FREQ=WEEKLY",
+        recurrence_exceptions=(datetime(2030, 3, 11, 9, tzinfo=timezone.utc),),
+    )
+    planner = SeriesReminderPlanner(
+        Repo(),  # type: ignore[arg-type]
+        ScheduleAppointmentReminder(client, offset_minutes=30),
+        tz="Europe/Istanbul",
+        lookahead_seconds=300,
+    )
+
+    series = await planner(series, user_email=None, now=datetime(2030, 3, 4, 9, 30, tzinfo=timezone.utc))
+    assert client.enqueued == [] and series.remind_at == datetime(2030, 3, 18, 8, 30, tzinfo=timezone.utc)
+
+    series = await planner(series, user_email=None, now=datetime(2030, 3, 18, 8, 27, tzinfo=timezone.utc))
+    assert len(client.enqueued) == 1 and series.reminder_task_id == "task-1"
+    assert client.enqueued[0].payload["start_at"].startswith("2030-03-18T09:00")
+    assert series.remind_at == datetime(2030, 3, 25, 8, 30, tzinfo=timezone.utc)
+
+    # Aynı tarama tekrar çalışsa da sıradaki tekrar vadesine gelmeden kurulmaz.
+    series = await planner(series, user_email=None, now=datetime(2030, 3, 18, 8, 28, tzinfo=timezone.utc))
+    assert len(client.enqueued) == 1
+
+
+@pytest.mark.asyncio
+async def test_calendar_feed_streams_folded_ics_with_conditional_get(test_client: AsyncClient):
+    _use_fake_scheduler(test_client)
+    user_payload = {"email": "feed@example.com", "username": "feeduser", "password": "StrongPass123!"}
+    assert (await test_client.post("/api/auth/register", json=user_payload)).status_code == 201
+    login = await test_client.post("/api/auth/login", json={"email": user_payload["email"], "password": user_payload["password"]})
+    assert login.status_code == 200
+
+    start = (datetime.now(timezone.utc) + timedelta(days=2)).replace(hour=9, minute=0, second=0, microsecond=0)
+    created = await test_client.post(
+        "/api/appointments/",
+        json={
+            "title": "Görüşme",
+            "description": "Çok uzun açıklama; " * 12,
+            "start_at": start.isoformat(),
+            "end_at": (start + timedelta(hours=1)).isoformat(),
+        },
+    )
+    appointment_id = created.json()["id"]
+    series_start = start + timedelta(hours=3)
+    await test_client.post(
+        "/api/appointments/",
+        json={
+            "title": "Haftalık",
+            "start_at": series_start.isoformat(),
+            "end_at": (series_start + timedelta(hours=1)).isoformat(),
+            "recurrence_rule": "FREQ=WEEKLY;COUNT=3",
+        },
+    )
+    far = start + timedelta(days=800)
+    await test_client.post(
+        "/api/appointments/",
+        json={"title": "Uzak", "start_at": far.isoformat(), "end_at": (far + timedelta(hours=1)).isoformat()},
+    )
+
+    rotated = await test_client.post("/api/appointments/feed")
+    assert rotated.status_code == 201
+    url, token = rotated.json()["url"], rotated.json()["token"]
+    assert url.startswith("webcal://") and url.endswith(f"/api/appointments/feed/{token}.ics")
+    path = f"/api/appointments/feed/{token}.ics"
+
+    test_client.cookies.clear()
+    first = await test_client.get(path)
+    assert first.status_code == 200
+    assert first.headers["content-type"].startswith("text/calendar")
+    body = first.text
+    assert body.count("BEGIN:VEVENT") == 4 and "Uzak" not in body and body.endswith("END:VCALENDAR\r\n")
+    assert all(len(line.encode("utf-8")) <= 75 for line in body.split("\r\n"))
+    assert "\r\n " in body
+    # DTSTAMP kayıttan gelir; aynı içerik byte byte aynıdır.
+    second = await test_client.get(path)
+    assert second.text == body and second.headers["etag"] == first.headers["etag"]
+
+    etag, last_modified = first.headers["etag"], first.headers["last-modified"]
+    assert (await test_client.get(path, headers={"If-None-Match": etag})).status_code == 304
+    assert (await test_client.get(path, headers={"If-None-Match": f"W/{etag}, \"other\""})).status_code == 304
+    assert (await test_client.get(path, headers={"If-Modified-Since": last_modified})).status_code == 304
+
+    assert (
+        await test_client.post("/api/auth/login", json={"email": user_payload["email"], "password": user_payload["password"]})
+    ).status_code == 200
+    assert (await test_client.put(f"/api/appointments/{appointment_id}", json={"title": "Yeni başlık"})).status_code == 200
+    changed = await test_client.get(path, headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and "SUMMARY:Yeni başlık" in changed.text
+    assert changed.headers["etag"] != etag
+
+    rotated_again = (await test_client.post("/api/appointments/feed")).json()["token"]
+    assert (await test_client.get(path)).status_code == 404
+    assert (await test_client.get(f"/api/appointments/feed/{rotated_again}.ics")).status_code == 200
+    assert (await test_client.delete("/api/appointments/feed")).status_code == 204
+    assert (await test_client.get(f"/api/appointments/feed/{rotated_again}.ics")).status_code == 404
+
+
+async def _login(test_client: AsyncClient, email: str, username: str) -> None:
+    payload = {"email": email, "username": username, "password": "StrongPass123!"}
+    assert (await test_client.post("/api/auth/register", json=payload)).status_code == 201
+    login = await test_client.post("/api/auth/login", json={"email": email, "password": payload["password"]})
+    assert login.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_import_csv_and_ics_checks_conflicts_and_schedules_reminders_in_bulk(test_client: AsyncClient):
+    client = _use_fake_scheduler(test_client)
+    await _login(test_client, "importapt@example.com", "importapt")
+    customer = await test_client.post("/api/customers/", json={"name": "Ayşe Yılmaz", "email": "ayse@example.com"})
+    customer_id = customer.json()["id"]
+    existing = await test_client.post(
+        "/api/appointments/",
+        json={"title": "Mevcut", "start_at": "2030-01-07T10:00:00+00:00", "end_at": "2030-01-07T11:00:00+00:00"},
+    )
+    existing_id = existing.json()["id"]
+    client.enqueued.clear()
+
+    # Europe/Istanbul (UTC+3): 10:00 yerel = 07:00 UTC.
+    content = "\n".join(
+        [
+            "Başlık;Başlangıç;Süre (dk);E-posta;Durum",
+            "Danışmanlık;07.01.2030 10:00;60;AYSE@example.com;",
+            "Çakışan;07.01.2030 13:30;30;;",
+            "Dosya içi;07.01.2030 10:30;30;;",
+            "İptal;07.01.2030 15:00;30;;iptal",
+            "Hatalı;32.01.2030 10:00;30;;",
+            "Geçmiş;07.01.2020 10:00;30;;",
+        ]
+    )
+    resp = await test_client.post("/api/appointments/imports", content=content.encode("utf-8"))
+    assert resp.status_code == 200
+    report = resp.json()
+    assert report["format"] == "csv" and report["job_id"] is None
+    counts = [report[key] for key in ("processed", "inserted", "conflicts", "skipped", "failed", "reminders")]
+    assert counts == [6, 2, 2, 1, 1, 1]
+    assert [(error["line"], error["reason"]) for error in report["errors"][:2]] == [
+        (3, f"Çakışma: #{existing_id} numaralı randevu"),
+        (4, "Çakışma: dosyadaki 2. satır"),
+    ]
+    assert [error["line"] for error in report["errors"]] == [3, 4, 5, 6]
+    # Geçmiş randevuya hatırlatıcı kurulmaz; kalanlar tek toplu çağrıyla kuyruğa alınır.
+    assert client.batches == [1]
+
+    ics = "\r\n".join(
+        [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            "BEGIN:VEVENT",
+            "SUMMARY:Haftalık\\, seans",
+            "DTSTART;TZID=Europe/Istanbul:20300108T090000",
+            "DURATION:PT45M",
+            "RRULE:FREQ=WEEKLY;COUNT=3",
+            "EXDATE;TZID=Europe/Istanbul:20300115T090000",
+            "DESCRIPTION:Katlanmış uzun",
+            "  açıklama",
+            "BEGIN:VALARM",
+            "TRIGGER:-PT15M",
+            "DESCRIPTION:Alarm",
+            "END:VALARM",
+            "END:VEVENT",
+            "BEGIN:VEVENT",
+            "SUMMARY:Tüm gün",
+            "DTSTART;VALUE=DATE:20300109",
+            "END:VEVENT",
+            "BEGIN:VEVENT",
+            "SUMMARY:İptal",
+            "STATUS:CANCELLED",
+            "DTSTART:20300110T090000Z",
+            "DTEND:20300110T100000Z",
+            "END:VEVENT",
+            "BEGIN:VEVENT",
+            "SUMMARY:UTC",
+            "DTSTART:20300110T090000Z",
+            "DTEND:20300110T100000Z",
+            "ATTENDEE;CN=Ayşe:mailto:ayse@example.com",
+            "END:VEVENT",
+            "END:VCALENDAR",
+        ]
+    )
+    resp = await test_client.post("/api/appointments/imports", content=ics.encode("utf-8"))
+    assert resp.status_code == 200
+    report = resp.json()
+    assert report["format"] == "ics"
+    counts = [report[key] for key in ("processed", "inserted", "conflicts", "skipped", "failed", "reminders")]
+    assert counts == [4, 2, 0, 1, 1, 1]
+    assert report["errors"][0]["reason"] == "Tüm gün etkinlikleri desteklenmiyor."
+
+    listed = await test_client.get(
+        "/api/appointments/", params={"start_from": "2019-01-01T00:00:00Z", "start_to": "2030-02-01T00:00:00Z"}
+    )
+    items = {(item["title"], item["start_at"][:16]): item for item in listed.json()["items"]}
+    assert set(items) == {
+        ("Geçmiş", "2020-01-07T07:00"),
+        ("Danışmanlık", "2030-01-07T07:00"),
+        ("Mevcut", "2030-01-07T10:00"),
+        ("Haftalık, seans", "2030-01-08T06:00"),
+        ("Haftalık, seans", "2030-01-22T06:00"),
+        ("UTC", "2030-01-10T09:00"),
+    }
+    imported = items[("Danışmanlık", "2030-01-07T07:00")]
+    assert imported["customer_id"] == customer_id and imported["reminder_task_id"]
+    assert items[("UTC", "2030-01-10T09:00")]["customer_id"] == customer_id
+    assert items[("Geçmiş", "2020-01-07T07:00")]["reminder_task_id"] is None
+    series = items[("Haftalık, seans", "2030-01-08T06:00")]
+    assert series["recurrence_rule"] == "FREQ=WEEKLY;COUNT=3"
+    assert series["description"] == "Katlanmış uzun açıklama"
+    assert series["end_at"][:16] == "2030-01-08T06:45"
+
+    assert (await test_client.post("/api/appointments/imports", content=b"foo;bar\n1;2\n")).status_code == 400
+    assert (await test_client.post("/api/appointments/imports", params={"format": "xls"}, content=b"x")).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_import_retries_rows_when_the_exclusion_constraint_fires_on_bulk_insert():
+    from sqlalchemy import func, select, text
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from sytefy_backend.core.database.base import Base
+    from sytefy_backend.modules.appointments.application.imports import AppointmentImportRecord, ImportAppointments
+    from sytefy_backend.modules.appointments.application.reminders import ScheduleAppointmentReminder
+    from sytefy_backend.modules.appointments.infrastructure.models import OVERLAP_CONSTRAINT, AppointmentModel
+    from sytefy_backend.modules.appointments.infrastructure.repository import AppointmentRepository
+    from sytefy_backend.modules.auth.infrastructure.models import UserModel  # noqa: F401
+    from sytefy_backend.modules.customers.infrastructure.repository import CustomerRepository
+
+    class LockingRepository(AppointmentRepository):
+        locks: list[int] = []
+
+        async def lock_schedule(self, *, user_id: int) -> None:
+            self.locks.append(user_id)
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # Denetimden sonra eşzamanlı eklenen kaydı taklit eder: INSERT anında kısıt ihlali yükselir.
+        await conn.execute(
+            text(
+                "CREATE TRIGGER concurrent_booking BEFORE INSERT ON appointments WHEN NEW.title = 'Yarış' "
+                f"BEGIN SELECT RAISE(ABORT, '{OVERLAP_CONSTRAINT}'); END"
+            )
+        )
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    start = datetime(2020, 1, 6, 9, tzinfo=timezone.utc)
+    records = [
+        AppointmentImportRecord(
+            line=index + 2,
+            title=title,
+            start_at=start + timedelta(hours=index),
+            end_at=start + timedelta(hours=index, minutes=30),
+        )
+        for index, title in enumerate(["Birinci", "Yarış", "Üçüncü"])
+    ]
+    async with session_factory() as session:
+        repo = LockingRepository(session)
+        importer = ImportAppointments(
+            repo,
+            ScheduleAppointmentReminder(_FakeReminderClient(), offset_minutes=30),
+            CustomerRepository(session),
+        )
+        result = await importer(user_id=1, user_email=None, records=records)
+
+        assert (result.inserted, result.conflicts) == (2, 1)
+        assert [(error.line, error.reason) for error in result.errors] == [(3, "Çakışma: eşzamanlı eklenen randevu")]
+        assert repo.locks == [1]
+        # Toplu INSERT hatası geri alındı; oturum kullanılabilir durumda kalır.
+        titles = (await session.execute(select(AppointmentModel.title).order_by(AppointmentModel.start_at))).scalars()
+        assert list(titles) == ["Birinci", "Üçüncü"]
+        assert (await session.execute(select(func.count()).select_from(AppointmentModel))).scalar_one() == 2
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_large_appointment_import_runs_as_background_job(test_client: AsyncClient, monkeypatch, background_tasks):
+    import csv
+    import io
+
+    from sytefy_backend.modules.appointments import tasks as appointment_tasks
+    from sytefy_backend.modules.appointments.infrastructure import reminder_queue
+    from sytefy_backend.modules.appointments.infrastructure.imports import LocalAppointmentImportStorage
+    from sytefy_backend.modules.appointments.web import router as appointment_router
+
+    client = _use_fake_scheduler(test_client)
+    monkeypatch.setattr(reminder_queue, "CeleryReminderTaskClient", lambda *args, **kwargs: client)
+    monkeypatch.setenv("APPOINTMENT_IMPORT_BATCH_SIZE", "7")
+    monkeypatch.setattr(appointment_router.settings, "appointment_import_inline_max_bytes", 64)
+    background_tasks.capture(
+        appointment_tasks,
+        appointment_tasks.import_appointments,
+        storage_env="APPOINTMENT_IMPORT_STORAGE_DIR",
+        storage_dependency=appointment_router.get_import_storage,
+        storage=LocalAppointmentImportStorage(background_tasks.storage_dir),
+    )
+
+    await _login(test_client, "bgapt@example.com", "bgapt")
+    start = datetime(2031, 3, 3, 6, tzinfo=timezone.utc)
+    lines = ["title,start,end"]
+    for index in range(20):
+        slot = start + timedelta(hours=index)
+        lines.append(f"Seans {index},{slot.isoformat()},{(slot + timedelta(minutes=30)).isoformat()}")
+    lines += [f"Çakışan,{start.isoformat()},{(start + timedelta(hours=1)).isoformat()}", "Eksik,,"]
+    started = await test_client.post("/api/appointments/imports", content="\n".join(lines).encode("utf-8"))
+    assert started.status_code == 202
+    job_id = started.json()["job_id"]
+    assert started.json()["status"] == "queued"
+
+    assert await background_tasks.run() == 1
+    job = (await test_client.get(f"/api/appointments/imports/{job_id}")).json()
+    assert job["status"] == "completed"
+    counts = [job[key] for key in ("processed", "inserted", "conflicts", "skipped", "failed", "reminders")]
+    assert counts == [22, 20, 1, 0, 1, 20]
+    assert job["position"] == job["size"]
+    # Parça başına tek toplu kuyruğa alma (7 + 7 + 6 eklenen satır).
+    assert client.batches == [7, 7, 6]
+    assert not any(background_tasks.storage_dir.rglob("*.upload"))
+
+    report = await test_client.get(f"/api/appointments/imports/{job_id}/errors")
+    assert report.status_code == 200
+    rows = list(csv.reader(io.StringIO(report.text)))
+    assert rows[0] == ["line", "reason"]
+    assert [row[0] for row in rows[1:]] == ["22", "23"]
+    assert (await test_client.get(f"/api/appointments/imports/{'0' * 32}")).status_code == 404
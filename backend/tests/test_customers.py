@@ -0,0 +1,241 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_customer_search_ranks_prefix_fuzzy_and_phone_matches(test_client: AsyncClient):
+    payload = {"email": "search@example.com", "username": "searchuser", "password": "StrongPass123!"}
+    assert (await test_client.post("/api/auth/register", json=payload)).status_code == 201
+    login = await test_client.post("/api/auth/login", json={"email": payload["email"], "password": payload["password"]})
+    assert login.status_code == 200
+
+    customers = [
+        {"name": "Ayşe Yılmaz", "email": "ayse@example.com", "phone": "+90 555 123 45 67"},
+        {"name": "Mehmet Ayaz", "email": "mehmet@firma.com.tr", "phone": "0532 987 65 43"},
+        {"name": "Şükrü Öztürk", "email": None, "phone": None},
+        {"name": "Zeynep Kaya", "email": "zeynep.ayse@example.com", "phone": None},
+    ]
+    for body in customers:
+        assert (await test_client.post("/api/customers/", json=body)).status_code == 201
+
+    async def search(q: str, **params) -> list[str]:
+        resp = await test_client.get("/api/customers/search", params={"q": q, **params})
+        assert resp.status_code == 200
+        return [item["name"] for item in resp.json()]
+
+    # Ad öneki en üstte, e-postada geçen sonra gelir; Türkçe karakterler katlanır.
+    assert await search("ayse") == ["Ayşe Yılmaz", "Zeynep Kaya"]
+    # Üç karakterden kısa sorgular yalnızca ad önekiyle eşleşir.
+    assert await search("AY") == ["Ayşe Yılmaz"]
+    # Kelime öneki, yalnızca trigram benzerliğiyle eşleşen kaydın önünde gelir.
+    assert await search("ayaz") == ["Mehmet Ayaz", "Ayşe Yılmaz"]
+    assert await search("ozturk") == ["Şükrü Öztürk"]
+    # Yazım hatası trigram benzerliğiyle bulunur.
+    assert await search("yilmz") == ["Ayşe Yılmaz"]
+    assert await search("0555 123") == ["Ayşe Yılmaz"]
+    assert await search("firma.com") == ["Mehmet Ayaz"]
+    assert await search("ay", limit=1) == ["Ayşe Yılmaz"]
+    assert await search("qqqq") == []
+
+    # Yeni kayıt sonrası süreç içi indeks yeniden kurulur.
+    assert (await test_client.post("/api/customers/", json={"name": "Ayten Demir"})).status_code == 201
+    assert await search("ayt") == ["Ayten Demir"]
+
+    assert (await test_client.get("/api/customers/search", params={"q": "!!"})).status_code == 400
+    assert (await test_client.get("/api/customers/search", params={"q": ""})).status_code == 422
+
+
+def test_postgres_customer_search_uses_trigram_operators():
+    from sqlalchemy.dialects import postgresql
+
+    from sytefy_backend.modules.customers.infrastructure import search
+
+    captured = []
+
+    class Session:
+        async def execute(self, stmt):
+            captured.append(str(stmt.compile(dialect=postgresql.dialect())))
+
+            class Result:
+                def all(self):
+                    return []
+
+            return Result()
+
+    import asyncio
+
+    asyncio.run(search.PostgresCustomerSearch(Session()).search(user_id=1, query="yilmaz", limit=5))  # type: ignore[arg-type]
+    asyncio.run(search.PostgresCustomerSearch(Session()).search(user_id=1, query="ay", limit=5))  # type: ignore[arg-type]
+    assert "word_similarity" in captured[0] and "<%" in captured[0]
+    assert "word_similarity" not in captured[1] and "LIKE" in captured[1]
+
+
+@pytest.mark.asyncio
+async def test_customer_loader_coalesces_concurrent_lookups():
+    import asyncio
+
+    from sytefy_backend.modules.appointments.application.use_cases import build_reminder_payloads
+    from sytefy_backend.modules.appointments.domain.entities import Appointment
+    from sytefy_backend.modules.customers.application.loader import CustomerLoader
+    from sytefy_backend.modules.customers.domain.entities import Customer
+
+    calls: list[list[int]] = []
+
+    class Repo:
+        async def get_many(self, customer_ids):
+            calls.append(sorted(customer_ids))
+            return {
+                customer_id: Customer(id=customer_id, user_id=1, name=f"Müşteri {customer_id}", email=None, phone=None, notes=None)
+                for customer_id in customer_ids
+                if customer_id != 99
+            }
+
+    loader = CustomerLoader(Repo())  # type: ignore[arg-type]
+    first, second, missing, again = await asyncio.gather(loader.load(1), loader.load(2), loader.load(99), loader.load(1))
+    assert calls == [[1, 2, 99]]
+    assert first is again and second.name == "Müşteri 2" and missing is None
+    assert (await loader.load(2)).name == "Müşteri 2"
+    assert calls == [[1, 2, 99]]
+
+    start = datetime(2024, 7, 1, 9, tzinfo=timezone.utc)
+    appointments = [
+        Appointment(
+            id=index,
+            user_id=1,
+            customer_id=customer_id,
+            title="Kontrol",
+            description=None,
+            location=None,
+            channel="in_person",
+            start_at=start,
+            end_at=start + timedelta(hours=1),
+            remind_at=None,
+            reminder_channels=("log",),
+            reminder_task_id=None,
+        )
+        for index, customer_id in enumerate([3, 4, 3, None, 1], start=1)
+    ]
+    payloads = await build_reminder_payloads(appointments, user_email=None, customers=loader)
+    assert calls == [[1, 2, 99], [3, 4]]
+    assert [payload["customer_name"] for payload in payloads] == ["Müşteri 3", "Müşteri 4", "Müşteri 3", None, "Müşteri 1"]
+    assert not loader._tasks
+
+    class SlowRepo:
+        async def get_many(self, customer_ids):
+            await asyncio.sleep(3600)
+
+    slow = CustomerLoader(SlowRepo())  # type: ignore[arg-type]
+    waiters = asyncio.gather(slow.load(5), slow.load(6), return_exceptions=True)
+    await asyncio.sleep(0)
+    (dispatch,) = slow._tasks
+    dispatch.cancel()
+    # Gönderim görevi iptal edilince bekleyenler askıda kalmaz ve anahtarlar yeniden denenebilir.
+    assert all(isinstance(result, asyncio.CancelledError) for result in await waiters)
+    assert not slow._tasks and not slow._cache
+
+
+async def _login(test_client: AsyncClient, email: str, username: str) -> None:
+    payload = {"email": email, "username": username, "password": "StrongPass123!"}
+    assert (await test_client.post("/api/auth/register", json=payload)).status_code == 201
+    login = await test_client.post("/api/auth/login", json={"email": email, "password": payload["password"]})
+    assert login.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_customer_import_normalizes_and_dedupes_csv_and_vcard(test_client: AsyncClient):
+    await _login(test_client, "import@example.com", "importuser")
+    existing = {"name": "Mevcut Müşteri", "email": "Mevcut@Example.com", "phone": "0555 000 11 22"}
+    assert (await test_client.post("/api/customers/", json=existing)).status_code == 201
+
+    content = (
+        "Ad Soyad;E-posta;Telefon;Not\n"
+        "Ayşe Yılmaz;AYSE@Example.com;0 (555) 123 45 67;\"Not; çok satırlı\nikinci satır\"\n"
+        "Aynı Telefon;;+90 555 123 45 67;\n"
+        "Eski Kayıt;mevcut@example.com;;\n"
+        "Eski Telefon;;+905550001122;\n"
+        "X;x@example.com;;\n"
+        "Hatalı E-posta;not-an-email;;\n"
+        ";;;\n"
+        "Mehmet Öz;;5321112233;\n"
+    ).encode("utf-8-sig")
+    resp = await test_client.post("/api/customers/imports", content=content)
+    assert resp.status_code == 200
+    report = resp.json()
+    assert report["status"] == "completed" and report["job_id"] is None
+    assert (report["processed"], report["inserted"], report["duplicates"], report["failed"]) == (7, 2, 3, 2)
+    assert [(error["line"], error["reason"].split(":")[0]) for error in report["errors"]] == [
+        (4, "Mükerrer kayıt"),
+        (5, "Mükerrer kayıt"),
+        (6, "Mükerrer kayıt"),
+        (7, "Ad en az 2 karakter olmalı."),
+        (8, "Geçersiz e-posta"),
+    ]
+
+    customers = {item["name"]: item for item in (await test_client.get("/api/customers/")).json()}
+    assert customers["Ayşe Yılmaz"]["email"] == "ayse@example.com"
+    assert customers["Ayşe Yılmaz"]["phone"] == "+905551234567"
+    assert customers["Ayşe Yılmaz"]["notes"] == "Not; çok satırlı\nikinci satır"
+    assert customers["Mehmet Öz"]["phone"] == "+905321112233"
+    assert [item["name"] for item in (await test_client.get("/api/customers/search", params={"q": "mehmet"})).json()] == [
+        "Mehmet Öz"
+    ]
+
+    vcard = (
+        "BEGIN:VCARD\r\nVERSION:3.0\r\nN:Kaya;Zeynep;;;\r\nEMAIL;TYPE=INTERNET:zeynep@example.com\r\n"
+        "TEL;TYPE=CELL:+90 533 444 55 66\r\nNOTE:Uzun bir not\r\n  devam ediyor\r\nEND:VCARD\r\n"
+        "BEGIN:VCARD\r\nVERSION:4.0\r\nFN:Ayşe Tekrar\r\nEMAIL:ayse@example.com\r\nEND:VCARD\r\n"
+    )
+    resp = await test_client.post("/api/customers/imports", content=vcard.encode("utf-8"))
+    assert resp.status_code == 200
+    assert (resp.json()["inserted"], resp.json()["duplicates"]) == (1, 1)
+    customers = {item["name"]: item for item in (await test_client.get("/api/customers/")).json()}
+    assert customers["Zeynep Kaya"]["phone"] == "+905334445566"
+    assert customers["Zeynep Kaya"]["notes"] == "Uzun bir not devam ediyor"
+
+    assert (await test_client.post("/api/customers/imports", content=b"email\nx@example.com\n")).status_code == 400
+    assert (await test_client.post("/api/customers/imports", params={"format": "xls"}, content=b"name\n")).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_large_customer_import_runs_as_background_job(test_client: AsyncClient, monkeypatch, background_tasks):
+    import csv
+    import io
+
+    from sytefy_backend.modules.customers import tasks as customer_tasks
+    from sytefy_backend.modules.customers.infrastructure.imports import LocalCustomerImportStorage
+    from sytefy_backend.modules.customers.web import router as customer_router
+
+    monkeypatch.setenv("CUSTOMER_IMPORT_BATCH_SIZE", "7")
+    monkeypatch.setattr(customer_router.settings, "customer_import_inline_max_bytes", 64)
+    background_tasks.capture(
+        customer_tasks,
+        customer_tasks.import_customers,
+        storage_env="CUSTOMER_IMPORT_STORAGE_DIR",
+        storage_dependency=customer_router.get_import_storage,
+        storage=LocalCustomerImportStorage(background_tasks.storage_dir),
+    )
+
+    await _login(test_client, "bgimport@example.com", "bgimport")
+    lines = ["name,email,phone"]
+    lines += [f"Müşteri {index},musteri{index}@example.com,0555 100 {index:04d}" for index in range(40)]
+    lines += ["Tekrar,musteri3@example.com,", "B,,"]
+    started = await test_client.post("/api/customers/imports", content="\n".join(lines).encode("utf-8"))
+    assert started.status_code == 202
+    job_id = started.json()["job_id"]
+    assert started.json()["status"] == "queued"
+
+    assert await background_tasks.run() == 1
+    job = (await test_client.get(f"/api/customers/imports/{job_id}")).json()
+    assert job["status"] == "completed"
+    assert (job["processed"], job["inserted"], job["duplicates"], job["failed"]) == (42, 40, 1, 1)
+    assert job["position"] == job["size"]
+    assert not any(background_tasks.storage_dir.rglob("*.upload"))
+
+    report = await test_client.get(f"/api/customers/imports/{job_id}/errors")
+    assert report.status_code == 200
+    rows = list(csv.reader(io.StringIO(report.text)))
+    assert rows[0] == ["line", "reason"]
+    assert [row[0] for row in rows[1:]] == ["42", "43"]
+    assert (await test_client.get(f"/api/customers/imports/{'0' * 32}")).status_code == 404
@@ -0,0 +1,81 @@
+import csv
+import io
+import zipfile
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+
+
+async def _login(test_client: AsyncClient, email: str, username: str) -> None:
+    payload = {"email": email, "username": username, "password": "StrongPass123!"}
+    assert (await test_client.post("/api/auth/register", json=payload)).status_code == 201
+    login = await test_client.post("/api/auth/login", json={"email": email, "password": payload["password"]})
+    assert login.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_stream_invoice_export_as_csv_and_xlsx(test_client: AsyncClient):
+    await _login(test_client, "export@example.com", "exportuser")
+    due = (datetime.now(timezone.utc) + timedelta(days=3)).isoformat()
+    for index in range(3):
+        resp = await test_client.post(
+            "/api/finances/invoices/",
+            json={"title": f"Fatura <{index}> & Şirket", "amount": 100.0 + index, "due_date": due},
+        )
+        assert resp.status_code == 201
+
+    resp = await test_client.get("/api/exports/invoices", params={"format": "csv"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert "attachment" in resp.headers["content-disposition"]
+    rows = list(csv.reader(io.StringIO(resp.content.decode("utf-8-sig"))))
+    assert rows[0][:3] == ["id", "number", "title"]
+    assert [row[2] for row in rows[1:]] == [f"Fatura <{index}> & Şirket" for index in range(3)]
+
+    resp = await test_client.get("/api/exports/invoices", params={"format": "xlsx"})
+    assert resp.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(resp.content)) as workbook:
+        assert workbook.testzip() is None
+        sheet = workbook.read("xl/worksheets/sheet1.xml").decode("utf-8")
+    assert sheet.count("<row>") == 4
+    assert "Fatura &lt;2&gt; &amp; Şirket" in sheet
+
+    assert (await test_client.get("/api/exports/payments")).status_code == 400
+    assert (await test_client.get("/api/exports/invoices", params={"format": "pdf"})).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_background_export_job_writes_downloadable_file(test_client: AsyncClient, monkeypatch, background_tasks):
+    from sytefy_backend.modules.exports import tasks as export_tasks
+    from sytefy_backend.modules.exports.infrastructure.storage import LocalExportStorage
+    from sytefy_backend.modules.exports.web.router import get_storage
+
+    monkeypatch.setenv("EXPORT_BATCH_SIZE", "2")
+    background_tasks.capture(
+        export_tasks,
+        export_tasks.generate_export,
+        storage_env="EXPORT_STORAGE_DIR",
+        storage_dependency=get_storage,
+        storage=LocalExportStorage(background_tasks.storage_dir),
+    )
+
+    await _login(test_client, "bgexport@example.com", "bgexport")
+    for index in range(5):
+        resp = await test_client.post("/api/customers/", json={"name": f"Müşteri {index}"})
+        assert resp.status_code == 201
+
+    started = await test_client.post("/api/exports/customers/jobs", params={"format": "csv"})
+    assert started.status_code == 202
+    job_id = started.json()["job_id"]
+
+    assert await background_tasks.run() == 1
+    job = (await test_client.get(f"/api/exports/jobs/{job_id}")).json()
+    assert job["status"] == "completed"
+    assert job["size"] > 0
+
+    download = await test_client.get(f"/api/exports/jobs/{job_id}/download")
+    assert download.status_code == 200
+    rows = list(csv.reader(io.StringIO(download.content.decode("utf-8-sig"))))
+    assert [row[1] for row in rows[1:]] == [f"Müşteri {index}" for index in range(5)]
+    assert (await test_client.get(f"/api/exports/jobs/{'0' * 32}")).status_code == 404
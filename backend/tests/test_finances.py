@@ -42,3 +42,435 @@ async def test_invoice_crud_flow(test_client: AsyncClient):
     list_after = await test_client.get("/api/finances/invoices/")
     assert list_after.status_code == 200
     assert list_after.json() == []
+
+
+@pytest.mark.asyncio
+async def test_finance_report_reads_incremental_rollups(test_client: AsyncClient):
+    user_payload = {"email": "report@example.com", "username": "reportuser", "password": "StrongPass123!"}
+    assert (await test_client.post("/api/auth/register", json=user_payload)).status_code == 201
+    login = await test_client.post("/api/auth/login", json={"email": user_payload["email"], "password": user_payload["password"]})
+    assert login.status_code == 200
+    customer = await test_client.post("/api/customers/", json={"name": "Rapor Müşteri"})
+    customer_id = customer.json()["id"]
+
+    now = datetime.now(timezone.utc)
+    last_month = now - timedelta(days=40)
+
+    async def create(amount: float, **extra):
+        body = {"title": "Fatura", "amount": amount, "due_date": (now + timedelta(days=7)).isoformat(), **extra}
+        resp = await test_client.post("/api/finances/invoices/", json=body)
+        assert resp.status_code == 201
+        return resp.json()["id"]
+
+    await create(100.0, status="paid", customer_id=customer_id, number="R-1")
+    sent_id = await create(250.0, status="sent", number="R-2")
+    await create(80.0, currency="USD", number="R-3")
+    await create(
+        40.0,
+        status="sent",
+        number="R-4",
+        issued_at=last_month.isoformat(),
+        due_date=(last_month + timedelta(days=5)).isoformat(),
+    )
+    removed_id = await create(999.0, number="R-5")
+
+    assert (await test_client.put(f"/api/finances/invoices/{sent_id}", json={"amount": 300.0, "status": "paid"})).status_code == 200
+    assert (await test_client.delete(f"/api/finances/invoices/{removed_id}")).status_code == 204
+
+    report = (await test_client.get("/api/finances/reports/")).json()
+    by_status = {(row["status"], row["currency"]): (row["count"], row["amount"]) for row in report["by_status"]}
+    assert by_status == {
+        ("draft", "USD"): (1, 80.0),
+        ("paid", "TRY"): (2, 400.0),
+        ("sent", "TRY"): (1, 40.0),
+    }
+    assert {row["currency"]: row["amount"] for row in report["by_currency"]} == {"TRY": 440.0, "USD": 80.0}
+    months = {(row["month"], row["currency"]): row["count"] for row in report["by_month"]}
+    assert months[(last_month.strftime("%Y-%m"), "TRY")] == 1
+    assert months[(now.strftime("%Y-%m"), "TRY")] == 2
+    customers = {(row["customer_id"], row["currency"]): row["amount"] for row in report["by_customer"]}
+    assert customers[(customer_id, "TRY")] == 100.0
+    assert customers[(None, "TRY")] == 340.0
+    assert report["overdue"] == [
+        {"currency": "TRY", "count": 1, "amount": 40.0, "status": None, "month": None, "customer_id": None}
+    ]
+
+    ranged = (await test_client.get("/api/finances/reports/", params={"date_from": now.date().isoformat()})).json()
+    assert sum(row["count"] for row in ranged["by_currency"]) == 3
+    invalid = await test_client.get(
+        "/api/finances/reports/", params={"date_from": now.date().isoformat(), "date_to": last_month.date().isoformat()}
+    )
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_parallel_invoice_creation_allocates_unique_numbers(tmp_path):
+    import asyncio
+
+    from sqlalchemy import func, select
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from sytefy_backend.core.database.base import Base
+    from sytefy_backend.modules.auth.infrastructure.models import UserModel  # noqa: F401
+    from sytefy_backend.modules.finances.application.use_cases import CreateInvoice
+    from sytefy_backend.modules.finances.infrastructure.models import InvoiceModel
+    from sytefy_backend.modules.finances.infrastructure.numbering import DatabaseSequenceSource, InvoiceNumberAllocator
+    from sytefy_backend.modules.finances.infrastructure.repository import InvoiceRepository
+
+    url = f"sqlite+aiosqlite:///{tmp_path / 'numbers.db'}"
+    engines = [create_async_engine(url, connect_args={"timeout": 30}) for _ in range(2)]
+    async with engines[0].begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    # İki ayrı süreci temsil eden iki motor ve iki bağımsız ayırıcı aynı sayaçları paylaşır.
+    factories = [async_sessionmaker(bind=engine, expire_on_commit=False) for engine in engines]
+    allocators = [
+        InvoiceNumberAllocator(DatabaseSequenceSource(factory), block_size=16, number_format="INV-{user_id}-{seq:06d}")
+        for factory in factories
+    ]
+    due = datetime.now(timezone.utc) + timedelta(days=30)
+
+    async def create(index: int) -> str:
+        worker = index % 2
+        async with factories[worker]() as session:
+            result = await CreateInvoice(InvoiceRepository(session), allocators[worker])(
+                user_id=1 + index % 3,
+                title=f"Fatura {index}",
+                amount=10.0,
+                currency="TRY",
+                due_date=due,
+            )
+        return result.invoice.number
+
+    numbers = await asyncio.gather(*(create(index) for index in range(600)))
+    assert len(set(numbers)) == 600
+    async with factories[0]() as session:
+        assert (await session.execute(select(func.count()).select_from(InvoiceModel))).scalar_one() == 600
+
+    # Yalnızca ayırıcı: binlerce eşzamanlı istek, iki süreç, boşluklar süreç başına en fazla bir blok.
+    issued = datetime.now(timezone.utc)
+    more = await asyncio.gather(
+        *(allocators[index % 2].allocate(user_id=1 + index % 3, issued_at=issued) for index in range(5000))
+    )
+    assert len(set(more) | set(numbers)) == 5600
+    for user_id in (1, 2, 3):
+        prefix = f"INV-{user_id}-"
+        sequences = sorted(int(number.removeprefix(prefix)) for number in numbers + more if number.startswith(prefix))
+        assert sequences[-1] <= len(sequences) + 2 * 16
+    for engine in engines:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_invoice_number_conflict_drops_the_cached_block():
+    from sytefy_backend.core.exceptions import ConflictError
+    from sytefy_backend.modules.finances.application.use_cases import CreateInvoice
+    from sytefy_backend.modules.finances.infrastructure.numbering import InvoiceNumberAllocator
+
+    class StaleSource:
+        # Redis kesintisinden sonra ilk blok zaten kullanılmış bir aralığa düşer.
+        def __init__(self):
+            self.starts = [1, 100]
+
+        async def reserve(self, user_id: int, size: int) -> int:
+            return self.starts.pop(0)
+
+    class TakenNumbersRepo:
+        def __init__(self):
+            self.attempts: list[str] = []
+
+        async def create(self, invoice):
+            self.attempts.append(invoice.number)
+            if int(invoice.number.rsplit("-", 1)[1]) < 100:
+                raise ConflictError("Fatura numarası zaten kullanılıyor.")
+            return invoice
+
+    repo = TakenNumbersRepo()
+    allocator = InvoiceNumberAllocator(StaleSource(), block_size=50, number_format="INV-{user_id}-{seq}")
+    result = await CreateInvoice(repo, allocator)(
+        user_id=4,
+        title="Blok",
+        amount=10.0,
+        currency="TRY",
+        due_date=datetime.now(timezone.utc) + timedelta(days=1),
+    )
+    assert repo.attempts == ["INV-4-1", "INV-4-100"]
+    assert result.invoice.number == "INV-4-100"
+
+
+@pytest.mark.asyncio
+async def test_invoice_pdf_is_cached_by_content_and_served_with_etag_and_range(
+    test_client: AsyncClient, monkeypatch, tmp_path
+):
+    from pathlib import Path
+
+    from sytefy_backend.modules.finances.infrastructure.pdf_renderer import CeleryPdfRenderer, ProcessPoolPdfRenderer
+    from sytefy_backend.modules.finances.infrastructure.pdf_store import LocalInvoicePdfStore
+    from sytefy_backend.modules.finances.web.router import get_pdf_renderer, get_pdf_store
+
+    app = test_client._transport.app  # type: ignore[attr-defined]
+    store = LocalInvoicePdfStore(tmp_path)
+    renderer = ProcessPoolPdfRenderer(max_workers=1)
+    app.dependency_overrides[get_pdf_store] = lambda: store
+    app.dependency_overrides[get_pdf_renderer] = lambda: renderer
+
+    user_payload = {"email": "pdf@example.com", "username": "pdfuser", "password": "StrongPass123!"}
+    assert (await test_client.post("/api/auth/register", json=user_payload)).status_code == 201
+    login = await test_client.post("/api/auth/login", json={"email": user_payload["email"], "password": user_payload["password"]})
+    assert login.status_code == 200
+    created = await test_client.post(
+        "/api/finances/invoices/",
+        json={
+            "title": "Danışmanlık (Şubat)",
+            "amount": 1500.0,
+            "due_date": (datetime.now(timezone.utc) + timedelta(days=7)).isoformat(),
+            "description": "Aylık ücret",
+        },
+    )
+    invoice_id = created.json()["id"]
+
+    try:
+        first = await test_client.get(f"/api/finances/invoices/{invoice_id}/pdf")
+        assert first.status_code == 200
+        assert first.headers["content-type"] == "application/pdf"
+        assert first.content.startswith(b"%PDF-1.4") and first.content.rstrip().endswith(b"%%EOF")
+        etag = first.headers["etag"]
+        assert len(list(tmp_path.rglob("*.pdf"))) == 1
+
+        cached = await test_client.get(f"/api/finances/invoices/{invoice_id}/pdf", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        for validator in (f'"other", W/{etag}', "*"):
+            headers = {"If-None-Match": validator}
+            assert (await test_client.get(f"/api/finances/invoices/{invoice_id}/pdf", headers=headers)).status_code == 304
+
+        partial = await test_client.get(f"/api/finances/invoices/{invoice_id}/pdf", headers={"Range": "bytes=0-7"})
+        assert partial.status_code == 206
+        assert partial.content == b"%PDF-1.4"
+        assert partial.headers["content-range"] == f"bytes 0-7/{len(first.content)}"
+        suffix = await test_client.get(f"/api/finances/invoices/{invoice_id}/pdf", headers={"Range": "bytes=-6"})
+        assert suffix.content == first.content[-6:]
+        beyond = await test_client.get(
+            f"/api/finances/invoices/{invoice_id}/pdf", headers={"Range": f"bytes={len(first.content)}-"}
+        )
+        assert beyond.status_code == 416
+
+        old_path = next(tmp_path.rglob("*.pdf"))
+        assert (await test_client.put(f"/api/finances/invoices/{invoice_id}", json={"amount": 1750.0})).status_code == 200
+        assert not Path(old_path).exists()
+
+        # Celery çizici: eager modda görev önbelleği doldurur, uç nokta aynı istekte sunar.
+        app.dependency_overrides[get_pdf_renderer] = lambda: CeleryPdfRenderer()
+        monkeypatch.setenv("INVOICE_PDF_CACHE_DIR", str(tmp_path))
+        updated = await test_client.get(f"/api/finances/invoices/{invoice_id}/pdf")
+        assert updated.status_code == 200
+        assert updated.headers["etag"] != etag
+        assert b"1750.00" in updated.content
+
+        assert (await test_client.get("/api/finances/invoices/9999/pdf")).status_code == 404
+        assert list(tmp_path.rglob("*.pdf"))
+        assert (await test_client.delete(f"/api/finances/invoices/{invoice_id}")).status_code == 204
+        assert not list(tmp_path.rglob("*.pdf"))
+    finally:
+        renderer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_overdue_scan_marks_invoices_in_keyset_batches_and_notifies_owners_once_per_batch():
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from sytefy_backend.core.database.base import Base
+    from sytefy_backend.modules.auth.infrastructure.models import UserModel  # noqa: F401
+    from sytefy_backend.modules.finances.application.use_cases import MarkOverdueInvoices
+    from sytefy_backend.modules.finances.domain.entities import Invoice
+    from sytefy_backend.modules.finances.infrastructure.models import InvoiceModel
+    from sytefy_backend.modules.finances.infrastructure.overdue_notifier import NotificationOverdueNotifier
+    from sytefy_backend.modules.finances.infrastructure.repository import InvoiceRepository
+    from sytefy_backend.modules.finances.infrastructure.rollups import InvoiceReportRepository
+    from sytefy_backend.modules.notifications.application.use_cases import NotificationDispatcher
+    from sytefy_backend.modules.notifications.infrastructure.models import NotificationModel
+    from sytefy_backend.modules.notifications.infrastructure.repository import NotificationRepository
+
+    class RecordingDispatcher(NotificationDispatcher):
+        def __init__(self):
+            self.batches: list[list[int]] = []
+
+        def dispatch_many(self, notifications):
+            self.batches.append([item.user_id for item in notifications])
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    now = datetime.now(timezone.utc)
+    specs = [
+        (1, "sent", -5),
+        (2, "sent", -4),
+        (1, "sent", -3),
+        (1, "sent", -2),
+        (2, "sent", -1),
+        (1, "sent", 3),
+        (1, "paid", -6),
+        (2, "draft", -6),
+    ]
+    async with session_factory() as session:
+        repo = InvoiceRepository(session)
+        for index, (user_id, status, days) in enumerate(specs):
+            await repo.create(
+                Invoice(
+                    id=None,
+                    user_id=user_id,
+                    customer_id=None,
+                    number=f"INV-{index}",
+                    title=f"Fatura {index}",
+                    description=None,
+                    amount=100.0,
+                    currency="TRY",
+                    status=status,
+                    due_date=now + timedelta(days=days),
+                    issued_at=now - timedelta(days=10),
+                )
+            )
+
+        dispatcher = RecordingDispatcher()
+        notifier = NotificationOverdueNotifier(NotificationRepository(session), dispatcher)
+        result = await MarkOverdueInvoices(repo, notifier)(now=now, batch_size=2, max_batches=10)
+        assert (result.scanned, result.updated, result.batches) == (5, 5, 3)
+        # Her parçada sahip başına tek bildirim, parça başına tek gruplu teslimat görevi.
+        assert dispatcher.batches == [[1, 2], [1], [2]]
+        assert result.notified_users == 4
+
+        statuses = dict((await session.execute(select(InvoiceModel.number, InvoiceModel.status))).all())
+        assert [statuses[f"INV-{index}"] for index in range(8)] == ["overdue"] * 5 + ["sent", "paid", "draft"]
+        bodies = (await session.execute(select(NotificationModel.body).order_by(NotificationModel.id))).scalars().all()
+        assert bodies[0] == "1 faturanın vadesi geçti: INV-0"
+
+        report = await InvoiceReportRepository(session).summarize(user_id=1, today=now.date())
+        assert {item.status: item.count for item in report.by_status} == {"overdue": 3, "sent": 1, "paid": 1}
+        assert [(item.count, item.amount) for item in report.overdue] == [(3, 300.0)]
+
+        again = await MarkOverdueInvoices(repo, notifier)(now=now, batch_size=2, max_batches=10)
+        assert (again.scanned, again.updated) == (0, 0)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_mark_overdue_moves_rollups_from_returned_rows_not_the_scanned_snapshot():
+    from dataclasses import replace
+
+    from sqlalchemy import update
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from sytefy_backend.core.database.base import Base
+    from sytefy_backend.modules.auth.infrastructure.models import UserModel  # noqa: F401
+    from sytefy_backend.modules.finances.domain.entities import Invoice
+    from sytefy_backend.modules.finances.infrastructure.models import InvoiceModel
+    from sytefy_backend.modules.finances.infrastructure.repository import InvoiceRepository
+    from sytefy_backend.modules.finances.infrastructure.rollups import InvoiceReportRepository
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    now = datetime.now(timezone.utc)
+    async with session_factory() as session:
+        repo = InvoiceRepository(session)
+        created = await repo.create(
+            Invoice(
+                id=None,
+                user_id=1,
+                customer_id=None,
+                number="INV-STALE",
+                title="Fatura",
+                description=None,
+                amount=100.0,
+                currency="TRY",
+                status="sent",
+                due_date=now - timedelta(days=2),
+                issued_at=now - timedelta(days=10),
+            )
+        )
+        # Tarama ile UPDATE arasında tutar değişir; özet güncel tutarla taşınmalıdır.
+        await session.execute(update(InvoiceModel).where(InvoiceModel.id == created.id).values(amount=250))
+        await session.commit()
+
+        updated = await repo.mark_overdue([replace(created, amount=100.0)], now=now)
+        assert [(item.number, item.status, item.amount) for item in updated] == [("INV-STALE", "overdue", 250.0)]
+
+        report = await InvoiceReportRepository(session).summarize(user_id=1, today=now.date())
+        assert {item.status: (item.count, item.amount) for item in report.by_status} == {"overdue": (1, 250.0)}
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_fx_rates_upload_and_converted_totals_are_memoized_per_version(test_client: AsyncClient, monkeypatch):
+    import importlib
+
+    from sytefy_backend.modules.finances.infrastructure.fx_rates import FxRateCache
+    from sytefy_backend.modules.finances.web import router as finances_router
+
+    cache = FxRateCache(ttl_seconds=3600)
+    test_client._transport.app.dependency_overrides[finances_router.get_fx_cache] = lambda: cache  # type: ignore[attr-defined]
+    user_payload = {"email": "fx@example.com", "username": "fxuser", "password": "StrongPass123!"}
+    assert (await test_client.post("/api/auth/register", json=user_payload)).status_code == 201
+    login = await test_client.post("/api/auth/login", json={"email": user_payload["email"], "password": user_payload["password"]})
+    assert login.status_code == 200
+
+    missing = await test_client.get("/api/finances/invoices/totals", params={"currency": "EUR"})
+    assert missing.status_code == 400
+
+    csv_body = "currency,rate\nUSD,30\nEUR,33\n"
+    # Kur tablosu kiracılar arası ortak olduğundan "owner" rolü yazmaya yetmez.
+    forbidden = await test_client.put("/api/finances/fx-rates/", content=csv_body, headers={"Content-Type": "text/csv"})
+    assert forbidden.status_code == 403
+    auth_router = importlib.import_module("sytefy_backend.modules.auth.web.router")
+    monkeypatch.setattr(auth_router.settings, "platform_admin_emails_raw", "fx@example.com")
+    uploaded = await test_client.put("/api/finances/fx-rates/", content=csv_body, headers={"Content-Type": "text/csv"})
+    assert uploaded.status_code == 200
+    assert uploaded.json()["version"] == 1
+    assert uploaded.json()["rates"] == {"EUR": 33.0, "TRY": 1.0, "USD": 30.0}
+    invalid = await test_client.put("/api/finances/fx-rates/", content="USD,-1\n")
+    assert invalid.status_code == 400
+
+    due = (datetime.now(timezone.utc) + timedelta(days=7)).isoformat()
+    for index, (amount, currency, status) in enumerate(
+        [(330.0, "TRY", "sent"), (10.0, "USD", "sent"), (20.0, "EUR", "paid"), (5.0, "GBP", "sent")]
+    ):
+        body = {"title": "Fatura", "amount": amount, "currency": currency, "status": status, "due_date": due}
+        assert (await test_client.post("/api/finances/invoices/", json={**body, "number": f"FX-{index}"})).status_code == 201
+
+    totals = (await test_client.get("/api/finances/invoices/totals", params={"currency": "eur"})).json()
+    assert {row["currency"]: row["amount"] for row in totals["by_currency"]} == {
+        "EUR": 20.0,
+        "GBP": 5.0,
+        "TRY": 330.0,
+        "USD": 10.0,
+    }
+    # 330 TRY = 10 EUR, 10 USD = 300 TRY ≈ 9.09 EUR; GBP kur tablosunda yok.
+    assert totals["converted"] == {
+        "currency": "EUR",
+        "count": 3,
+        "amount": 39.09,
+        "rate_version": 1,
+        "missing_currencies": ["GBP"],
+    }
+    sent = (await test_client.get("/api/finances/invoices/totals", params={"currency": "TRY", "status_filter": "sent"})).json()
+    assert sent["converted"]["amount"] == 630.0
+
+    table = await cache.current(None)  # type: ignore[arg-type]
+    first = cache.factors(table, ["TRY", "USD", "EUR", "GBP"], "EUR")
+    assert cache.factors(table, ["GBP", "EUR", "USD", "TRY"], "EUR") is first
+
+    json_body = '{"base": "TRY", "rates": {"USD": 31, "EUR": 33, "GBP": 40}}'
+    assert (await test_client.put("/api/finances/fx-rates/", content=json_body)).json()["version"] == 2
+    report = (await test_client.get("/api/finances/reports/", params={"currency": "TRY"})).json()
+    assert report["converted_total"] == {
+        "currency": "TRY",
+        "count": 4,
+        "amount": 330.0 + 310.0 + 660.0 + 200.0,
+        "rate_version": 2,
+        "missing_currencies": [],
+    }
+    assert report["converted_overdue"]["amount"] == 0.0
+    assert (await test_client.get("/api/finances/fx-rates/")).json()["version"] == 2
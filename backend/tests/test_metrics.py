@@ -12,3 +12,51 @@ async def test_metrics_endpoint_reports_requests(test_client: AsyncClient):
     body = metrics_resp.text
     assert "sytefy_requests_total" in body
     assert 'path="/api/health"' in body
+
+
+def test_queue_depth_and_pending_reminder_collectors():
+    from datetime import datetime, timezone
+
+    from fakeredis import FakeRedis
+    from prometheus_client import CollectorRegistry
+
+    from sytefy_backend.core.observability.queue_metrics import PendingReminderCollector, QueueDepthCollector
+    from sytefy_backend.modules.appointments.infrastructure.pending_reminders import RedisPendingReminderTracker
+
+    redis = FakeRedis()
+    redis.rpush("reminders", "a", "b")
+    redis.rpush("reminders:3", "c")
+    redis.rpush("bulk:9", "d")
+    tracker = RedisPendingReminderTracker(redis, clock=lambda: 1_000_000.0)
+    tracker.add("overdue", datetime.fromtimestamp(1_000_000.0 - 90, tz=timezone.utc))
+    tracker.add("future", datetime.fromtimestamp(1_000_000.0 + 600, tz=timezone.utc))
+    tracker.add("revoked", datetime.fromtimestamp(1_000_000.0 - 300, tz=timezone.utc))
+    tracker.remove("revoked")
+
+    registry = CollectorRegistry()
+    registry.register(QueueDepthCollector(redis, ["reminders", "bulk"], priority_steps=range(10)))
+    registry.register(PendingReminderCollector(tracker.snapshot))
+
+    assert registry.get_sample_value("sytefy_celery_queue_depth", {"queue": "reminders"}) == 3
+    assert registry.get_sample_value("sytefy_celery_queue_depth", {"queue": "bulk"}) == 1
+    assert registry.get_sample_value("sytefy_reminders_pending", {"state": "overdue"}) == 1
+    assert registry.get_sample_value("sytefy_reminders_pending", {"state": "scheduled"}) == 1
+    assert registry.get_sample_value("sytefy_reminder_oldest_overdue_seconds") == 90
+
+
+def test_in_memory_pending_tracker_is_only_used_when_tasks_run_in_process(monkeypatch):
+    from sytefy_backend.config.settings import Settings
+    from sytefy_backend.modules.appointments.infrastructure import pending_reminders
+
+    monkeypatch.setattr(pending_reminders, "_tracker", None)
+    assert pending_reminders.get_pending_reminder_tracker(Settings(celery_task_always_eager=False)) is None
+    tracker = pending_reminders.get_pending_reminder_tracker(Settings(celery_task_always_eager=True))
+    assert isinstance(tracker, pending_reminders.InMemoryPendingReminderTracker)
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_exposes_reminder_punctuality(test_client: AsyncClient):
+    metrics_resp = await test_client.get("/metrics")
+    body = metrics_resp.text
+    assert "sytefy_reminder_dispatch_lag_seconds" in body
+    assert "sytefy_reminder_oldest_overdue_seconds" in body
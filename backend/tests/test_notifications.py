@@ -30,3 +30,383 @@ async def test_notification_flow(test_client: AsyncClient):
     mark_resp = await test_client.post(f"/api/notifications/{notification_id}/read")
     assert mark_resp.status_code == 200
     assert mark_resp.json()["status"] == "read"
+
+
+@pytest.mark.asyncio
+async def test_notification_stream_resumes_from_last_event_id(test_client: AsyncClient):
+    from sytefy_backend.modules.notifications.infrastructure.stream import InMemoryNotificationHub
+    from sytefy_backend.modules.notifications.web import router as notifications_router
+
+    class OneShotHub(InMemoryNotificationHub):
+        async def subscribe(self, user_id: int):
+            subscription = await super().subscribe(user_id)
+            subscription.close()
+            return subscription
+
+    app = test_client._transport.app  # type: ignore[attr-defined]
+    app.dependency_overrides[notifications_router.get_hub] = OneShotHub
+
+    payload = {"email": "stream@example.com", "username": "streamuser", "password": "StrongPass123!"}
+    assert (await test_client.post("/api/auth/register", json=payload)).status_code == 201
+    login = await test_client.post("/api/auth/login", json={"email": payload["email"], "password": payload["password"]})
+    assert login.status_code == 200
+
+    ids = []
+    for title in ("Bir", "İki", "Üç"):
+        created = await test_client.post(
+            "/api/notifications/",
+            json={"user_id": 1, "title": title, "body": "Gövde", "channel": "log"},
+        )
+        ids.append(created.json()["id"])
+
+    resp = await test_client.get("/api/notifications/stream", headers={"Last-Event-ID": str(ids[0])})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert f"id: {ids[1]}\n" in resp.text
+    assert f"id: {ids[2]}\n" in resp.text
+    assert f"id: {ids[0]}\n" not in resp.text
+
+    bad = await test_client.get("/api/notifications/stream", headers={"Last-Event-ID": "abc"})
+    assert bad.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_notification_stream_pushes_live_events_with_heartbeat_and_overflow(monkeypatch):
+    from sytefy_backend.modules.notifications.domain.entities import Notification
+    from sytefy_backend.modules.notifications.infrastructure.stream import InMemoryNotificationHub
+    from sytefy_backend.modules.notifications.web import router as notifications_router
+
+    monkeypatch.setattr(notifications_router.settings, "notification_stream_heartbeat_seconds", 0.01)
+
+    class FakeRequest:
+        async def is_disconnected(self) -> bool:
+            return False
+
+    def notification(notification_id: int) -> Notification:
+        return Notification(
+            id=notification_id,
+            user_id=7,
+            title=f"N{notification_id}",
+            body="",
+            channel="log",
+            status="sent",
+            read_at=None,
+            created_at=None,
+        )
+
+    hub = InMemoryNotificationHub(max_buffer=2)
+    subscription = await hub.subscribe(7)
+    stream = notifications_router._event_stream(FakeRequest(), hub, subscription, [], last_event_id=None)
+
+    assert (await anext(stream)).startswith("retry:")
+    assert await anext(stream) == ": heartbeat\n\n"
+    await hub.publish(notification(1))
+    await hub.publish(notification(2))
+    assert (await anext(stream)).startswith("id: 1\n")
+    assert (await anext(stream)).startswith("id: 2\n")
+
+    for notification_id in (3, 4, 5):
+        await hub.publish(notification(notification_id))
+    chunks = [chunk async for chunk in stream]
+    assert [chunk.split("\n", 1)[0] for chunk in chunks[:2]] == ["id: 3", "id: 4"]
+    assert chunks[-1].startswith("event: overflow")
+    assert subscription.overflowed
+    assert not hub._subscribers
+
+
+@pytest.mark.asyncio
+async def test_unread_count_and_bulk_mark_read(test_client: AsyncClient, monkeypatch):
+    from sytefy_backend.modules.notifications.infrastructure import unread_counter
+
+    monkeypatch.setattr(unread_counter, "_counter", None)
+
+    payload = {"email": "unread@example.com", "username": "unreaduser", "password": "StrongPass123!"}
+    assert (await test_client.post("/api/auth/register", json=payload)).status_code == 201
+    login = await test_client.post("/api/auth/login", json={"email": payload["email"], "password": payload["password"]})
+    assert login.status_code == 200
+
+    ids = []
+    for index in range(4):
+        created = await test_client.post(
+            "/api/notifications/",
+            json={"user_id": 1, "title": f"Bildirim {index}", "body": "Gövde", "channel": "log"},
+        )
+        ids.append(created.json()["id"])
+
+    count = await test_client.get("/api/notifications/unread-count")
+    assert count.status_code == 200
+    assert count.json() == {"unread": 4}
+
+    await test_client.post(
+        "/api/notifications/",
+        json={"user_id": 1, "title": "Yeni", "body": "Gövde", "channel": "log"},
+    )
+    assert (await test_client.get("/api/notifications/unread-count")).json() == {"unread": 5}
+
+    single = await test_client.post(f"/api/notifications/{ids[0]}/read")
+    assert single.status_code == 200
+    assert single.json()["status"] == "read"
+    assert (await test_client.post(f"/api/notifications/{ids[0]}/read")).status_code == 200
+    assert (await test_client.get("/api/notifications/unread-count")).json() == {"unread": 4}
+
+    bulk = await test_client.post("/api/notifications/mark-read", json={"ids": [ids[0], ids[1], ids[2], 9999]})
+    assert bulk.json() == {"updated": 2, "unread": 2}
+
+    everything = await test_client.post("/api/notifications/mark-all-read")
+    assert everything.json() == {"updated": 2, "unread": 0}
+
+    missing = await test_client.post("/api/notifications/9999/read")
+    assert missing.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_redis_unread_counter_only_adjusts_initialized_counters(monkeypatch):
+    from fakeredis import FakeAsyncRedis
+
+    from sytefy_backend.config.settings import Settings
+    from sytefy_backend.modules.notifications.infrastructure import unread_counter
+
+    monkeypatch.setattr(unread_counter, "_counter", None)
+    with pytest.raises(RuntimeError):
+        unread_counter.get_unread_counter(Settings(celery_task_always_eager=False))
+
+    redis = FakeAsyncRedis(decode_responses=True)
+    counter = unread_counter.RedisUnreadCounter(lambda: redis, ttl_seconds=60)
+    await counter.adjust(1, 1)
+    assert await counter.get(1) is None
+    await counter.initialize(1, 2)
+    await counter.initialize(1, 7)
+    await counter.adjust(1, 3)
+    assert await counter.get(1) == 5
+    assert 0 < await redis.ttl("notifications:unread:1") <= 60
+    # Eksiye düşen sayaç geçersiz kılınır; sıradaki okuma COUNT ile yeniden başlatır.
+    await counter.adjust(1, -9)
+    assert await counter.get(1) is None
+
+
+@pytest.mark.asyncio
+async def test_redis_publisher_uses_async_client_and_memory_stream_requires_eager(monkeypatch):
+    from fakeredis import FakeAsyncRedis
+
+    from sytefy_backend.config.settings import Settings
+    from sytefy_backend.modules.notifications.domain.entities import Notification
+    from sytefy_backend.modules.notifications.infrastructure import stream
+
+    monkeypatch.setattr(stream, "_publisher", None)
+    with pytest.raises(RuntimeError):
+        stream.get_notification_publisher(
+            Settings(notification_stream_backend="memory", celery_task_always_eager=False)
+        )
+
+    redis = FakeAsyncRedis(decode_responses=True)
+    pubsub = redis.pubsub()
+    await pubsub.subscribe("notifications:user:7")
+    await pubsub.get_message(timeout=1)
+    publisher = stream.RedisNotificationPublisher(lambda: redis)
+    await publisher.publish(
+        Notification(
+            id=1, user_id=7, title="N1", body="", channel="log", status="sent", read_at=None, created_at=None
+        )
+    )
+    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1)
+    assert message is not None and '"id": 1' in message["data"]
+    await pubsub.aclose()
+
+
+@pytest.mark.asyncio
+async def test_admin_broadcast_inserts_in_chunks_and_reports_progress(
+    test_client: AsyncClient, monkeypatch, background_tasks
+):
+    import importlib
+
+    from sytefy_backend.config.settings import Settings
+    from sytefy_backend.modules.notifications import tasks as notification_tasks
+    from sytefy_backend.modules.notifications.infrastructure import broadcast_jobs, unread_counter
+
+    monkeypatch.setattr(broadcast_jobs, "_store", None)
+    monkeypatch.setattr(unread_counter, "_counter", None)
+    monkeypatch.setenv("NOTIFICATION_BROADCAST_CHUNK_SIZE", "2")
+    with pytest.raises(RuntimeError):
+        broadcast_jobs.get_broadcast_job_store(Settings(celery_task_always_eager=False))
+    background_tasks.capture(notification_tasks, notification_tasks.broadcast_notifications)
+    delivered: list[dict] = []
+    monkeypatch.setattr(notification_tasks.deliver_notifications, "delay", lambda **kwargs: delivered.append(kwargs))
+
+    for index in range(3):
+        payload = {"email": f"bcast{index}@example.com", "username": f"bcast{index}", "password": "StrongPass123!"}
+        assert (await test_client.post("/api/auth/register", json=payload)).status_code == 201
+    login = await test_client.post("/api/auth/login", json={"email": "bcast0@example.com", "password": "StrongPass123!"})
+    assert login.status_code == 200
+
+    # Kendi kaydolan her kullanıcı "owner" olduğundan yayın yalnızca platform yöneticilerine açıktır.
+    forbidden = await test_client.post(
+        "/api/notifications/broadcast",
+        json={"title": "Duyuru", "body": "Bakım", "role": "owner"},
+    )
+    assert forbidden.status_code == 403
+    assert (await test_client.get("/api/notifications/broadcast/missing")).status_code == 403
+    auth_router = importlib.import_module("sytefy_backend.modules.auth.web.router")
+    monkeypatch.setattr(auth_router.settings, "platform_admin_emails_raw", "BCAST0@example.com")
+
+    invalid = await test_client.post(
+        "/api/notifications/broadcast",
+        json={"title": "Duyuru", "body": "Bakım", "role": "owner", "user_ids": [1]},
+    )
+    assert invalid.status_code == 400
+
+    started = await test_client.post(
+        "/api/notifications/broadcast",
+        json={"title": "Duyuru", "body": "Bakım çalışması", "role": "owner"},
+    )
+    assert started.status_code == 202
+    job_id = started.json()["job_id"]
+
+    assert await background_tasks.run() == 1
+    job = (await test_client.get(f"/api/notifications/broadcast/{job_id}")).json()
+    assert job["status"] == "completed"
+    assert job["created"] == 3
+    assert job["chunks"] == 2
+    assert [len(call["recipients"]) for call in delivered] == [2, 1]
+
+    items = (await test_client.get("/api/notifications/")).json()
+    assert [item["title"] for item in items] == ["Duyuru"]
+    assert (await test_client.get("/api/notifications/unread-count")).json() == {"unread": 1}
+    assert (await test_client.get("/api/notifications/broadcast/missing")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_purge_expired_notifications_deletes_in_bounded_batches():
+    from datetime import datetime, timedelta, timezone
+
+    from sqlalchemy import func, select
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from sytefy_backend.core.database.base import Base
+    from sytefy_backend.modules.auth.infrastructure.models import UserModel  # noqa: F401
+    from sytefy_backend.modules.notifications.application.use_cases import PurgeExpiredNotifications
+    from sytefy_backend.modules.notifications.infrastructure.models import NotificationModel
+    from sytefy_backend.modules.notifications.infrastructure.repository import NotificationRepository
+    from sytefy_backend.modules.notifications.infrastructure.unread_counter import InMemoryUnreadCounter
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    now = datetime.now(timezone.utc)
+    async with session_factory() as session:
+        session.add_all(
+            [
+                NotificationModel(
+                    user_id=1,
+                    title=f"Eski {index}",
+                    body="",
+                    channel="log",
+                    status="read" if index % 2 else "sent",
+                    created_at=now - timedelta(days=400 + index),
+                )
+                for index in range(5)
+            ]
+            + [NotificationModel(user_id=1, title="Yeni", body="", channel="log", status="sent", created_at=now)]
+        )
+        await session.commit()
+
+        repo = NotificationRepository(session)
+        counter = InMemoryUnreadCounter()
+        await counter.initialize(1, await repo.count_unread(user_id=1))
+        assert await counter.get(1) == 4
+
+        purge = PurgeExpiredNotifications(repo, counter=counter)
+        deleted = await purge(cutoff=now - timedelta(days=180), batch_size=2, max_batches=2)
+        assert deleted == 4
+        # Silinen okunmamış bildirimler her parçadan sonra rozetten düşülür.
+        assert await counter.get(1) == await repo.count_unread(user_id=1)
+        deleted = await purge(cutoff=now - timedelta(days=180), batch_size=2, max_batches=10)
+        assert deleted == 1
+        assert await counter.get(1) == await repo.count_unread(user_id=1) == 1
+        remaining = (await session.execute(select(func.count()).select_from(NotificationModel))).scalar_one()
+        assert remaining == 1
+    await engine.dispose()
+
+
+def test_notification_partition_rotation_plan():
+    from datetime import date, datetime, timezone
+
+    from sytefy_backend.modules.notifications.infrastructure import partitions
+
+    months = partitions.months_to_create(datetime(2024, 11, 15, tzinfo=timezone.utc), 2)
+    assert [partitions.partition_name(month) for month in months] == [
+        "notifications_p202411",
+        "notifications_p202412",
+        "notifications_p202501",
+    ]
+    assert "FROM ('2024-12-01') TO ('2025-01-01')" in partitions.create_partition_sql(date(2024, 12, 1))
+
+    existing = ["notifications_p202404", "notifications_p202405", "notifications_p202406", partitions.DEFAULT_PARTITION]
+    cutoff = datetime(2024, 6, 20, tzinfo=timezone.utc)
+    assert partitions.expired_partitions(existing, cutoff) == ["notifications_p202404", "notifications_p202405"]
+
+
+@pytest.mark.asyncio
+async def test_partition_maintenance_moves_default_rows_into_new_months():
+    from datetime import date, datetime, timezone
+    from types import SimpleNamespace
+
+    from sytefy_backend.modules.notifications.infrastructure import partitions
+
+    class FakeResult:
+        def __init__(self, value):
+            self._value = value
+
+        def scalar(self):
+            return self._value
+
+        def scalars(self):
+            return SimpleNamespace(all=lambda: self._value)
+
+    class FakeSession:
+        bind = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
+        def __init__(self, default_has_rows: bool):
+            self.default_has_rows = default_has_rows
+            self.statements: list[str] = []
+            self.commits = 0
+
+        async def execute(self, statement):
+            sql = str(statement)
+            if sql == partitions.IS_PARTITIONED_SQL:
+                return FakeResult(True)
+            if sql == partitions.LIST_PARTITIONS_SQL:
+                return FakeResult(["notifications_p202411", partitions.DEFAULT_PARTITION])
+            if sql.startswith("SELECT EXISTS"):
+                assert "created_at >= '2024-12-01' AND created_at < '2025-02-01'" in sql
+                return FakeResult(self.default_has_rows)
+            self.statements.append(sql)
+            return FakeResult(None)
+
+        async def commit(self):
+            self.commits += 1
+
+    # Bakım Aralık'ı kaçırdı: Aralık satırları varsayılan bölümde.
+    late = FakeSession(default_has_rows=True)
+    result = await partitions.NotificationPartitionManager(late).maintain(
+        now=datetime(2024, 12, 3, tzinfo=timezone.utc), months_ahead=1, cutoff=None
+    )
+    assert result.created == ["notifications_p202412", "notifications_p202501"]
+    assert late.statements[0] == "ALTER TABLE notifications DETACH PARTITION notifications_pdefault"
+    assert late.statements[1:3] == [
+        partitions.create_partition_sql(date(2024, 12, 1)),
+        partitions.create_partition_sql(date(2025, 1, 1)),
+    ]
+    assert late.statements[3].startswith("WITH moved AS (DELETE FROM notifications_pdefault")
+    assert late.statements[4] == "ALTER TABLE notifications ATTACH PARTITION notifications_pdefault DEFAULT"
+    assert late.commits == 1
+
+    on_time = FakeSession(default_has_rows=False)
+    await partitions.NotificationPartitionManager(on_time).maintain(
+        now=datetime(2024, 12, 3, tzinfo=timezone.utc), months_ahead=1, cutoff=None
+    )
+    assert [sql.split(" PARTITION OF")[0] for sql in on_time.statements] == [
+        "CREATE TABLE IF NOT EXISTS notifications_p202412",
+        "CREATE TABLE IF NOT EXISTS notifications_p202501",
+    ]
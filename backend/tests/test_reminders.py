@@ -2,6 +2,7 @@ from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
 import httpx
+import pytest
 from prometheus_client import REGISTRY
 
 from sytefy_backend.core.observability import celery_metrics
@@ -10,7 +11,7 @@ from sytefy_backend.modules.appointments import tasks as reminder_tasks
 from sytefy_backend.modules.appointments.application.reminders import ReminderScheduled, ScheduleAppointmentReminder
 from sytefy_backend.modules.appointments.infrastructure.reminder_queue import CeleryReminderTaskClient
 from sytefy_backend.modules.appointments.tasks import send_appointment_reminder
-from sytefy_backend.modules.notifications.infrastructure import channels
+from sytefy_backend.modules.notifications.infrastructure import channels, providers
 
 
 def test_schedule_appointment_reminder_executes_task_eagerly():
@@ -36,6 +37,20 @@ def test_schedule_reminder_clamps_past_times():
     assert result.remind_at >= now - timedelta(seconds=1)
 
 
+def test_reminder_tasks_are_routed_to_dedicated_queues():
+    router = celery_app.amqp.router
+
+    reminder_route = router.route({}, "appointments.send_reminder")
+    bulk_route = router.route({}, "bulk.notifications.broadcast")
+
+    assert reminder_route["queue"].name == "reminders"
+    assert reminder_route["priority"] == 0
+    assert bulk_route["queue"].name == "bulk"
+    assert router.route({}, "notifications.retry_delivery")["queue"].name == "notifications"
+    assert send_appointment_reminder.acks_late is True
+    assert celery_app.conf.task_ignore_result is True
+
+
 def test_send_appointment_reminder_delivers_channels(monkeypatch):
     monkeypatch.setenv("NOTIFICATION_SMS_ENABLED", "true")
     monkeypatch.setenv("NOTIFICATION_SMS_ACCOUNT_SID", "AC123")
@@ -79,13 +94,15 @@ def test_send_appointment_reminder_delivers_channels(monkeypatch):
 
     monkeypatch.setattr(channels, "smtplib", SimpleNamespace(SMTP=DummySMTP, SMTP_SSL=DummySMTP))
 
-    def fake_post(url, data, auth=None, timeout=None):
-        fake_post.called = True
-        request = httpx.Request("POST", url)
-        return httpx.Response(201, json={"sid": "SM123"}, request=request)
+    sms_requests: list[httpx.Request] = []
+
+    def twilio_handler(request: httpx.Request) -> httpx.Response:
+        sms_requests.append(request)
+        return httpx.Response(201, json={"sid": "SM123"})
 
-    fake_post.called = False
-    monkeypatch.setattr(channels, "httpx", SimpleNamespace(post=fake_post))
+    mock_client = httpx.Client(transport=httpx.MockTransport(twilio_handler))
+    providers.reset_provider_clients()
+    monkeypatch.setattr(providers, "get_sms_http_client", lambda config: mock_client)
 
     recorded_notifications: list[dict] = []
 
@@ -114,6 +131,9 @@ def test_send_appointment_reminder_delivers_channels(monkeypatch):
         "sytefy_reminder_tasks_total",
         {"status": "started"},
     )
+    lag_before = metric_value("sytefy_reminder_dispatch_lag_seconds_count", {})
+    delivery_before = metric_value("sytefy_reminder_delivery_seconds_count", {"channel": "sms"})
+    send_duration_before = metric_value("sytefy_reminder_channel_send_duration_seconds_count", {"channel": "email"})
 
     task_ctx = SimpleNamespace(request=SimpleNamespace(id="test-task"))
     raw_task = send_appointment_reminder.__wrapped__
@@ -133,7 +153,8 @@ def test_send_appointment_reminder_delivers_channels(monkeypatch):
     delivered = set(result["delivered"])
     assert {"email", "sms", "log"}.issubset(delivered)
     assert DummySMTP.sent_messages, "email should be sent via SMTP backend"
-    assert fake_post.called is True
+    assert len(sms_requests) == 1
+    assert sms_requests[0].url.path == "/2010-04-01/Accounts/AC123/Messages.json"
     assert {item["channel"] for item in recorded_notifications} == {"email", "sms"}
     assert all(item["status"] == "sent" for item in recorded_notifications)
     assert metric_value(
@@ -152,3 +173,294 @@ def test_send_appointment_reminder_delivers_channels(monkeypatch):
         "sytefy_reminder_tasks_total",
         {"status": "started"},
     ) == task_start_before + 1
+    assert metric_value("sytefy_reminder_dispatch_lag_seconds_count", {}) == lag_before + 1
+    assert metric_value("sytefy_reminder_delivery_seconds_count", {"channel": "sms"}) == delivery_before + 1
+    assert (
+        metric_value("sytefy_reminder_channel_send_duration_seconds_count", {"channel": "email"})
+        == send_duration_before + 1
+    )
+    providers.reset_provider_clients()
+
+
+def test_twilio_backend_reuses_pooled_client_and_records_latency():
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(201, json={"sid": f"SM{len(calls)}"})
+
+    labels = {"provider": "twilio", "outcome": "success"}
+    before = REGISTRY.get_sample_value("sytefy_notification_provider_duration_seconds_count", labels) or 0.0
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        backend = channels.TwilioSMSBackend(
+            account_sid="AC1",
+            auth_token="token",
+            from_number="+18885550100",
+            base_url="https://api.test.twilio.com/",
+            client=client,
+        )
+        assert backend.send(to="+15555550123", body="Merhaba") == {"sid": "SM1"}
+        assert backend.send(to="+15555550124", body="Merhaba") == {"sid": "SM2"}
+
+    assert [req.url.host for req in calls] == ["api.test.twilio.com", "api.test.twilio.com"]
+    assert b"To=%2B15555550124" in calls[1].content
+    after = REGISTRY.get_sample_value("sytefy_notification_provider_duration_seconds_count", labels)
+    assert after == before + 2
+
+
+@pytest.mark.asyncio
+async def test_twilio_backend_async_send_and_error_outcome():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if b"fail" in request.content:
+            return httpx.Response(429, json={"message": "Too Many Requests"})
+        return httpx.Response(201, json={"sid": "SMasync"})
+
+    error_labels = {"provider": "twilio", "outcome": "error"}
+    errors_before = REGISTRY.get_sample_value("sytefy_notification_provider_duration_seconds_count", error_labels) or 0.0
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as async_client:
+        backend = channels.TwilioSMSBackend(
+            account_sid="AC1",
+            auth_token="token",
+            from_number="+18885550100",
+            async_client=async_client,
+        )
+        service = channels.SMSNotificationService(sender="Sytefy", enabled=True, backend=backend)
+        assert await backend.send_async(to="+15555550123", body="Merhaba") == {"sid": "SMasync"}
+        assert await service.send_async(recipient="+15555550123", body="fail") is False
+
+    errors_after = REGISTRY.get_sample_value("sytefy_notification_provider_duration_seconds_count", error_labels)
+    assert errors_after == errors_before + 1
+
+
+def test_sms_http_client_is_pooled_per_config_with_http2():
+    providers.reset_provider_clients()
+    config = providers.HTTPPoolConfig(timeout=1.0)
+    client = providers.get_sms_http_client(config)
+    assert providers.get_sms_http_client(config) is client
+    assert client._transport._pool._http2 is True
+    providers.reset_provider_clients()
+    assert client.is_closed
+
+
+def test_batched_reminders_share_smtp_session_and_retry_individually(monkeypatch):
+    from smtplib import SMTPRecipientsRefused
+
+    from sytefy_backend.config.settings import Settings
+    from sytefy_backend.modules.notifications import tasks as notification_tasks
+    from sytefy_backend.modules.notifications.infrastructure import delivery_buffer
+
+    monkeypatch.setenv("NOTIFICATION_BATCH_ENABLED", "true")
+    monkeypatch.setenv("NOTIFICATION_BATCH_SIZE", "3")
+    monkeypatch.setenv("REMINDER_MAX_RETRIES", "1")
+    monkeypatch.setenv("NOTIFICATION_EMAIL_HOST", "smtp.batch.test")
+    monkeypatch.setenv("NOTIFICATION_SMS_ENABLED", "true")
+    monkeypatch.setenv("NOTIFICATION_SMS_ACCOUNT_SID", "ACbatch")
+    monkeypatch.setenv("NOTIFICATION_SMS_AUTH_TOKEN", "token")
+    monkeypatch.setenv("NOTIFICATION_SMS_FROM", "+18885550100")
+
+    class SessionSMTP:
+        sessions: list = []
+
+        def __init__(self, host, port, timeout=None):
+            self.sent: list = []
+            SessionSMTP.sessions.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def ehlo(self):
+            return True
+
+        def starttls(self):
+            return True
+
+        def send_message(self, message):
+            if message["To"] == "bad@example.com":
+                raise SMTPRecipientsRefused({"bad@example.com": (550, b"unknown")})
+            self.sent.append(message["To"])
+
+    monkeypatch.setattr(channels, "smtplib", SimpleNamespace(SMTP=SessionSMTP, SMTP_SSL=SessionSMTP))
+    sms_requests: list[httpx.Request] = []
+
+    def twilio_handler(request: httpx.Request) -> httpx.Response:
+        sms_requests.append(request)
+        return httpx.Response(201, json={"sid": "SMbatch"})
+
+    mock_client = httpx.Client(transport=httpx.MockTransport(twilio_handler))
+    providers.reset_provider_clients()
+    monkeypatch.setattr(providers, "get_sms_http_client", lambda config: mock_client)
+    monkeypatch.setattr(delivery_buffer, "_buffer", None)
+    with pytest.raises(RuntimeError):
+        delivery_buffer.get_delivery_buffer(
+            Settings(notification_batch_enabled=True, notification_batch_backend="memory", celery_task_always_eager=False)
+        )
+    monkeypatch.setattr(delivery_buffer, "_buffer", delivery_buffer.InMemoryDeliveryBuffer())
+    persisted: list[tuple[str, str | None, bool]] = []
+
+    def fake_persist(deliveries, results):
+        persisted.extend((item.channel, item.recipient, ok) for item, ok in zip(deliveries, results))
+
+    monkeypatch.setattr(notification_tasks, "_persist_outcomes", fake_persist)
+
+    task_ctx = SimpleNamespace(request=SimpleNamespace(id="batch-task"))
+    bound = send_appointment_reminder.__wrapped__.__get__(task_ctx, type(task_ctx))
+    recipients = [
+        ("a@example.com", "+15555550001"),
+        ("bad@example.com", "+15555550002"),
+        ("c@example.com", "+15555550003"),
+    ]
+    for index, (email, phone) in enumerate(recipients):
+        result = bound(
+            appointment_id=index,
+            remind_at=datetime.now(timezone.utc).isoformat(),
+            channels=["email", "sms"],
+            context={"title": "Toplu", "user_id": 7, "customer_email": email, "customer_phone": phone},
+        )
+        assert result["queued"] == ["email", "sms"]
+        assert result["delivered"] == []
+
+    batch_session, retry_session = SessionSMTP.sessions
+    assert batch_session.sent == ["a@example.com", "c@example.com"]
+    assert retry_session.sent == []
+    assert len(sms_requests) == 3
+    assert sorted(persisted) == sorted(
+        [
+            ("email", "a@example.com", True),
+            ("email", "c@example.com", True),
+            ("email", "bad@example.com", False),
+            ("sms", "+15555550001", True),
+            ("sms", "+15555550002", True),
+            ("sms", "+15555550003", True),
+        ]
+    )
+    providers.reset_provider_clients()
+
+
+def test_open_circuit_parks_delivery_without_calling_provider(monkeypatch):
+    from sytefy_backend.modules.notifications import tasks as notification_tasks
+
+    monkeypatch.setenv("NOTIFICATION_SMS_ENABLED", "true")
+    monkeypatch.setenv("NOTIFICATION_SMS_ACCOUNT_SID", "ACcircuit")
+    monkeypatch.setenv("NOTIFICATION_SMS_AUTH_TOKEN", "token")
+    monkeypatch.setenv("NOTIFICATION_SMS_FROM", "+18885550100")
+    monkeypatch.setenv("NOTIFICATION_CIRCUIT_FAILURE_THRESHOLD", "2")
+    monkeypatch.setenv("REMINDER_MAX_RETRIES", "0")
+    sms_requests: list[httpx.Request] = []
+
+    def failing_handler(request: httpx.Request) -> httpx.Response:
+        sms_requests.append(request)
+        return httpx.Response(503, json={"message": "unavailable"})
+
+    mock_client = httpx.Client(transport=httpx.MockTransport(failing_handler))
+    providers.reset_provider_clients()
+    monkeypatch.setattr(providers, "get_sms_http_client", lambda config: mock_client)
+    monkeypatch.setattr(reminder_tasks, "_persist_notification", lambda **kwargs: None)
+    persisted: list[tuple[str, bool]] = []
+    monkeypatch.setattr(
+        notification_tasks,
+        "_persist_outcomes",
+        lambda deliveries, results: persisted.extend((item.recipient, ok) for item, ok in zip(deliveries, results)),
+    )
+    parked_before = REGISTRY.get_sample_value(
+        "sytefy_reminder_channel_events_total", {"channel": "sms", "status": "parked"}
+    ) or 0.0
+
+    task_ctx = SimpleNamespace(request=SimpleNamespace(id="circuit-task"))
+    bound = send_appointment_reminder.__wrapped__.__get__(task_ctx, type(task_ctx))
+    context = {"title": "Devre", "user_id": 3, "customer_phone": "+15555550199"}
+    for _ in range(2):
+        result = bound(appointment_id=1, remind_at=datetime.now(timezone.utc).isoformat(), channels=["sms"], context=context)
+        assert result["parked"] == []
+    assert len(sms_requests) == 2
+    assert REGISTRY.get_sample_value("sytefy_notification_provider_circuit_state", {"provider": "twilio"}) == 2
+
+    result = bound(appointment_id=1, remind_at=datetime.now(timezone.utc).isoformat(), channels=["sms"], context=context)
+    assert result["parked"] == ["sms"]
+    assert len(sms_requests) == 2
+    assert persisted == [("+15555550199", False)]
+    assert REGISTRY.get_sample_value(
+        "sytefy_reminder_channel_events_total", {"channel": "sms", "status": "parked"}
+    ) == parked_before + 1
+    providers.reset_provider_clients()
+
+
+def test_throttled_email_is_parked_and_permits_are_taken_before_connecting(monkeypatch):
+    from email.message import EmailMessage
+
+    from sytefy_backend.core.resilience import (
+        InMemoryTokenBucketStore,
+        Throttle,
+        ThrottleTimeoutError,
+        TokenBucketConfig,
+    )
+
+    events: list[str] = []
+
+    class RecordingSMTP:
+        def __init__(self, host, port, timeout=None):
+            events.append("connect")
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def ehlo(self):
+            return True
+
+        def starttls(self):
+            return True
+
+        def send_message(self, message):
+            events.append(f"send:{message['To']}")
+
+    class RecordingThrottle(Throttle):
+        def acquire(self) -> float:
+            events.append("acquire")
+            return super().acquire()
+
+    monkeypatch.setattr(channels, "smtplib", SimpleNamespace(SMTP=RecordingSMTP, SMTP_SSL=RecordingSMTP))
+    throttle = RecordingThrottle(
+        name="smtp",
+        key="smtp:throttled",
+        store=InMemoryTokenBucketStore(clock=lambda: 1000.0),
+        config=TokenBucketConfig(rate_per_second=0.5, capacity=1),
+        max_wait=0,
+    )
+    backend = channels.SMTPEmailBackend(host="smtp.throttle.test", port=587, throttle=throttle)
+    messages = []
+    for recipient in ("a@example.com", "b@example.com"):
+        message = EmailMessage()
+        message["To"] = recipient
+        messages.append(message)
+
+    first, second = backend.send_many(messages)
+    assert first is None
+    assert isinstance(second, ThrottleTimeoutError)
+    assert second.retry_after == pytest.approx(2.0)
+    assert events == ["acquire", "acquire", "connect", "send:a@example.com"]
+
+    service = channels.EmailNotificationService(sender="no-reply@sytefy.test", backend=backend)
+    with pytest.raises(ThrottleTimeoutError):
+        service.send(recipient="c@example.com", subject="Hatırlatma", body="Yarın")
+    assert "send:c@example.com" not in events
+
+    parked: list[tuple[str, float]] = []
+    monkeypatch.setattr(reminder_tasks, "get_email_service", lambda settings: service)
+    monkeypatch.setattr(reminder_tasks, "park_delivery", lambda delivery, retry_after: parked.append((delivery.recipient, retry_after)))
+    monkeypatch.setattr(reminder_tasks, "_persist_notification", lambda **kwargs: None)
+    task_ctx = SimpleNamespace(request=SimpleNamespace(id=None))
+    bound = send_appointment_reminder.__wrapped__.__get__(task_ctx, type(task_ctx))
+    result = bound(
+        appointment_id=5,
+        remind_at=datetime.now(timezone.utc).isoformat(),
+        channels=["email"],
+        context={"title": "Kısıtlı", "customer_email": "d@example.com"},
+    )
+    assert result["parked"] == ["email"]
+    assert result["delivered"] == []
+    assert parked == [("d@example.com", pytest.approx(2.0))]
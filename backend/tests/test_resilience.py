@@ -0,0 +1,160 @@
+import pytest
+from fakeredis import FakeRedis
+
+from sytefy_backend.core.resilience import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitOpenError,
+    InMemoryCircuitBreakerStore,
+    InMemoryTokenBucketStore,
+    RedisCircuitBreakerStore,
+    RedisTokenBucketStore,
+    Throttle,
+    ThrottleTimeoutError,
+    TokenBucketConfig,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.parametrize(
+    "store_factory",
+    [InMemoryCircuitBreakerStore, lambda: RedisCircuitBreakerStore(FakeRedis(), prefix="test-circuit")],
+)
+def test_circuit_breaker_opens_probes_and_recovers(store_factory):
+    clock = FakeClock()
+    transitions: list[str] = []
+    breaker = CircuitBreaker(
+        name="smtp",
+        store=store_factory(),
+        config=CircuitBreakerConfig(failure_threshold=2, recovery_timeout=30, half_open_max_calls=1),
+        clock=clock,
+        on_state_change=lambda name, state: transitions.append(state),
+    )
+
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state() == "closed"
+    breaker.record_failure()
+    assert breaker.state() == "open"
+
+    clock.now += 10
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_call()
+    assert exc_info.value.retry_after == pytest.approx(20)
+
+    clock.now += 25
+    assert breaker.state() == "half_open"
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_failure()
+    assert breaker.state() == "open"
+
+    clock.now += 31
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state() == "closed"
+    assert transitions[-1] == "closed"
+    assert "half_open" in transitions
+
+
+@pytest.mark.parametrize(
+    "store_factory",
+    [InMemoryCircuitBreakerStore, lambda: RedisCircuitBreakerStore(FakeRedis(), prefix="test-circuit")],
+)
+def test_throttled_half_open_probe_is_released(store_factory):
+    from sytefy_backend.modules.notifications.infrastructure.channels import SMSNotificationService
+
+    class ThrottledBackend:
+        calls = 0
+
+        def send(self, *, to: str, body: str) -> dict:
+            self.calls += 1
+            raise ThrottleTimeoutError("twilio", 0.5)
+
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        name="twilio",
+        store=store_factory(),
+        config=CircuitBreakerConfig(failure_threshold=1, recovery_timeout=30, half_open_max_calls=1),
+        clock=clock,
+    )
+    breaker.record_failure()
+    clock.now += 31
+    backend = ThrottledBackend()
+    service = SMSNotificationService(sender="Sytefy", enabled=True, backend=backend, breaker=breaker)
+
+    # Kısıtlanan deneme sağlayıcıya ulaşmadı; sonraki çağrı yeni deneme hakkı alır.
+    for _ in range(2):
+        with pytest.raises(ThrottleTimeoutError):
+            service.send(recipient="+15555550123", body="Merhaba")
+    assert backend.calls == 2
+    assert breaker.state() == "half_open"
+
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.release()
+    breaker.release()
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state() == "closed"
+    breaker.release()
+    assert breaker.store.get("twilio").probes == 0
+
+
+@pytest.mark.parametrize(
+    "store_factory",
+    [
+        lambda clock: InMemoryTokenBucketStore(clock=clock),
+        lambda clock: RedisTokenBucketStore(FakeRedis(), prefix="test-throttle", clock=clock),
+    ],
+)
+def test_token_bucket_shares_budget_per_account(store_factory):
+    clock = FakeClock()
+    store = store_factory(clock)
+    config = TokenBucketConfig(rate_per_second=2, capacity=2)
+
+    assert store.try_acquire("twilio:AC1", config) == 0
+    assert store.try_acquire("twilio:AC1", config) == 0
+    assert store.try_acquire("twilio:AC1", config) == pytest.approx(0.5)
+    assert store.try_acquire("twilio:AC2", config) == 0
+
+    clock.now += 0.5
+    assert store.try_acquire("twilio:AC1", config) == 0
+    assert store.try_acquire("twilio:AC1", config) > 0
+
+
+def test_throttle_waits_for_permit_and_times_out():
+    clock = FakeClock()
+    waits: list[tuple[str, float]] = []
+
+    def fake_sleep(seconds: float) -> None:
+        clock.now += seconds
+
+    throttle = Throttle(
+        name="twilio",
+        key="twilio:AC1",
+        store=InMemoryTokenBucketStore(clock=clock),
+        config=TokenBucketConfig(rate_per_second=1, capacity=1),
+        max_wait=1.5,
+        sleep=fake_sleep,
+        on_wait=lambda name, seconds: waits.append((name, seconds)),
+    )
+
+    throttle.acquire()
+    throttle.acquire()
+    assert clock.now == pytest.approx(1001.0)
+    assert [name for name, _ in waits] == ["twilio", "twilio"]
+
+    throttle.max_wait = 0.5
+    with pytest.raises(ThrottleTimeoutError):
+        throttle.acquire()
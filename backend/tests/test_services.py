@@ -45,3 +45,107 @@ async def test_service_crud_flow(test_client: AsyncClient):
     list_after = await test_client.get("/api/services/")
     assert list_after.status_code == 200
     assert list_after.json() == []
+
+
+@pytest.mark.asyncio
+async def test_service_catalog_etag_and_invalidation(test_client: AsyncClient, monkeypatch):
+    from sytefy_backend.modules.services.infrastructure.repository import ServiceRepository
+
+    payload = {"email": "catalog@example.com", "username": "cataloguser", "password": "StrongPass123!"}
+    assert (await test_client.post("/api/auth/register", json=payload)).status_code == 201
+    login_resp = await test_client.post("/api/auth/login", json={"email": payload["email"], "password": payload["password"]})
+    assert login_resp.status_code == 200
+
+    queries = []
+    original = ServiceRepository.list_by_user
+
+    async def counting_list(self, *, user_id: int, status: str | None = None):
+        queries.append(user_id)
+        return await original(self, user_id=user_id, status=status)
+
+    monkeypatch.setattr(ServiceRepository, "list_by_user", counting_list)
+
+    service = {"name": "Bakım", "price_amount": 500.0, "duration_minutes": 30}
+    assert (await test_client.post("/api/services/", json=service)).status_code == 201
+
+    first = await test_client.get("/api/services/")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert [item["name"] for item in first.json()] == ["Bakım"]
+
+    cached = await test_client.get("/api/services/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert (await test_client.get("/api/services/", headers={"If-None-Match": f'"other", W/{etag}'})).status_code == 304
+    assert len(queries) == 1
+
+    filtered = await test_client.get("/api/services/", params={"status_filter": "inactive"})
+    assert filtered.json() == [] and filtered.headers["etag"] != etag
+    assert len(queries) == 1
+
+    created = await test_client.post("/api/services/", json={**service, "name": "Analiz"})
+    changed = await test_client.get("/api/services/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert [item["name"] for item in changed.json()] == ["Analiz", "Bakım"]
+    assert changed.headers["etag"] != etag
+    assert len(queries) == 2
+
+    service_id = created.json()["id"]
+    assert (await test_client.put(f"/api/services/{service_id}", json={"status": "inactive"})).status_code == 200
+    assert [item["name"] for item in (await test_client.get("/api/services/", params={"status_filter": "inactive"})).json()] == [
+        "Analiz"
+    ]
+    assert (await test_client.delete(f"/api/services/{service_id}")).status_code == 204
+    assert [item["name"] for item in (await test_client.get("/api/services/")).json()] == ["Bakım"]
+    assert len(queries) == 4
+
+
+@pytest.mark.asyncio
+async def test_service_catalog_cache_ignores_snapshots_built_before_invalidation():
+    from sytefy_backend.modules.services.domain.entities import ServiceCatalog
+    from sytefy_backend.modules.services.infrastructure.catalog_cache import InMemoryServiceCatalogCache
+
+    cache = InMemoryServiceCatalogCache(max_users=2)
+    stale_version = await cache.version(1)
+    await cache.invalidate(1)
+    await cache.put(ServiceCatalog(user_id=1, version=stale_version, services=(), etag="stale"))
+    assert await cache.get(1) is None
+
+    for user_id in (1, 2, 3):
+        await cache.put(ServiceCatalog(user_id=user_id, version=await cache.version(user_id), services=(), etag=str(user_id)))
+    assert await cache.get(1) is None
+    assert (await cache.get(3)).etag == "3"
+
+
+@pytest.mark.asyncio
+async def test_in_memory_catalog_snapshots_expire_after_ttl():
+    from sytefy_backend.modules.services.domain.entities import ServiceCatalog
+    from sytefy_backend.modules.services.infrastructure.catalog_cache import InMemoryServiceCatalogCache
+
+    now = [100.0]
+    cache = InMemoryServiceCatalogCache(ttl_seconds=5, clock=lambda: now[0])
+    await cache.put(ServiceCatalog(user_id=1, version=await cache.version(1), services=(), etag="fresh"))
+    now[0] += 4.9
+    assert (await cache.get(1)).etag == "fresh"
+    # Başka bir worker'daki yazma bu süreçte sürümü ilerletmez; görüntü süre dolunca yeniden okunur.
+    now[0] += 0.2
+    assert await cache.get(1) is None
+
+
+@pytest.mark.asyncio
+async def test_redis_catalog_cache_shares_versions_across_processes():
+    from fakeredis import FakeAsyncRedis
+
+    from sytefy_backend.modules.services.domain.entities import ServiceCatalog
+    from sytefy_backend.modules.services.infrastructure.catalog_cache import RedisServiceCatalogCache
+
+    redis = FakeAsyncRedis(decode_responses=True)
+    writer = RedisServiceCatalogCache(lambda: redis, ttl_seconds=60)
+    reader = RedisServiceCatalogCache(lambda: redis, ttl_seconds=60)
+    await writer.put(ServiceCatalog(user_id=1, version=await writer.version(1), services=(), etag="v0"))
+    assert (await reader.get(1)).etag == "v0"
+
+    # Diğer süreçteki yazma sürümü ilerletir; okuyucunun yerel kopyası artık sunulmaz.
+    await writer.invalidate(1)
+    assert await reader.get(1) is None
+    assert await redis.get("services:catalog:1:v") == "1"